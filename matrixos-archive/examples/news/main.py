@@ -17,6 +17,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from matrixos.app_framework import App
 from matrixos.input import InputEvent
+from matrixos.ui import Ticker
 
 CYAN = (0, 255, 255)
 DARK_BLUE = (0, 0, 40)
@@ -40,23 +41,30 @@ class NewsApp(App):
             ("World", "International summit begins", "Leaders gather for talks..."),
         ]
         self.selected = 0
-        self.scroll_offset = 0
+        # Selected headline scrolls in its row (rendered once, blitted per frame)
+        self.ticker = Ticker("", x=50, y=0, width=102, color=YELLOW, speed=30, gap=24)
+        self.select(0)
+    
+    def select(self, index):
+        self.selected = index
+        self.ticker.set_text(self.articles[index][1])
+        self.ticker.offset = 0.0
+        self.ticker.y = 30 + index * 15
+        self.dirty = True
     
     def on_event(self, event):
         if event.key == InputEvent.UP:
-            self.selected = max(0, self.selected - 1)
-            self.dirty = True
+            self.select(max(0, self.selected - 1))
             return True
         elif event.key == InputEvent.DOWN:
-            self.selected = min(len(self.articles) - 1, self.selected + 1)
-            self.dirty = True
+            self.select(min(len(self.articles) - 1, self.selected + 1))
             return True
         return False
     
     def on_update(self, delta_time):
-        # Auto-scroll current article
-        self.scroll_offset += 1
-        self.dirty = True
+        # Auto-scroll current headline; redraw only when it moved a pixel
+        if self.ticker.update(delta_time):
+            self.dirty = True
     
     def render(self, matrix):
         matrix.clear()
@@ -72,8 +80,8 @@ class NewsApp(App):
             if i == self.selected:
                 # Highlighted
                 matrix.rect(5, y - 2, 150, 12, YELLOW)
-                matrix.text(f"{category}:", 10, y, DARK_BLUE)
-                matrix.text(headline[:18], 50, y, DARK_BLUE)
+                matrix.text(f"{category}:", 10, y, YELLOW)
+                self.ticker.render(matrix)
             else:
                 # Normal
                 matrix.text(f"{category}:", 10, y, GREEN)
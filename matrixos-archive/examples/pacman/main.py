@@ -102,7 +102,7 @@ class PacManGame(App):
         # Power pellet state
         self.power_mode = False
         self.power_timer = 0
-        self.power_duration = 300  # frames (~5 seconds at 60fps)
+        self.power_duration = 300  # ticks (5 seconds)
         
         # Game state
         self.game_state = "playing"  # playing, dead, won
@@ -110,9 +110,10 @@ class PacManGame(App):
         self.death_animation_timer = 0
         self.respawn_timer = 0
         
-        # Movement timing (update every N frames for smooth movement)
+        # Movement timing (update every N ticks for smooth movement)
+        self.tick_rate = 60  # Fixed timestep: game speed doesn't depend on frame rate
         self.move_counter = 0
-        self.move_interval = 4  # Update every 4 frames (15 updates/sec at 60fps)
+        self.move_interval = 4  # Update every 4 ticks (15 updates/sec)
         
         self.reset_level()
         self.dirty = True
@@ -290,7 +291,7 @@ class PacManGame(App):
         
         self.dirty = True
     
-    def render(self, matrix):
+    def render(self, matrix, alpha=0.0):
         """Draw game"""
         # Dark blue background
         matrix.clear()
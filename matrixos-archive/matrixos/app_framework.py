@@ -8,6 +8,8 @@ import time
 import sys
 from matrixos import async_tasks
 from matrixos.input import InputEvent
+from matrixos.compositor import Compositor
+from matrixos.text_layout import layout_text, matrix_font
 
 # Debug logging to file
 DEBUG_LOG = None
@@ -37,6 +39,12 @@ class App:
         self.dirty = True  # Needs redraw?
         self.needs_keyboard = False  # Request on-screen keyboard
 
+        # Fixed timestep (opt-in): set tick_rate to get on_update() called
+        # with a constant delta_time, tick_rate times per second, however
+        # long frames take. render() then also gets `alpha`.
+        self.tick_rate = None  # Simulation ticks per second, None = once per frame
+        self.max_catch_up_steps = 5  # Most ticks run in one frame; the rest is dropped
+
     def get_help_text(self):
         """Return list of (key, description) tuples for app-specific controls.
 
@@ -63,8 +71,11 @@ class App:
     def on_update(self, delta_time):
         """Called every frame when app is active (~60fps).
 
+        With `tick_rate` set it is called once per simulation tick instead
+        (zero or more times per frame) and delta_time is always 1 / tick_rate.
+
         Args:
-            delta_time: Time since last frame in seconds
+            delta_time: Time since last frame (or the fixed tick) in seconds
 
         Use this for animations, game logic, etc.
         Keep this fast - return quickly!
@@ -104,6 +115,11 @@ class App:
 
         Called by OS after on_update(). Draw your UI here.
         Don't call matrix.show() - OS does that!
+
+        Apps with `tick_rate` set are rendered every frame, including the
+        frames between ticks, and are called as render(matrix, alpha):
+        alpha (0.0-1.0) is how far the frame is between the last tick and
+        the next, for interpolating positions.
         """
         self.dirty = False  # Clear dirty flag after render
 
@@ -141,6 +157,28 @@ class OSContext:
         self.attention_queue = []  # Apps requesting attention
         self.showing_help = False  # Help overlay visible?
         self.help_scroll = 0  # Help scroll position
+        self.keyboard = None  # Non-blocking on-screen keyboard (open_keyboard)
+        self.keyboard_callback = None
+        self.toast_expires = 0.0
+
+        # Fixed-timestep state (apps with tick_rate set)
+        self.tick_accumulator = 0.0  # Unsimulated time, in seconds
+        self.ticks = 0  # Fixed ticks run
+        self.catch_up_frames = 0  # Frames that ran more than one tick
+        self.catch_up_ticks = 0  # Extra ticks run to catch up
+        self.dropped_ticks = 0  # Ticks skipped because max_catch_up_steps was hit
+
+        # Overlays (help, keyboard, toasts) are compositor layers over the
+        # app's last frame, so toggling them doesn't re-run App.render().
+        # Matrices without a framebuffer fall back to drawing directly.
+        self.compositor = Compositor.for_matrix(matrix)
+        self.help_layer = None
+        self.toast_layer = None
+        if self.compositor:
+            matrix.compositor = self.compositor
+            self.help_layer = self.compositor.create_layer(
+                'help', z=100, mode='rgba', opacity=230
+            )
 
     def register_app(self, app):
         """Register an app with the OS.
@@ -181,6 +219,7 @@ class OSContext:
         # Activate new app
         self.active_app = app
         app.active = True
+        self.tick_accumulator = 0.0
         try:
             app.on_activate()
         except Exception as e:
@@ -209,12 +248,18 @@ class OSContext:
         self.attention_queue.sort(key=lambda x: x[0], reverse=True)
 
     def render_help_overlay(self):
-        """Render help overlay showing available controls."""
+        """Render help overlay showing available controls.
+
+        Draws into the help layer when there is a compositor (the app stays
+        visible underneath), otherwise straight onto the matrix.
+        """
+        target = self.help_layer if self.help_layer else self.matrix
+
         # Draw semi-transparent background (fill with dark color)
-        self.matrix.fill((20, 20, 40))
+        target.fill((20, 20, 40))
 
         # Title
-        self.matrix.centered_text("HELP", 4, (255, 255, 0))
+        target.centered_text("HELP", 4, (255, 255, 0))
 
         # Build all help items first
         help_items = []
@@ -225,7 +270,7 @@ class OSContext:
             if app_help:
                 help_items.append(("APP KEYS:", "", True))  # Section header
                 for key, description in app_help:
-                    help_items.append((key[:4].upper(), description[:10].upper(), False))
+                    help_items.append((key.upper(), description.upper(), False))
 
         # Universal controls
         help_items.append(("", "", True))  # Spacing
@@ -234,10 +279,18 @@ class OSContext:
         help_items.append(("BKSP", "GO BACK", False))
         help_items.append(("TAB", "THIS HELP", False))
 
+        # Key column as wide as the widest key (up to a third of the screen);
+        # keys and descriptions too wide for their column are ellipsized
+        font = matrix_font(target)
+        key_width = min(max(font.measure(key)[0] for key, _, is_header in help_items
+                            if not is_header), target.width // 3)
+        desc_x = 6 + key_width + 4
+        desc_width = target.width - desc_x - 2
+
         # Calculate visible range based on scroll
         start_y = 14
         line_height = 8
-        visible_lines = (self.matrix.height - start_y - 16) // line_height
+        visible_lines = (target.height - start_y - 16) // line_height
         start_index = self.help_scroll
         end_index = min(start_index + visible_lines, len(help_items))
 
@@ -248,25 +301,142 @@ class OSContext:
 
             if is_header:
                 if key:  # Section header with text
-                    self.matrix.text(key, 4, y, (0, 255, 255))
+                    target.text(key, 4, y, (0, 255, 255))
                 # Empty headers are just spacing
             else:
-                self.matrix.text(key, 6, y, (255, 255, 255))
+                layout_text(key, font, key_width, wrap=False).draw(target, 6, y, (255, 255, 255))
                 if desc:
-                    self.matrix.text(desc, 28, y, (150, 150, 150))
+                    layout_text(desc, font, desc_width, wrap=False).draw(
+                        target, desc_x, y, (150, 150, 150))
 
             y += line_height
 
         # Scroll indicators
         if start_index > 0:
             # Can scroll up
-            self.matrix.centered_text("^", start_y - 6, (255, 255, 0))
+            target.centered_text("^", start_y - 6, (255, 255, 0))
         if end_index < len(help_items):
             # Can scroll down
-            self.matrix.centered_text("v", self.matrix.height - 14, (255, 255, 0))
+            target.centered_text("v", target.height - 14, (255, 255, 0))
 
         # Footer
-        self.matrix.centered_text("TAB/BKSP TO CLOSE", self.matrix.height - 8, (100, 100, 100))
+        target.centered_text("TAB/BKSP TO CLOSE", target.height - 8, (100, 100, 100))
+
+    def _help_changed(self):
+        """Show, hide or redraw the help overlay after a help key."""
+        if self.help_layer:
+            if self.showing_help:
+                self.render_help_overlay()
+            self.help_layer.visible = self.showing_help
+        elif self.active_app:
+            # Mark active app as needing redraw
+            self.active_app.dirty = True
+
+    def show_toast(self, message, duration=2.0, color=(255, 255, 255),
+                   bg_color=(40, 40, 80)):
+        """Show a short notification at the bottom of the screen.
+
+        Args:
+            message: Text to show
+            duration: Seconds before it disappears
+            color: Text color
+            bg_color: Background color
+        """
+        if not self.compositor:
+            return
+        if self.toast_layer is None:
+            self.toast_layer = self.compositor.create_layer(
+                'toast', 0, self.matrix.height - 10, self.matrix.width, 10, z=200
+            )
+        self.toast_layer.fill(bg_color)
+        self.toast_layer.centered_text(message, 1, color)
+        self.toast_layer.visible = True
+        self.toast_expires = time.time() + duration
+
+    def open_keyboard(self, prompt="Enter text:", initial="", on_done=None):
+        """Open the on-screen keyboard without blocking the OS loop.
+
+        Input goes to the keyboard until it is closed; the keyboard is a
+        layer, so only its area is redrawn on each key press.
+
+        Args:
+            prompt: Prompt text
+            initial: Initial text value
+            on_done: Called with the entered text, or None if cancelled
+        """
+        from matrixos.keyboard import OnScreenKeyboard
+
+        self.keyboard = OnScreenKeyboard(prompt, initial)
+        self.keyboard_callback = on_done
+        if self.compositor:
+            self.keyboard.open_layer(self.compositor)
+
+    def _keyboard_event(self, event):
+        """Route an input event to the open on-screen keyboard."""
+        keyboard = self.keyboard
+        if keyboard.handle_input(event):
+            keyboard.render_layer()
+            if not keyboard.layer and self.active_app:
+                self.active_app.dirty = True
+
+        if keyboard.done:
+            keyboard.close_layer()
+            self.keyboard = None
+            callback, self.keyboard_callback = self.keyboard_callback, None
+            if self.active_app:
+                self.active_app.dirty = True
+            if callback:
+                callback(None if keyboard.cancelled else keyboard.text)
+
+    def _run_ticks(self, app, delta_time):
+        """Run the fixed-timestep ticks that are due for an app.
+
+        Frame time is accumulated and spent in steps of 1 / tick_rate. When
+        more than max_catch_up_steps are due (a stall), the excess is
+        dropped rather than run, so the game slows down instead of
+        spiralling further behind.
+
+        Args:
+            app: Active app with tick_rate set
+            delta_time: Wall-clock time since the last frame
+
+        Returns:
+            tuple: (ticks run, alpha) - alpha is the fraction of a tick
+                   left over, for render() to interpolate with
+        """
+        step = 1.0 / app.tick_rate
+        self.tick_accumulator += delta_time
+        due = int(self.tick_accumulator / step)
+
+        if due > app.max_catch_up_steps:
+            dropped = due - app.max_catch_up_steps
+            self.dropped_ticks += dropped
+            self.tick_accumulator -= dropped * step
+            due = app.max_catch_up_steps
+        if due > 1:
+            self.catch_up_frames += 1
+            self.catch_up_ticks += due - 1
+
+        for _ in range(due):
+            app.on_update(step)
+            self.tick_accumulator -= step
+            self.ticks += 1
+
+        return due, min(1.0, max(0.0, self.tick_accumulator / step))
+
+    def get_timestep_stats(self):
+        """Fixed-timestep counters for monitoring.
+
+        Returns:
+            dict: ticks run, frames and extra ticks spent catching up, and
+                  ticks dropped because the catch-up cap was reached
+        """
+        return {
+            'ticks': self.ticks,
+            'catch_up_frames': self.catch_up_frames,
+            'catch_up_ticks': self.catch_up_ticks,
+            'dropped_ticks': self.dropped_ticks,
+        }
 
     def run(self):
         """Main OS event loop.
@@ -296,19 +466,19 @@ class OSContext:
             # Handle system-level input events
             event = self.input.get_key(timeout=0.001)
             if event:
-                if event.key == InputEvent.HELP:  # TAB = toggle help
+                if self.keyboard:
+                    # Open keyboard gets all input until it closes
+                    self._keyboard_event(event)
+                elif event.key == InputEvent.HELP:  # TAB = toggle help
                     self.showing_help = not self.showing_help
                     if not self.showing_help:
                         self.help_scroll = 0
-                    # Mark active app as needing redraw
-                    if self.active_app:
-                        self.active_app.dirty = True
+                    self._help_changed()
                 elif self.showing_help:
                     # Handle scrolling in help screen
                     if event.key == 'UP':
                         self.help_scroll = max(0, self.help_scroll - 1)
-                        if self.active_app:
-                            self.active_app.dirty = True
+                        self._help_changed()
                     elif event.key == 'DOWN':
                         # Calculate max scroll based on help content
                         app_help_count = len(self.active_app.get_help_text()) if self.active_app else 0
@@ -316,14 +486,12 @@ class OSContext:
                         visible_lines = (self.matrix.height - 14 - 16) // 8
                         max_scroll = max(0, total_items - visible_lines)
                         self.help_scroll = min(max_scroll, self.help_scroll + 1)
-                        if self.active_app:
-                            self.active_app.dirty = True
+                        self._help_changed()
                     elif event.key == InputEvent.BACK:
                         # Close help
                         self.showing_help = False
                         self.help_scroll = 0
-                        if self.active_app:
-                            self.active_app.dirty = True
+                        self._help_changed()
                 else:
                     # HOME always returns to launcher (like iOS home button) - check FIRST
                     if event.key == InputEvent.HOME:
@@ -377,8 +545,15 @@ class OSContext:
 
             # Update active app
             if self.active_app:
+                alpha = None
                 try:
-                    self.active_app.on_update(delta_time)
+                    if self.active_app.tick_rate:
+                        # Alpha moves on every frame, ticked or not, so
+                        # every frame is a new interpolated picture
+                        _, alpha = self._run_ticks(self.active_app, delta_time)
+                        self.active_app.dirty = True
+                    else:
+                        self.active_app.on_update(delta_time)
                 except Exception as e:
                     debug_log(f"[ERROR] {self.active_app.name}.on_update() crashed: {e}")
                     import traceback
@@ -391,13 +566,16 @@ class OSContext:
                 # Only render if something changed (dirty flag)
                 if self.active_app.dirty:
                     self.matrix.clear()
-                    if self.showing_help:
+                    if self.showing_help and not self.compositor:
                         # Show help overlay
                         self.render_help_overlay()
                     else:
                         # Show normal app UI
                         try:
-                            self.active_app.render(self.matrix)
+                            if alpha is None:
+                                self.active_app.render(self.matrix)
+                            else:
+                                self.active_app.render(self.matrix, alpha)
                         except Exception as e:
                             debug_log(f"[ERROR] {self.active_app.name}.render() crashed: {e}")
                             import traceback
@@ -406,7 +584,21 @@ class OSContext:
                             if self.launcher:
                                 self.switch_to_app(self.launcher)
                             continue
-                    self.matrix.show()
+                    if self.compositor:
+                        # New app frame becomes the base under the overlays
+                        self.compositor.set_base(self.matrix.display)
+                    else:
+                        if self.keyboard:
+                            self.keyboard.render(self.matrix)
+                        self.matrix.show()
+
+            # Expire toast notifications
+            if self.toast_layer and self.toast_layer.visible and current_time >= self.toast_expires:
+                self.toast_layer.visible = False
+
+            # Composite and show whatever changed (app frame or overlays)
+            if self.compositor and self.compositor.needs_compose():
+                self.compositor.present(self.matrix)
 
             # Background tasks (~1 per second)
             if current_time - last_background_tick >= 1.0:
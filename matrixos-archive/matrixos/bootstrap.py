@@ -77,16 +77,17 @@ def boot(project_root=None):
         print("ERROR: Failed to initialize input!")
         return 1
     
-    # Wrap the display driver with LED API
+    # Wrap the display driver with LED API (double-buffered; show()
+    # flips buffers and presents the front buffer through the driver).
+    # Drivers are always RGB, so the buffers follow the driver's mode
+    # unless indexed mode was requested (expanded to RGB in show()).
     from matrixos.led_api import LEDMatrix
-    matrix = LEDMatrix(args.width, args.height, args.color_mode)
-    # Replace the internal display with our device driver
-    matrix.display = device_manager.active_display
-    
-    # Override show() to use device driver instead of terminal renderer
-    def show_via_driver(*args, **kwargs):
-        device_manager.active_display.show()
-    matrix.show = show_via_driver
+    display_driver = device_manager.active_display
+    color_mode = 'indexed' if args.color_mode == 'indexed' else display_driver.color_mode
+    matrix = LEDMatrix(args.width, args.height, color_mode,
+                       driver=display_driver,
+                       color_correction=device_manager.create_color_correction(),
+                       threaded_output=device_manager.config["display"].get("output_thread", False))
     
     input_handler = device_manager.active_inputs[0]  # Use first input device
 
@@ -109,6 +110,13 @@ def boot(project_root=None):
         launcher.run()
     
     finally:
+        # Output the last frame before the display goes away
+        if matrix.output_thread is not None:
+            stats = matrix.output_thread.get_stats()
+            matrix.stop_output_thread()
+            print(f"Output thread: {stats['presented']} frames, {stats['dropped']} dropped, "
+                  f"{stats['average_ms']:.1f} ms average, {stats['utilization']:.0%} busy")
+
         # Clean shutdown of all devices
         device_manager.cleanup()
 
@@ -10,6 +10,7 @@ import importlib.util
 from pathlib import Path
 from matrixos import layout  # Import layout helpers
 from matrixos.input import InputEvent  # For key constants
+from matrixos.display import Bitmap, Display  # For cached icon blits
 from matrixos.emoji_loader import get_emoji_loader  # For emoji icons
 from matrixos.logger import get_logger  # For logging
 
@@ -44,6 +45,7 @@ class App:
         self.icon_pixels = None
         self.icon_format = "palette"  # "palette", "rgb", or "hex"
         self.icon_native_size = 16  # Native size of the icon (16 or 32)
+        self._icon_bitmaps = {}  # (size, color_mode, palette) -> scaled Bitmap
 
         logger.debug(f"Loading config for {folder_path.name}")
         self._load_config()
@@ -235,8 +237,32 @@ class App:
             matrix.rect(x, y, size, size, (100, 100, 100), fill=True)
             return
 
+        # Blit a cached, pre-scaled bitmap when the matrix supports it
+        display = getattr(matrix, 'display', None)
+        if isinstance(display, Display) and hasattr(matrix, 'blit'):
+            key = (size, display.color_mode, id(display.palette))
+            bitmap = self._icon_bitmaps.get(key)
+            if bitmap is None:
+                bitmap = Bitmap(size, size, display.color_mode, display.palette)
+                bitmap.set_alpha_rect(0, 0, size, size, 0)
+                self._draw_icon_pixels(bitmap, 0, 0, size)
+                self._icon_bitmaps[key] = bitmap
+            matrix.blit(bitmap, x, y)
+            return
+        
+        self._draw_icon_pixels(matrix, x, y, size)
+    
+    def _draw_icon_pixels(self, target, x, y, size):
+        """Draw the scaled icon one rectangle per icon pixel.
+        
+        Args:
+            target: Matrix, or a Bitmap (whose alpha is set where drawn)
+            x, y: Top-left position
+            size: Icon size
+        """
         # Calculate scale factor
         scale = size / self.icon_native_size
+        is_bitmap = isinstance(target, Bitmap)
         
         # ALWAYS use rect rendering to avoid gridline artifacts
         # (set_pixel seems to create gaps, rect with fill=True doesn't)
@@ -250,7 +276,11 @@ class App:
                     pw = max(1, int(scale))
                     ph = max(1, int(scale))
                     # Always use rect, never set_pixel
-                    matrix.rect(px, py, pw, ph, color, fill=True)
+                    if is_bitmap:
+                        target.fill_rect(px, py, pw, ph, color)
+                        target.set_alpha_rect(px, py, pw, ph, 255)
+                    else:
+                        target.rect(px, py, pw, ph, color, fill=True)
     
     def _get_pixel_color(self, pixel):
         """Convert pixel data to RGB color tuple.
@@ -0,0 +1,318 @@
+"""
+Layered compositor for overlays.
+
+The app renders its frame as usual; overlays such as the help screen, the
+on-screen keyboard and toast notifications live in separate layers that are
+composited on top of it. Each layer has its own buffer, a z-order and a
+visibility flag, so opening, closing or redrawing an overlay only
+recomposites the region it covers - the app's last frame is kept as the
+base layer and App.render() is not run again.
+
+Layer modes:
+    'opaque' - every pixel covers what is below
+    'key'    - pixels equal to the key colour are transparent
+    'rgba'   - per-pixel alpha (layer.alpha, 0-255) over the RGB buffer
+
+Example:
+    compositor = Compositor(matrix.width, matrix.height)
+    toast = compositor.create_layer('toast', 0, 56, 64, 8, z=200)
+    toast.text("SAVED", 2, 0, (255, 255, 255))
+    toast.visible = True
+
+    compositor.set_base(matrix.display)   # after App.render()
+    compositor.present(matrix)            # composites and shows
+"""
+
+from typing import List, Optional, Tuple
+from matrixos.display import Display, Rect
+from matrixos.led_api import LEDMatrix
+
+
+class Layer(LEDMatrix):
+    """
+    One compositor layer.
+
+    Supports the full LEDMatrix drawing API (text, rect, circle...); drawing
+    is tracked through the layer's damage so the compositor can recomposite
+    just what changed. Layers are never shown directly.
+    """
+
+    def __init__(self, name: str, x: int, y: int, width: int, height: int,
+                 z: int = 0, mode: str = 'opaque', key: Tuple[int, int, int] = (0, 0, 0),
+                 opacity: int = 255, color_mode: str = 'rgb', palette=None):
+        """
+        Create a layer (usually via Compositor.create_layer).
+
+        Args:
+            name: Layer name for lookups
+            x, y: Position on screen
+            width, height: Layer size
+            z: Stacking order (higher = on top)
+            mode: 'opaque', 'key' or 'rgba'
+            key: Transparent colour in 'key' mode
+            opacity: Initial alpha for every pixel in 'rgba' mode
+            color_mode: Must match the compositor
+            palette: Compositor's palette in 'indexed' mode
+        """
+        if mode not in ('opaque', 'key', 'rgba'):
+            raise ValueError(f"Unknown layer mode: {mode}")
+
+        super().__init__(width, height, color_mode, palette=palette)
+        self.front = None  # Layers are composited, never flipped
+        self.output = None
+        self.name = name
+        self.x = x
+        self.y = y
+        self.z = z
+        self.mode = mode
+        self.key = key
+        self.alpha = bytearray([opacity]) * (width * height) if mode == 'rgba' else None
+        self.compositor = None
+        self._visible = False
+
+    @property
+    def visible(self) -> bool:
+        """Whether the layer is composited (hidden layers cost nothing)"""
+        return self._visible
+
+    @visible.setter
+    def visible(self, value: bool):
+        value = bool(value)
+        if value != self._visible:
+            self._visible = value
+            self.invalidate()
+
+    @property
+    def bounds(self) -> Rect:
+        """Screen rectangle covered by the layer"""
+        return (self.x, self.y, self.width, self.height)
+
+    def invalidate(self):
+        """Recomposite the whole area covered by the layer"""
+        if self.compositor:
+            self.compositor.invalidate(*self.bounds)
+
+    def move(self, x: int, y: int):
+        """Move the layer, recompositing its old and new areas."""
+        self.invalidate()
+        self.x = x
+        self.y = y
+        self.invalidate()
+
+    def set_alpha(self, x: int, y: int, alpha: int):
+        """Set one pixel's alpha ('rgba' layers only)."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.alpha[y * self.width + x] = max(0, min(255, int(alpha)))
+            self.display.add_damage(x, y, 1, 1)
+
+    def fill_alpha(self, alpha: int, rect: Optional[Rect] = None):
+        """
+        Set alpha for the whole layer or a rectangle ('rgba' layers only).
+
+        Args:
+            alpha: 0 (transparent) to 255 (opaque)
+            rect: Optional (x, y, width, height) in layer coordinates
+        """
+        clipped = self.display.clip_rect(*(rect or (0, 0, self.width, self.height)))
+        if clipped is None:
+            return
+        x, y, w, h = clipped
+        value = bytes([max(0, min(255, int(alpha)))]) * w
+        for row in range(y, y + h):
+            start = row * self.width + x
+            self.alpha[start:start + w] = value
+        self.display.add_damage(x, y, w, h)
+
+    def show(self, renderer=None, clear_screen: bool = True):
+        """Layers are shown by their compositor; this does nothing."""
+        pass
+
+
+class Compositor:
+    """
+    Stack of layers composited over the app's frame.
+
+    Keeps the app's last frame (base) and the last composited frame
+    (output). Only invalidated regions - from set_base(), layer drawing,
+    visibility changes or moves - are recomposited.
+    """
+
+    def __init__(self, width: int, height: int, color_mode: str = 'rgb',
+                 palette=None):
+        """
+        Initialize compositor.
+
+        Args:
+            width: Screen width in pixels
+            height: Screen height in pixels
+            color_mode: 'rgb', 'mono' or 'indexed' (alpha rounds to
+                       opaque/transparent in the 1-byte modes)
+            palette: Shared Palette in 'indexed' mode
+        """
+        self.width = width
+        self.height = height
+        self.color_mode = color_mode
+        self.base = Display(width, height, color_mode, palette)
+        self.output = Display(width, height, color_mode, palette)  # Damage = pending region
+        self.palette = self.base.palette
+        self.output.take_damage()
+        self.layers: List[Layer] = []
+
+    @classmethod
+    def for_matrix(cls, matrix) -> Optional['Compositor']:
+        """Create a compositor for an LEDMatrix, or None if it has no framebuffer."""
+        if not isinstance(getattr(matrix, 'display', None), Display):
+            return None
+        return cls(matrix.width, matrix.height, matrix.display.color_mode,
+                   matrix.display.palette)
+
+    # Layer management
+
+    def create_layer(self, name: str, x: int = 0, y: int = 0,
+                     width: Optional[int] = None, height: Optional[int] = None,
+                     z: int = 0, mode: str = 'opaque', key=(0, 0, 0),
+                     opacity: int = 255) -> Layer:
+        """
+        Create and add a (hidden) layer.
+
+        Args:
+            name: Layer name
+            x, y: Position on screen
+            width, height: Size (default: rest of the screen)
+            z: Stacking order (higher = on top)
+            mode: 'opaque', 'key' or 'rgba'
+            key: Transparent colour for 'key' mode
+            opacity: Initial alpha for 'rgba' mode
+
+        Returns:
+            Layer to draw into; set layer.visible = True to show it
+        """
+        if width is None:
+            width = self.width - x
+        if height is None:
+            height = self.height - y
+        layer = Layer(name, x, y, width, height, z=z, mode=mode, key=key,
+                      opacity=opacity, color_mode=self.color_mode,
+                      palette=self.palette)
+        self.add_layer(layer)
+        return layer
+
+    def add_layer(self, layer: Layer):
+        """Add a layer to the stack."""
+        layer.compositor = self
+        self.layers.append(layer)
+        # Stable sort keeps insertion order for equal z
+        self.layers.sort(key=lambda l: l.z)
+        if layer.visible:
+            layer.invalidate()
+
+    def remove_layer(self, layer: Layer):
+        """Remove a layer, uncovering whatever was below it."""
+        if layer in self.layers:
+            layer.invalidate()
+            self.layers.remove(layer)
+            layer.compositor = None
+
+    def get_layer(self, name: str) -> Optional[Layer]:
+        """Find a layer by name."""
+        for layer in self.layers:
+            if layer.name == name:
+                return layer
+        return None
+
+    def has_visible_layers(self) -> bool:
+        """Check if any overlay is currently shown."""
+        return any(layer.visible for layer in self.layers)
+
+    # Damage
+
+    def invalidate(self, x: int = 0, y: int = 0,
+                   width: Optional[int] = None, height: Optional[int] = None):
+        """Mark a screen region for recompositing (default: everything)."""
+        if width is None:
+            width = self.width - x
+        if height is None:
+            height = self.height - y
+        self.output.add_damage(x, y, width, height)
+
+    def set_base(self, frame: Display):
+        """
+        Store the app's freshly rendered frame as the bottom layer.
+
+        Args:
+            frame: Display with the app's frame (e.g. matrix.display)
+        """
+        self.base.copy_from(frame, mark_damage=False)
+        self.invalidate()
+
+    def _collect_layer_damage(self):
+        """Turn drawing inside layers into screen damage."""
+        for layer in self.layers:
+            rects = layer.display.take_damage()
+            if not layer.visible:
+                continue
+            for x, y, w, h in rects:
+                self.invalidate(layer.x + x, layer.y + y, w, h)
+
+    def needs_compose(self) -> bool:
+        """Check if anything changed since the last compose()."""
+        self._collect_layer_damage()
+        return self.output.has_damage()
+
+    # Compositing
+
+    def compose(self) -> List[Rect]:
+        """
+        Recomposite invalidated regions into self.output.
+
+        Returns:
+            list: (x, y, width, height) rectangles that were recomposited
+        """
+        self._collect_layer_damage()
+        rects = self.output.take_damage()
+        if not rects:
+            return rects
+
+        visible = [layer for layer in self.layers if layer.visible]
+        for rect in rects:
+            x, y, w, h = rect
+            self.output.copy_rect(self.base, x, y, w, h, x, y)
+            for layer in visible:
+                self._blend_layer(layer, rect)
+
+        # Writes above re-added damage for the same rects
+        self.output.take_damage()
+        return rects
+
+    def present(self, matrix) -> bool:
+        """
+        Composite pending changes into the matrix and show it.
+
+        Args:
+            matrix: LEDMatrix to draw the composited frame into
+
+        Returns:
+            bool: True if a frame was shown
+        """
+        if not self.compose():
+            return False
+        matrix.display.copy_from(self.output)
+        matrix.show()
+        return True
+
+    def _blend_layer(self, layer: Layer, rect: Rect):
+        """Composite the part of a layer that overlaps rect into the output."""
+        x0 = max(rect[0], layer.x)
+        y0 = max(rect[1], layer.y)
+        x1 = min(rect[0] + rect[2], layer.x + layer.width)
+        y1 = min(rect[1] + rect[3], layer.y + layer.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        src_rect = (x0 - layer.x, y0 - layer.y, x1 - x0, y1 - y0)
+        if layer.mode == 'key':
+            self.output.blit(layer.display, x0, y0, src_rect, key=layer.key)
+        elif layer.mode == 'rgba':
+            self.output.blit(layer.display, x0, y0, src_rect, alpha=layer.alpha)
+        else:
+            self.output.blit(layer.display, x0, y0, src_rect)
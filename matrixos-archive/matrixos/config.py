@@ -15,6 +15,7 @@ def parse_matrix_args(description=None):
 
     Returns:
         Namespace with width, height, color_mode attributes
+        (color_mode is 'mono', 'rgb' or 'indexed')
     """
     parser = argparse.ArgumentParser(
         description=description or "LED Matrix Application"
@@ -47,6 +48,12 @@ def parse_matrix_args(description=None):
         help='Use monochrome mode instead of RGB'
     )
 
+    parser.add_argument(
+        '--indexed',
+        action='store_true',
+        help='Use indexed-colour (palette) mode: 1 byte per pixel, RGB at output'
+    )
+
     args = parser.parse_args()
 
     # Handle resolution shortcut
@@ -65,7 +72,12 @@ def parse_matrix_args(description=None):
             args.height = 192
 
     # Set color mode
-    args.color_mode = 'mono' if args.mono else 'rgb'
+    if args.mono:
+        args.color_mode = 'mono'
+    elif args.indexed:
+        args.color_mode = 'indexed'
+    else:
+        args.color_mode = 'rgb'
 
     return args
 
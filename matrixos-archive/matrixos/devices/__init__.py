@@ -53,7 +53,11 @@ class DeviceManager:
                 "height": 192,
                 "driver": "auto",
                 "scale": 4,  # Increased from 3 for better visibility
-                "pixel_gap": 0  # 0 = full pixels, 1+ = LED matrix look with gaps
+                "pixel_gap": 0,  # 0 = full pixels, 1+ = LED matrix look with gaps
+                "output_process": False,  # True = drive the display from a separate process
+                "panel_layout": None,  # HUB75 chain mapping (see display/panel_layout.py)
+                "color_correction": None,  # gamma, brightness, balance, max_current (amps)
+                "output_thread": False  # True = output frames on a background thread (not for pygame on macOS)
             },
             "input_devices": [],
             "bluetooth": {
@@ -110,6 +114,16 @@ class DeviceManager:
         Returns:
             DisplayDriver: Instantiated driver
         """
+        name, driver_class = self.select_best_display_class()
+        return driver_class(width=width, height=height, **kwargs)
+    
+    def select_best_display_class(self):
+        """
+        Pick the best available display driver class without creating it.
+        
+        Returns:
+            tuple: (name, driver_class)
+        """
         available = []
         
         for name, driver_class in self.display_drivers.items():
@@ -134,7 +148,7 @@ class DeviceManager:
         priority, name, driver_class = available[0]
         print(f"[DeviceManager] Selected display driver: {name} (priority: {priority})")
         
-        return driver_class(width=width, height=height, **kwargs)
+        return name, driver_class
     
     def initialize_display(self, driver_name: str = None) -> bool:
         """
@@ -159,7 +173,26 @@ class DeviceManager:
         if driver_name is None:
             driver_name = config.get("driver", "auto")
         
-        if driver_name == "auto" or driver_name not in self.display_drivers:
+        # Multi-panel walls: the driver sees the physical panel chain
+        layout = self.create_panel_layout(width, height)
+        if layout is not None:
+            width, height = layout.physical_size
+            print(f"[DeviceManager] Panel layout: {len(layout.panels)} panels, chain {width}×{height}")
+        
+        if config.get("output_process", False):
+            # Display server mode: the real driver runs in its own process
+            # and apps publish frames through shared memory
+            from .display.shared_memory import SharedMemoryDisplayDriver
+            if driver_name == "auto" or driver_name not in self.display_drivers:
+                driver_name, driver_class = self.select_best_display_class()
+            else:
+                driver_class = self.display_drivers[driver_name]
+            print(f"[DeviceManager] Running {driver_name} in an output process")
+            self.active_display = SharedMemoryDisplayDriver(
+                width=width, height=height, output_driver=driver_class,
+                scale=scale, pixel_gap=pixel_gap
+            )
+        elif driver_name == "auto" or driver_name not in self.display_drivers:
             # Auto-select best driver with settings
             self.active_display = self.select_best_display(
                 width, height, scale=scale, pixel_gap=pixel_gap
@@ -171,6 +204,10 @@ class DeviceManager:
                 width=width, height=height, scale=scale, pixel_gap=pixel_gap
             )
         
+        if layout is not None:
+            from .display.panel_layout import PanelMappedDisplayDriver
+            self.active_display = PanelMappedDisplayDriver(self.active_display, layout)
+        
         success = self.active_display.initialize()
         
         if success:
@@ -180,6 +217,48 @@ class DeviceManager:
         
         return success
     
+    def create_panel_layout(self, width: int, height: int):
+        """
+        Build the PanelLayout from the display.panel_layout config, if any.
+        
+        The permutation is computed here once; drivers then remap every
+        frame with a single gather pass.
+        
+        Args:
+            width: Logical display width the layout must produce
+            height: Logical display height the layout must produce
+            
+        Returns:
+            PanelLayout, or None when no layout is configured
+        """
+        config = self.config.get("display", {}).get("panel_layout")
+        if not config:
+            return None
+        
+        from .display.panel_layout import PanelLayout
+        layout = PanelLayout.from_config(config)
+        if layout.logical_size != (width, height):
+            raise ValueError(
+                f"Panel layout covers {layout.logical_size[0]}×{layout.logical_size[1]}, "
+                f"display is {width}×{height}"
+            )
+        return layout
+    
+    def create_color_correction(self):
+        """
+        Build the output ColorCorrection from the display.color_correction
+        config, if any.
+        
+        Returns:
+            ColorCorrection, or None when no correction is configured
+        """
+        config = self.config.get("display", {}).get("color_correction")
+        if not config:
+            return None
+        
+        from ..display import ColorCorrection
+        return ColorCorrection.from_config(config)
+    
     def initialize_inputs(self) -> bool:
         """
         Initialize input drivers.
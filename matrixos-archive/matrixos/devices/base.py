@@ -49,11 +49,69 @@ class DisplayDriver(ABC):
             for x in range(self.width):
                 self.set_pixel(x, y, color)
     
+    def fill_rect(self, x: int, y: int, width: int, height: int,
+                  color: Tuple[int, int, int] = (0, 0, 0)):
+        """Fill a rectangle, clipped to the display (default implementation)"""
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.width, x + width), min(self.height, y + height)
+        for py in range(y0, y1):
+            for px in range(x0, x1):
+                self.set_pixel(px, py, color)
+    
+    def hline(self, x: int, y: int, width: int, color: Tuple[int, int, int] = (0, 0, 0)):
+        """Draw a horizontal line of `width` pixels (clipped)"""
+        self.fill_rect(x, y, width, 1, color)
+    
+    def vline(self, x: int, y: int, height: int, color: Tuple[int, int, int] = (0, 0, 0)):
+        """Draw a vertical line of `height` pixels (clipped)"""
+        self.fill_rect(x, y, 1, height, color)
+    
+    def fill_span(self, y: int, x0: int, x1: int, color: Tuple[int, int, int] = (0, 0, 0)):
+        """Fill one scanline span from x0 to x1 inclusive (either order, clipped)"""
+        if x0 > x1:
+            x0, x1 = x1, x0
+        self.fill_rect(x0, y, x1 - x0 + 1, 1, color)
+    
+    def add_damage(self, x: int, y: int, width: int, height: int):
+        """
+        Mark a region as changed so the next show() repaints it.
+        
+        Default implementation does nothing: drivers without damage
+        tracking repaint the whole display on every show().
+        """
+        pass
+    
+    def take_damage(self) -> List[Tuple[int, int, int, int]]:
+        """
+        Get and reset the region changed since the last show().
+        
+        Returns:
+            list: (x, y, width, height) rectangles to repaint. The default
+                  implementation reports the whole display.
+        """
+        return [(0, 0, self.width, self.height)]
+    
     @abstractmethod
     def show(self):
         """Push buffer to actual display hardware"""
         pass
     
+    def present(self, frame):
+        """
+        Output a complete frame owned by the caller (e.g. LEDMatrix's front buffer).
+        
+        The frame must not be modified until present() returns. Drivers that
+        can render straight from a Display override this; the default copies
+        every pixel into the driver's own buffer and calls show().
+        
+        Args:
+            frame: Display with the same width and height as this driver
+        """
+        for y in range(self.height):
+            for x in range(self.width):
+                self.set_pixel(x, y, frame.get_pixel(x, y))
+        self.show()
+    
     @abstractmethod
     def cleanup(self):
         """Release resources and cleanup"""
@@ -2,5 +2,11 @@
 
 from .terminal import TerminalDisplayDriver
 from .macos_window import MacOSWindowDriver
+from .shared_memory import SharedMemoryDisplayDriver, run_output_loop
+from .panel_layout import PanelLayout, PanelMappedDisplayDriver
+from .bitplane import BitplaneEncoder, BitplaneDisplayDriver, BitplaneSink, FileSink
 
-__all__ = ['TerminalDisplayDriver', 'MacOSWindowDriver']
+__all__ = ['TerminalDisplayDriver', 'MacOSWindowDriver',
+           'SharedMemoryDisplayDriver', 'run_output_loop',
+           'PanelLayout', 'PanelMappedDisplayDriver',
+           'BitplaneEncoder', 'BitplaneDisplayDriver', 'BitplaneSink', 'FileSink']
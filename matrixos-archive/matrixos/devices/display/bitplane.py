@@ -0,0 +1,335 @@
+"""
+Bit-plane (BCM) Encoder Output Stage
+
+Turns RGB frames into binary-coded-modulation bit-planes for LED panels
+driven from a plain GPIO/SPI bitstream. Each colour channel goes through a
+gamma LUT to a `bits`-bit value; bit-plane p holds bit p of every value and
+is shown for 2**p time units, so the planes together give `bits`-bit PWM.
+
+HUB75 panels light two rows at once (one in the top half and one in the
+bottom half), so the encoder produces one packed row buffer per scan row and
+plane - one byte per column, ready to shift out:
+
+    bit 0 R1   bit 1 G1   bit 2 B1     (row y, top half)
+    bit 3 R2   bit 4 G2   bit 5 B2     (row y + scan_rows, bottom half)
+
+Encoding is incremental: a scan row whose pixels are unchanged since the
+last frame keeps its encoded planes. Finished frames go to a pluggable
+BitplaneSink; FileSink records them for offline checking and benchmarks
+(python -m matrixos.tools.benchmark_bitplane).
+
+File format (little-endian): a header '<4sHHHH' (b'MXBP', version, width,
+scan_rows, bits), then per frame, for each scan row, its `bits` plane
+buffers of `width` bytes each.
+"""
+
+import struct
+import time
+from typing import List, Optional, Tuple
+from ..base import DisplayDriver
+from ...display import Display
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional - the pure Python encoder is the fallback
+    numpy = None
+
+
+MAGIC = b'MXBP'
+VERSION = 1
+HEADER_FORMAT = '<4sHHHH'
+
+
+def gamma_lut(bits: int = 8, gamma: float = 2.2) -> List[int]:
+    """
+    Map 8-bit channel values to gamma-corrected `bits`-bit values.
+
+    Args:
+        bits: Output bit depth (number of bit-planes)
+        gamma: Gamma exponent (1.0 = linear)
+
+    Returns:
+        list of 256 ints in 0..2**bits - 1
+    """
+    top = (1 << bits) - 1
+    return [int(round((v / 255) ** gamma * top)) for v in range(256)]
+
+
+class BitplaneEncoder:
+    """Incremental RGB to packed BCM bit-plane encoder"""
+
+    def __init__(self, width: int, height: int, bits: int = 8, gamma: float = 2.2,
+                 scan_rows: Optional[int] = None):
+        """
+        Args:
+            width: Panel chain width in pixels
+            height: Panel height in pixels
+            bits: Number of bit-planes (1-16)
+            gamma: Gamma exponent for the LUT
+            scan_rows: Rows addressed by the panel; height // 2 for HUB75
+                       (two rows lit at once), or height for one row at a time
+        """
+        if not 1 <= bits <= 16:
+            raise ValueError(f"bits must be 1-16, not {bits}")
+        if scan_rows is None:
+            scan_rows = height // 2 if height > 1 else height
+        if height not in (scan_rows, scan_rows * 2):
+            raise ValueError(f"A {height}-row panel cannot use {scan_rows} scan rows")
+
+        self.width = width
+        self.height = height
+        self.bits = bits
+        self.gamma = gamma
+        self.scan_rows = scan_rows
+        self.halves = height // scan_rows
+        self.lut = gamma_lut(bits, gamma)
+
+        blank = bytes(width)
+        self.rows: List[List[bytes]] = [[blank] * bits for _ in range(scan_rows)]
+        self._sources: List[Optional[bytes]] = [None] * scan_rows
+
+        # Statistics
+        self.frames = 0
+        self.rows_encoded = 0
+        self.rows_reused = 0
+        self.last_encode_ms = 0.0
+        self.total_encode_ms = 0.0
+
+        if numpy is not None:
+            self._lut_array = numpy.array(self.lut, dtype=numpy.uint16)
+            self._plane_shifts = numpy.arange(bits, dtype=numpy.uint16).reshape(-1, 1, 1)
+            self._pin_shifts = numpy.arange(self.halves * 3, dtype=numpy.uint16)
+        else:
+            # spread[pin][v] has bit p of lut[v] at bit `pin` of byte p, so
+            # OR-ing a column's six pins gives all its plane bytes at once
+            self._spread = [
+                [sum(((value >> p) & 1) << (8 * p + pin) for p in range(bits))
+                 for value in self.lut]
+                for pin in range(self.halves * 3)
+            ]
+
+    def _row_source(self, buffer, row: int) -> bytes:
+        """Pixel bytes of both rows driven by scan row `row`"""
+        stride = self.width * 3
+        start = row * stride
+        if self.halves == 1:
+            return bytes(buffer[start:start + stride])
+        lower = start + self.scan_rows * stride
+        return bytes(buffer[start:start + stride]) + bytes(buffer[lower:lower + stride])
+
+    def encode(self, buffer) -> int:
+        """
+        Encode an RGB frame, reusing the planes of unchanged scan rows.
+
+        Args:
+            buffer: RGB888 frame bytes (Display.buffer layout)
+
+        Returns:
+            int: Number of scan rows re-encoded
+        """
+        start = time.perf_counter()
+
+        dirty = []
+        for row in range(self.scan_rows):
+            source = self._row_source(buffer, row)
+            if source != self._sources[row]:
+                self._sources[row] = source
+                dirty.append(row)
+
+        if dirty:
+            if numpy is not None:
+                self._encode_numpy(dirty)
+            else:
+                for row in dirty:
+                    self.rows[row] = self._encode_row(self._sources[row])
+
+        self.frames += 1
+        self.rows_encoded += len(dirty)
+        self.rows_reused += self.scan_rows - len(dirty)
+        self.last_encode_ms = (time.perf_counter() - start) * 1000
+        self.total_encode_ms += self.last_encode_ms
+        return len(dirty)
+
+    def _encode_row(self, source: bytes) -> List[bytes]:
+        """Pure Python: pack one scan row into its plane buffers"""
+        width, bits = self.width, self.bits
+        channels = [source[c::3] for c in range(3)]
+        if self.halves == 1:
+            r1, g1, b1 = channels
+            t0, t1, t2 = self._spread
+            words = [t0[r] | t1[g] | t2[b] for r, g, b in zip(r1, g1, b1)]
+        else:
+            t0, t1, t2, t3, t4, t5 = self._spread
+            r, g, b = channels
+            words = [t0[r1] | t1[g1] | t2[b1] | t3[r2] | t4[g2] | t5[b2]
+                     for r1, g1, b1, r2, g2, b2 in zip(r[:width], g[:width], b[:width],
+                                                       r[width:], g[width:], b[width:])]
+        packed = b''.join(word.to_bytes(bits, 'little') for word in words)
+        return [packed[p::bits] for p in range(bits)]
+
+    def _encode_numpy(self, dirty: List[int]):
+        """NumPy: pack every dirty scan row in one pass"""
+        sources = numpy.frombuffer(b''.join(self._sources[row] for row in dirty),
+                                   dtype=numpy.uint8)
+        # (rows, halves, width, rgb) -> (rows, width, pins)
+        pixels = sources.reshape(len(dirty), self.halves, self.width, 3)
+        pins = self._lut_array[pixels].transpose(0, 2, 1, 3).reshape(
+            len(dirty), self.width, self.halves * 3
+        )
+        # (rows, bits, width, pins) -> one byte per column and plane
+        planes = (pins[:, None] >> self._plane_shifts) & 1
+        packed = (planes << self._pin_shifts).sum(axis=3, dtype=numpy.uint8)
+        for i, row in enumerate(dirty):
+            self.rows[row] = [plane.tobytes() for plane in packed[i]]
+
+    def get_stats(self) -> dict:
+        """Encode statistics"""
+        return {
+            'frames': self.frames,
+            'rows_encoded': self.rows_encoded,
+            'rows_reused': self.rows_reused,
+            'last_encode_ms': self.last_encode_ms,
+            'average_encode_ms': self.total_encode_ms / self.frames if self.frames else 0.0,
+        }
+
+
+class BitplaneSink:
+    """
+    Destination for encoded frames (the default discards them).
+
+    Subclass for GPIO/SPI output: write() receives encoder.rows, a list of
+    scan rows, each a list of `bits` packed plane buffers.
+    """
+
+    def open(self, width: int, scan_rows: int, bits: int):
+        """Called once before the first frame"""
+        pass
+
+    def write(self, rows: List[List[bytes]]):
+        """Output one encoded frame"""
+        pass
+
+    def close(self):
+        """Release resources"""
+        pass
+
+
+class FileSink(BitplaneSink):
+    """Records encoded frames to a file (format in the module docs)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file = None
+
+    def open(self, width: int, scan_rows: int, bits: int):
+        self.file = open(self.path, 'wb')
+        self.file.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, width, scan_rows, bits))
+
+    def write(self, rows: List[List[bytes]]):
+        self.file.write(b''.join(b''.join(planes) for planes in rows))
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+    @staticmethod
+    def read(path: str) -> Tuple[Tuple[int, int, int], List[List[List[bytes]]]]:
+        """
+        Load a recorded file.
+
+        Returns:
+            tuple: ((width, scan_rows, bits), frames), each frame laid out
+                   like encoder.rows
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+        magic, version, width, scan_rows, bits = struct.unpack_from(HEADER_FORMAT, data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"'{path}' is not a MatrixOS bit-plane file")
+
+        offset = struct.calcsize(HEADER_FORMAT)
+        frames = []
+        while offset < len(data):
+            rows = []
+            for _ in range(scan_rows):
+                rows.append([data[offset + p * width:offset + (p + 1) * width]
+                             for p in range(bits)])
+                offset += bits * width
+            frames.append(rows)
+        return (width, scan_rows, bits), frames
+
+
+class BitplaneDisplayDriver(DisplayDriver):
+    """
+    Display driver that encodes frames to BCM bit-planes for a sink.
+
+    Keeps its own RGB buffer like the other drivers; present() encodes a
+    caller-owned frame directly.
+    """
+
+    def __init__(self, width: int, height: int, sink: Optional[BitplaneSink] = None,
+                 bits: int = 8, gamma: float = 2.2, scan_rows: Optional[int] = None,
+                 **kwargs):
+        super().__init__(width, height)
+        self.name = "Bit-plane Encoder"
+        self.sink = sink if sink is not None else BitplaneSink()
+        self.encoder = BitplaneEncoder(width, height, bits, gamma, scan_rows)
+        self.display = Display(width, height, color_mode='rgb')
+        # Bit-plane driver ignores scale and pixel_gap settings
+
+    def initialize(self) -> bool:
+        """Open the sink"""
+        self.sink.open(self.width, self.encoder.scan_rows, self.encoder.bits)
+        return True
+
+    def set_pixel(self, x: int, y: int, color: Tuple[int, int, int]):
+        """Set a single pixel"""
+        self.display.set_pixel(x, y, color)
+
+    def get_pixel(self, x: int, y: int) -> Tuple[int, int, int]:
+        """Get pixel color"""
+        return self.display.get_pixel(x, y)
+
+    def clear(self):
+        """Clear the display"""
+        self.display.clear()
+
+    def fill(self, color=(0, 0, 0)):
+        """Fill display with color"""
+        self.display.fill(color)
+
+    def fill_rect(self, x: int, y: int, width: int, height: int, color=(0, 0, 0)):
+        """Fill a rectangle (clipped) with row slices"""
+        self.display.fill_rect(x, y, width, height, color)
+
+    def hline(self, x: int, y: int, width: int, color=(0, 0, 0)):
+        """Draw a horizontal line (clipped)"""
+        self.display.hline(x, y, width, color)
+
+    def vline(self, x: int, y: int, height: int, color=(0, 0, 0)):
+        """Draw a vertical line (clipped)"""
+        self.display.vline(x, y, height, color)
+
+    def fill_span(self, y: int, x0: int, x1: int, color=(0, 0, 0)):
+        """Fill a scanline span from x0 to x1 inclusive (clipped)"""
+        self.display.fill_span(y, x0, x1, color)
+
+    def show(self):
+        """Encode and output the driver's own buffer"""
+        self.present(self.display)
+
+    def present(self, frame):
+        """Encode a frame (unchanged scan rows are reused) and write it to the sink"""
+        frame.take_damage()
+        self.encoder.encode(frame.buffer)
+        self.sink.write(self.encoder.rows)
+
+    def cleanup(self):
+        """Close the sink"""
+        self.sink.close()
+
+    @classmethod
+    def get_priority(cls) -> int:
+        """Never auto-selected - needs a sink for the target hardware"""
+        return 0
@@ -3,11 +3,23 @@ macOS Window Display Driver
 
 Uses Pygame to create a native window displaying the LED matrix.
 Pixels are scaled 2x for better visibility (256x192 -> 512x384 window).
+
+Frames are uploaded in one call (pygame.image.frombuffer over the flat RGB
+buffer), scaled with pygame.transform.scale and, when pixel_gap is set,
+covered by a cached mask surface that paints the gaps between LEDs. Only
+damaged rectangles are scaled and passed to pygame.display.update().
+
+Works with SDL_VIDEODRIVER=dummy for headless tests and benchmarks.
 """
 
 import pygame
 from typing import Tuple
 from ..base import DisplayDriver
+from ...display import Display
+
+
+# Colour key for the transparent (LED) area of the pixel gap mask
+MASK_KEY = (255, 0, 255)
 
 
 class MacOSWindowDriver(DisplayDriver):
@@ -22,9 +34,13 @@ class MacOSWindowDriver(DisplayDriver):
         self.window_width = width * scale
         self.window_height = height * scale
         self.screen = None
-        self.buffer = None
+        self.display = None  # Flat RGB framebuffer with damage tracking
+        self.presented = None  # Copy of the frame currently in the window
+        self.needs_full_repaint = True
         self.current_scale = scale  # Track current scale for resizing
         self.aspect_ratio = width / height  # Store aspect ratio for proportional resizing
+        self.gap_mask = None  # Cached pixel gap overlay for the current scale
+        self.gap_mask_key = None
         
         # Debug output
         print(f"[MacOSWindowDriver] Init: width={width}, height={height}, scale={scale}, pixel_gap={pixel_gap}")
@@ -41,7 +57,8 @@ class MacOSWindowDriver(DisplayDriver):
             pygame.display.set_caption("MatrixOS - ZX Spectrum Edition")
             
             # Create pixel buffer
-            self.buffer = [[(0, 0, 0) for _ in range(self.width)] for _ in range(self.height)]
+            self.display = Display(self.width, self.height, color_mode='rgb')
+            self.presented = bytearray(len(self.display.buffer))
             
             # Clear to black
             self.clear()
@@ -54,32 +71,54 @@ class MacOSWindowDriver(DisplayDriver):
     
     def set_pixel(self, x: int, y: int, color: Tuple[int, int, int]):
         """Set pixel in buffer"""
-        if 0 <= x < self.width and 0 <= y < self.height:
-            self.buffer[y][x] = color
+        self.display.set_pixel(x, y, color)
     
     def get_pixel(self, x: int, y: int) -> Tuple[int, int, int]:
         """Get pixel from buffer"""
-        if 0 <= x < self.width and 0 <= y < self.height:
-            return self.buffer[y][x]
-        return (0, 0, 0)
+        return self.display.get_pixel(x, y)
     
     def clear(self):
         """Clear buffer to black"""
-        for y in range(self.height):
-            for x in range(self.width):
-                self.buffer[y][x] = (0, 0, 0)
+        self.display.clear()
     
     def fill(self, color=(0, 0, 0)):
         """Fill buffer with color"""
-        for y in range(self.height):
-            for x in range(self.width):
-                self.buffer[y][x] = color
+        self.display.fill(color)
+    
+    def fill_rect(self, x: int, y: int, width: int, height: int, color=(0, 0, 0)):
+        """Fill a rectangle (clipped) with row slices"""
+        self.display.fill_rect(x, y, width, height, color)
+    
+    def hline(self, x: int, y: int, width: int, color=(0, 0, 0)):
+        """Draw a horizontal line (clipped)"""
+        self.display.hline(x, y, width, color)
+    
+    def vline(self, x: int, y: int, height: int, color=(0, 0, 0)):
+        """Draw a vertical line (clipped)"""
+        self.display.vline(x, y, height, color)
+    
+    def fill_span(self, y: int, x0: int, x1: int, color=(0, 0, 0)):
+        """Fill a scanline span from x0 to x1 inclusive (clipped)"""
+        self.display.fill_span(y, x0, x1, color)
+    
+    def add_damage(self, x: int, y: int, width: int, height: int):
+        """Mark a region as changed"""
+        self.display.add_damage(x, y, width, height)
+    
+    def take_damage(self):
+        """Get and reset the region that differs from what is in the window"""
+        return self.display.take_damage(self.presented)
     
     def show(self):
         """
         Render buffer to Pygame window.
-        Each LED pixel is drawn as a scaled rectangle with optional gap.
+        The frame is scaled up as a whole, with the optional LED gap mask on top.
+        Only damaged regions are redrawn, unless the window was resized.
         """
+        self.present(self.display)
+    
+    def present(self, frame):
+        """Render an external frame buffer (e.g. LEDMatrix's front buffer) to the window"""
         if self.screen is None:
             return
         
@@ -110,37 +149,77 @@ class MacOSWindowDriver(DisplayDriver):
                     print(f"[Resize] Snapping to: {new_width}×{new_height}")
                     
                     self.screen = pygame.display.set_mode((new_width, new_height), pygame.RESIZABLE)
+                    self.needs_full_repaint = True
         
-        # Draw pixels based on gap setting
-        if self.pixel_gap > 0:
-            # LED matrix mode: clear background and draw pixels with gaps
-            self.screen.fill((0, 0, 0))
-            pixel_size = max(1, self.current_scale - self.pixel_gap)
-            
-            for y in range(self.height):
-                for x in range(self.width):
-                    color = self.buffer[y][x]
-                    # Use fill instead of draw.rect to avoid antialiasing
-                    rect = pygame.Rect(
-                        x * self.current_scale,
-                        y * self.current_scale,
-                        pixel_size,
-                        pixel_size
-                    )
-                    self.screen.fill(color, rect)
+        if self.needs_full_repaint:
+            frame.take_damage()
+            self.presented[:] = frame.buffer
+            rects = [(0, 0, self.width, self.height)]
         else:
-            # Full pixel mode: no gaps, draw solid blocks without any spacing
+            rects = frame.take_damage(self.presented)
+            if not rects:
+                return
+        
+        scale = self.current_scale
+        source = self._frame_surface(frame)
+        mask = self._gap_mask()
+        
+        screen_rects = []
+        for rx, ry, rw, rh in rects:
+            dest = pygame.Rect(rx * scale, ry * scale, rw * scale, rh * scale)
+            region = source.subsurface((rx, ry, rw, rh))
+            self.screen.blit(pygame.transform.scale(region, dest.size), dest)
+            if mask is not None:
+                # LED matrix look: black gaps on top, LEDs show through the key
+                self.screen.blit(mask, dest, dest)
+            screen_rects.append(dest)
+        
+        if self.needs_full_repaint:
+            pygame.display.flip()
+            self.needs_full_repaint = False
+        else:
+            pygame.display.update(screen_rects)
+    
+    def _frame_surface(self, frame):
+        """Wrap the frame's pixels in a Surface (no copy for RGB frames)"""
+        if frame.color_mode != 'rgb':
+            # Mono frames: expand to RGB first
+            rgb = Display(self.width, self.height, color_mode='rgb')
             for y in range(self.height):
-                y_pos = y * self.current_scale
                 for x in range(self.width):
-                    x_pos = x * self.current_scale
-                    color = self.buffer[y][x]
-                    
-                    # Use pygame.draw.rect instead of surface.fill for guaranteed solid blocks
-                    pygame.draw.rect(self.screen, color, 
-                                   (x_pos, y_pos, self.current_scale, self.current_scale), 0)
+                    rgb.set_pixel(x, y, frame.get_pixel(x, y))
+            frame = rgb
+        return pygame.image.frombuffer(frame.buffer, (self.width, self.height), 'RGB')
+    
+    def _gap_mask(self):
+        """
+        Get the window-sized overlay that blacks out the gaps between LEDs.
         
-        pygame.display.flip()
+        Built once per (scale, pixel_gap); LED areas are the colour key, so
+        blitting it only touches gap pixels.
+        
+        Returns:
+            pygame.Surface, or None when there are no gaps to draw
+        """
+        scale = self.current_scale
+        pixel_size = max(1, scale - self.pixel_gap)
+        if self.pixel_gap <= 0 or pixel_size >= scale:
+            return None
+        
+        key = (scale, self.pixel_gap)
+        if self.gap_mask_key != key:
+            width, height = self.width * scale, self.height * scale
+            gap = scale - pixel_size
+            mask = pygame.Surface((width, height))
+            mask.fill(MASK_KEY)
+            for x in range(self.width):
+                mask.fill((0, 0, 0), pygame.Rect(x * scale + pixel_size, 0, gap, height))
+            for y in range(self.height):
+                mask.fill((0, 0, 0), pygame.Rect(0, y * scale + pixel_size, width, gap))
+            mask.set_colorkey(MASK_KEY, pygame.RLEACCEL)
+            self.gap_mask = mask
+            self.gap_mask_key = key
+        return self.gap_mask
     
     def cleanup(self):
         """Cleanup Pygame"""
@@ -0,0 +1,272 @@
+"""
+HUB75 Panel Layout
+
+Maps the logical display onto a chain of HUB75 panels. A chain of N panels
+is driven as one long strip (N * panel_width x panel_height); PanelLayout
+describes where each panel of the chain sits on the wall and which way up
+it is mounted, and turns that into a flat permutation computed once:
+
+    physical[p] = logical[index[p]]
+
+Every frame is then remapped with a single gather pass (NumPy take() when
+available, otherwise one itemgetter call) instead of coordinate math per
+pixel.
+
+Layout options:
+    chain       'row-major' (default), 'column-major', or an explicit list
+                of [col, row] or [col, row, upside_down] grid positions,
+                one per panel in chain order
+    serpentine  Every other row (column for column-major) of panels runs
+                the opposite way, so the cable snakes back
+    u_mapping   Like serpentine, but panels on the returning rows are
+                mounted upside down (the chain folds back in a U)
+    rotation    0, 90, 180 or 270 degrees clockwise - how the image is
+                turned onto the wall
+
+Example (docs/HARDWARE.md 256x192 build, six 128x64 panels, 2 wide and
+3 high, cable snaking back on the middle row):
+
+    layout = PanelLayout(128, 64, cols=2, rows=3, u_mapping=True)
+    layout.logical_size    # (256, 192)
+    layout.physical_size   # (768, 64)
+"""
+
+import operator
+from typing import List, Optional, Tuple
+from ..base import DisplayDriver
+from ...display import Display
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional - itemgetter is the fallback
+    numpy = None
+
+
+class PanelLayout:
+    """Logical-to-physical pixel mapping for a chain of panels"""
+
+    def __init__(self, panel_width: int, panel_height: int, cols: int = 1, rows: int = 1,
+                 chain='row-major', serpentine: bool = False, u_mapping: bool = False,
+                 rotation: int = 0, bytes_per_pixel: int = 3):
+        """
+        Build the layout and its permutation.
+
+        Args:
+            panel_width, panel_height: Size of one panel
+            cols, rows: Panels across and down the wall
+            chain: Chain order (see module docs)
+            serpentine: Alternate direction on every other row/column
+            u_mapping: Serpentine with returning panels upside down
+            rotation: Image rotation onto the wall (0, 90, 180, 270)
+            bytes_per_pixel: Pixel size of the frames to remap (3 = RGB)
+        """
+        if rotation not in (0, 90, 180, 270):
+            raise ValueError(f"Rotation must be 0, 90, 180 or 270, not {rotation}")
+
+        self.panel_width = panel_width
+        self.panel_height = panel_height
+        self.cols = cols
+        self.rows = rows
+        self.rotation = rotation
+        self.bytes_per_pixel = bytes_per_pixel
+        self.panels = self._chain_positions(chain, serpentine or u_mapping, u_mapping)
+
+        wall_width, wall_height = cols * panel_width, rows * panel_height
+        if rotation in (90, 270):
+            self.logical_size = (wall_height, wall_width)
+        else:
+            self.logical_size = (wall_width, wall_height)
+        self.physical_size = (panel_width * len(self.panels), panel_height)
+
+        self.index = self._build_index()
+        self.is_identity = self.index == list(range(len(self.index)))
+        self._byte_index = None
+        self._gather = None
+        self._array_index = None
+
+    @classmethod
+    def from_config(cls, config: dict, bytes_per_pixel: int = 3) -> 'PanelLayout':
+        """
+        Create a layout from the display.panel_layout config section.
+
+        Args:
+            config: Dict with panel_width, panel_height and optional cols,
+                    rows, chain, serpentine, u_mapping, rotation
+            bytes_per_pixel: Pixel size of the frames to remap
+        """
+        return cls(
+            config["panel_width"], config["panel_height"],
+            cols=config.get("cols", 1), rows=config.get("rows", 1),
+            chain=config.get("chain", "row-major"),
+            serpentine=config.get("serpentine", False),
+            u_mapping=config.get("u_mapping", False),
+            rotation=config.get("rotation", 0),
+            bytes_per_pixel=bytes_per_pixel
+        )
+
+    def _chain_positions(self, chain, serpentine: bool,
+                         upside_down_returns: bool) -> List[Tuple[int, int, bool]]:
+        """(col, row, upside_down) of each panel, in chain order"""
+        if not isinstance(chain, str):
+            panels = []
+            for entry in chain:
+                col, row = entry[0], entry[1]
+                if not (0 <= col < self.cols and 0 <= row < self.rows):
+                    raise ValueError(f"Panel position {entry} is outside the {self.cols}x{self.rows} grid")
+                panels.append((col, row, bool(entry[2]) if len(entry) > 2 else False))
+            return panels
+
+        if chain not in ('row-major', 'column-major'):
+            raise ValueError(f"Unknown chain order: {chain}")
+
+        panels = []
+        if chain == 'row-major':
+            for row in range(self.rows):
+                returning = serpentine and row % 2 == 1
+                cols = range(self.cols - 1, -1, -1) if returning else range(self.cols)
+                for col in cols:
+                    panels.append((col, row, returning and upside_down_returns))
+        else:
+            for col in range(self.cols):
+                returning = serpentine and col % 2 == 1
+                rows = range(self.rows - 1, -1, -1) if returning else range(self.rows)
+                for row in rows:
+                    panels.append((col, row, returning and upside_down_returns))
+        return panels
+
+    def _build_index(self) -> List[int]:
+        """Logical pixel index shown by each physical pixel"""
+        pw, ph = self.panel_width, self.panel_height
+        wall_width, wall_height = self.cols * pw, self.rows * ph
+        logical_width = self.logical_size[0]
+        rotation = self.rotation
+
+        index = [0] * (self.physical_size[0] * ph)
+        chain_width = self.physical_size[0]
+        for i, (col, row, upside_down) in enumerate(self.panels):
+            for v in range(ph):
+                for u in range(pw):
+                    if upside_down:
+                        cx = col * pw + pw - 1 - u
+                        cy = row * ph + ph - 1 - v
+                    else:
+                        cx = col * pw + u
+                        cy = row * ph + v
+
+                    # Wall position -> logical image position
+                    if rotation == 0:
+                        lx, ly = cx, cy
+                    elif rotation == 90:
+                        lx, ly = cy, wall_width - 1 - cx
+                    elif rotation == 180:
+                        lx, ly = wall_width - 1 - cx, wall_height - 1 - cy
+                    else:
+                        lx, ly = wall_height - 1 - cy, cx
+
+                    index[v * chain_width + i * pw + u] = ly * logical_width + lx
+        return index
+
+    def remap(self, frame, out: Optional[bytearray] = None) -> bytearray:
+        """
+        Reorder a logical frame into physical chain order.
+
+        Args:
+            frame: Logical frame bytes (Display.buffer layout)
+            out: Optional destination of the same size
+
+        Returns:
+            bytearray in physical chain order
+        """
+        if out is None:
+            out = bytearray(len(frame))
+        if self.is_identity:
+            out[:] = frame
+            return out
+
+        if numpy is not None:
+            if self._array_index is None:
+                self._array_index = numpy.array(self.index, dtype=numpy.intp)
+            bpp = self.bytes_per_pixel
+            pixels = numpy.frombuffer(frame, dtype=numpy.uint8).reshape(-1, bpp)
+            target = numpy.frombuffer(out, dtype=numpy.uint8).reshape(-1, bpp)
+            numpy.take(pixels, self._array_index, axis=0, out=target)
+            return out
+
+        if self._gather is None:
+            bpp = self.bytes_per_pixel
+            self._byte_index = [i * bpp + b for i in self.index for b in range(bpp)]
+            self._gather = operator.itemgetter(*self._byte_index)
+        out[:] = bytes(self._gather(frame))
+        return out
+
+
+class PanelMappedDisplayDriver(DisplayDriver):
+    """
+    Display driver that remaps frames through a PanelLayout.
+
+    Apps draw at the logical size; every presented frame is gathered into
+    physical chain order and handed to the wrapped driver, which is sized
+    to the physical chain.
+    """
+
+    def __init__(self, output_driver: DisplayDriver, layout: PanelLayout):
+        width, height = layout.logical_size
+        super().__init__(width, height)
+        self.output_driver = output_driver
+        self.layout = layout
+        self.name = f"{output_driver.name} (panel layout)"
+        self.platform = output_driver.platform
+        self.display = Display(width, height, color_mode='rgb')
+        self.physical = Display(*layout.physical_size, color_mode='rgb')
+
+    def initialize(self) -> bool:
+        """Initialize the wrapped driver"""
+        return self.output_driver.initialize()
+
+    def set_pixel(self, x: int, y: int, color: Tuple[int, int, int]):
+        """Set a single pixel"""
+        self.display.set_pixel(x, y, color)
+
+    def get_pixel(self, x: int, y: int) -> Tuple[int, int, int]:
+        """Get pixel color"""
+        return self.display.get_pixel(x, y)
+
+    def clear(self):
+        """Clear the display"""
+        self.display.clear()
+
+    def fill(self, color=(0, 0, 0)):
+        """Fill display with color"""
+        self.display.fill(color)
+
+    def fill_rect(self, x: int, y: int, width: int, height: int, color=(0, 0, 0)):
+        """Fill a rectangle (clipped) with row slices"""
+        self.display.fill_rect(x, y, width, height, color)
+
+    def hline(self, x: int, y: int, width: int, color=(0, 0, 0)):
+        """Draw a horizontal line (clipped)"""
+        self.display.hline(x, y, width, color)
+
+    def vline(self, x: int, y: int, height: int, color=(0, 0, 0)):
+        """Draw a vertical line (clipped)"""
+        self.display.vline(x, y, height, color)
+
+    def fill_span(self, y: int, x0: int, x1: int, color=(0, 0, 0)):
+        """Fill a scanline span from x0 to x1 inclusive (clipped)"""
+        self.display.fill_span(y, x0, x1, color)
+
+    def show(self):
+        """Remap and output the driver's own buffer"""
+        self.present(self.display)
+
+    def present(self, frame):
+        """Remap a logical frame into chain order and present it"""
+        frame.take_damage()
+        self.layout.remap(frame.buffer, self.physical.buffer)
+        # The output driver narrows this down against what it last showed
+        self.physical.mark_all_damaged()
+        self.output_driver.present(self.physical)
+
+    def cleanup(self):
+        """Cleanup the wrapped driver"""
+        self.output_driver.cleanup()
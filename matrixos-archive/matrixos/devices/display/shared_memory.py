@@ -0,0 +1,382 @@
+"""
+Shared Memory Display Driver
+
+Display server mode: apps publish finished frames into a framebuffer that
+lives in shared memory, and a separate output process reads them and drives
+the real DisplayDriver (terminal, pygame window, HUB75 panel...). Panel
+refresh then no longer competes with app logic for the same core and GIL.
+
+Shared memory layout (little-endian):
+
+    offset 0   4s  magic b'MXFB'
+    offset 4   H   layout version
+    offset 6   H   width
+    offset 8   H   height
+    offset 10  H   bytes per pixel (3 = RGB888)
+    offset 16  Q   frame sequence counter
+    offset 32      pixels, row-major, same layout as Display.buffer
+
+The sequence counter works as a seqlock: it is odd while the writer is
+copying a frame and even once the frame is complete, so the reader can
+detect (and retry) torn reads. Pixels are copied without locking, but the
+counter is only read and written while holding a multiprocessing.Lock.
+Taking and releasing it is a full memory barrier, which a seqlock needs
+on weakly ordered CPUs like the Pi's ARM cores: without it the counter
+stores can become visible out of order with the pixel stores, and a torn
+frame can pass the check. The lock can't be found by name, so it is
+handed to the output process when it starts. Readers that attach by
+name alone get no barrier; that is fine on x86 but can show torn frames
+on ARM.
+"""
+
+import multiprocessing
+import struct
+import time
+from contextlib import nullcontext
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+from ..base import DisplayDriver
+from ...display import Display
+
+
+MAGIC = b'MXFB'
+VERSION = 1
+HEADER_FORMAT = '<4sHHHH'
+SEQUENCE_OFFSET = 16
+HEADER_SIZE = 32
+
+
+class SharedFramebuffer:
+    """A frame buffer in shared memory with a frame sequence counter"""
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool, lock=None):
+        self.shm = shm
+        self.owner = owner  # Creator unlinks the segment on close
+        self.lock = lock  # Guards the sequence counter (None = no barrier)
+        self._barrier = lock if lock is not None else nullcontext()
+
+        magic, version, width, height, bpp = struct.unpack_from(
+            HEADER_FORMAT, shm.buf, 0
+        )
+        if magic != MAGIC or version != VERSION:
+            shm.close()
+            raise ValueError(f"'{shm.name}' is not a MatrixOS framebuffer")
+
+        self.width = width
+        self.height = height
+        self.bytes_per_pixel = bpp
+        self.frame_size = width * height * bpp
+        self.pixels = shm.buf[HEADER_SIZE:HEADER_SIZE + self.frame_size]
+
+    @classmethod
+    def create(cls, width: int, height: int, name: Optional[str] = None,
+               bytes_per_pixel: int = 3, lock=None) -> 'SharedFramebuffer':
+        """
+        Create a new shared framebuffer.
+
+        Args:
+            width: Frame width in pixels
+            height: Frame height in pixels
+            name: Shared memory name, or None for a unique generated name
+            bytes_per_pixel: 3 for RGB888, 1 for mono
+            lock: multiprocessing.Lock guarding the sequence counter
+                  (default: a new one; pass it on to readers)
+
+        Returns:
+            SharedFramebuffer that owns the segment
+        """
+        size = HEADER_SIZE + width * height * bytes_per_pixel
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        struct.pack_into(HEADER_FORMAT, shm.buf, 0,
+                         MAGIC, VERSION, width, height, bytes_per_pixel)
+        struct.pack_into('<Q', shm.buf, SEQUENCE_OFFSET, 0)
+        if lock is None:
+            lock = multiprocessing.Lock()
+        return cls(shm, owner=True, lock=lock)
+
+    @classmethod
+    def attach(cls, name: str, lock=None) -> 'SharedFramebuffer':
+        """
+        Attach to an existing shared framebuffer by name.
+
+        Args:
+            name: Shared memory name
+            lock: The creator's lock (see the module docstring for why
+                  readers should have it)
+        """
+        return cls(shared_memory.SharedMemory(name=name), owner=False, lock=lock)
+
+    @property
+    def name(self) -> str:
+        """Shared memory name to pass to the output process"""
+        return self.shm.name
+
+    @property
+    def sequence(self) -> int:
+        """Current frame sequence counter (even = frame complete)"""
+        with self._barrier:
+            return struct.unpack_from('<Q', self.shm.buf, SEQUENCE_OFFSET)[0]
+
+    def publish(self, data) -> int:
+        """
+        Publish a complete frame.
+
+        Args:
+            data: Bytes-like frame in Display.buffer layout
+
+        Returns:
+            int: Sequence number of the published frame
+        """
+        if len(data) != self.frame_size:
+            raise ValueError(
+                f"Frame is {len(data)} bytes, framebuffer holds {self.frame_size}"
+            )
+
+        with self._barrier:
+            sequence = struct.unpack_from('<Q', self.shm.buf, SEQUENCE_OFFSET)[0] & ~1
+            struct.pack_into('<Q', self.shm.buf, SEQUENCE_OFFSET, sequence + 1)
+        self.pixels[:] = data
+        with self._barrier:
+            struct.pack_into('<Q', self.shm.buf, SEQUENCE_OFFSET, sequence + 2)
+        return sequence + 2
+
+    def read_into(self, buffer: bytearray, last_sequence: int = 0,
+                  retries: int = 8) -> Optional[int]:
+        """
+        Copy the latest complete frame into a local buffer.
+
+        Args:
+            buffer: Destination with the same size as the frame
+            last_sequence: Sequence of the frame the caller already has
+            retries: How often to retry a read torn by a concurrent publish
+
+        Returns:
+            int: Sequence of the frame copied, or None if there is no new frame
+        """
+        for _ in range(retries):
+            before = self.sequence
+            if before == last_sequence:
+                return None
+            if before & 1:
+                continue  # Writer is mid-frame
+            buffer[:] = self.pixels
+            if self.sequence == before:
+                return before
+        return None
+
+    def close(self):
+        """Detach from the segment (and remove it if we created it)"""
+        if self.shm is None:
+            return
+        self.pixels.release()
+        self.shm.close()
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+        self.shm = None
+
+
+def run_output_loop(name: str, driver: DisplayDriver, stop_event=None,
+                    poll_interval: float = 0.001,
+                    max_frames: Optional[int] = None, lock=None) -> int:
+    """
+    Output side of display server mode: show frames as they are published.
+
+    Attaches to the shared framebuffer, and every time a new frame appears
+    copies it out and hands it to driver.present(). Returns when stop_event
+    is set, after max_frames frames, or when the framebuffer goes away.
+
+    Args:
+        name: Shared framebuffer name (SharedMemoryDisplayDriver.shm_name)
+        driver: Initialized DisplayDriver that does the real output
+        stop_event: Optional Event (threading or multiprocessing) to stop on
+        poll_interval: Seconds to sleep when no new frame is ready
+        max_frames: Stop after this many frames (None = run until stopped)
+        lock: The framebuffer's lock (SharedMemoryDisplayDriver.shm_lock)
+
+    Returns:
+        int: Number of frames presented
+    """
+    framebuffer = SharedFramebuffer.attach(name, lock)
+    try:
+        mode = 'rgb' if framebuffer.bytes_per_pixel == 3 else 'mono'
+        frame = Display(framebuffer.width, framebuffer.height, color_mode=mode)
+        last_sequence = 0
+        frames = 0
+
+        while stop_event is None or not stop_event.is_set():
+            sequence = framebuffer.read_into(frame.buffer, last_sequence)
+            if sequence is None:
+                time.sleep(poll_interval)
+                continue
+
+            last_sequence = sequence
+            # Drivers narrow this down against what they last showed
+            frame.mark_all_damaged()
+            driver.present(frame)
+            frames += 1
+            if max_frames is not None and frames >= max_frames:
+                break
+
+        return frames
+    finally:
+        framebuffer.close()
+
+
+def _output_process_main(name: str, driver_class, width: int, height: int,
+                         driver_kwargs: dict, stop_event, lock):
+    """Entry point of the output process"""
+    driver = driver_class(width=width, height=height, **driver_kwargs)
+    if not driver.initialize():
+        print(f"[SharedMemoryDisplay] Output driver {driver.name} failed to initialize")
+        return
+    try:
+        run_output_loop(name, driver, stop_event, lock=lock)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        driver.cleanup()
+
+
+class SharedMemoryDisplayDriver(DisplayDriver):
+    """
+    App-side display driver that publishes frames to shared memory.
+
+    show()/present() only copy the frame into the shared framebuffer and bump
+    the sequence counter. If output_driver is given, initialize() also starts
+    an output process running that driver; otherwise any process can call
+    run_output_loop(driver.shm_name, ..., lock=driver.shm_lock) to display
+    the frames.
+    """
+
+    def __init__(self, width: int, height: int, output_driver=None,
+                 output_kwargs: Optional[dict] = None,
+                 shm_name: Optional[str] = None, **kwargs):
+        super().__init__(width, height)
+        self.name = "Shared Memory Display"
+        self.output_driver = output_driver
+        # Pass window settings (scale, pixel_gap) through to the real driver
+        self.output_kwargs = dict(kwargs, **(output_kwargs or {}))
+        self.requested_name = shm_name
+        self.display = None
+        self.framebuffer = None
+        self.process = None
+        self.stop_event = None
+
+    @property
+    def shm_name(self) -> Optional[str]:
+        """Name of the shared framebuffer for run_output_loop()"""
+        return self.framebuffer.name if self.framebuffer else None
+
+    @property
+    def shm_lock(self):
+        """Lock guarding the frame sequence counter, for run_output_loop()"""
+        return self.framebuffer.lock if self.framebuffer else None
+
+    def initialize(self) -> bool:
+        """Create the shared framebuffer and start the output process"""
+        try:
+            self.display = Display(self.width, self.height, color_mode='rgb')
+            self.framebuffer = SharedFramebuffer.create(
+                self.width, self.height, self.requested_name
+            )
+        except Exception as e:
+            print(f"[SharedMemoryDisplay] Initialization failed: {e}")
+            return False
+
+        if self.output_driver is not None:
+            self.stop_event = multiprocessing.Event()
+            self.process = multiprocessing.Process(
+                target=_output_process_main,
+                args=(self.framebuffer.name, self.output_driver,
+                      self.width, self.height, self.output_kwargs,
+                      self.stop_event, self.framebuffer.lock),
+                name="matrixos-display-output",
+                daemon=True
+            )
+            self.process.start()
+        return True
+
+    def set_pixel(self, x: int, y: int, color: Tuple[int, int, int]):
+        """Set a single pixel"""
+        if self.display:
+            self.display.set_pixel(x, y, color)
+
+    def get_pixel(self, x: int, y: int) -> Tuple[int, int, int]:
+        """Get pixel color"""
+        if self.display:
+            return self.display.get_pixel(x, y)
+        return (0, 0, 0)
+
+    def clear(self):
+        """Clear the display"""
+        if self.display:
+            self.display.clear()
+
+    def fill(self, color=(0, 0, 0)):
+        """Fill display with color"""
+        if self.display:
+            self.display.fill(color)
+
+    def fill_rect(self, x: int, y: int, width: int, height: int, color=(0, 0, 0)):
+        """Fill a rectangle (clipped) with row slices"""
+        if self.display:
+            self.display.fill_rect(x, y, width, height, color)
+
+    def hline(self, x: int, y: int, width: int, color=(0, 0, 0)):
+        """Draw a horizontal line (clipped)"""
+        if self.display:
+            self.display.hline(x, y, width, color)
+
+    def vline(self, x: int, y: int, height: int, color=(0, 0, 0)):
+        """Draw a vertical line (clipped)"""
+        if self.display:
+            self.display.vline(x, y, height, color)
+
+    def fill_span(self, y: int, x0: int, x1: int, color=(0, 0, 0)):
+        """Fill a scanline span from x0 to x1 inclusive (clipped)"""
+        if self.display:
+            self.display.fill_span(y, x0, x1, color)
+
+    def show(self):
+        """Publish the driver's own buffer"""
+        if self.display:
+            self.present(self.display)
+
+    def present(self, frame):
+        """Publish a complete frame for the output process"""
+        if not self.framebuffer:
+            return
+        # The output process diffs frames itself; damage is not shared
+        frame.take_damage()
+        self.framebuffer.publish(frame.buffer)
+
+    def cleanup(self):
+        """Stop the output process and release the shared framebuffer"""
+        if self.process is not None:
+            self.stop_event.set()
+            self.process.join(timeout=2.0)
+            if self.process.is_alive():
+                self.process.terminate()
+            self.process = None
+        if self.framebuffer is not None:
+            self.framebuffer.close()
+            self.framebuffer = None
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Needs a working multiprocessing.shared_memory"""
+        try:
+            shm = shared_memory.SharedMemory(create=True, size=HEADER_SIZE)
+        except Exception:
+            return False
+        shm.close()
+        shm.unlink()
+        return True
+
+    @classmethod
+    def get_priority(cls) -> int:
+        """Never auto-selected - enabled with display.output_process"""
+        return 0
@@ -6,7 +6,7 @@ Uses the existing Display and TerminalRenderer classes.
 """
 
 import sys
-from typing import Tuple
+from typing import Optional, Tuple
 from ..base import DisplayDriver
 from ...display import Display, TerminalRenderer
 
@@ -14,18 +14,23 @@ from ...display import Display, TerminalRenderer
 class TerminalDisplayDriver(DisplayDriver):
     """Display driver for terminal output using ANSI escape codes"""
     
-    def __init__(self, width: int, height: int, **kwargs):
+    def __init__(self, width: int, height: int, truecolor: Optional[bool] = None, **kwargs):
         super().__init__(width, height)
         self.name = "Terminal Display"
+        self.truecolor = truecolor  # None = detect from COLORTERM
         self.display = None
         self.renderer = None
+        self.presented = None  # Copy of the frame currently on screen
+        self.needs_full_repaint = True
         # Terminal driver ignores scale and pixel_gap settings
     
     def initialize(self) -> bool:
         """Initialize the terminal display"""
         try:
             self.display = Display(self.width, self.height, color_mode='rgb')
-            self.renderer = TerminalRenderer(self.display)
+            self.renderer = TerminalRenderer(self.display, truecolor=self.truecolor)
+            self.presented = bytearray(len(self.display.buffer))
+            self.needs_full_repaint = True
             return True
         except Exception as e:
             print(f"[TerminalDisplay] Initialization failed: {e}")
@@ -52,13 +57,65 @@ class TerminalDisplayDriver(DisplayDriver):
         if self.display:
             self.display.fill(color)
     
+    def fill_rect(self, x: int, y: int, width: int, height: int, color=(0, 0, 0)):
+        """Fill a rectangle (clipped) with row slices"""
+        if self.display:
+            self.display.fill_rect(x, y, width, height, color)
+    
+    def hline(self, x: int, y: int, width: int, color=(0, 0, 0)):
+        """Draw a horizontal line (clipped)"""
+        if self.display:
+            self.display.hline(x, y, width, color)
+    
+    def vline(self, x: int, y: int, height: int, color=(0, 0, 0)):
+        """Draw a vertical line (clipped)"""
+        if self.display:
+            self.display.vline(x, y, height, color)
+    
+    def fill_span(self, y: int, x0: int, x1: int, color=(0, 0, 0)):
+        """Fill a scanline span from x0 to x1 inclusive (clipped)"""
+        if self.display:
+            self.display.fill_span(y, x0, x1, color)
+    
+    def add_damage(self, x: int, y: int, width: int, height: int):
+        """Mark a region as changed"""
+        if self.display:
+            self.display.add_damage(x, y, width, height)
+    
+    def take_damage(self):
+        """Get and reset the region that differs from what is on screen"""
+        if not self.display:
+            return []
+        return self.display.take_damage(self.presented)
+    
     def show(self):
-        """Push buffer to terminal"""
-        if self.renderer:
-            self.renderer.display_in_terminal(
-                use_half_blocks=True,
-                clear_screen=True
-            )
+        """Push buffer to terminal (only the damaged cells after the first frame)"""
+        if self.display:
+            self.present(self.display)
+    
+    def present(self, frame):
+        """Render an external frame buffer to the terminal"""
+        if not self.renderer:
+            return
+        
+        self.renderer.display = frame
+        try:
+            if self.needs_full_repaint:
+                frame.take_damage()
+                self.presented[:] = frame.buffer
+                self.renderer.display_in_terminal(
+                    use_half_blocks=True,
+                    clear_screen=True
+                )
+                self.needs_full_repaint = False
+            else:
+                self.renderer.display_in_terminal(
+                    use_half_blocks=True,
+                    clear_screen=False,
+                    rects=frame.take_damage(self.presented)
+                )
+        finally:
+            self.renderer.display = self.display
     
     def cleanup(self):
         """Cleanup terminal state"""
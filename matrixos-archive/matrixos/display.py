@@ -4,7 +4,287 @@ Provides a framebuffer for LED matrix displays with terminal rendering.
 """
 
 import os
-from typing import Tuple, Optional
+import sys
+from typing import Tuple, Optional, List
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional - pure Python is the fallback
+    numpy = None
+
+
+# Damage rectangle: (x, y, width, height)
+Rect = Tuple[int, int, int, int]
+
+# ZX Spectrum colours: 0-7 normal, 8-15 BRIGHT
+SPECTRUM_PALETTE = [
+    (0, 0, 0), (0, 0, 215), (215, 0, 0), (215, 0, 215),
+    (0, 215, 0), (0, 215, 215), (215, 215, 0), (215, 215, 215),
+    (0, 0, 0), (0, 0, 255), (255, 0, 0), (255, 0, 255),
+    (0, 255, 0), (0, 255, 255), (255, 255, 0), (255, 255, 255),
+]
+
+
+class Palette:
+    """
+    Colour table for 'indexed' displays (up to 256 RGB entries).
+
+    RGB colours drawn on an indexed display are looked up here; colours not
+    yet in the table get the next free entry, or the nearest existing entry
+    once the table is full. Changing an entry recolours every pixel using
+    it on the next output (palette animation), and `version` is bumped so
+    outputs know to repaint.
+    """
+
+    SIZE = 256
+
+    def __init__(self, colors: Optional[List[Tuple[int, int, int]]] = None):
+        """
+        Initialize palette.
+
+        Args:
+            colors: Initial entries (default: the 16 ZX Spectrum colours)
+        """
+        if colors is None:
+            colors = SPECTRUM_PALETTE
+        if len(colors) > self.SIZE:
+            raise ValueError(f"Palette holds at most {self.SIZE} colours")
+        self.colors = [(0, 0, 0)] * self.SIZE
+        self.used = 0
+        self.version = 0
+        self._index = {}
+        self._nearest = {}  # Colours mapped to the nearest entry once full
+        self._tables = None  # (version, r, g, b) translate tables
+        for color in colors:
+            self.colors[self.used] = self._clamp(color)
+            self._index.setdefault(self.colors[self.used], self.used)
+            self.used += 1
+
+    @staticmethod
+    def _clamp(color) -> Tuple[int, int, int]:
+        return tuple(max(0, min(255, int(c))) for c in color[:3])
+
+    def __len__(self) -> int:
+        return self.used
+
+    def __getitem__(self, index: int) -> Tuple[int, int, int]:
+        return self.colors[index]
+
+    def __setitem__(self, index: int, color):
+        """Change an entry (palette animation)."""
+        if not 0 <= index < self.SIZE:
+            raise IndexError(f"Palette index out of range: {index}")
+        color = self._clamp(color)
+        old = self.colors[index]
+        if self._index.get(old) == index:
+            del self._index[old]
+        self.colors[index] = color
+        self._index.setdefault(color, index)
+        # Any remembered nearest match may no longer be the nearest
+        self._nearest.clear()
+        self.used = max(self.used, index + 1)
+        self.version += 1
+
+    def index_of(self, color) -> int:
+        """
+        Get the palette index for an RGB colour, allocating one if needed.
+
+        Args:
+            color: (r, g, b) tuple
+
+        Returns:
+            int: Index of the colour (or the nearest colour if the table is full)
+        """
+        try:
+            index = self._index.get(color)
+            if index is None:
+                index = self._nearest.get(color)
+        except TypeError:  # Unhashable, e.g. a list
+            index = None
+        if index is not None:
+            return index
+        color = self._clamp(color)
+        index = self._index.get(color)
+        if index is None:
+            index = self._nearest.get(color)
+        if index is not None:
+            return index
+
+        if self.used < self.SIZE:
+            index = self.used
+            self.used += 1
+            self.colors[index] = color
+            self._index[color] = index
+            self.version += 1
+            return index
+
+        # Table full: remember the nearest entry for this colour (until an
+        # entry changes)
+        r, g, b = color
+        index = min(range(self.SIZE), key=lambda i: (self.colors[i][0] - r) ** 2 +
+                    (self.colors[i][1] - g) ** 2 + (self.colors[i][2] - b) ** 2)
+        self._nearest[color] = index
+        return index
+
+    def channel_tables(self) -> Tuple[bytes, bytes, bytes]:
+        """Per-channel 256-entry lookup tables for the current palette."""
+        if self._tables is None or self._tables[0] != self.version:
+            self._tables = (self.version,
+                            bytes(c[0] for c in self.colors),
+                            bytes(c[1] for c in self.colors),
+                            bytes(c[2] for c in self.colors))
+        return self._tables[1:]
+
+    def expand(self, indices, out: bytearray):
+        """
+        Expand palette indices to RGB888 bytes.
+
+        Each channel is one bytes.translate() through a precomputed table,
+        interleaved with extended-slice assignment, so no per-pixel Python
+        code runs.
+
+        Args:
+            indices: Bytes-like, one palette index per pixel
+            out: bytearray of 3 * len(indices) bytes to write
+        """
+        red, green, blue = self.channel_tables()
+        indices = bytes(indices)
+        out[0::3] = indices.translate(red)
+        out[1::3] = indices.translate(green)
+        out[2::3] = indices.translate(blue)
+
+
+class ColorCorrection:
+    """
+    Output colour correction for LED panels: gamma, brightness, colour
+    balance and a power limiter.
+
+    Gamma, brightness and colour balance are folded into one 256-entry
+    table per channel, so correcting a frame is three bytes.translate()
+    calls. The power limiter estimates the frame's current draw from the
+    per-channel sums of the corrected frame (LED current is proportional to
+    PWM duty) and, when it would exceed `max_current`, dims the whole frame
+    to fit. Dimming is immediate; recovery is spread over a few frames
+    (`release` per frame) so bright flashes don't make the panel pump.
+    """
+
+    # Amps drawn by one channel of one pixel at full duty: full white is
+    # about 1.8A for 64x64 and 7.4A for 128x128 (docs/HARDWARE.md)
+    CHANNEL_CURRENT = 0.00015
+    SETTINGS = ('gamma', 'brightness', 'balance', 'max_current', 'channel_current', 'release')
+
+    def __init__(self, gamma: float = 1.0, brightness: float = 1.0,
+                 balance: Tuple[float, float, float] = (1.0, 1.0, 1.0),
+                 max_current: Optional[float] = None,
+                 channel_current: Tuple[float, float, float] = (CHANNEL_CURRENT,) * 3,
+                 release: float = 0.05):
+        """
+        Args:
+            gamma: Gamma exponent (1.0 = none, 2.2 = typical for LEDs)
+            brightness: Overall brightness (0.0-1.0)
+            balance: Per-channel (r, g, b) multipliers (white point)
+            max_current: Power supply budget in amps, or None for no limit
+            channel_current: Amps per channel at full duty (r, g, b)
+            release: How much the limiter may brighten again per frame
+        """
+        self.gamma = gamma
+        self.brightness = brightness
+        self.balance = tuple(balance)
+        self.max_current = max_current
+        self.channel_current = tuple(channel_current)
+        self.release = release
+        self.limit = 1.0  # Current limiter scale
+        self.estimated_current = 0.0  # Last frame's draw before limiting (amps)
+        self.version = 0
+        self._tables = None  # (version, r, g, b) translate tables
+        self._applied = None  # (version, limit) of the last corrected frame
+
+    @classmethod
+    def from_config(cls, config: dict) -> 'ColorCorrection':
+        """
+        Create from the display.color_correction config section.
+
+        Args:
+            config: Dict with any of gamma, brightness, balance, max_current,
+                    channel_current, release
+        """
+        unknown = set(config) - set(cls.SETTINGS)
+        if unknown:
+            raise ValueError(f"Unknown colour correction settings: {', '.join(sorted(unknown))}")
+        return cls(**config)
+
+    def set(self, **settings):
+        """
+        Change settings (gamma, brightness, balance, max_current, ...).
+
+        The tables are rebuilt on the next frame, which is repainted in full.
+        """
+        for name, value in settings.items():
+            if name not in self.SETTINGS:
+                raise AttributeError(f"Unknown colour correction setting: {name}")
+            setattr(self, name, tuple(value) if name in ('balance', 'channel_current') else value)
+        self.version += 1
+
+    def channel_tables(self) -> Tuple[bytes, bytes, bytes]:
+        """Per-channel 256-entry tables combining gamma, brightness and balance."""
+        if self._tables is None or self._tables[0] != self.version:
+            tables = []
+            for factor in self.balance:
+                scale = 255 * max(0.0, self.brightness * factor)
+                tables.append(bytes(min(255, int(round((v / 255) ** self.gamma * scale)))
+                                    for v in range(256)))
+            self._tables = (self.version, *tables)
+        return self._tables[1:]
+
+    def apply(self, source: 'Display', target: 'Display'):
+        """
+        Write the corrected (and power-limited) frame into another display.
+
+        Damage carries over to the target; a settings or limiter change
+        damages the whole target, since every pixel may have changed.
+
+        Args:
+            source: 'rgb' Display to correct
+            target: 'rgb' Display of the same size
+        """
+        if source.bytes_per_pixel != 3 or target.bytes_per_pixel != 3:
+            raise ValueError("ColorCorrection.apply() needs RGB displays")
+        if target.width != source.width or target.height != source.height:
+            raise ValueError("ColorCorrection.apply() requires displays of the same size")
+
+        red, green, blue = self.channel_tables()
+        pixels = bytes(source.buffer)
+        out = target.buffer
+        out[0::3] = pixels[0::3].translate(red)
+        out[1::3] = pixels[1::3].translate(green)
+        out[2::3] = pixels[2::3].translate(blue)
+
+        if self.max_current is not None:
+            self._limit_power(out)
+
+        state = (self.version, self.limit)
+        if self._applied != state:
+            self._applied = state
+            source.take_damage()
+            target.mark_all_damaged()
+        else:
+            for rect in source.take_damage():
+                target.add_damage(*rect)
+
+    def _limit_power(self, out: bytearray):
+        """Estimate the frame's current draw and dim it to fit max_current."""
+        r_amps, g_amps, b_amps = self.channel_current
+        self.estimated_current = (sum(out[0::3]) * r_amps + sum(out[1::3]) * g_amps +
+                                  sum(out[2::3]) * b_amps) / 255
+        needed = 1.0
+        if self.estimated_current > self.max_current:
+            needed = self.max_current / self.estimated_current
+        # Dim at once, brighten back gradually
+        self.limit = needed if needed < self.limit else min(needed, self.limit + self.release)
+
+        if self.limit < 1.0:
+            table = bytes(int(v * self.limit) for v in range(256))
+            out[:] = out.translate(table)
 
 
 class Display:
@@ -12,38 +292,88 @@ class Display:
     Represents an LED matrix display with a pixel buffer.
 
     Coordinates are (x, y) where (0, 0) is top-left.
-    Pixels are stored as RGB tuples or can be monochrome.
+    Pixels live in one contiguous bytearray: 3 bytes per pixel (RGB888)
+    in 'rgb' mode, 1 byte per pixel (0 = off, 1 = on) in 'mono' mode, and
+    1 byte per pixel (a Palette index) in 'indexed' mode.
+    Pixel (x, y) starts at byte offset (y * width + x) * bytes_per_pixel.
+
+    Writes are tracked as damage: each row remembers the leftmost and
+    rightmost column touched since the last take_damage(), so drivers can
+    repaint only the regions that changed.
     """
 
-    def __init__(self, width: int, height: int, color_mode: str = 'mono'):
+    def __init__(self, width: int, height: int, color_mode: str = 'mono',
+                 palette: Optional[Palette] = None):
         """
         Initialize the display.
 
         Args:
             width: Display width in pixels
             height: Display height in pixels
-            color_mode: 'mono' for monochrome (on/off), 'rgb' for RGB color
+            color_mode: 'mono' for monochrome (on/off), 'rgb' for RGB color,
+                       'indexed' for 1-byte palette indices
+            palette: Palette for 'indexed' mode (default: new ZX Spectrum palette).
+                     Share one Palette between displays that exchange pixels.
         """
         self.width = width
         self.height = height
         self.color_mode = color_mode
+        self.palette = None
 
-        # Initialize framebuffer
         if color_mode == 'mono':
-            # Boolean array: True = on, False = off
-            self.buffer = [[False for _ in range(width)] for _ in range(height)]
+            self.bytes_per_pixel = 1
         elif color_mode == 'rgb':
-            # RGB tuples: (r, g, b) each 0-255
-            self.buffer = [[(0, 0, 0) for _ in range(width)] for _ in range(height)]
+            self.bytes_per_pixel = 3
+        elif color_mode == 'indexed':
+            self.bytes_per_pixel = 1
+            self.palette = palette if palette is not None else Palette()
+            self._expanded_version = None  # Palette version at last expand_to()
         else:
             raise ValueError(f"Unknown color_mode: {color_mode}")
 
+        # Flat framebuffer, row-major, `stride` bytes per row
+        self.stride = width * self.bytes_per_pixel
+        self.buffer = bytearray(self.stride * height)
+        # Zeroed template so clear() is a single memcpy
+        self._blank = bytes(len(self.buffer))
+
+        # Per-row damage extents (x0 > x1 means the row is clean)
+        self._damage_x0 = [width] * height
+        self._damage_x1 = [-1] * height
+
     def clear(self):
         """Clear the entire display (turn all pixels off)."""
-        if self.color_mode == 'mono':
-            self.buffer = [[False for _ in range(self.width)] for _ in range(self.height)]
-        else:
-            self.buffer = [[(0, 0, 0) for _ in range(self.width)] for _ in range(self.height)]
+        self.buffer[:] = self._blank
+        self.mark_all_damaged()
+
+    def pack_color(self, value) -> bytes:
+        """
+        Convert a color value to the raw bytes stored for one pixel.
+
+        Args:
+            value: For mono: truthy/falsy. For RGB: (r, g, b) tuple, or a
+                   bool (True = white, False = black). Components are
+                   clamped to 0-255. For indexed: a palette index (int) or
+                   an RGB color, which is looked up in the palette.
+
+        Returns:
+            bytes of length bytes_per_pixel
+        """
+        if self.palette is not None:
+            if value is True:
+                value = (255, 255, 255)
+            elif value is False or value is None:
+                return b'\x00'
+            if isinstance(value, int):
+                return bytes((value & 0xFF,))
+            return bytes((self.palette.index_of(value),))
+        if self.bytes_per_pixel == 1:
+            return b'\x01' if value else b'\x00'
+        if value is True:
+            return b'\xff\xff\xff'
+        if value is False or value is None:
+            return b'\x00\x00\x00'
+        return bytes(max(0, min(255, int(c))) for c in value[:3])
 
     def set_pixel(self, x: int, y: int, value=True):
         """
@@ -52,22 +382,811 @@ class Display:
         Args:
             x: X coordinate (0 to width-1)
             y: Y coordinate (0 to height-1)
-            value: For mono: True/False. For RGB: (r, g, b) tuple
+            value: For mono: True/False. For RGB: (r, g, b) tuple.
+                   For indexed: palette index or (r, g, b) tuple
         """
         if 0 <= x < self.width and 0 <= y < self.height:
-            self.buffer[y][x] = value
+            if x < self._damage_x0[y]:
+                self._damage_x0[y] = x
+            if x > self._damage_x1[y]:
+                self._damage_x1[y] = x
+            if self.bytes_per_pixel == 3:
+                i = (y * self.width + x) * 3
+                buf = self.buffer
+                try:
+                    r, g, b = value
+                    buf[i] = r
+                    buf[i + 1] = g
+                    buf[i + 2] = b
+                except (TypeError, ValueError):
+                    # Bools, floats, lists or out-of-range components
+                    buf[i:i + 3] = self.pack_color(value)
+            elif self.palette is not None:
+                if type(value) is int:
+                    self.buffer[y * self.width + x] = value & 0xFF
+                else:
+                    self.buffer[y * self.width + x] = self.pack_color(value)[0]
+            else:
+                self.buffer[y * self.width + x] = 1 if value else 0
 
     def get_pixel(self, x: int, y: int):
-        """Get the value of a pixel at the given coordinates."""
+        """Get the value of a pixel (RGB tuple in 'indexed' mode)."""
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.buffer[y][x]
+            if self.bytes_per_pixel == 3:
+                i = (y * self.width + x) * 3
+                buf = self.buffer
+                return (buf[i], buf[i + 1], buf[i + 2])
+            if self.palette is not None:
+                return self.palette.colors[self.buffer[y * self.width + x]]
+            return bool(self.buffer[y * self.width + x])
         return False if self.color_mode == 'mono' else (0, 0, 0)
 
+    def get_index(self, x: int, y: int) -> int:
+        """Get the raw palette index of a pixel ('indexed' mode)."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.buffer[y * self.width + x]
+        return 0
+
+    def expand_to(self, target: 'Display'):
+        """
+        Expand an 'indexed' frame to RGB888 in another display.
+
+        Runs once per output frame through the palette's lookup tables.
+        Damage carries over to the target; a palette change since the last
+        expansion damages the whole target, since any pixel may have changed.
+
+        Args:
+            target: 'rgb' Display of the same size
+        """
+        if self.palette is None or target.bytes_per_pixel != 3:
+            raise ValueError("expand_to() needs an indexed source and an RGB target")
+        if target.width != self.width or target.height != self.height:
+            raise ValueError("expand_to() requires displays of the same size")
+
+        self.palette.expand(self.buffer, target.buffer)
+        if self._expanded_version != self.palette.version:
+            self._expanded_version = self.palette.version
+            self.take_damage()
+            target.mark_all_damaged()
+        else:
+            for rect in self.take_damage():
+                target.add_damage(*rect)
+
+    def fill(self, value=True):
+        """Fill the entire display with the given value."""
+        self.buffer[:] = self.pack_color(value) * (self.width * self.height)
+        self.mark_all_damaged()
+
+    def clip_rect(self, x: int, y: int, width: int, height: int) -> Optional[Rect]:
+        """
+        Clip a rectangle to the display.
+
+        Returns:
+            (x, y, width, height) of the visible part, or None if nothing is visible
+        """
+        x0 = max(0, x)
+        y0 = max(0, y)
+        x1 = min(self.width, x + width)
+        y1 = min(self.height, y + height)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return (x0, y0, x1 - x0, y1 - y0)
+
+    def fill_rect(self, x: int, y: int, width: int, height: int, value=True):
+        """
+        Fill a rectangle (clipped) with one row-slice assignment per row.
+
+        Args:
+            x, y: Top-left corner
+            width, height: Rectangle size
+            value: Fill color
+        """
+        clipped = self.clip_rect(x, y, width, height)
+        if clipped is None:
+            return
+        x, y, width, height = clipped
+
+        bpp = self.bytes_per_pixel
+        stride = self.stride
+        start = y * stride + x * bpp
+        if width == self.width:
+            # Full-width rows are contiguous: one slice for the whole block
+            self.buffer[start:start + height * stride] = \
+                self.pack_color(value) * (width * height)
+        else:
+            span = self.pack_color(value) * width
+            n = width * bpp
+            for offset in range(start, start + height * stride, stride):
+                self.buffer[offset:offset + n] = span
+        self.add_damage(x, y, width, height)
+
+    def hline(self, x: int, y: int, width: int, value=True):
+        """Draw a horizontal line of `width` pixels (clipped, one slice assignment)."""
+        self.fill_rect(x, y, width, 1, value)
+
+    def vline(self, x: int, y: int, height: int, value=True):
+        """Draw a vertical line of `height` pixels (clipped)."""
+        self.fill_rect(x, y, 1, height, value)
+
+    def fill_span(self, y: int, x0: int, x1: int, value=True):
+        """
+        Fill one scanline span from x0 to x1 inclusive (either order, clipped).
+
+        Args:
+            y: Row
+            x0, x1: End columns
+            value: Fill color
+        """
+        if x0 > x1:
+            x0, x1 = x1, x0
+        self.fill_rect(x0, y, x1 - x0 + 1, 1, value)
+
+    def fill_spans(self, spans, dx: int = 0, dy: int = 0, value=True):
+        """
+        Fill many scanline spans (clipped), e.g. a cached shape.
+
+        The color is packed once and each span is one slice assignment,
+        without the per-call clipping and damage overhead of fill_span().
+
+        Args:
+            spans: Iterable of (y, x0, x1) inclusive spans, x0 <= x1
+            dx, dy: Offset added to every span
+            value: Fill color
+        """
+        packed = self.pack_color(value)
+        bpp = self.bytes_per_pixel
+        width = self.width
+        height = self.height
+        buffer = self.buffer
+        damage_x0 = self._damage_x0
+        damage_x1 = self._damage_x1
+        for y, x0, x1 in spans:
+            y += dy
+            if y < 0 or y >= height:
+                continue
+            x0 += dx
+            x1 += dx
+            if x0 < 0:
+                x0 = 0
+            if x1 >= width:
+                x1 = width - 1
+            if x0 > x1:
+                continue
+            start = (y * width + x0) * bpp
+            count = x1 - x0 + 1
+            buffer[start:start + count * bpp] = packed * count
+            if x0 < damage_x0[y]:
+                damage_x0[y] = x0
+            if x1 > damage_x1[y]:
+                damage_x1[y] = x1
+
+    def copy_rect(self, src: 'Display', sx: int, sy: int, width: int, height: int,
+                  dx: int, dy: int):
+        """
+        Copy a rectangle of pixels from another display (a rect blit).
+
+        Both the source and destination rectangles are clipped. The source
+        must use the same color mode.
+
+        Args:
+            src: Source display
+            sx, sy: Top-left corner in the source
+            width, height: Rectangle size
+            dx, dy: Top-left corner in this display
+        """
+        region = self._clip_copy(src, sx, sy, width, height, dx, dy)
+        if region is None:
+            return
+        sx, sy, width, height, dx, dy = region
+
+        bpp = self.bytes_per_pixel
+        n = width * bpp
+        src_buf = src.buffer
+        dst_buf = self.buffer
+        for row in range(height):
+            s = (sy + row) * src.stride + sx * bpp
+            d = (dy + row) * self.stride + dx * bpp
+            dst_buf[d:d + n] = src_buf[s:s + n]
+        self.add_damage(dx, dy, width, height)
+
+    def _clip_copy(self, src: 'Display', sx: int, sy: int, width: int, height: int,
+                   dx: int, dy: int) -> Optional[Tuple[int, int, int, int, int, int]]:
+        """Clip a copy_rect() against both displays; None if nothing is visible."""
+        if src.color_mode != self.color_mode:
+            raise ValueError("copy_rect() requires displays with the same color mode")
+        # Clip against the source
+        if sx < 0:
+            width += sx
+            dx -= sx
+            sx = 0
+        if sy < 0:
+            height += sy
+            dy -= sy
+            sy = 0
+        width = min(width, src.width - sx)
+        height = min(height, src.height - sy)
+        # Clip against the destination
+        if dx < 0:
+            width += dx
+            sx -= dx
+            dx = 0
+        if dy < 0:
+            height += dy
+            sy -= dy
+            dy = 0
+        width = min(width, self.width - dx)
+        height = min(height, self.height - dy)
+        if width <= 0 or height <= 0:
+            return None
+        return (sx, sy, width, height, dx, dy)
+
+    def blit(self, src: 'Display', x: int, y: int, src_rect: Optional[Rect] = None,
+             key=None, alpha=None):
+        """
+        Draw a packed pixel buffer at (x, y), row slice by row slice (clipped).
+
+        Opaque runs are copied with one slice assignment each; partially
+        transparent runs are blended through lookup tables.
+
+        Args:
+            src: Source Display or Bitmap (a Bitmap's own alpha mask is used
+                 when neither key nor alpha is given)
+            x, y: Where the top-left of src_rect lands
+            src_rect: Optional (x, y, width, height) part of src to draw
+            key: Colour in src to treat as transparent
+            alpha: 0-255 for the whole blit, or a bytes-like mask with one
+                   byte per src pixel
+        """
+        if src_rect is None:
+            src_rect = (0, 0, src.width, src.height)
+        sx, sy, width, height = src_rect
+
+        if src.color_mode != self.color_mode:
+            self._blit_pixels(src, sx, sy, width, height, x, y, key, alpha)
+            return
+
+        region = self._clip_copy(src, sx, sy, width, height, x, y)
+        if region is None:
+            return
+        sx, sy, width, height, dx, dy = region
+
+        cached_runs = getattr(src, 'row_runs', None) if key is None and alpha is None else None
+        if key is None and alpha is None and cached_runs is None:
+            self.copy_rect(src, sx, sy, width, height, dx, dy)
+            return
+
+        bpp = self.bytes_per_pixel
+        src_buf = src.buffer
+        dst_buf = self.buffer
+        x_end = sx + width
+        for row in range(height):
+            src_row = sy + row
+            if cached_runs is not None:
+                runs = cached_runs(src_row)
+            else:
+                runs = mask_runs(src, src_row, key, alpha)
+            s_base = src_row * src.stride
+            d_base = (dy + row) * self.stride + (dx - sx) * bpp
+            for start, end, a in runs:
+                if start < sx:
+                    start = sx
+                if end > x_end:
+                    end = x_end
+                if start < end:
+                    blend_span(dst_buf, d_base + start * bpp, src_buf,
+                               s_base + start * bpp, (end - start) * bpp, a, bpp)
+        self.add_damage(dx, dy, width, height)
+
+    def _blit_pixels(self, src: 'Display', sx: int, sy: int, width: int, height: int,
+                     dx: int, dy: int, key, alpha):
+        """Per-pixel blit between different color modes (alpha thresholded)."""
+        for row in range(max(0, sy), min(src.height, sy + height)):
+            for start, end, a in mask_runs(src, row, key, alpha):
+                if a < 128:
+                    continue
+                for col in range(max(start, sx), min(end, sx + width)):
+                    self.set_pixel(dx + col - sx, dy + row - sy, src.get_pixel(col, row))
+
+    def scale_brightness(self, factor: float, rect: Optional[Rect] = None):
+        """
+        Scale every channel by `factor` in place (e.g. 0.5 to darken by half).
+
+        Uses a 256-entry translate table, so no per-pixel Python code runs.
+        Mono and indexed displays are left unchanged (dim the palette instead).
+
+        Args:
+            factor: Brightness multiplier (results are clamped to 255)
+            rect: Optional (x, y, width, height) to limit the effect to
+        """
+        if self.bytes_per_pixel != 3:
+            return
+        table = bytes(min(255, int(i * factor)) for i in range(256))
+
+        if rect is None:
+            self.buffer[:] = self.buffer.translate(table)
+            self.mark_all_damaged()
+            return
+
+        clipped = self.clip_rect(*rect)
+        if clipped is None:
+            return
+        x, y, width, height = clipped
+        start = y * self.stride + x * 3
+        n = width * 3
+        for offset in range(start, start + height * self.stride, self.stride):
+            self.buffer[offset:offset + n] = self.buffer[offset:offset + n].translate(table)
+        self.add_damage(x, y, width, height)
+
+    def view(self) -> memoryview:
+        """
+        Zero-copy view of the framebuffer for drivers.
+
+        Returns:
+            memoryview over the raw bytes (row-major, `stride` bytes per row)
+        """
+        return memoryview(self.buffer)
+
+    def copy_from(self, other: 'Display', mark_damage: bool = True):
+        """
+        Copy another display's pixels into this one (same size and mode).
+
+        Args:
+            other: Source display
+            mark_damage: Mark the whole display as changed. Pass False when
+                        this buffer is known to match what is on screen.
+        """
+        if other.width != self.width or other.height != self.height or \
+                other.color_mode != self.color_mode:
+            raise ValueError("copy_from() requires displays of the same size and mode")
+        self.buffer[:] = other.buffer
+        if mark_damage:
+            self.mark_all_damaged()
+
+    # Damage tracking
+
+    def add_damage(self, x: int, y: int, width: int, height: int):
+        """
+        Mark a rectangle as changed (clipped to the display).
+
+        Args:
+            x, y: Top-left corner
+            width, height: Rectangle size
+        """
+        x0 = max(0, x)
+        x1 = min(self.width, x + width) - 1
+        if x0 > x1:
+            return
+        damage_x0 = self._damage_x0
+        damage_x1 = self._damage_x1
+        for row in range(max(0, y), min(self.height, y + height)):
+            if x0 < damage_x0[row]:
+                damage_x0[row] = x0
+            if x1 > damage_x1[row]:
+                damage_x1[row] = x1
+
+    def mark_all_damaged(self):
+        """Mark the whole display as changed."""
+        self._damage_x0 = [0] * self.height
+        self._damage_x1 = [self.width - 1] * self.height
+
+    def has_damage(self) -> bool:
+        """Check if anything was written since the last take_damage()."""
+        return any(x1 >= 0 for x1 in self._damage_x1)
+
+    def take_damage(self, previous: Optional[bytearray] = None) -> List[Rect]:
+        """
+        Return the accumulated damage region and reset it.
+
+        Args:
+            previous: Optional copy of the last frame the caller output
+                     (same size as `buffer`). When given, damage is narrowed
+                     to pixels that actually differ from it, and `previous`
+                     is updated to match the current buffer.
+
+        Returns:
+            List of merged (x, y, width, height) rectangles
+        """
+        spans = list(zip(self._damage_x0, self._damage_x1))
+        self._damage_x0 = [self.width] * self.height
+        self._damage_x1 = [-1] * self.height
+
+        if previous is not None:
+            spans = [self._changed_span(y, x0, x1, previous)
+                     for y, (x0, x1) in enumerate(spans)]
+
+        return merge_row_spans(spans)
+
+    def _changed_span(self, y: int, x0: int, x1: int,
+                      previous: bytearray) -> Tuple[int, int]:
+        """Narrow a row's damage span to the pixels that differ from `previous`."""
+        if x0 > x1:
+            return (x0, x1)
+
+        bpp = self.bytes_per_pixel
+        row = y * self.stride
+        start = row + x0 * bpp
+        end = row + (x1 + 1) * bpp
+        current = self.buffer[start:end]
+        if current == previous[start:end]:
+            return (self.width, -1)
+
+        # Binary search for the first and last differing pixel using
+        # slice comparisons, which run in C
+        lo, hi = 0, x1 - x0 + 1
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if current[lo * bpp:mid * bpp] == previous[start + lo * bpp:start + mid * bpp]:
+                lo = mid
+            else:
+                hi = mid
+        first = lo
+
+        lo, hi = first, x1 - x0 + 1
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if current[mid * bpp:] == previous[start + mid * bpp:end]:
+                hi = mid
+            else:
+                lo = mid
+        last = lo
+
+        previous[start + first * bpp:start + (last + 1) * bpp] = \
+            current[first * bpp:(last + 1) * bpp]
+        return (x0 + first, x0 + last)
+
+
+class NumpyDisplay(Display):
+    """
+    Display backed by an H×W×bytes_per_pixel uint8 NumPy array.
+
+    The array is a view over the same bytearray the pure-Python code uses,
+    so per-pixel methods, damage tracking and drivers work unchanged; only
+    the bulk operations (fill, fill_rect, copy_rect, scale_brightness) are
+    replaced with vectorized versions.
+
+    Requires NumPy - use create_display() to fall back automatically.
+    """
+
+    def __init__(self, width: int, height: int, color_mode: str = 'mono',
+                 palette: Optional[Palette] = None):
+        if numpy is None:
+            raise ImportError("NumpyDisplay requires numpy")
+        super().__init__(width, height, color_mode, palette)
+        self.array = numpy.frombuffer(self.buffer, dtype=numpy.uint8).reshape(
+            height, width, self.bytes_per_pixel)
+
     def fill(self, value=True):
         """Fill the entire display with the given value."""
-        for y in range(self.height):
-            for x in range(self.width):
-                self.buffer[y][x] = value
+        self.array[:, :] = numpy.frombuffer(self.pack_color(value), dtype=numpy.uint8)
+        self.mark_all_damaged()
+
+    def fill_rect(self, x: int, y: int, width: int, height: int, value=True):
+        """Fill a rectangle (clipped) with a single array assignment."""
+        clipped = self.clip_rect(x, y, width, height)
+        if clipped is None:
+            return
+        x, y, width, height = clipped
+        self.array[y:y + height, x:x + width] = \
+            numpy.frombuffer(self.pack_color(value), dtype=numpy.uint8)
+        self.add_damage(x, y, width, height)
+
+    def copy_rect(self, src: Display, sx: int, sy: int, width: int, height: int,
+                  dx: int, dy: int):
+        """Copy a rectangle of pixels from another display with one array assignment."""
+        region = self._clip_copy(src, sx, sy, width, height, dx, dy)
+        if region is None:
+            return
+        sx, sy, width, height, dx, dy = region
+        src_array = getattr(src, 'array', None)
+        if src_array is None:
+            src_array = numpy.frombuffer(src.buffer, dtype=numpy.uint8).reshape(
+                src.height, src.width, src.bytes_per_pixel)
+        self.array[dy:dy + height, dx:dx + width] = src_array[sy:sy + height, sx:sx + width]
+        self.add_damage(dx, dy, width, height)
+
+    def scale_brightness(self, factor: float, rect: Optional[Rect] = None):
+        """Scale every channel by `factor` in place, vectorized."""
+        if self.bytes_per_pixel != 3:
+            return
+        if rect is None:
+            x, y, width, height = 0, 0, self.width, self.height
+        else:
+            clipped = self.clip_rect(*rect)
+            if clipped is None:
+                return
+            x, y, width, height = clipped
+        region = self.array[y:y + height, x:x + width]
+        # Truncate like the pure-Python table: int(value * factor), clamped
+        region[...] = numpy.minimum(region * float(factor), 255).astype(numpy.uint8)
+        self.add_damage(x, y, width, height)
+
+
+class Bitmap(Display):
+    """
+    Packed image for blitting (sprites, icons, tiles), with optional alpha.
+
+    Pixels use the same layout as Display. `alpha` is None (fully opaque)
+    or a bytearray with one 0-255 value per pixel. The visible runs of each
+    row are computed once and cached, so blitting the same bitmap every
+    frame is a few slice copies per row.
+    """
+
+    def __init__(self, width: int, height: int, color_mode: str = 'rgb',
+                 palette: Optional[Palette] = None):
+        super().__init__(width, height, color_mode, palette)
+        self.alpha = None
+        self._runs = [None] * height
+
+    @classmethod
+    def from_rgba(cls, width: int, height: int, data, threshold: Optional[int] = None) -> 'Bitmap':
+        """
+        Create an RGB bitmap from packed RGBA bytes.
+
+        Args:
+            width, height: Image size
+            data: width * height * 4 bytes (RGBA)
+            threshold: If given, alpha below it becomes transparent and the
+                       rest opaque (hard-edged sprites, no blending)
+
+        Returns:
+            Bitmap
+        """
+        bitmap = cls(width, height, 'rgb')
+        data = bytes(data)
+        bitmap.buffer[0::3] = data[0::4]
+        bitmap.buffer[1::3] = data[1::4]
+        bitmap.buffer[2::3] = data[2::4]
+        alpha = data[3::4]
+        if threshold is not None:
+            alpha = alpha.translate(bytes(0 if v < threshold else 255 for v in range(256)))
+        if alpha.count(255) != len(alpha):
+            bitmap.alpha = bytearray(alpha)
+        return bitmap
+
+    @classmethod
+    def from_image(cls, image, threshold: Optional[int] = None) -> 'Bitmap':
+        """Create a bitmap from a PIL image (converted to RGBA)."""
+        image = image.convert('RGBA')
+        width, height = image.size
+        return cls.from_rgba(width, height, image.tobytes(), threshold)
+
+    def set_alpha_rect(self, x: int, y: int, width: int, height: int, alpha: int):
+        """
+        Set the alpha of a rectangle (0 = transparent, 255 = opaque).
+
+        Args:
+            x, y: Top-left corner
+            width, height: Rectangle size
+            alpha: New alpha value
+        """
+        clipped = self.clip_rect(x, y, width, height)
+        if clipped is None:
+            return
+        x, y, width, height = clipped
+        if self.alpha is None:
+            if alpha >= 255:
+                return
+            self.alpha = bytearray(b'\xff') * (self.width * self.height)
+        value = bytes((max(0, min(255, alpha)),)) * width
+        for row in range(y, y + height):
+            start = row * self.width + x
+            self.alpha[start:start + width] = value
+        self.invalidate_runs(y, y + height)
+
+    def invalidate_runs(self, y0: int = 0, y1: Optional[int] = None):
+        """Forget cached runs for rows y0..y1 (after changing `alpha` directly)."""
+        if y1 is None:
+            y1 = self.height
+        for row in range(max(0, y0), min(self.height, y1)):
+            self._runs[row] = None
+
+    def row_runs(self, row: int) -> List[Tuple[int, int, int]]:
+        """Cached visible (start, end, alpha) runs of a row."""
+        runs = self._runs[row]
+        if runs is None:
+            if self.alpha is None:
+                runs = [(0, self.width, 255)]
+            else:
+                runs = alpha_runs(self.alpha[row * self.width:(row + 1) * self.width])
+            self._runs[row] = runs
+        return runs
+
+
+def create_display(width: int, height: int, color_mode: str = 'mono',
+                   backend: str = 'python', palette: Optional[Palette] = None) -> Display:
+    """
+    Create a framebuffer with the requested backend.
+
+    Args:
+        width: Display width in pixels
+        height: Display height in pixels
+        color_mode: 'mono', 'rgb' or 'indexed'
+        backend: 'python' (default), 'numpy', or 'auto' (NumPy when installed).
+                 'numpy' falls back to pure Python when NumPy is missing.
+        palette: Palette for 'indexed' mode
+
+    Returns:
+        Display (or NumpyDisplay) instance
+    """
+    if backend not in ('python', 'numpy', 'auto'):
+        raise ValueError(f"Unknown display backend: {backend}")
+    if backend != 'python' and numpy is not None:
+        return NumpyDisplay(width, height, color_mode, palette)
+    return Display(width, height, color_mode, palette)
+
+
+def merge_row_spans(spans: List[Tuple[int, int]]) -> List[Rect]:
+    """
+    Merge per-row damage spans into rectangles.
+
+    Consecutive rows whose spans overlap or touch are combined into one
+    rectangle covering the union of their columns.
+
+    Args:
+        spans: One (x0, x1) inclusive column span per row, x0 > x1 = clean
+
+    Returns:
+        List of (x, y, width, height) rectangles
+    """
+    rects = []
+    current = None  # [x0, y0, x1, y1]
+    for y, (x0, x1) in enumerate(spans):
+        if x0 > x1:
+            if current:
+                rects.append(current)
+                current = None
+            continue
+        if current and x0 <= current[2] + 1 and x1 >= current[0] - 1:
+            current[0] = min(current[0], x0)
+            current[2] = max(current[2], x1)
+            current[3] = y
+        else:
+            if current:
+                rects.append(current)
+            current = [x0, y, x1, y]
+    if current:
+        rects.append(current)
+    return [(x0, y0, x1 - x0 + 1, y1 - y0 + 1) for x0, y0, x1, y1 in rects]
+
+
+# Blend tables per alpha value: (src * a // 255, dst * (255 - a) // 255)
+_alpha_tables = {}
+
+
+def blend_span(dst: bytearray, d: int, src, s: int, length: int, a: int, bpp: int):
+    """
+    Blend `length` bytes of src over dst with one alpha value.
+
+    Alpha 255 is a plain slice copy. RGB bytes in between are blended with
+    two 256-entry translate tables (no per-pixel Python code); 1-byte modes
+    (mono, indexed) can't blend, so alpha is thresholded at 128.
+
+    Args:
+        dst: Destination buffer
+        d: Byte offset in dst
+        src: Source buffer
+        s: Byte offset in src
+        length: Number of bytes
+        a: Alpha 0-255
+        bpp: Bytes per pixel
+    """
+    if a >= 255 or (bpp == 1 and a >= 128):
+        dst[d:d + length] = src[s:s + length]
+    elif a > 0 and bpp == 3:
+        tables = _alpha_tables.get(a)
+        if tables is None:
+            inv = 255 - a
+            tables = (bytes(v * a // 255 for v in range(256)),
+                      bytes(v * inv // 255 for v in range(256)))
+            _alpha_tables[a] = tables
+        over, under = tables
+        dst[d:d + length] = bytes(map(
+            int.__add__,
+            bytes(src[s:s + length]).translate(over),
+            bytes(dst[d:d + length]).translate(under)
+        ))
+
+
+def alpha_runs(alpha_row) -> List[Tuple[int, int, int]]:
+    """
+    Split one row of alpha values into runs of equal, non-zero alpha.
+
+    Args:
+        alpha_row: Sequence of 0-255 values, one per pixel
+
+    Returns:
+        List of (start, end, alpha) with end exclusive; transparent pixels
+        are left out
+    """
+    runs = []
+    start = 0
+    n = len(alpha_row)
+    while start < n:
+        a = alpha_row[start]
+        end = start + 1
+        while end < n and alpha_row[end] == a:
+            end += 1
+        if a:
+            runs.append((start, end, a))
+        start = end
+    return runs
+
+
+def mask_runs(src: Display, row: int, key=None, alpha=None) -> List[Tuple[int, int, int]]:
+    """
+    Visible runs of one source row for a blit with a colour key and/or alpha.
+
+    Args:
+        src: Source display
+        row: Source row
+        key: Colour treated as transparent
+        alpha: int for the whole row, or a mask with one byte per src pixel
+
+    Returns:
+        List of (start, end, alpha) runs, end exclusive
+    """
+    width = src.width
+    if alpha is None:
+        alpha = getattr(src, 'alpha', None)
+    if alpha is None:
+        a_row = [255] * width
+    elif isinstance(alpha, int):
+        a_row = [max(0, min(255, alpha))] * width
+    else:
+        a_row = list(alpha[row * width:(row + 1) * width])
+
+    if key is not None:
+        bpp = src.bytes_per_pixel
+        key_bytes = src.pack_color(key)
+        line = src.buffer[row * src.stride:(row + 1) * src.stride]
+        for col in range(width):
+            if line[col * bpp:(col + 1) * bpp] == key_bytes:
+                a_row[col] = 0
+    return alpha_runs(a_row)
+
+
+def truecolor_supported() -> bool:
+    """Check whether the terminal advertises 24-bit colour (COLORTERM)."""
+    return os.environ.get('COLORTERM', '').lower() in ('truecolor', '24bit')
+
+
+# xterm 256-colour palette: channel levels of the 6x6x6 cube (16-231)
+# and the grey ramp (232-255)
+CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+GREY_LEVELS = tuple(8 + 10 * i for i in range(24))
+
+
+def build_ansi256_lut() -> bytes:
+    """
+    Build the RGB555 -> 256-colour index table (32768 entries).
+
+    Each 5-bit colour maps to the nearest cube colour or grey, whichever is
+    closer, so greys and dark gradients don't all collapse onto the cube.
+    """
+    # Nearest cube level and its value for each 5-bit channel value
+    nearest = []
+    for v5 in range(32):
+        v = (v5 << 3) | (v5 >> 2)
+        level = min(range(6), key=lambda i: abs(CUBE_LEVELS[i] - v))
+        nearest.append((v, level, CUBE_LEVELS[level]))
+
+    lut = bytearray(32768)
+    for r5 in range(32):
+        r, ri, rc = nearest[r5]
+        for g5 in range(32):
+            g, gi, gc = nearest[g5]
+            base = (r5 << 10) | (g5 << 5)
+            for b5 in range(32):
+                b, bi, bc = nearest[b5]
+                cube_error = (r - rc) ** 2 + (g - gc) ** 2 + (b - bc) ** 2
+                grey = min(23, max(0, ((r + g + b) // 3 - 3) // 10))
+                gv = GREY_LEVELS[grey]
+                grey_error = (r - gv) ** 2 + (g - gv) ** 2 + (b - gv) ** 2
+                if grey_error < cube_error:
+                    lut[base | b5] = 232 + grey
+                else:
+                    lut[base | b5] = 16 + 36 * ri + 6 * gi + bi
+    return bytes(lut)
 
 
 class TerminalRenderer:
@@ -76,12 +1195,34 @@ class TerminalRenderer:
 
     Uses half-block characters (▀ ▄) to pack 2 vertical pixels per character,
     making the display more compact and readable in the terminal.
+
+    Colours are sent as 24-bit truecolor when the terminal supports it
+    (COLORTERM), otherwise quantized to the 256-colour palette through a
+    precomputed RGB555 lookup table. Each cell carries its full colour
+    state, and an SGR sequence is only sent when it differs from the one
+    before, so runs of same-coloured cells cost one escape.
+
+    display_in_terminal() remembers the cells it last wrote: later frames
+    only emit the cells that changed, each run of them behind a
+    cursor-positioning escape, and every frame goes out as a single write
+    to sys.stdout.buffer.
     """
 
     # ANSI color codes
     RESET = '\033[0m'
 
-    def __init__(self, display: Display, pixel_char: str = '█', off_char: str = ' ', ascii_mode: bool = False):
+    # Pixel codes besides colours
+    OFF = -1
+    MONO_ON = -2
+
+    # Unchanged cells between two changed runs are re-sent instead of
+    # skipped when there are fewer than this many (a cursor escape costs more)
+    MERGE_GAP = 4
+
+    _ansi256_lut = None  # Built on first use, shared by all renderers
+
+    def __init__(self, display: Display, pixel_char: str = '█', off_char: str = ' ',
+                 ascii_mode: bool = False, truecolor: Optional[bool] = None):
         """
         Initialize the renderer.
 
@@ -90,9 +1231,11 @@ class TerminalRenderer:
             pixel_char: Character to use for "on" pixels in mono mode
             off_char: Character to use for "off" pixels
             ascii_mode: If True, use ASCII characters instead of Unicode blocks
+            truecolor: Use 24-bit colour escapes (None = detect from COLORTERM)
         """
         self.display = display
         self.ascii_mode = ascii_mode
+        self.truecolor = truecolor_supported() if truecolor is None else truecolor
 
         if ascii_mode:
             self.pixel_char = '#'
@@ -105,18 +1248,167 @@ class TerminalRenderer:
             self.upper_half_char = '▀'
             self.lower_half_char = '▄'
 
+        self.cells = None  # Cell keys currently on screen, one list per terminal row
+        self.cells_half_blocks = None  # Mode self.cells were rendered in
+        self._cell_cache = {}  # Cell key -> (SGR sequence, character)
+
+    @classmethod
+    def ansi256_lut(cls) -> bytes:
+        """The shared RGB555 -> 256-colour index table."""
+        if cls._ansi256_lut is None:
+            TerminalRenderer._ansi256_lut = build_ansi256_lut()
+        return cls._ansi256_lut
+
+    @staticmethod
+    def ansi256_index(r: int, g: int, b: int) -> int:
+        """Nearest 256-colour palette index of an RGB colour."""
+        return TerminalRenderer.ansi256_lut()[((r >> 3) << 10) | ((g >> 3) << 5) | (b >> 3)]
+
     @staticmethod
     def rgb_to_ansi(r: int, g: int, b: int, background: bool = False) -> str:
         """Convert RGB values to ANSI 256-color escape code."""
-        # Simple conversion to 256-color palette
-        # Using the 216-color cube (16-231)
-        r_idx = int(r / 255 * 5)
-        g_idx = int(g / 255 * 5)
-        b_idx = int(b / 255 * 5)
-        color_code = 16 + 36 * r_idx + 6 * g_idx + b_idx
+        prefix = '48' if background else '38'
+        return f'\033[{prefix};5;{TerminalRenderer.ansi256_index(r, g, b)}m'
 
+    @staticmethod
+    def rgb_to_truecolor(r: int, g: int, b: int, background: bool = False) -> str:
+        """Convert RGB values to an ANSI 24-bit colour escape code."""
         prefix = '48' if background else '38'
-        return f'\033[{prefix};5;{color_code}m'
+        return f'\033[{prefix};2;{r};{g};{b}m'
+
+    @staticmethod
+    def write(text: str):
+        """Write a frame to the terminal with one buffered write."""
+        stream = sys.stdout
+        raw = getattr(stream, 'buffer', None)
+        if raw is None:
+            # Redirected to a text stream (e.g. io.StringIO)
+            stream.write(text)
+            stream.flush()
+            return
+        stream.flush()  # Keep ordering with earlier print() output
+        raw.write(text.encode('utf-8'))
+        raw.flush()
+
+    def _row_codes(self, y: int, x0: int, x1: int) -> List[int]:
+        """
+        Pixel codes of row y, columns x0..x1-1 (OFF below the last row).
+
+        Codes are 0xRRGGBB in truecolor mode and palette indices otherwise.
+        """
+        display = self.display
+        off = self.OFF
+        if y >= display.height:
+            return [off] * (x1 - x0)
+
+        if display.color_mode == 'mono':
+            return [self.MONO_ON if display.get_pixel(x, y) else off
+                    for x in range(x0, x1)]
+
+        if display.color_mode == 'rgb':
+            start = (y * display.width + x0) * 3
+            end = start + (x1 - x0) * 3
+            buffer = display.buffer
+            pixels = zip(buffer[start:end:3], buffer[start + 1:end:3], buffer[start + 2:end:3])
+        else:
+            pixels = [display.get_pixel(x, y) for x in range(x0, x1)]
+
+        if self.truecolor:
+            return [(r << 16) | (g << 8) | b if r or g or b else off for r, g, b in pixels]
+        lut = self.ansi256_lut()
+        return [lut[((r >> 3) << 10) | ((g >> 3) << 5) | (b >> 3)] if r or g or b else off
+                for r, g, b in pixels]
+
+    def _sgr(self, top: int, bottom: int) -> str:
+        """Full colour state for a foreground code and optional background code."""
+        if self.truecolor:
+            fg = f'38;2;{top >> 16};{(top >> 8) & 0xFF};{top & 0xFF}'
+            bg = '49' if bottom == self.OFF else \
+                f'48;2;{bottom >> 16};{(bottom >> 8) & 0xFF};{bottom & 0xFF}'
+        else:
+            fg = f'38;5;{top}'
+            bg = '49' if bottom == self.OFF else f'48;5;{bottom}'
+        return f'\033[{fg};{bg}m'
+
+    def _make_cell(self, top: int, bottom: Optional[int]) -> Tuple[str, str]:
+        """
+        Build one cell (bottom is None in full mode).
+
+        Returns:
+            (SGR sequence the cell needs, or '' for any, character)
+        """
+        off = self.OFF
+        if top == self.MONO_ON or bottom == self.MONO_ON:
+            # Mono: pick a block character, no colour
+            if bottom is None or (top != off and bottom != off):
+                return ('', self.pixel_char)  # Full block
+            return ('', self.upper_half_char if top != off else self.lower_half_char)
+
+        if bottom is None:
+            # One pixel per cell
+            if top == off:
+                return (self.RESET, self.off_char)
+            return (self._sgr(top, off), self.pixel_char)
+
+        if top != off:
+            # Foreground color for top, background (if on) for bottom
+            return (self._sgr(top, bottom), self.upper_half_char)
+        elif bottom != off:
+            # Only bottom on
+            return (self._sgr(bottom, off), self.lower_half_char)
+        # Both off
+        return (self.RESET, self.off_char)
+
+    def _row_keys(self, row: int, use_half_blocks: bool,
+                  x0: int = 0, x1: Optional[int] = None) -> list:
+        """Cell keys of one terminal row, columns x0..x1-1."""
+        if x1 is None:
+            x1 = self.display.width
+        if use_half_blocks:
+            return list(zip(self._row_codes(row * 2, x0, x1),
+                            self._row_codes(row * 2 + 1, x0, x1)))
+        return [(code, None) for code in self._row_codes(row, x0, x1)]
+
+    def _emit(self, keys: list, output: list, state: str) -> str:
+        """
+        Append cells to output, sending SGR sequences only when they change.
+
+        Args:
+            keys: Cell keys to draw, left to right
+            output: List of strings to append to
+            state: SGR state the terminal is in
+
+        Returns:
+            SGR state after the cells
+        """
+        cache = self._cell_cache
+        for key in keys:
+            cell = cache.get(key)
+            if cell is None:
+                cell = cache[key] = self._make_cell(*key)
+            sgr, char = cell
+            if sgr and sgr != state:
+                output.append(sgr)
+                state = sgr
+            output.append(char)
+        return state
+
+    def _rows_used(self, use_half_blocks: bool) -> int:
+        """Terminal rows covered by the display."""
+        # Half-block mode uses height/2 rows, full mode uses height rows
+        if use_half_blocks:
+            return (self.display.height + 1) // 2
+        return self.display.height
+
+    def _render_rows(self, rows: list) -> str:
+        """Render full rows of cell keys, resetting colours at each line end."""
+        lines = []
+        for keys in rows:
+            output = []
+            if self._emit(keys, output, self.RESET) != self.RESET:
+                output.append(self.RESET)
+            lines.append(''.join(output))
+        return '\n'.join(lines)
 
     def render(self, use_half_blocks: bool = True) -> str:
         """
@@ -129,96 +1421,126 @@ class TerminalRenderer:
         Returns:
             String with ANSI escape codes for terminal display
         """
+        return self._render_rows([self._row_keys(row, use_half_blocks)
+                                  for row in range(self._rows_used(use_half_blocks))])
+
+    def render_changes(self, use_half_blocks: bool = True,
+                       rects: Optional[list] = None) -> str:
+        """
+        Render only the cells that differ from the last frame written.
+
+        Args:
+            use_half_blocks: Must match the mode of the last full render
+            rects: Optional (x, y, width, height) pixel rectangles to limit
+                   the comparison to (e.g. the display's damage)
+
+        Returns:
+            String of positioned ANSI updates (empty if nothing changed)
+        """
+        width = self.display.width
+        pixels_per_row = 2 if use_half_blocks else 1
+        rows_used = self._rows_used(use_half_blocks)
+        if rects is None:
+            rects = [(0, 0, width, self.display.height)]
+
         output = []
+        state = self.RESET  # Every frame ends with colours reset
+        for x, y, w, h in rects:
+            x0, x1 = max(0, x), min(width, x + w)
+            first_row = max(0, y // pixels_per_row)
+            last_row = min(rows_used - 1, (y + h - 1) // pixels_per_row)
+            if x0 >= x1:
+                continue
+            for row in range(first_row, last_row + 1):
+                old = self.cells[row]
+                new = self._row_keys(row, use_half_blocks, x0, x1)
+                run_start = None
+                gap = 0
+                for i, key in enumerate(new, x0):
+                    if key != old[i]:
+                        if run_start is None:
+                            run_start = i
+                        gap = 0
+                        old[i] = key
+                    elif run_start is not None:
+                        gap += 1
+                        if gap >= self.MERGE_GAP:
+                            output.append(f'\033[{row + 1};{run_start + 1}H')
+                            state = self._emit(old[run_start:i - gap + 1], output, state)
+                            run_start = None
+                if run_start is not None:
+                    output.append(f'\033[{row + 1};{run_start + 1}H')
+                    state = self._emit(old[run_start:x0 + len(new) - gap], output, state)
 
-        if not use_half_blocks:
-            # Simple mode: one character per pixel
-            for y in range(self.display.height):
-                line = []
-                for x in range(self.display.width):
-                    pixel = self.display.buffer[y][x]
-
-                    if self.display.color_mode == 'mono':
-                        line.append(self.pixel_char if pixel else self.off_char)
-                    else:  # RGB
-                        r, g, b = pixel
-                        if r == 0 and g == 0 and b == 0:
-                            line.append(self.off_char)
-                        else:
-                            color = self.rgb_to_ansi(r, g, b)
-                            line.append(f'{color}{self.pixel_char}{self.RESET}')
-
-                output.append(''.join(line))
-        else:
-            # Half-block mode: pack 2 vertical pixels per character
-            # Process pairs of rows
-            for y in range(0, self.display.height, 2):
-                line = []
-                for x in range(self.display.width):
-                    top_pixel = self.display.buffer[y][x]
-                    bottom_pixel = self.display.buffer[y + 1][x] if y + 1 < self.display.height else (False if self.display.color_mode == 'mono' else (0, 0, 0))
-
-                    if self.display.color_mode == 'mono':
-                        # Determine which character to use
-                        if top_pixel and bottom_pixel:
-                            line.append(self.pixel_char)  # Full block
-                        elif top_pixel and not bottom_pixel:
-                            line.append(self.upper_half_char)  # Upper half
-                        elif not top_pixel and bottom_pixel:
-                            line.append(self.lower_half_char)  # Lower half
-                        else:
-                            line.append(self.off_char)  # Empty
-                    else:  # RGB mode
-                        r1, g1, b1 = top_pixel
-                        r2, g2, b2 = bottom_pixel
-
-                        top_on = not (r1 == 0 and g1 == 0 and b1 == 0)
-                        bottom_on = not (r2 == 0 and g2 == 0 and b2 == 0)
-
-                        if top_on and bottom_on:
-                            # Both on - use foreground color for top, background for bottom
-                            fg = self.rgb_to_ansi(r1, g1, b1, False)
-                            bg = self.rgb_to_ansi(r2, g2, b2, True)
-                            line.append(f'{fg}{bg}{self.upper_half_char}{self.RESET}')
-                        elif top_on:
-                            # Only top on
-                            fg = self.rgb_to_ansi(r1, g1, b1, False)
-                            line.append(f'{fg}{self.upper_half_char}{self.RESET}')
-                        elif bottom_on:
-                            # Only bottom on
-                            fg = self.rgb_to_ansi(r2, g2, b2, False)
-                            line.append(f'{fg}{self.lower_half_char}{self.RESET}')
-                        else:
-                            # Both off
-                            line.append(self.off_char)
-
-                output.append(''.join(line))
-
-        return '\n'.join(output)
-
-    def display_in_terminal(self, use_half_blocks: bool = True, clear_screen: bool = True):
+        if state != self.RESET:
+            output.append(self.RESET)
+        return ''.join(output)
+
+    def render_rects(self, rects: list, use_half_blocks: bool = True) -> str:
+        """
+        Render the given damage rectangles, using cursor positioning.
+
+        Args:
+            rects: List of (x, y, width, height) pixel rectangles
+            use_half_blocks: Must match the mode used for the last full render
+
+        Returns:
+            String of positioned ANSI updates (empty if rects is empty)
+        """
+        # Each terminal row covers 2 pixel rows in half-block mode
+        pixels_per_row = 2 if use_half_blocks else 1
+
+        output = []
+        state = self.RESET
+        for x, y, w, h in rects:
+            first_row = y // pixels_per_row
+            last_row = (y + h - 1) // pixels_per_row
+            for row in range(first_row, last_row + 1):
+                output.append(f'\033[{row + 1};{x + 1}H')
+                state = self._emit(self._row_keys(row, use_half_blocks, x, x + w),
+                                   output, state)
+
+        if state != self.RESET:
+            output.append(self.RESET)
+        return ''.join(output)
+
+    def display_in_terminal(self, use_half_blocks: bool = True, clear_screen: bool = True,
+                            rects: Optional[list] = None):
         """
         Display the current framebuffer in the terminal.
 
         Args:
             use_half_blocks: Use half-block characters for compact display
-            clear_screen: Clear terminal before rendering
+            clear_screen: Clear terminal and repaint every cell. Otherwise only
+                          cells that changed since the last frame are written.
+            rects: If given (and clear_screen is False), only look for changes
+                   inside these damage rectangles
         """
-        if clear_screen:
-            # Clear terminal and move cursor to home
-            print('\033[2J\033[H', end='')
+        rows_used = self._rows_used(use_half_blocks)
+        cached = (self.cells is not None and
+                  self.cells_half_blocks == use_half_blocks and
+                  len(self.cells) == rows_used and
+                  all(len(row) == self.display.width for row in self.cells))
 
-        # Render the matrix
-        matrix_output = self.render(use_half_blocks)
-        print(matrix_output)
+        if cached and not clear_screen:
+            # Partial update: repaint changed cells, then park the cursor
+            # below the matrix again
+            changes = self.render_changes(use_half_blocks, rects)
+            if changes:
+                self.write(changes + f'\033[{rows_used + 3};1H')
+            return
 
-        # Calculate number of rows used by matrix
-        # Half-block mode uses height/2 rows, full mode uses height rows
-        rows_used = (self.display.height // 2) if use_half_blocks else self.display.height
+        self.cells = [self._row_keys(row, use_half_blocks) for row in range(rows_used)]
+        self.cells_half_blocks = use_half_blocks
+
+        # Clear terminal (or just go home) and render the matrix
+        output = ['\033[2J\033[H' if clear_screen else '\033[H',
+                  self._render_rows(self.cells), '\n']
 
         # Position cursor below matrix for log output (leave 1 blank line)
         # This ensures any print() statements appear below the matrix
-        print(f'\033[{rows_used + 2};1H', end='')
+        output.append(f'\033[{rows_used + 2};1H')
 
         # Add a separator line
-        print('─' * min(self.display.width, 80))
+        output.append('─' * min(self.display.width, 80) + '\n')
+        self.write(''.join(output))
@@ -1,31 +1,188 @@
 """
 ZX Spectrum-style font system for LED matrix display.
 8x8 pixel characters with RGB color support.
+
+Other bitmap fonts can be loaded from BDF or PCF files (see font_loader);
+their glyphs keep their own advance widths, so text is proportional.
+
+Glyphs are rasterized into spans once, when the font is loaded or a
+character is registered. A string drawn to a framebuffer a second time
+is rendered into a Bitmap and kept in a small LRU cache, so a label
+redrawn every frame costs one blit; text that keeps changing (scores,
+clocks) is drawn straight from the glyph spans and never fills the
+cache. Text can be drawn at integer scale factors; scaled glyphs are
+cached too.
 """
 
+from collections import OrderedDict
 from typing import Tuple, Union, Optional, Dict
-from matrixos.display import Display
+from matrixos.display import Bitmap, Display
+from matrixos.font_loader import load_font_file
+from matrixos.graphics import draw_spans
 
 
 # Type alias for color
 Color = Union[bool, Tuple[int, int, int]]
 
 
+class Glyph:
+    """
+    A pre-rasterized character.
+
+    `spans` are the (dy, x0, x1) runs of lit pixels and `gaps` the unlit
+    runs of its cell (painted when there is a background color). The cell
+    is `width` pixels wide - the pen advance - and `height` rows tall.
+    """
+
+    __slots__ = ('width', 'height', 'spans', 'gaps')
+
+    def __init__(self, width: int, height: int, spans: list, gaps: Optional[list] = None):
+        """
+        Args:
+            width: Advance width (cell width)
+            height: Cell height
+            spans: Lit (dy, x0, x1) runs
+            gaps: Unlit runs of the cell (default: worked out from spans)
+        """
+        self.width = width
+        self.height = height
+        self.spans = spans
+        if gaps is None:
+            gaps = []
+            rows = {}
+            for dy, x0, x1 in spans:
+                rows.setdefault(dy, []).append((x0, x1))
+            for dy in range(height):
+                x = 0
+                for x0, x1 in sorted(rows.get(dy, ())):
+                    if x0 > x:
+                        gaps.append((dy, x, min(x0, width) - 1))
+                    x = max(x, x1 + 1)
+                if x < width:
+                    gaps.append((dy, x, width - 1))
+        self.gaps = gaps
+
+    @classmethod
+    def from_rows(cls, rows: list, width: int = 8, height: int = 8, x_offset: int = 0,
+                  top: int = 0, advance: Optional[int] = None,
+                  cell_height: Optional[int] = None) -> 'Glyph':
+        """
+        Rasterize a glyph from bitmap rows.
+
+        Args:
+            rows: One integer per row, MSB = leftmost of `width` pixels
+            width, height: Size of the bitmap
+            x_offset, top: Where the bitmap sits in the cell
+            advance: Cell width (default: width)
+            cell_height: Cell height (default: height); rows outside are dropped
+
+        Returns:
+            Glyph
+        """
+        if advance is None:
+            advance = width
+        if cell_height is None:
+            cell_height = height
+        spans = []
+        for row in range(height):
+            dy = top + row
+            if not 0 <= dy < cell_height:
+                continue
+            bits = rows[row] if row < len(rows) else 0
+            col = 0
+            while col < width:
+                if bits & (1 << (width - 1 - col)):
+                    start = col
+                    while col < width and bits & (1 << (width - 1 - col)):
+                        col += 1
+                    spans.append((dy, x_offset + start, x_offset + col - 1))
+                else:
+                    col += 1
+        return cls(advance, cell_height, spans)
+
+    def scaled(self, scale: int) -> 'Glyph':
+        """This glyph with every pixel drawn as a scale x scale block."""
+        def grow(spans):
+            return [(dy * scale + k, x0 * scale, x1 * scale + scale - 1)
+                    for dy, x0, x1 in spans for k in range(scale)]
+        return Glyph(self.width * scale, self.height * scale,
+                     grow(self.spans), grow(self.gaps))
+
+
 class Font:
     """
     Font class for rendering text on LED matrix.
     Based on ZX Spectrum 8x8 character set.
     """
 
-    def __init__(self):
-        """Initialize font with ZX Spectrum character set."""
+    def __init__(self, path: Optional[str] = None, text_cache_size: int = 128):
+        """
+        Initialize font with ZX Spectrum character set.
+
+        Args:
+            path: BDF or PCF font file to load instead (see load())
+            text_cache_size: Rendered strings kept for reuse (0 = no cache)
+        """
         self.char_width = 8
         self.char_height = 8
         self.charset = {}
         self.custom_chars = {}
+        self.glyphs: Dict[str, Glyph] = {}
+        self.default_char = ' '  # Drawn for characters the font lacks
+        self.scaled_glyphs: Dict[Tuple[str, int], Glyph] = {}
+        self.glyph_version = 0  # Bumped when glyphs change (text_layout's cache key)
+
+        # Rendered strings: (text, mode, fg, bg, spacing, scale) -> (Bitmap, x offset)
+        self.text_cache = OrderedDict()
+        self.text_cache_size = text_cache_size
+        # Keys of strings drawn once; drawn again, they are cached
+        self.text_seen = OrderedDict()
+        self.text_hits = 0
+        self.text_misses = 0
+        self.text_evictions = 0
+
+        if path is not None:
+            self.load(path)
+            return
 
         # Load default ZX Spectrum font
         self._load_zx_spectrum_font()
+        for char, bitmap in self.charset.items():
+            self.glyphs[char] = Glyph.from_rows(bitmap)
+
+    def load(self, path: str):
+        """
+        Replace the glyphs with a BDF or PCF bitmap font.
+
+        Glyphs keep their own advance widths; char_width becomes the widest
+        advance (used for grid positions) and char_height the line height.
+        Characters registered with register_char() are kept.
+
+        Args:
+            path: .bdf or .pcf file, optionally gzip-compressed
+        """
+        data = load_font_file(path)
+        height = data.ascent + data.descent
+        self.charset = {}
+        self.glyphs = {
+            chr(codepoint): Glyph.from_rows(rows, width, glyph_height, x_offset, top,
+                                            advance, height)
+            for codepoint, (rows, width, glyph_height, x_offset, top, advance)
+            in data.glyphs.items() if codepoint <= 0x10FFFF
+        }
+        self.char_height = height
+        self.char_width = max((g.width for g in self.glyphs.values()), default=8)
+
+        self.default_char = ' '
+        if data.default_char is not None and chr(data.default_char) in self.glyphs:
+            self.default_char = chr(data.default_char)
+        if self.default_char not in self.glyphs:
+            self.glyphs[self.default_char] = Glyph(self.char_width, height, [])
+        for char, bitmap in self.custom_chars.items():
+            self.glyphs[char] = Glyph.from_rows(bitmap)
+        self.scaled_glyphs.clear()
+        self.text_cache.clear()
+        self.glyph_version += 1
 
     def _load_zx_spectrum_font(self):
         """
@@ -232,6 +389,11 @@ class Font:
             raise ValueError("Bitmap must be exactly 8 rows")
 
         self.custom_chars[char] = bitmap
+        self.glyphs[char] = Glyph.from_rows(bitmap)
+        # Cached scaled glyphs, strings and layouts may use the old glyph
+        self.scaled_glyphs.clear()
+        self.text_cache.clear()
+        self.glyph_version += 1
 
     def get_char_bitmap(self, char: str) -> Optional[list]:
         """
@@ -242,6 +404,8 @@ class Font:
 
         Returns:
             List of 8 bytes representing the character, or None if not found
+            (always None for fonts loaded from a file, except registered
+            characters - use get_glyph())
         """
         # Check custom characters first
         if char in self.custom_chars:
@@ -254,8 +418,55 @@ class Font:
         # Return space if character not found
         return self.charset.get(' ')
 
+    def get_glyph(self, char: str, scale: int = 1) -> Optional[Glyph]:
+        """
+        Pre-rasterized glyph for a character (the default char if not found).
+
+        Args:
+            char: Character to look up
+            scale: Integer scale factor; scaled glyphs are cached
+
+        Returns:
+            Glyph, or None if the font has neither the char nor a default
+        """
+        if char not in self.glyphs:
+            char = self.default_char
+        glyph = self.glyphs.get(char)
+        if scale == 1 or glyph is None:
+            return glyph
+        if not isinstance(scale, int) or scale < 1:
+            raise ValueError(f"Scale must be a positive integer, not {scale!r}")
+        scaled = self.scaled_glyphs.get((char, scale))
+        if scaled is None:
+            scaled = glyph.scaled(scale)
+            self.scaled_glyphs[(char, scale)] = scaled
+        return scaled
+
+    def measure(self, text: str, scale: int = 1, spacing: int = 0) -> Tuple[int, int]:
+        """
+        Size of a string as draw_text() would draw it.
+
+        Args:
+            text: Text to measure
+            scale: Integer scale factor
+            spacing: Additional spacing between characters
+
+        Returns:
+            (width, height) in pixels: the sum of the advances (plus spacing
+            between characters) and the line height
+        """
+        width = 0
+        for char in text:
+            glyph = self.get_glyph(char)
+            if glyph is not None:
+                width += glyph.width
+        width *= scale
+        if len(text) > 1:
+            width += spacing * (len(text) - 1)
+        return width, self.char_height * scale
+
     def draw_char(self, display: Display, char: str, x: int, y: int,
-                  color: Color = True, bg_color: Optional[Color] = None):
+                  color: Color = True, bg_color: Optional[Color] = None, scale: int = 1):
         """
         Draw a single character at pixel position.
 
@@ -265,26 +476,26 @@ class Font:
             x, y: Top-left pixel position
             color: Foreground color
             bg_color: Background color (None = transparent)
+            scale: Integer scale factor
         """
-        bitmap = self.get_char_bitmap(char)
-        if not bitmap:
+        glyph = self.get_glyph(char, scale)
+        if glyph is None:
             return
 
-        for row in range(8):
-            byte = bitmap[row]
-            for col in range(8):
-                # Check if pixel is set (bit is 1)
-                if byte & (0x80 >> col):
-                    display.set_pixel(x + col, y + row, color)
-                elif bg_color is not None:
-                    # Draw background
-                    display.set_pixel(x + col, y + row, bg_color)
+        if bg_color is not None:
+            draw_spans(display, x, y, glyph.gaps, bg_color)
+        draw_spans(display, x, y, glyph.spans, color)
 
     def draw_text(self, display: Display, text: str, x: int, y: int,
-                  color: Color = True, bg_color: Optional[Color] = None, spacing: int = 0):
+                  color: Color = True, bg_color: Optional[Color] = None, spacing: int = 0,
+                  scale: int = 1):
         """
         Draw text string at pixel position.
 
+        On a framebuffer a string drawn before is rendered once (see
+        render_text) and blitted from the cache; a string seen for the first
+        time, and anything on other displays, is drawn glyph by glyph.
+
         Args:
             display: Display instance
             text: Text to draw
@@ -292,11 +503,147 @@ class Font:
             color: Foreground color
             bg_color: Background color (None = transparent)
             spacing: Additional spacing between characters
+            scale: Integer scale factor
         """
+        if isinstance(display, Display):
+            if not text:
+                return
+            key = self._text_key(display, text, color, bg_color, spacing, scale)
+            entry = self.text_cache.get(key)
+            if entry is not None:
+                self.text_cache.move_to_end(key)
+                self.text_hits += 1
+                display.blit(entry[0], x + entry[1], y)
+                return
+            self.text_misses += 1
+            if key in self.text_seen:
+                # Second sighting: worth caching
+                del self.text_seen[key]
+                bitmap, offset = self._cache_text(key, self._render(display, text, key))
+                display.blit(bitmap, x + offset, y)
+                return
+            if self.text_cache_size > 0:
+                self.text_seen[key] = True
+                while len(self.text_seen) > self.text_cache_size:
+                    self.text_seen.popitem(last=False)
+
         cursor_x = x
         for char in text:
-            self.draw_char(display, char, cursor_x, y, color, bg_color)
-            cursor_x += self.char_width + spacing
+            glyph = self.get_glyph(char, scale)
+            if glyph is None:
+                continue
+            if bg_color is not None:
+                draw_spans(display, cursor_x, y, glyph.gaps, bg_color)
+            draw_spans(display, cursor_x, y, glyph.spans, color)
+            cursor_x += glyph.width + spacing
+
+    def render_text(self, display: Display, text: str, color: Color = True,
+                    bg_color: Optional[Color] = None, spacing: int = 0,
+                    scale: int = 1) -> Tuple[Bitmap, int]:
+        """
+        Render a string into a Bitmap matching `display`'s color mode (cached).
+
+        Cells without a background are transparent (alpha mask), so the
+        bitmap blits exactly like drawing the characters one by one.
+
+        Args:
+            display: Framebuffer the bitmap will be blitted to
+            text: Text to render (not empty)
+            color: Foreground color
+            bg_color: Background color (None = transparent)
+            spacing: Additional spacing between characters
+            scale: Integer scale factor
+
+        Returns:
+            (bitmap, offset): blit the bitmap `offset` pixels right of the
+            text position (negative spacing or bearings can start the
+            string to the left)
+        """
+        key = self._text_key(display, text, color, bg_color, spacing, scale)
+        entry = self.text_cache.get(key)
+        if entry is not None:
+            self.text_cache.move_to_end(key)
+            self.text_hits += 1
+            return entry
+
+        self.text_misses += 1
+        self.text_seen.pop(key, None)
+        return self._cache_text(key, self._render(display, text, key))
+
+    @staticmethod
+    def _text_key(display: Display, text: str, color: Color, bg_color: Optional[Color],
+                  spacing: int, scale: int) -> tuple:
+        """Rendered-string cache key."""
+        bg = None if bg_color is None else display.pack_color(bg_color)
+        return (text, display.color_mode, display.pack_color(color), bg, spacing, scale)
+
+    def _cache_text(self, key: tuple, entry: Tuple[Bitmap, int]) -> Tuple[Bitmap, int]:
+        """Store a rendered string, evicting the least recently used."""
+        if self.text_cache_size > 0:
+            self.text_cache[key] = entry
+            while len(self.text_cache) > self.text_cache_size:
+                self.text_cache.popitem(last=False)
+                self.text_evictions += 1
+        return entry
+
+    def _render(self, display: Display, text: str, key: tuple) -> Tuple[Bitmap, int]:
+        """Render a string into a Bitmap (see render_text())."""
+        _, _, fg, bg, spacing, scale = key
+        placed = []
+        left = 0
+        right = 0
+        pen = 0
+        for char in text:
+            glyph = self.get_glyph(char, scale)
+            if glyph is None:
+                continue
+            placed.append((glyph, pen))
+            left = min([left, pen] + [pen + x0 for _, x0, _ in glyph.spans])
+            right = max([right, pen + glyph.width] + [pen + x1 + 1 for _, _, x1 in glyph.spans])
+            pen += glyph.width + spacing
+        width = max(1, right - left)
+        height = self.char_height * scale
+
+        bitmap = Bitmap(width, height, display.color_mode, display.palette)
+        buffer = bitmap.buffer
+        bpp = bitmap.bytes_per_pixel
+        alpha = bytearray(width * height)
+
+        def paint(spans, packed, x):
+            for dy, x0, x1 in spans:
+                n = x1 - x0 + 1
+                start = dy * width + x + x0
+                buffer[start * bpp:(start + n) * bpp] = packed * n
+                alpha[start:start + n] = b'\xff' * n
+
+        for glyph, pen in placed:
+            if bg is not None:
+                paint(glyph.gaps, bg, pen - left)
+            paint(glyph.spans, fg, pen - left)
+        if alpha.count(255) != len(alpha):
+            bitmap.alpha = alpha
+        return bitmap, left
+
+    def get_cache_stats(self) -> dict:
+        """
+        Rendered-string cache statistics.
+
+        Returns:
+            dict: glyphs (pre-rasterized), scaled_glyphs, hits, misses,
+                  evictions, entries, max_entries and hit_rate (fraction of
+                  lookups that hit)
+        """
+        lookups = self.text_hits + self.text_misses
+        return {
+            'glyphs': len(self.glyphs),
+            'scaled_glyphs': len(self.scaled_glyphs),
+            'hits': self.text_hits,
+            'misses': self.text_misses,
+            'evictions': self.text_evictions,
+            'entries': len(self.text_cache),
+            'max_entries': self.text_cache_size,
+            'hit_rate': self.text_hits / lookups if lookups else 0.0,
+        }
 
     def draw_text_grid(self, display: Display, text: str, col: int, row: int,
                        color: Color = True, bg_color: Optional[Color] = None):
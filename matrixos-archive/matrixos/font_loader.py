@@ -0,0 +1,283 @@
+"""
+Bitmap font loader for MatrixOS
+
+Reads X11 bitmap fonts - BDF (text) and PCF (binary, as shipped in
+/usr/share/fonts/X11), optionally gzip-compressed - into plain glyph
+records that font.Font turns into pre-rasterized glyphs.
+
+Each glyph record is (rows, width, height, x_offset, top, advance):
+rows holds one integer per bitmap row, MSB = leftmost of `width` pixels;
+the bitmap sits `x_offset` pixels right of the pen position and `top`
+rows below the top of the line (ascent + descent rows tall); `advance`
+is how far the pen moves on.
+"""
+
+import gzip
+import struct
+from typing import Dict, Optional, Tuple
+
+GlyphRecord = Tuple[list, int, int, int, int, int]
+
+# PCF table types
+PCF_PROPERTIES = 1 << 0
+PCF_ACCELERATORS = 1 << 1
+PCF_METRICS = 1 << 2
+PCF_BITMAPS = 1 << 3
+PCF_BDF_ENCODINGS = 1 << 5
+PCF_BDF_ACCELERATORS = 1 << 8
+
+# PCF format bits
+PCF_COMPRESSED_METRICS = 0x100
+PCF_GLYPH_PAD_MASK = 0x3
+PCF_BYTE_MASK = 0x4  # Set: most significant byte first
+PCF_BIT_MASK = 0x8  # Set: most significant bit first
+PCF_SCAN_UNIT_MASK = 0x30
+
+# Reverses the bits of a byte (LSBit-first PCF bitmaps)
+_BIT_REVERSE = bytes(int(f'{v:08b}'[::-1], 2) for v in range(256))
+
+
+class FontData:
+    """Glyphs and line metrics read from a font file."""
+
+    def __init__(self, ascent: int, descent: int, glyphs: Dict[int, GlyphRecord],
+                 default_char: Optional[int] = None):
+        """
+        Args:
+            ascent, descent: Rows above and below the baseline
+            glyphs: Glyph records by codepoint
+            default_char: Codepoint drawn for characters the font lacks
+        """
+        self.ascent = ascent
+        self.descent = descent
+        self.glyphs = glyphs
+        self.default_char = default_char
+
+
+def load_font_file(path: str) -> FontData:
+    """
+    Read a BDF or PCF font (gzip-compressed or not).
+
+    Args:
+        path: Font file
+
+    Returns:
+        FontData
+
+    Raises:
+        ValueError: The file is neither BDF nor PCF
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:2] == b'\x1f\x8b':
+        data = gzip.decompress(data)
+    if data[:4] == b'\x01fcp':
+        return parse_pcf(data)
+    if data.lstrip()[:9] == b'STARTFONT':
+        return parse_bdf(data.decode('latin-1'))
+    raise ValueError(f"Not a BDF or PCF font: {path}")
+
+
+# ============================================================================
+# BDF
+# ============================================================================
+
+def parse_bdf(text: str) -> FontData:
+    """
+    Parse a BDF (Glyph Bitmap Distribution Format) font.
+
+    Args:
+        text: Contents of the .bdf file
+
+    Returns:
+        FontData
+    """
+    ascent = descent = None
+    bbox = (0, 0, 0, 0)
+    font_advance = None
+    default_char = None
+    glyphs = {}
+
+    lines = iter(text.splitlines())
+    for line in lines:
+        parts = line.split()
+        if not parts:
+            continue
+        keyword = parts[0]
+        if keyword == 'FONTBOUNDINGBOX':
+            bbox = tuple(int(v) for v in parts[1:5])
+        elif keyword == 'FONT_ASCENT':
+            ascent = int(parts[1])
+        elif keyword == 'FONT_DESCENT':
+            descent = int(parts[1])
+        elif keyword == 'DEFAULT_CHAR':
+            default_char = int(parts[1])
+        elif keyword == 'DWIDTH':
+            font_advance = int(parts[1])  # Font-wide default (METRICSSET fonts)
+        elif keyword == 'STARTCHAR':
+            glyph = _parse_bdf_char(lines, bbox, font_advance)
+            if glyph is not None:
+                codepoint, record = glyph
+                glyphs[codepoint] = record
+
+    if ascent is None:
+        ascent = bbox[1] + bbox[3]
+    if descent is None:
+        descent = -bbox[3]
+    # Make room for glyphs reaching past the declared ascent/descent
+    for rows, width, height, x_offset, y_offset, advance in glyphs.values():
+        ascent = max(ascent, y_offset + height)
+        descent = max(descent, -y_offset)
+    return FontData(ascent, descent, {
+        codepoint: (rows, width, height, x_offset, ascent - y_offset - height, advance)
+        for codepoint, (rows, width, height, x_offset, y_offset, advance) in glyphs.items()
+    }, default_char)
+
+
+def _parse_bdf_char(lines, bbox: tuple, font_advance: Optional[int]):
+    """
+    Parse one STARTCHAR ... ENDCHAR block.
+
+    Returns:
+        (codepoint, (rows, width, height, x_offset, y_offset, advance)) with
+        y_offset still relative to the baseline, or None for unencoded glyphs
+    """
+    codepoint = -1
+    width, height, x_offset, y_offset = bbox
+    advance = font_advance
+    rows = []
+    for line in lines:
+        parts = line.split()
+        if not parts:
+            continue
+        keyword = parts[0]
+        if keyword == 'ENCODING':
+            codepoint = int(parts[1])
+        elif keyword == 'DWIDTH':
+            advance = int(parts[1])
+        elif keyword == 'BBX':
+            width, height, x_offset, y_offset = (int(v) for v in parts[1:5])
+        elif keyword == 'BITMAP':
+            padded = (width + 7) // 8 * 8
+            for line in lines:
+                line = line.strip()
+                if line == 'ENDCHAR':
+                    break
+                rows.append(int(line, 16) >> (padded - width) if line else 0)
+            break
+        elif keyword == 'ENDCHAR':
+            break
+
+    if codepoint < 0:
+        return None
+    if advance is None:
+        advance = width
+    return codepoint, (rows, width, height, x_offset, y_offset, advance)
+
+
+# ============================================================================
+# PCF
+# ============================================================================
+
+def parse_pcf(data: bytes) -> FontData:
+    """
+    Parse a PCF (Portable Compiled Format) font.
+
+    Args:
+        data: Contents of the .pcf file (decompressed)
+
+    Returns:
+        FontData
+    """
+    count, = struct.unpack_from('<I', data, 4)
+    tables = {}
+    for i in range(count):
+        kind, fmt, size, offset = struct.unpack_from('<IIII', data, 8 + i * 16)
+        tables[kind] = offset
+    for required in (PCF_METRICS, PCF_BITMAPS, PCF_BDF_ENCODINGS):
+        if required not in tables:
+            raise ValueError("PCF font is missing a required table")
+
+    metrics = _pcf_metrics(data, tables[PCF_METRICS])
+    bitmaps = _pcf_bitmaps(data, tables[PCF_BITMAPS], metrics)
+    encoding, default_char = _pcf_encodings(data, tables[PCF_BDF_ENCODINGS])
+
+    accelerators = tables.get(PCF_BDF_ACCELERATORS, tables.get(PCF_ACCELERATORS))
+    if accelerators is not None:
+        fmt, = struct.unpack_from('<I', data, accelerators)
+        order = '>' if fmt & PCF_BYTE_MASK else '<'
+        ascent, descent = struct.unpack_from(order + 'ii', data, accelerators + 12)
+    else:
+        ascent = descent = 0
+    # Make room for glyphs reaching past the declared ascent/descent
+    ascent = max([ascent] + [m[3] for m in metrics])
+    descent = max([descent] + [m[4] for m in metrics])
+
+    glyphs = {}
+    for codepoint, index in encoding.items():
+        if index >= len(metrics):
+            continue
+        left, right, advance, glyph_ascent, glyph_descent = metrics[index]
+        glyphs[codepoint] = (bitmaps[index], right - left, glyph_ascent + glyph_descent,
+                             left, ascent - glyph_ascent, advance)
+    return FontData(ascent, descent, glyphs, default_char)
+
+
+def _pcf_metrics(data: bytes, offset: int) -> list:
+    """Read the metrics table: (left, right, advance, ascent, descent) per glyph."""
+    fmt, = struct.unpack_from('<I', data, offset)
+    order = '>' if fmt & PCF_BYTE_MASK else '<'
+    if fmt & 0xFFFFFF00 == PCF_COMPRESSED_METRICS:
+        count, = struct.unpack_from(order + 'H', data, offset + 4)
+        raw = data[offset + 6:offset + 6 + count * 5]
+        return [tuple(v - 0x80 for v in raw[i:i + 5]) for i in range(0, len(raw), 5)]
+    count, = struct.unpack_from(order + 'I', data, offset + 4)
+    return [struct.unpack_from(order + 'hhhhh', data, offset + 8 + i * 12)
+            for i in range(count)]
+
+
+def _pcf_bitmaps(data: bytes, offset: int, metrics: list) -> list:
+    """Read the bitmaps table: row integers (MSB = leftmost) per glyph."""
+    fmt, = struct.unpack_from('<I', data, offset)
+    order = '>' if fmt & PCF_BYTE_MASK else '<'
+    count, = struct.unpack_from(order + 'I', data, offset + 4)
+    offsets = struct.unpack_from(order + f'{count}I', data, offset + 8)
+    sizes = struct.unpack_from(order + '4I', data, offset + 8 + count * 4)
+    start = offset + 8 + count * 4 + 16
+    pad = 1 << (fmt & PCF_GLYPH_PAD_MASK)
+    unit = 1 << ((fmt & PCF_SCAN_UNIT_MASK) >> 4)
+    blob = bytearray(data[start:start + sizes[fmt & PCF_GLYPH_PAD_MASK]])
+
+    # Normalize to MSBit-first bits in MSByte-first order
+    if not fmt & PCF_BIT_MASK:
+        blob = bytearray(blob.translate(_BIT_REVERSE))
+    if unit > 1 and bool(fmt & PCF_BYTE_MASK) != bool(fmt & PCF_BIT_MASK):
+        for i in range(0, len(blob) - unit + 1, unit):
+            blob[i:i + unit] = blob[i:i + unit][::-1]
+
+    glyphs = []
+    for index, (left, right, advance, ascent, descent) in enumerate(metrics[:count]):
+        width = right - left
+        stride = (width + pad * 8 - 1) // (pad * 8) * pad
+        base = offsets[index]
+        rows = []
+        for row in range(ascent + descent):
+            chunk = blob[base + row * stride:base + (row + 1) * stride]
+            rows.append(int.from_bytes(chunk, 'big') >> (stride * 8 - width) if width > 0 else 0)
+        glyphs.append(rows)
+    return glyphs
+
+
+def _pcf_encodings(data: bytes, offset: int) -> Tuple[Dict[int, int], int]:
+    """Read the encodings table: glyph index by codepoint, and the default char."""
+    fmt, = struct.unpack_from('<I', data, offset)
+    order = '>' if fmt & PCF_BYTE_MASK else '<'
+    min2, max2, min1, max1, default_char = struct.unpack_from(order + '5H', data, offset + 4)
+    columns = max2 - min2 + 1
+    count = columns * (max1 - min1 + 1)
+    indices = struct.unpack_from(order + f'{count}H', data, offset + 14)
+    encoding = {}
+    for i, index in enumerate(indices):
+        if index != 0xFFFF:
+            encoding[((min1 + i // columns) << 8) | (min2 + i % columns)] = index
+    return encoding, default_char
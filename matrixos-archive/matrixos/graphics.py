@@ -3,7 +3,8 @@ Graphics primitives for LED matrix display.
 All functions support RGB color.
 """
 
-from typing import Tuple, Optional, Union
+from collections import OrderedDict
+from typing import Callable, Tuple, Optional, Union
 import math
 
 
@@ -11,6 +12,163 @@ import math
 Color = Union[bool, Tuple[int, int, int]]
 
 
+class SpanCache:
+    """
+    Bounded LRU cache of rasterized shapes.
+
+    Circles, ellipses, rounded rects and stars are rasterized once, relative
+    to their origin, into (dy, x0, x1) spans keyed by shape type and size.
+    Drawing the same shape again - every frame, anywhere on screen - only
+    offsets the cached spans.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Args:
+            max_entries: Shapes kept before the least recently used is
+                         dropped (0 disables caching)
+        """
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: tuple, rasterize: Callable[[], list]) -> tuple:
+        """
+        Get the spans for a shape, rasterizing it on a miss.
+
+        Args:
+            key: Shape type and parameters, e.g. ('circle', radius, fill)
+            rasterize: Called on a miss; returns the shape's spans
+
+        Returns:
+            tuple: (dy, x0, x1) spans relative to the shape's origin
+        """
+        spans = self.entries.get(key)
+        if spans is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return spans
+
+        self.misses += 1
+        spans = tuple(rasterize())
+        if self.max_entries > 0:
+            self.entries[key] = spans
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+        return spans
+
+    def clear(self):
+        """Drop every cached shape and reset the statistics."""
+        self.entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def get_stats(self) -> dict:
+        """
+        Cache statistics.
+
+        Returns:
+            dict: hits, misses, evictions, entries, max_entries and
+                  hit_rate (fraction of lookups that were hits)
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'max_entries': self.max_entries,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Shared by every draw_* function below
+span_cache = SpanCache()
+
+
+class _PixelRecorder:
+    """Stand-in display that records the pixels a shape plots."""
+
+    def __init__(self):
+        self.pixels = set()
+
+    def set_pixel(self, x, y, color=True):
+        self.pixels.add((x, y))
+
+    def spans(self) -> list:
+        """The recorded pixels as (y, x0, x1) runs."""
+        spans = []
+        for y, x in sorted((y, x) for x, y in self.pixels):
+            if spans and spans[-1][0] == y and spans[-1][2] == x - 1:
+                spans[-1] = (y, spans[-1][1], x)
+            else:
+                spans.append((y, x, x))
+        return spans
+
+
+def draw_span(display, y: int, x0: int, x1: int, color: Color = True):
+    """
+    Fill one horizontal span from x0 to x1 inclusive (either order).
+
+    Uses the display's clipped fill_span() when it has one (Display and
+    every DisplayDriver do), so a span is one call instead of one
+    set_pixel() per pixel.
+
+    Args:
+        display: Display instance
+        y: Row
+        x0, x1: End columns
+        color: True for mono, (r,g,b) for RGB
+    """
+    fill_span = getattr(display, 'fill_span', None)
+    if fill_span is not None:
+        fill_span(y, x0, x1, color)
+        return
+    if x0 > x1:
+        x0, x1 = x1, x0
+    for x in range(x0, x1 + 1):
+        display.set_pixel(x, y, color)
+
+
+def draw_spans(display, x: int, y: int, spans, color: Color = True):
+    """
+    Draw (dy, x0, x1) spans offset by (x, y), e.g. a cached shape.
+
+    Framebuffers write them all with one fill_spans() call; other displays
+    get one fill_span() (or set_pixel() run) per span.
+
+    Args:
+        display: Display instance
+        x, y: Offset
+        spans: Iterable of (dy, x0, x1) inclusive spans, x0 <= x1
+        color: True for mono, (r,g,b) for RGB
+    """
+    fill_spans = getattr(display, 'fill_spans', None)
+    if fill_spans is not None:
+        fill_spans(spans, x, y, color)
+        return
+    for dy, x0, x1 in spans:
+        draw_span(display, y + dy, x + x0, x + x1, color)
+
+
+def draw_hline(display, x: int, y: int, width: int, color: Color = True):
+    """Draw a horizontal line of `width` pixels starting at (x, y)."""
+    if width > 0:
+        draw_span(display, y, x, x + width - 1, color)
+
+
+def draw_vline(display, x: int, y: int, height: int, color: Color = True):
+    """Draw a vertical line of `height` pixels starting at (x, y)."""
+    vline = getattr(display, 'vline', None)
+    if vline is not None:
+        vline(x, y, height, color)
+        return
+    for dy in range(height):
+        display.set_pixel(x, y + dy, color)
+
+
 def draw_line(display, x0: int, y0: int, x1: int, y1: int, color: Color = True):
     """
     Draw a line using Bresenham's algorithm.
@@ -21,6 +179,13 @@ def draw_line(display, x0: int, y0: int, x1: int, y1: int, color: Color = True):
         x1, y1: Ending point
         color: True for mono, (r,g,b) for RGB
     """
+    if y0 == y1:
+        draw_span(display, y0, x0, x1, color)
+        return
+    if x0 == x1:
+        draw_vline(display, x0, min(y0, y1), abs(y1 - y0) + 1, color)
+        return
+
     dx = abs(x1 - x0)
     dy = abs(y1 - y0)
     sx = 1 if x0 < x1 else -1
@@ -58,19 +223,22 @@ def draw_rect(display, x: int, y: int, width: int, height: int,
     """
     if fill:
         # Filled rectangle
-        for dy in range(height):
-            for dx in range(width):
-                display.set_pixel(x + dx, y + dy, color)
+        fill_rect = getattr(display, 'fill_rect', None)
+        if fill_rect is not None:
+            # Framebuffer fast path (row slices or a NumPy assignment)
+            fill_rect(x, y, width, height, color)
+            return
+        if width > 0:
+            for dy in range(height):
+                draw_span(display, y + dy, x, x + width - 1, color)
     else:
         # Outline only
         # Top and bottom
-        for dx in range(width):
-            display.set_pixel(x + dx, y, color)
-            display.set_pixel(x + dx, y + height - 1, color)
+        draw_hline(display, x, y, width, color)
+        draw_hline(display, x, y + height - 1, width, color)
         # Left and right
-        for dy in range(height):
-            display.set_pixel(x, y + dy, color)
-            display.set_pixel(x + width - 1, y + dy, color)
+        draw_vline(display, x, y, height, color)
+        draw_vline(display, x + width - 1, y, height, color)
 
 
 def draw_circle(display, cx: int, cy: int, radius: int,
@@ -78,6 +246,8 @@ def draw_circle(display, cx: int, cy: int, radius: int,
     """
     Draw a circle using midpoint circle algorithm.
 
+    The spans are cached per radius (see SpanCache).
+
     Args:
         display: Display instance
         cx, cy: Center point
@@ -85,35 +255,46 @@ def draw_circle(display, cx: int, cy: int, radius: int,
         color: True for mono, (r,g,b) for RGB
         fill: If True, fill the circle
     """
+    spans = span_cache.get(('circle', radius, fill), lambda: _circle_spans(radius, fill))
+    draw_spans(display, cx, cy, spans, color)
+
+
+def _circle_spans(radius: int, fill: bool) -> list:
+    """Rasterize a circle centred on (0, 0)."""
     if fill:
-        # Filled circle - draw horizontal lines
+        # Filled circle - one span per row
+        spans = []
         for y in range(-radius, radius + 1):
             x = int(math.sqrt(radius * radius - y * y))
-            draw_line(display, cx - x, cy + y, cx + x, cy + y, color)
-    else:
-        # Outline only - midpoint circle algorithm
-        x = radius
-        y = 0
-        err = 0
-
-        while x >= y:
-            # Draw 8 octants
-            display.set_pixel(cx + x, cy + y, color)
-            display.set_pixel(cx + y, cy + x, color)
-            display.set_pixel(cx - y, cy + x, color)
-            display.set_pixel(cx - x, cy + y, color)
-            display.set_pixel(cx - x, cy - y, color)
-            display.set_pixel(cx - y, cy - x, color)
-            display.set_pixel(cx + y, cy - x, color)
-            display.set_pixel(cx + x, cy - y, color)
-
-            if err <= 0:
-                y += 1
-                err += 2 * y + 1
-
-            if err > 0:
-                x -= 1
-                err -= 2 * x + 1
+            spans.append((y, -x, x))
+        return spans
+
+    # Outline only - midpoint circle algorithm
+    recorder = _PixelRecorder()
+    plot = recorder.set_pixel
+    x = radius
+    y = 0
+    err = 0
+
+    while x >= y:
+        # Draw 8 octants
+        plot(x, y)
+        plot(y, x)
+        plot(-y, x)
+        plot(-x, y)
+        plot(-x, -y)
+        plot(-y, -x)
+        plot(y, -x)
+        plot(x, -y)
+
+        if err <= 0:
+            y += 1
+            err += 2 * y + 1
+
+        if err > 0:
+            x -= 1
+            err -= 2 * x + 1
+    return recorder.spans()
 
 
 def draw_circle_outline(display, cx: int, cy: int, radius: int,
@@ -144,6 +325,8 @@ def draw_ellipse(display, cx: int, cy: int, rx: int, ry: int,
     """
     Draw an ellipse.
 
+    The spans are cached per radius pair (see SpanCache).
+
     Args:
         display: Display instance
         cx, cy: Center point
@@ -152,56 +335,219 @@ def draw_ellipse(display, cx: int, cy: int, rx: int, ry: int,
         color: True for mono, (r,g,b) for RGB
         fill: If True, fill the ellipse
     """
+    spans = span_cache.get(('ellipse', rx, ry, fill), lambda: _ellipse_spans(rx, ry, fill))
+    draw_spans(display, cx, cy, spans, color)
+
+
+def _ellipse_spans(rx: int, ry: int, fill: bool) -> list:
+    """Rasterize an ellipse centred on (0, 0)."""
     if fill:
-        # Filled ellipse
+        # Filled ellipse - one span per row
+        if ry == 0:
+            return [(0, -rx, rx)]
+        spans = []
         for y in range(-ry, ry + 1):
             x = int(rx * math.sqrt(1 - (y / ry) ** 2))
-            draw_line(display, cx - x, cy + y, cx + x, cy + y, color)
-    else:
-        # Outline ellipse using midpoint algorithm
-        rx2 = rx * rx
-        ry2 = ry * ry
-
-        # Region 1
-        x = 0
-        y = ry
-        px = 0
-        py = 2 * rx2 * y
-
-        # Plot initial points
-        def plot_ellipse_points(x, y):
-            display.set_pixel(cx + x, cy + y, color)
-            display.set_pixel(cx - x, cy + y, color)
-            display.set_pixel(cx + x, cy - y, color)
-            display.set_pixel(cx - x, cy - y, color)
-
+            spans.append((y, -x, x))
+        return spans
+
+    # Outline ellipse using midpoint algorithm
+    recorder = _PixelRecorder()
+    rx2 = rx * rx
+    ry2 = ry * ry
+
+    # Region 1
+    x = 0
+    y = ry
+    px = 0
+    py = 2 * rx2 * y
+
+    # Plot initial points
+    def plot_ellipse_points(x, y):
+        recorder.set_pixel(x, y)
+        recorder.set_pixel(-x, y)
+        recorder.set_pixel(x, -y)
+        recorder.set_pixel(-x, -y)
+
+    plot_ellipse_points(x, y)
+
+    # Region 1
+    p = ry2 - (rx2 * ry) + (0.25 * rx2)
+    while px < py:
+        x += 1
+        px += 2 * ry2
+        if p < 0:
+            p += ry2 + px
+        else:
+            y -= 1
+            py -= 2 * rx2
+            p += ry2 + px - py
         plot_ellipse_points(x, y)
 
-        # Region 1
-        p = ry2 - (rx2 * ry) + (0.25 * rx2)
-        while px < py:
+    # Region 2
+    p = ry2 * (x + 0.5) ** 2 + rx2 * (y - 1) ** 2 - rx2 * ry2
+    while y > 0:
+        y -= 1
+        py -= 2 * rx2
+        if p > 0:
+            p += rx2 - py
+        else:
             x += 1
             px += 2 * ry2
-            if p < 0:
-                p += ry2 + px
-            else:
-                y -= 1
-                py -= 2 * rx2
-                p += ry2 + px - py
-            plot_ellipse_points(x, y)
-
-        # Region 2
-        p = ry2 * (x + 0.5) ** 2 + rx2 * (y - 1) ** 2 - rx2 * ry2
-        while y > 0:
-            y -= 1
-            py -= 2 * rx2
-            if p > 0:
-                p += rx2 - py
-            else:
-                x += 1
-                px += 2 * ry2
-                p += rx2 - py + px
-            plot_ellipse_points(x, y)
+            p += rx2 - py + px
+        plot_ellipse_points(x, y)
+    return recorder.spans()
+
+
+def polygon_spans(points: list, rule: str = 'evenodd', y_min: Optional[int] = None,
+                  y_max: Optional[int] = None) -> list:
+    """
+    Rasterize a polygon into horizontal spans with an active edge table.
+
+    Edges are sorted by their top row and join the active list when the
+    scanline reaches them, so each row only looks at the edges crossing it.
+    Rows are sampled at integer y; an edge covers the rows from its top up
+    to (not including) its bottom, so shared vertices are counted once,
+    except on the polygon's last row, which is kept so fills reach their
+    outline. Horizontal edges become spans of their own.
+
+    Args:
+        points: List of (x, y) vertices (any shape, concave or self-intersecting)
+        rule: 'evenodd' or 'nonzero' fill rule
+        y_min, y_max: Optional rows to clip to (inclusive)
+
+    Returns:
+        list: (y, x0, x1) spans, x0 <= x1 inclusive, in row order with
+              touching spans merged
+    """
+    if rule not in ('evenodd', 'nonzero'):
+        raise ValueError(f"Unknown fill rule: {rule}")
+
+    # Edge table: [top, bottom, x at top, dx per row, winding direction]
+    edges = []
+    flat = []
+    count = len(points)
+    for i in range(count):
+        x0, y0 = points[i]
+        x1, y1 = points[(i + 1) % count]
+        if y0 == y1:
+            flat.append((y0, x0, x1))
+            continue
+        direction = 1
+        if y0 > y1:
+            x0, y0, x1, y1 = x1, y1, x0, y0
+            direction = -1
+        edges.append((y0, y1, x0, (x1 - x0) / (y1 - y0), direction))
+    if not edges and not flat:
+        return []
+
+    ys = [p[1] for p in points]
+    bottom = max(ys)
+    first = math.ceil(min(ys))
+    last = math.floor(bottom)
+    if y_min is not None:
+        first = max(first, y_min)
+    if y_max is not None:
+        last = min(last, y_max)
+
+    edges.sort(key=lambda e: e[0])
+    spans = []
+    active = []
+    next_edge = 0
+    for y in range(first, last + 1):
+        # Add edges that start at or above this row, drop finished ones
+        while next_edge < len(edges) and edges[next_edge][0] <= y:
+            active.append(edges[next_edge])
+            next_edge += 1
+        active = [e for e in active if y < e[1] or y == e[1] == bottom]
+
+        crossings = sorted((e[2] + (y - e[0]) * e[3], e[4]) for e in active)
+        if rule == 'evenodd':
+            for i in range(0, len(crossings) - 1, 2):
+                spans.append((y, math.ceil(crossings[i][0] - 0.5),
+                              math.floor(crossings[i + 1][0] + 0.5)))
+        else:
+            winding = 0
+            for i in range(len(crossings) - 1):
+                winding += crossings[i][1]
+                if winding:
+                    spans.append((y, math.ceil(crossings[i][0] - 0.5),
+                                  math.floor(crossings[i + 1][0] + 0.5)))
+
+    for y, x0, x1 in flat:
+        if y == int(y) and first <= y <= last:
+            x0, x1 = min(x0, x1), max(x0, x1)
+            spans.append((int(y), math.ceil(x0 - 0.5), math.floor(x1 + 0.5)))
+
+    # One span per run: horizontal edges and nonzero runs overlap row spans
+    merged = []
+    for y, x0, x1 in sorted(spans):
+        if merged and merged[-1][0] == y and x0 <= merged[-1][2] + 1:
+            if x1 > merged[-1][2]:
+                merged[-1] = (y, merged[-1][1], x1)
+        else:
+            merged.append((y, x0, x1))
+    return merged
+
+
+def _triangle_spans(x0, y0, x1, y1, x2, y2, y_min: int, y_max: int) -> Optional[list]:
+    """
+    polygon_spans() for a triangle without the edge table.
+
+    A triangle crosses every row exactly twice: its long edge (top vertex
+    to bottom vertex) and whichever short edge covers the row, so each row
+    is worked out directly. Crossings, rounding and the rows each edge
+    covers are the same as polygon_spans(), so the spans are too.
+
+    Returns:
+        list: (y, x0, x1) spans, or None for a flat triangle (all one row)
+    """
+    (ax, ay), (bx, by), (cx, cy) = sorted(((x0, y0), (x1, y1), (x2, y2)),
+                                          key=lambda p: p[1])
+    if ay == cy:
+        return None
+
+    long_dx = (cx - ax) / (cy - ay)
+    upper_dx = (bx - ax) / (by - ay) if by != ay else 0
+    lower_dx = (cx - bx) / (cy - by) if cy != by else 0
+    first = max(math.ceil(ay), y_min)
+    last = min(math.floor(cy), y_max)
+
+    # The upper edge covers the rows above b, and b's row too when the
+    # lower edge is flat (it is then the bottom row)
+    split = last + 1 if by == cy else max(math.ceil(by), first)
+    spans = []
+    for rows, x, top, dx in ((range(first, min(split, last + 1)), ax, ay, upper_dx),
+                             (range(split, last + 1), bx, by, lower_dx)):
+        for y in rows:
+            a = ax + (y - ay) * long_dx
+            b = x + (y - top) * dx
+            if b < a:
+                a, b = b, a
+            spans.append((y, math.ceil(a - 0.5), math.floor(b + 0.5)))
+
+    # polygon_spans() adds a flat top or bottom edge as a span of its own,
+    # merged with the row's span
+    for i, y, ends in ((0, ay, (ax, bx)), (-1, cy, (bx, cx))):
+        if spans and spans[i][0] == y == by:
+            row, left, right = spans[i]
+            spans[i] = (row, min(left, math.ceil(min(ends) - 0.5)),
+                        max(right, math.floor(max(ends) + 0.5)))
+    return spans
+
+
+def fill_polygon(display, points: list, color: Color = True, rule: str = 'evenodd'):
+    """
+    Fill a polygon with the scanline filler (see polygon_spans).
+
+    Args:
+        display: Display instance
+        points: List of (x, y) vertices
+        color: True for mono, (r,g,b) for RGB
+        rule: 'evenodd' or 'nonzero' fill rule
+    """
+    for y, x0, x1 in polygon_spans(points, rule, 0, display.height - 1):
+        draw_span(display, y, x0, x1, color)
 
 
 def draw_triangle(display, x0: int, y0: int, x1: int, y1: int,
@@ -218,33 +564,12 @@ def draw_triangle(display, x0: int, y0: int, x1: int, y1: int,
         fill: If True, fill the triangle
     """
     if fill:
-        # Filled triangle using scanline algorithm
-        # Sort vertices by y coordinate
-        points = sorted([(x0, y0), (x1, y1), (x2, y2)], key=lambda p: p[1])
-        (x0, y0), (x1, y1), (x2, y2) = points
-
-        def interpolate(x0, y0, x1, y1, y):
-            """Get x coordinate for given y on line from (x0,y0) to (x1,y1)."""
-            if y1 == y0:
-                return x0
-            return x0 + (x1 - x0) * (y - y0) / (y1 - y0)
-
-        # Draw triangle
-        for y in range(y0, y2 + 1):
-            if y < y1:
-                # Upper part
-                xa = interpolate(x0, y0, x1, y1, y)
-                xb = interpolate(x0, y0, x2, y2, y)
-            else:
-                # Lower part
-                xa = interpolate(x1, y1, x2, y2, y)
-                xb = interpolate(x0, y0, x2, y2, y)
-
-            if xa > xb:
-                xa, xb = xb, xa
-
-            for x in range(int(xa), int(xb) + 1):
-                display.set_pixel(x, y, color)
+        spans = _triangle_spans(x0, y0, x1, y1, x2, y2, 0, display.height - 1)
+        if spans is None:
+            spans = polygon_spans([(x0, y0), (x1, y1), (x2, y2)], 'evenodd',
+                                  0, display.height - 1)
+        for y, left, right in spans:
+            draw_span(display, y, left, right, color)
     else:
         # Outline only
         draw_line(display, x0, y0, x1, y1, color)
@@ -252,7 +577,8 @@ def draw_triangle(display, x0: int, y0: int, x1: int, y1: int,
         draw_line(display, x2, y2, x0, y0, color)
 
 
-def draw_polygon(display, points: list, color: Color = True, fill: bool = False):
+def draw_polygon(display, points: list, color: Color = True, fill: bool = False,
+                 rule: str = 'evenodd'):
     """
     Draw a polygon from a list of points.
 
@@ -260,21 +586,14 @@ def draw_polygon(display, points: list, color: Color = True, fill: bool = False)
         display: Display instance
         points: List of (x, y) tuples
         color: True for mono, (r,g,b) for RGB
-        fill: If True, fill the polygon
+        fill: If True, fill the polygon (concave shapes are fine)
+        rule: Fill rule for self-intersecting polygons - 'evenodd' or 'nonzero'
     """
     if len(points) < 3:
         return
 
     if fill:
-        # Use scanline fill algorithm
-        # This is simplified - for complex polygons you'd want a better algorithm
-        # For now, just draw triangles from first point to each edge
-        for i in range(1, len(points) - 1):
-            draw_triangle(display,
-                         points[0][0], points[0][1],
-                         points[i][0], points[i][1],
-                         points[i + 1][0], points[i + 1][1],
-                         color, fill=True)
+        fill_polygon(display, points, color, rule)
     else:
         # Draw outline
         for i in range(len(points)):
@@ -288,6 +607,8 @@ def draw_star(display, cx: int, cy: int, radius: int, points: int = 5,
     """
     Draw a star shape.
 
+    The spans are cached per radius and point count (see SpanCache).
+
     Args:
         display: Display instance
         cx, cy: Center point
@@ -299,6 +620,13 @@ def draw_star(display, cx: int, cy: int, radius: int, points: int = 5,
     if points < 3:
         points = 3
 
+    spans = span_cache.get(('star', radius, points, fill),
+                           lambda: _star_spans(radius, points, fill))
+    draw_spans(display, cx, cy, spans, color)
+
+
+def _star_spans(radius: int, points: int, fill: bool) -> list:
+    """Rasterize a star centred on (0, 0)."""
     # Calculate star vertices
     inner_radius = radius * 0.4  # Inner points are 40% of outer radius
     vertices = []
@@ -306,50 +634,157 @@ def draw_star(display, cx: int, cy: int, radius: int, points: int = 5,
     for i in range(points * 2):
         angle = (i * math.pi / points) - math.pi / 2
         r = radius if i % 2 == 0 else inner_radius
-        x = cx + int(r * math.cos(angle))
-        y = cy + int(r * math.sin(angle))
-        vertices.append((x, y))
+        vertices.append((int(r * math.cos(angle)), int(r * math.sin(angle))))
 
-    draw_polygon(display, vertices, color, fill)
+    if fill:
+        return polygon_spans(vertices)
+    recorder = _PixelRecorder()
+    draw_polygon(recorder, vertices)
+    return recorder.spans()
 
 
-def flood_fill(display, x: int, y: int, color: Color):
+def color_mask(display, x: int, y: int, tolerance: int = 0) -> bytearray:
     """
-    Flood fill starting from point (x, y).
+    Mark the pixels that match the color at (x, y).
+
+    Works on the framebuffer storage of a Display: each channel goes
+    through a 256-entry "within tolerance" table with bytes.translate() and
+    the channels are AND-ed as big integers, so no per-pixel Python code
+    runs. Other displays are read with get_pixel().
 
     Args:
         display: Display instance
-        x, y: Starting point
-        color: Fill color
+        x, y: Pixel whose color to match
+        tolerance: Largest per-channel difference that still matches
+
+    Returns:
+        bytearray: One byte per pixel (row-major), 1 = matches
     """
-    if x < 0 or x >= display.width or y < 0 or y >= display.height:
-        return
+    width, height = display.width, display.height
+    buffer = getattr(display, 'buffer', None)
+    bpp = getattr(display, 'bytes_per_pixel', None)
+
+    if isinstance(buffer, bytearray) and bpp in (1, 3):
+        offset = (y * width + x) * bpp
+        if bpp == 3:
+            channels = [buffer[c::3] for c in range(3)]
+            target = buffer[offset:offset + 3]
+        elif display.palette is not None:
+            # Indexed: compare the palette colors of each index
+            indices = bytes(buffer)
+            channels = [indices.translate(table) for table in display.palette.channel_tables()]
+            target = display.palette[buffer[offset]]
+        else:
+            channels = [bytes(buffer)]
+            target = (buffer[offset],)
+
+        mask = -1
+        for data, value in zip(channels, target):
+            table = bytes(1 if abs(v - value) <= tolerance else 0 for v in range(256))
+            mask &= int.from_bytes(data.translate(table), 'big')
+        return bytearray(mask.to_bytes(width * height, 'big'))
 
     target = display.get_pixel(x, y)
+    mask = bytearray(width * height)
+    for py in range(height):
+        row = py * width
+        for px in range(width):
+            pixel = display.get_pixel(px, py)
+            if pixel == target or (tolerance and isinstance(pixel, tuple) and
+                                   all(abs(a - b) <= tolerance for a, b in zip(pixel, target))):
+                mask[row + px] = 1
+    return mask
+
+
+def flood_spans(mask: bytearray, width: int, height: int, x: int, y: int,
+                connectivity: int = 4) -> list:
+    """
+    Find the region connected to (x, y) in a pixel mask, as spans.
 
-    # Don't fill if same color
-    if target == color:
-        return
+    Scanline flood fill: each seed is grown into the whole run of set
+    pixels on its row (bytes.find/rfind), the run is cleared in the mask,
+    and the rows above and below are searched for runs touching it - one
+    seed per run rather than four per pixel.
 
-    # Use stack-based flood fill to avoid recursion limits
-    stack = [(x, y)]
+    Args:
+        mask: One byte per pixel, 1 = inside; visited pixels are cleared
+        width, height: Mask size
+        x, y: Seed pixel
+        connectivity: 4, or 8 to also connect diagonal neighbours
 
+    Returns:
+        list: (y, x0, x1) inclusive spans of the region
+    """
+    if connectivity not in (4, 8):
+        raise ValueError(f"Connectivity must be 4 or 8, not {connectivity}")
+    if not (0 <= x < width and 0 <= y < height) or not mask[y * width + x]:
+        return []
+
+    reach = 1 if connectivity == 8 else 0
+    spans = []
+    stack = [(x, y)]
     while stack:
-        px, py = stack.pop()
+        x, y = stack.pop()
+        row = y * width
+        if not mask[row + x]:
+            continue  # Reached through another run already
+
+        left = mask.rfind(0, row, row + x)
+        left = row if left < 0 else left + 1
+        right = mask.find(0, row + x, row + width)
+        if right < 0:
+            right = row + width
+        mask[left:right] = bytes(right - left)
+        spans.append((y, left - row, right - row - 1))
+
+        # Seed every run touching this one in the rows above and below
+        lo = max(left - row - reach, 0)
+        hi = min(right - row + reach, width)
+        for ny in (y - 1, y + 1):
+            if 0 <= ny < height:
+                base = ny * width
+                pos, end = base + lo, base + hi
+                while True:
+                    pos = mask.find(1, pos, end)
+                    if pos < 0:
+                        break
+                    stack.append((pos - base, ny))
+                    pos = mask.find(0, pos, end)
+                    if pos < 0:
+                        break
+    return spans
+
+
+def flood_fill(display, x: int, y: int, color: Color, connectivity: int = 4,
+               tolerance: int = 0) -> int:
+    """
+    Flood fill starting from point (x, y).
 
-        if px < 0 or px >= display.width or py < 0 or py >= display.height:
-            continue
+    Scanline fill over the framebuffer (see color_mask and flood_spans);
+    the region is drawn as spans.
 
-        if display.get_pixel(px, py) != target:
-            continue
+    Args:
+        display: Display instance
+        x, y: Starting point
+        color: Fill color
+        connectivity: 4, or 8 to also spread through diagonal gaps
+        tolerance: Also fill pixels whose channels are within this much
+                   of the starting color
 
-        display.set_pixel(px, py, color)
+    Returns:
+        int: Number of pixels filled
+    """
+    if x < 0 or x >= display.width or y < 0 or y >= display.height:
+        return 0
 
-        # Add neighbors
-        stack.append((px + 1, py))
-        stack.append((px - 1, py))
-        stack.append((px, py + 1))
-        stack.append((px, py - 1))
+    # Don't fill if same color
+    if not tolerance and display.get_pixel(x, y) == color:
+        return 0
+
+    mask = color_mask(display, x, y, tolerance)
+    spans = flood_spans(mask, display.width, display.height, x, y, connectivity)
+    draw_spans(display, 0, 0, spans, color)
+    return sum(x1 - x0 + 1 for _, x0, x1 in spans)
 
 
 def draw_rounded_rect(display, x: int, y: int, width: int, height: int,
@@ -357,6 +792,8 @@ def draw_rounded_rect(display, x: int, y: int, width: int, height: int,
     """
     Draw a rounded rectangle.
 
+    The spans are cached per size and corner radius (see SpanCache).
+
     Args:
         display: Display instance
         x, y: Top-left corner
@@ -368,41 +805,60 @@ def draw_rounded_rect(display, x: int, y: int, width: int, height: int,
     # Clamp radius
     radius = min(radius, width // 2, height // 2)
 
+    spans = span_cache.get(('rounded_rect', width, height, radius, fill),
+                           lambda: _rounded_rect_spans(width, height, radius, fill))
+    draw_spans(display, x, y, spans, color)
+
+
+def _rounded_rect_spans(width: int, height: int, radius: int, fill: bool) -> list:
+    """Rasterize a rounded rectangle with its top-left corner at (0, 0)."""
     if fill:
-        # Fill main rectangles
-        draw_rect(display, x + radius, y, width - 2 * radius, height, color, fill=True)
-        draw_rect(display, x, y + radius, radius, height - 2 * radius, color, fill=True)
-        draw_rect(display, x + width - radius, y + radius, radius, height - 2 * radius, color, fill=True)
-
-        # Fill corners with circles
-        draw_circle(display, x + radius, y + radius, radius, color, fill=True)
-        draw_circle(display, x + width - radius - 1, y + radius, radius, color, fill=True)
-        draw_circle(display, x + radius, y + height - radius - 1, radius, color, fill=True)
-        draw_circle(display, x + width - radius - 1, y + height - radius - 1, radius, color, fill=True)
-    else:
-        # Draw straight edges
-        draw_line(display, x + radius, y, x + width - radius - 1, y, color)  # Top
-        draw_line(display, x + radius, y + height - 1, x + width - radius - 1, y + height - 1, color)  # Bottom
-        draw_line(display, x, y + radius, x, y + height - radius - 1, color)  # Left
-        draw_line(display, x + width - 1, y + radius, x + width - 1, y + height - radius - 1, color)  # Right
-
-        # Draw corner arcs (simplified - draw quarter circles)
-        # This is approximate but works for LED matrix resolution
-        for angle in range(0, 90, 5):
-            rad = math.radians(angle)
-            # Top-left
-            px = x + radius - int(radius * math.cos(rad + math.pi))
-            py = y + radius - int(radius * math.sin(rad + math.pi))
-            display.set_pixel(px, py, color)
-            # Top-right
-            px = x + width - radius - 1 - int(radius * math.cos(rad + math.pi / 2))
-            py = y + radius - int(radius * math.sin(rad + math.pi / 2))
-            display.set_pixel(px, py, color)
-            # Bottom-left
-            px = x + radius - int(radius * math.cos(rad - math.pi / 2))
-            py = y + height - radius - 1 - int(radius * math.sin(rad - math.pi / 2))
-            display.set_pixel(px, py, color)
-            # Bottom-right
-            px = x + width - radius - 1 - int(radius * math.cos(rad))
-            py = y + height - radius - 1 - int(radius * math.sin(rad))
-            display.set_pixel(px, py, color)
+        # One span per row: full width between the corners, and inset by
+        # the corner circles (centred radius pixels in) in the top and
+        # bottom radius rows
+        spans = []
+        for row in range(height):
+            if row < radius:
+                d = radius - row
+            elif row >= height - radius:
+                d = row - (height - radius - 1)
+            else:
+                spans.append((row, 0, width - 1))
+                continue
+            inset = radius - int(math.sqrt(max(0, radius * radius - d * d)))
+            # A radius of half an even width insets the end rows past the
+            # middle; the span covers the two middle columns either way
+            left, right = inset, width - 1 - inset
+            spans.append((row, min(left, right), max(left, right)))
+        return spans
+
+    recorder = _PixelRecorder()
+    x = y = 0
+
+    # Draw straight edges
+    draw_hline(recorder, x + radius, y, width - 2 * radius)  # Top
+    draw_hline(recorder, x + radius, y + height - 1, width - 2 * radius)  # Bottom
+    draw_vline(recorder, x, y + radius, height - 2 * radius)  # Left
+    draw_vline(recorder, x + width - 1, y + radius, height - 2 * radius)  # Right
+
+    # Draw corner arcs (simplified - draw quarter circles)
+    # This is approximate but works for LED matrix resolution
+    for angle in range(0, 90, 5):
+        rad = math.radians(angle)
+        # Top-left
+        px = x + radius - int(radius * math.cos(rad + math.pi))
+        py = y + radius - int(radius * math.sin(rad + math.pi))
+        recorder.set_pixel(px, py)
+        # Top-right
+        px = x + width - radius - 1 - int(radius * math.cos(rad + math.pi / 2))
+        py = y + radius - int(radius * math.sin(rad + math.pi / 2))
+        recorder.set_pixel(px, py)
+        # Bottom-left
+        px = x + radius - int(radius * math.cos(rad - math.pi / 2))
+        py = y + height - radius - 1 - int(radius * math.sin(rad - math.pi / 2))
+        recorder.set_pixel(px, py)
+        # Bottom-right
+        px = x + width - radius - 1 - int(radius * math.cos(rad))
+        py = y + height - radius - 1 - int(radius * math.sin(rad))
+        recorder.set_pixel(px, py)
+    return recorder.spans()
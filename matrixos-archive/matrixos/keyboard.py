@@ -82,6 +82,8 @@ class OnScreenKeyboard:
         
         self.done = False
         self.cancelled = False
+        
+        self.layer = None  # Compositor layer while open as an overlay
     
     def handle_input(self, event: InputEvent) -> bool:
         """
@@ -178,19 +180,56 @@ class OnScreenKeyboard:
             self.cursor_pos += 1
             return True
     
-    def render(self, matrix):
+    @staticmethod
+    def keyboard_height(screen_height: int) -> int:
+        """Keyboard takes bottom half (or at least 48 pixels)."""
+        return max(screen_height // 2, 48)
+    
+    def open_layer(self, compositor):
+        """
+        Show the keyboard as a compositor layer over the bottom of the screen.
+        
+        Args:
+            compositor: Compositor to add the layer to
+            
+        Returns:
+            The keyboard layer
+        """
+        kbd_height = self.keyboard_height(compositor.height)
+        self.layer = compositor.create_layer(
+            'keyboard', 0, compositor.height - kbd_height,
+            compositor.width, kbd_height, z=150
+        )
+        self.render_layer()
+        self.layer.visible = True
+        return self.layer
+    
+    def render_layer(self):
+        """Redraw the keyboard layer (only its area is recomposited)."""
+        if self.layer:
+            self.layer.clear()
+            self.render(self.layer, kbd_y=0)
+    
+    def close_layer(self):
+        """Remove the keyboard layer, uncovering the app below."""
+        if self.layer:
+            self.layer.compositor.remove_layer(self.layer)
+            self.layer = None
+    
+    def render(self, matrix, kbd_y: int = None):
         """
         Render keyboard on bottom half of screen.
         
         Args:
-            matrix: Display matrix
+            matrix: Display matrix (or keyboard layer)
+            kbd_y: Top of the keyboard area (default: bottom half of matrix)
         """
         width = matrix.width
         height = matrix.height
         
-        # Keyboard takes bottom half (or at least 48 pixels)
-        kbd_height = max(height // 2, 48)
-        kbd_y = height - kbd_height
+        if kbd_y is None:
+            kbd_y = height - self.keyboard_height(height)
+        kbd_height = height - kbd_y
         
         # Background for keyboard area (darker to distinguish)
         matrix.rect(0, kbd_y, width, kbd_height, (30, 30, 40), fill=True)
@@ -303,6 +342,22 @@ def show_keyboard(matrix, input_handler, prompt: str = "Enter text:",
     
     keyboard = OnScreenKeyboard(prompt, initial)
     
+    # With a compositor the keyboard is an overlay on the app's last frame,
+    # and only the keyboard area is redrawn after each key press
+    compositor = getattr(matrix, 'compositor', None)
+    if compositor is not None:
+        keyboard.open_layer(compositor)
+        try:
+            while not keyboard.done:
+                compositor.present(matrix)
+                event = input_handler.get_key(timeout=0.1)
+                if event and keyboard.handle_input(event):
+                    keyboard.render_layer()
+        finally:
+            keyboard.close_layer()
+            compositor.present(matrix)
+        return None if keyboard.cancelled else keyboard.text
+    
     iteration = 0
     while not keyboard.done:
         iteration += 1
@@ -3,6 +3,8 @@ Layout utilities for resolution-agnostic display code.
 Helps create displays that adapt to any matrix size.
 """
 
+from matrixos.text_layout import layout_text, matrix_font
+
 
 def scale_value(base_value, current_size, base_size=64):
     """
@@ -140,23 +142,21 @@ class LayoutHelper:
 
 
 def center_text(matrix, text, y=None, color=(255, 255, 255)):
-    """Draw text centered horizontally.
+    """Draw text centered horizontally (ellipsized if wider than the matrix).
     
     Args:
         matrix: Display matrix
-        text: Text to draw
+        text: Text to draw (newlines start new lines)
         y: Vertical position (None = center vertically too)
         color: Text color
     """
-    char_width = 8
-    text_width = len(text) * char_width
-    x = (matrix.width - text_width) // 2
+    box = layout_text(text, matrix_font(matrix), matrix.width, align='center', wrap=False)
     
     if y is None:
         # Center vertically too
-        y = (matrix.height - 8) // 2
+        y = (matrix.height - box.text_height) // 2
     
-    matrix.text(text, x, y, color)
+    box.draw(matrix, 0, y, color)
 
 
 def get_grid_dimensions(matrix, item_size, padding=2):
@@ -234,13 +234,13 @@ def draw_icon_with_text(matrix, icon_char, text, x, y,
     """
     matrix.text(icon_char, x, y, icon_color)
     matrix.text(text, x + 10, y, text_color)
-    return 10 + len(text) * 8
+    return 10 + matrix_font(matrix).measure(text)[0]
 
 
 def menu_list(matrix, items, selected_index, y_start=14, item_height=9, 
               highlight_color=(255, 200, 0), text_color=(150, 150, 150),
               max_visible=6):
-    """Draw a scrollable menu list.
+    """Draw a scrollable menu list (items too wide are ellipsized).
     
     Args:
         matrix: Display matrix
@@ -253,6 +253,7 @@ def menu_list(matrix, items, selected_index, y_start=14, item_height=9,
         max_visible: Maximum visible items (for scrolling)
     """
     width = matrix.width
+    font = matrix_font(matrix)
     visible_items = min(max_visible, len(items))
     
     # Calculate scroll offset
@@ -267,14 +268,15 @@ def menu_list(matrix, items, selected_index, y_start=14, item_height=9,
     y = y_start
     for i, item in enumerate(items_to_show):
         is_selected = (i == selected_offset)
+        label = layout_text(item.upper(), font, width - 16, wrap=False)
         
         if is_selected:
             # Highlight selected
             matrix.rect(2, y - 1, width - 4, 8, highlight_color, fill=True)
             matrix.text(">", 4, y, (0, 0, 0))
-            matrix.text(item.upper(), 12, y, (0, 0, 0))
+            label.draw(matrix, 12, y, (0, 0, 0))
         else:
-            matrix.text(item.upper(), 12, y, text_color)
+            label.draw(matrix, 12, y, text_color)
         
         y += item_height
 
@@ -3,9 +3,12 @@ High-level API for LED matrix display.
 Simple interface for drawing graphics and text.
 """
 
-from matrixos.display import Display, TerminalRenderer
+from matrixos.display import (
+    Bitmap, ColorCorrection, Display, Palette, TerminalRenderer, create_display
+)
 from matrixos.graphics import *
 from matrixos.font import Font, default_font
+from matrixos.output_thread import OutputThread
 from typing import Tuple, Union, Optional
 
 
@@ -17,18 +20,53 @@ class LEDMatrix:
     """
     High-level interface for LED matrix display.
     Provides simple functions for graphics and text.
+
+    Double-buffered: all drawing goes to the back buffer (`display`), and
+    show() flips it with the front buffer (`front`) by swapping references.
+    The driver reads the front buffer for the whole output pass while the
+    app draws the next frame into the back buffer.
     """
 
-    def __init__(self, width: int = 64, height: int = 64, color_mode: str = 'rgb'):
+    def __init__(self, width: int = 64, height: int = 64, color_mode: str = 'rgb',
+                 driver=None, copy_front_to_back: bool = False, backend: str = 'python',
+                 palette: Optional[Palette] = None,
+                 color_correction: Optional[ColorCorrection] = None,
+                 threaded_output: bool = False):
         """
         Initialize LED matrix.
 
         Args:
             width: Display width in pixels
             height: Display height in pixels
-            color_mode: 'mono' or 'rgb'
+            color_mode: 'mono', 'rgb' or 'indexed' (1 byte per pixel plus a
+                       palette, expanded to RGB once per frame in show())
+            driver: DisplayDriver to present frames with (None = terminal renderer)
+            copy_front_to_back: After each flip, copy the shown frame into the
+                               new back buffer so apps can draw incrementally
+                               instead of redrawing the whole frame
+            backend: Framebuffer backend - 'python', 'numpy' or 'auto'
+                    (NumPy falls back to pure Python when not installed)
+            palette: Palette for 'indexed' mode (default: ZX Spectrum colours)
+            color_correction: Gamma/brightness/power limiting applied to each
+                             frame on output (None = frames are output as drawn)
+            threaded_output: Output frames on a background thread; show()
+                            returns once the frame is handed over, and frames
+                            are dropped if output can't keep up
         """
-        self.display = Display(width, height, color_mode)
+        if color_mode == 'indexed' and palette is None:
+            palette = Palette()
+        self.palette = palette if color_mode == 'indexed' else None
+        self.display = create_display(width, height, color_mode, backend, self.palette)  # Back buffer
+        self.front = create_display(width, height, color_mode, backend, self.palette)    # Last shown frame
+        # RGB frame the indexed front buffer is expanded into for output
+        self.output = Display(width, height, 'rgb') if self.palette else None
+        self.color_correction = color_correction
+        self.corrected = None  # RGB frame colour correction writes into
+        self.output_thread = OutputThread(self._output) if threaded_output else None
+        self.driver = driver
+        self.copy_front_to_back = copy_front_to_back
+        self.compositor = None  # Overlay compositor, set by OSContext
+        self.renderer = None  # TerminalRenderer used when there is no driver
         self.font = default_font
         self.width = width
         self.height = height
@@ -50,7 +88,70 @@ class LEDMatrix:
         """Get pixel value at position."""
         return self.display.get_pixel(x, y)
 
-    # Graphics primitives
+    def set_palette_color(self, index: int, color: Tuple[int, int, int]):
+        """
+        Change a palette entry ('indexed' mode).
+
+        Every pixel drawn with that index changes colour on the next
+        show() or refresh() - no redraw needed (palette animation).
+
+        Args:
+            index: Palette index (0-255)
+            color: New (r, g, b) colour
+        """
+        self.palette[index] = color
+
+    def color_index(self, color: Tuple[int, int, int]) -> int:
+        """Get (or allocate) the palette index for a colour ('indexed' mode)."""
+        return self.palette.index_of(color)
+
+    def scale_brightness(self, factor: float, rect: Optional[tuple] = None):
+        """
+        Scale the brightness of what has been drawn so far.
+
+        Args:
+            factor: Brightness multiplier (0.5 = half as bright)
+            rect: Optional (x, y, width, height) to limit the effect to
+        """
+        self.display.scale_brightness(factor, rect)
+
+    def set_brightness(self, brightness: float):
+        """
+        Set the output brightness of the panel (0.0-1.0).
+
+        Applied when frames are output, so apps keep drawing full colours.
+        """
+        if self.color_correction is None:
+            self.color_correction = ColorCorrection()
+        self.color_correction.set(brightness=brightness)
+
+    def blit(self, src: Display, x: int, y: int, src_rect: Optional[tuple] = None,
+             key: Optional[Color] = None, alpha=None):
+        """
+        Draw a packed pixel buffer (Display or Bitmap) at (x, y).
+
+        Copies row slices with clipping instead of setting pixels one by one.
+
+        Args:
+            src: Source Display or Bitmap (Bitmaps carry their own alpha mask)
+            x, y: Destination position
+            src_rect: Optional (x, y, width, height) part of src to draw
+            key: Colour in src to treat as transparent
+            alpha: 0-255 for the whole blit, or a mask with one byte per src pixel
+        """
+        self.display.blit(src, x, y, src_rect, key, alpha)
+
+    def hline(self, x: int, y: int, width: int, color: Color = True):
+        """Draw a horizontal line of `width` pixels."""
+        self.display.hline(x, y, width, color)
+
+    def vline(self, x: int, y: int, height: int, color: Color = True):
+        """Draw a vertical line of `height` pixels."""
+        self.display.vline(x, y, height, color)
+
+    def fill_span(self, y: int, x0: int, x1: int, color: Color = True):
+        """Fill row y from x0 to x1 inclusive."""
+        self.display.fill_span(y, x0, x1, color)
 
     def line(self, x0: int, y0: int, x1: int, y1: int, color: Color = True):
         """Draw a line."""
@@ -96,14 +197,16 @@ class LEDMatrix:
         """Draw a star shape."""
         draw_star(self.display, cx, cy, radius, points, color, fill)
 
-    def flood_fill(self, x: int, y: int, color: Color):
-        """Flood fill from point."""
-        flood_fill(self.display, x, y, color)
+    def flood_fill(self, x: int, y: int, color: Color, connectivity: int = 4,
+                   tolerance: int = 0) -> int:
+        """Flood fill from point. Returns the number of pixels filled."""
+        return flood_fill(self.display, x, y, color, connectivity, tolerance)
 
     # Text functions
 
     def text(self, text: str, x: int, y: int,
-             color: Color = True, bg_color: Optional[Color] = None, spacing: int = 0):
+             color: Color = True, bg_color: Optional[Color] = None, spacing: int = 0,
+             scale: int = 1):
         """
         Draw text at pixel position.
 
@@ -113,8 +216,38 @@ class LEDMatrix:
             color: Text color
             bg_color: Background color (None = transparent)
             spacing: Extra spacing between characters
+            scale: Integer scale factor (2 = double size)
+        """
+        self.font.draw_text(self.display, text, x, y, color, bg_color, spacing, scale)
+
+    def measure_text(self, text: str, scale: int = 1, spacing: int = 0) -> Tuple[int, int]:
         """
-        self.font.draw_text(self.display, text, x, y, color, bg_color, spacing)
+        Size of text in the current font.
+
+        Args:
+            text: Text string
+            scale: Integer scale factor
+            spacing: Extra spacing between characters
+
+        Returns:
+            (width, height) in pixels
+        """
+        return self.font.measure(text, scale, spacing)
+
+    def load_font(self, path: str):
+        """
+        Switch to a BDF or PCF bitmap font.
+
+        Characters registered with register_char() are carried over to the
+        new font.
+
+        Args:
+            path: .bdf or .pcf file (optionally .gz)
+        """
+        font = Font(path)
+        for char, bitmap in self.font.custom_chars.items():
+            font.register_char(char, bitmap)
+        self.font = font
 
     def text_grid(self, text: str, col: int, row: int,
                   color: Color = True, bg_color: Optional[Color] = None):
@@ -145,7 +278,7 @@ class LEDMatrix:
         self.font.fill_text_buffer(self.display, lines, color, bg_color)
 
     def char(self, char: str, x: int, y: int,
-             color: Color = True, bg_color: Optional[Color] = None):
+             color: Color = True, bg_color: Optional[Color] = None, scale: int = 1):
         """
         Draw a single character at pixel position.
 
@@ -154,8 +287,9 @@ class LEDMatrix:
             x, y: Top-left pixel position
             color: Text color
             bg_color: Background color (None = transparent)
+            scale: Integer scale factor
         """
-        self.font.draw_char(self.display, char, x, y, color, bg_color)
+        self.font.draw_char(self.display, char, x, y, color, bg_color, scale)
 
     def register_char(self, char: str, bitmap: list):
         """
@@ -183,27 +317,95 @@ class LEDMatrix:
         self.font.register_char(char, bitmap)
 
     def draw_char(self, char: str, x: int, y: int,
-                  color: Color = True, bg_color: Optional[Color] = None):
+                  color: Color = True, bg_color: Optional[Color] = None, scale: int = 1):
         """Alias for char() method."""
-        self.char(char, x, y, color, bg_color)
+        self.char(char, x, y, color, bg_color, scale)
 
     # Display output
 
+    def flip(self):
+        """
+        Swap the back and front buffers (no pixel copy).
+
+        In copy_front_to_back mode the new back buffer is then refreshed
+        from the front buffer; otherwise it keeps stale contents and is
+        marked fully damaged, since it no longer matches the screen.
+        """
+        self.display, self.front = self.front, self.display
+        if self.copy_front_to_back:
+            self.display.copy_from(self.front, mark_damage=False)
+        else:
+            self.display.mark_all_damaged()
+
     def show(self, renderer=None, clear_screen: bool = True):
         """
-        Display the framebuffer.
+        Flip buffers and display the new front buffer.
 
         Args:
-            renderer: Renderer to use (default: create TerminalRenderer)
+            renderer: Renderer to use when there is no driver
+                     (default: a TerminalRenderer kept between frames)
+            clear_screen: Clear screen and repaint everything; with False
+                         only the cells that changed are written
+        """
+        self.flip()
+        self.refresh(renderer, clear_screen)
+
+    def refresh(self, renderer=None, clear_screen: bool = True):
+        """
+        Output the front buffer again without flipping.
+
+        Use after changing the palette to animate colours without redrawing.
+
+        Args:
+            renderer: Renderer to use when there is no driver
             clear_screen: Clear screen before rendering
         """
+        frame = self.front
+        if self.output is not None:
+            # Indexed mode: expand to RGB once, at output time
+            frame.expand_to(self.output)
+            frame = self.output
+
+        if self.color_correction is not None and frame.bytes_per_pixel == 3:
+            # Gamma, brightness and power limit: one table pass per channel
+            if self.corrected is None:
+                self.corrected = Display(self.width, self.height, 'rgb')
+            self.color_correction.apply(frame, self.corrected)
+            frame = self.corrected
+
+        if self.output_thread is not None:
+            self.output_thread.submit(frame, renderer, clear_screen)
+        else:
+            self._output(frame, renderer, clear_screen)
+
+    def _output(self, frame: Display, renderer, clear_screen: bool):
+        """Present a finished frame through the driver or terminal renderer."""
+        if self.driver is not None:
+            self.driver.present(frame)
+            return
+
         if renderer is None:
-            renderer = TerminalRenderer(self.display)
+            if self.renderer is None:
+                self.renderer = TerminalRenderer(frame)
+            renderer = self.renderer
+        renderer.display = frame
 
         renderer.display_in_terminal(clear_screen=clear_screen)
 
+    def start_output_thread(self):
+        """Output frames on a background thread from now on (see OutputThread)."""
+        if self.output_thread is None:
+            self.output_thread = OutputThread(self._output)
+        self.output_thread.start()
+
+    def stop_output_thread(self):
+        """Output the last frame, stop the output thread and output inline again."""
+        if self.output_thread is not None:
+            self.output_thread.stop()
+            self.output_thread = None
+
     def get_display(self):
-        """Get underlying Display object (for advanced use)."""
+        """Get underlying Display object (the back buffer, for advanced use)."""
         return self.display
 
     def get_font(self):
@@ -218,11 +420,11 @@ class LEDMatrix:
             self.rect(t, t, self.width - 2*t, self.height - 2*t, color, fill=False)
 
     def centered_text(self, text: str, y: int,
-                     color: Color = True, bg_color: Optional[Color] = None):
+                     color: Color = True, bg_color: Optional[Color] = None, scale: int = 1):
         """Draw text centered horizontally at given y position."""
-        text_width = len(text) * 8
+        text_width, _ = self.font.measure(text, scale)
         x = (self.width - text_width) // 2
-        self.text(text, x, y, color, bg_color)
+        self.text(text, x, y, color, bg_color, scale=scale)
 
     def grid_lines(self, spacing: int = 8, color: Color = (50, 50, 50)):
         """Draw a grid (useful for debugging positioning)."""
@@ -233,16 +435,19 @@ class LEDMatrix:
 
 
 # Convenience function to create a matrix
-def create_matrix(width: int = 64, height: int = 64, color_mode: str = 'rgb') -> LEDMatrix:
+def create_matrix(width: int = 64, height: int = 64, color_mode: str = 'rgb',
+                  driver=None, backend: str = 'python') -> LEDMatrix:
     """
     Create an LED matrix.
 
     Args:
         width: Display width (default 64)
         height: Display height (default 64)
-        color_mode: 'mono' or 'rgb' (default 'rgb')
+        color_mode: 'mono', 'rgb' or 'indexed' (default 'rgb')
+        driver: Optional DisplayDriver to present frames with
+        backend: Framebuffer backend - 'python', 'numpy' or 'auto'
 
     Returns:
         LEDMatrix instance
     """
-    return LEDMatrix(width, height, color_mode)
+    return LEDMatrix(width, height, color_mode, driver=driver, backend=backend)
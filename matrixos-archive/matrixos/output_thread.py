@@ -0,0 +1,178 @@
+"""
+Output Thread for MatrixOS
+
+Moves frame output (terminal writes, window uploads, panel refresh) off the
+main loop. LEDMatrix.show() hands the finished frame to the output thread
+through a single-slot mailbox and returns straight away, so slow output no
+longer stretches frame time and input latency.
+
+The mailbox holds at most one frame: if the output thread is still busy
+when the next frame arrives, the waiting frame is replaced (latest frame
+wins) and its damage is merged into the new one. Frames are never queued,
+so output lag can't build up.
+
+The thread records its own timing (get_stats()): when `utilization` is
+close to 1.0 and frames are being dropped, output - not the app - is the
+bottleneck.
+"""
+
+import threading
+import time
+from typing import Callable, List, Optional
+
+from matrixos.display import Display
+
+
+class OutputThread:
+    """Presents frames on a background thread, latest frame wins."""
+
+    def __init__(self, present: Callable, name: str = "MatrixOS-Output"):
+        """Create the output thread (not started).
+
+        Args:
+            present: Called on the output thread with each frame (a Display)
+                     and any extra arguments given to submit()
+            name: Thread name
+        """
+        self.present = present
+        self.name = name
+        self.thread = None
+        self.running = False
+        self.condition = threading.Condition()
+
+        # Mailbox: the waiting frame and its arguments
+        self.pending: Optional[Display] = None
+        self.pending_args = ()
+        self.busy = False  # Output thread is presenting a frame
+        self.spare: List[Display] = []  # Free frame copies
+
+        # Statistics (written by the output thread)
+        self.submitted = 0
+        self.presented = 0
+        self.dropped = 0
+        self.errors = 0
+        self.last_output_ms = 0.0
+        self.max_output_ms = 0.0
+        self.total_output_ms = 0.0
+        self.total_idle_ms = 0.0
+
+    def start(self):
+        """Start the output thread."""
+        if self.running:
+            return
+        self.running = True
+        self.thread = threading.Thread(target=self._loop, name=self.name, daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout: float = 2.0):
+        """Output the waiting frame (if any), then stop the thread."""
+        if not self.running:
+            return
+        self.flush(timeout)
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        self.thread.join(timeout=timeout)
+        self.thread = None
+
+    def submit(self, frame: Display, *args):
+        """Hand a frame to the output thread.
+
+        The frame is copied, so the caller may draw into it again at once.
+        A frame still waiting in the mailbox is replaced (and counted as
+        dropped).
+
+        Args:
+            frame: Finished frame; its damage is taken over by the copy
+            *args: Extra arguments for present()
+        """
+        if not self.running:
+            self.start()
+
+        with self.condition:
+            slot = self.pending
+            if slot is None:
+                slot = self._spare_for(frame)
+            else:
+                self.dropped += 1  # Damage of the dropped frame stays in the slot
+            slot.copy_from(frame, mark_damage=False)
+            for rect in frame.take_damage():
+                slot.add_damage(*rect)
+            self.pending = slot
+            self.pending_args = args
+            self.submitted += 1
+            self.condition.notify_all()
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """Wait until every submitted frame has been output.
+
+        Returns:
+            bool: False if the timeout expired first
+        """
+        with self.condition:
+            return self.condition.wait_for(
+                lambda: self.pending is None and not self.busy, timeout
+            )
+
+    def _spare_for(self, frame: Display) -> Display:
+        """Get a free frame copy matching `frame` (caller holds the lock)."""
+        while self.spare:
+            slot = self.spare.pop()
+            if (slot.width, slot.height, slot.color_mode) == \
+                    (frame.width, frame.height, frame.color_mode):
+                return slot
+        return Display(frame.width, frame.height, frame.color_mode)
+
+    def _loop(self):
+        """Output thread main loop."""
+        while True:
+            idle_start = time.perf_counter()
+            with self.condition:
+                while self.pending is None and self.running:
+                    self.condition.wait()
+                if self.pending is None:
+                    break  # Stopped with nothing left to output
+                frame, args = self.pending, self.pending_args
+                self.pending = None
+                self.busy = True
+
+            start = time.perf_counter()
+            try:
+                self.present(frame, *args)
+            except Exception as e:
+                self.errors += 1
+                print(f"Output error: {e}")
+            elapsed = (time.perf_counter() - start) * 1000
+
+            self.last_output_ms = elapsed
+            self.max_output_ms = max(self.max_output_ms, elapsed)
+            self.total_output_ms += elapsed
+            self.total_idle_ms += (start - idle_start) * 1000
+            self.presented += 1
+
+            frame.take_damage()  # Drivers that ignore damage leave it behind
+            with self.condition:
+                self.spare.append(frame)
+                self.busy = False
+                self.condition.notify_all()
+
+    def get_stats(self) -> dict:
+        """Output timing statistics.
+
+        Returns:
+            dict: submitted/presented/dropped frame counts, last/average/max
+                  output time in ms, and utilization (fraction of time the
+                  thread spent outputting rather than waiting for frames)
+        """
+        busy = self.total_output_ms
+        total = busy + self.total_idle_ms
+        return {
+            'submitted': self.submitted,
+            'presented': self.presented,
+            'dropped': self.dropped,
+            'errors': self.errors,
+            'last_ms': self.last_output_ms,
+            'average_ms': busy / self.presented if self.presented else 0.0,
+            'max_ms': self.max_output_ms,
+            'utilization': busy / total if total else 0.0,
+        }
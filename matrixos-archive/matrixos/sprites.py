@@ -25,9 +25,14 @@ Usage:
     # Check collisions
     if player.collides_with(enemy):
         game_over()
+    
+    # Many sprites: index groups in a spatial hash for fast collision checks
+    bullets = SpriteGroup(cell_size=16)
 """
 
+import copy
 import math
+from matrixos.display import Bitmap, Display
 from matrixos.logger import get_logger
 
 logger = get_logger("sprites")
@@ -102,6 +107,34 @@ def distance(x1, y1, x2, y2):
     return math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
 
 
+# ============================================================================
+# Drawing Utilities
+# ============================================================================
+
+def blit_bitmap(matrix, bitmap, x, y):
+    """
+    Draw a Bitmap with matrix.blit(), or pixel by pixel on matrices without it.
+    
+    Args:
+        matrix: LED matrix (or test display) to draw on
+        bitmap: Bitmap to draw (its alpha mask decides transparency)
+        x: Screen x of the bitmap's left edge
+        y: Screen y of the bitmap's top edge
+    """
+    blit = getattr(matrix, 'blit', None)
+    if blit is not None:
+        blit(bitmap, x, y)
+        return
+    
+    for row in range(bitmap.height):
+        for start, end, alpha in bitmap.row_runs(row):
+            if alpha < 128:
+                continue
+            for col in range(start, end):
+                matrix.set_pixel(x + col, y + row, bitmap.get_pixel(col, row))
+
+
+
 # ============================================================================
 # Base Sprite Class
 # ============================================================================
@@ -172,6 +205,71 @@ class Sprite:
         # Optional name for debugging
         self.name = None
     
+    # Spatial hashes indexing this sprite (see SpatialHash); position and
+    # size are properties so moving the sprite tells them
+    _spatial_hashes = ()
+    
+    @property
+    def x(self):
+        return self._x
+    
+    @x.setter
+    def x(self, value):
+        self._x = value
+        if self._spatial_hashes:
+            self._moved()
+    
+    @property
+    def y(self):
+        return self._y
+    
+    @y.setter
+    def y(self, value):
+        self._y = value
+        if self._spatial_hashes:
+            self._moved()
+    
+    @property
+    def width(self):
+        return self._width
+    
+    @width.setter
+    def width(self, value):
+        self._width = value
+        if self._spatial_hashes:
+            self._moved()
+    
+    @property
+    def height(self):
+        return self._height
+    
+    @height.setter
+    def height(self, value):
+        self._height = value
+        if self._spatial_hashes:
+            self._moved()
+    
+    def _moved(self):
+        """Mark the sprite for re-bucketing in the spatial hashes indexing it."""
+        for spatial_hash in self._spatial_hashes:
+            spatial_hash.dirty.add(self)
+    
+    def __copy__(self):
+        """Copy the sprite (e.g. spawning from a prototype), outside any spatial hash."""
+        copied = self.__class__.__new__(self.__class__)
+        copied.__dict__.update(self.__dict__)
+        copied.__dict__.pop('_spatial_hashes', None)
+        return copied
+    
+    def __deepcopy__(self, memo):
+        """Deep copy the sprite, outside any spatial hash."""
+        copied = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copied
+        for name, value in self.__dict__.items():
+            if name != '_spatial_hashes':
+                copied.__dict__[name] = copy.deepcopy(value, memo)
+        return copied
+    
     def rect(self):
         """
         Get bounding rectangle.
@@ -179,7 +277,7 @@ class Sprite:
         Returns:
             tuple: (x, y, width, height)
         """
-        return (self.x, self.y, self.width, self.height)
+        return (self._x, self._y, self._width, self._height)
     
     def center(self):
         """
@@ -211,8 +309,10 @@ class Sprite:
         Args:
             delta_time: Time since last update in seconds
         """
-        self.x += self.velocity_x * delta_time
-        self.y += self.velocity_y * delta_time
+        self._x += self.velocity_x * delta_time
+        self._y += self.velocity_y * delta_time
+        if self._spatial_hashes:
+            self._moved()
     
     def render(self, matrix):
         """
@@ -285,6 +385,222 @@ class Sprite:
         return f"{name}(x={self.x:.1f}, y={self.y:.1f}, {self.width}×{self.height})"
 
 
+# ============================================================================
+# Spatial Hash
+# ============================================================================
+
+_plain_classes = {}
+
+
+def _is_plain(sprite):
+    """True if the sprite collides by its x/y/width/height box (rect() and
+    collides_with() not overridden), so pairs can be tested inline."""
+    cls = type(sprite)
+    plain = _plain_classes.get(cls)
+    if plain is None:
+        plain = cls.rect is Sprite.rect and cls.collides_with is Sprite.collides_with
+        _plain_classes[cls] = plain
+    return plain
+
+
+def _overlaps(a, b):
+    """rect_overlap(a.rect(), b.rect()) without building the tuples."""
+    ax = a._x
+    bx = b._x
+    if ax + a._width <= bx or bx + b._width <= ax:
+        return False
+    ay = a._y
+    by = b._y
+    return not (ay + a._height <= by or by + b._height <= ay)
+
+
+def _collide(a, b):
+    """a.collides_with(b), tested inline when both are plain sprites."""
+    if _is_plain(a) and _is_plain(b):
+        return _overlaps(a, b)
+    return a.collides_with(b)
+
+
+class SpatialHash:
+    """
+    Uniform-grid spatial hash of sprites (a collision broadphase).
+    
+    The plane is divided into square cells and each sprite is listed in
+    every cell its bounding box touches, so only sprites sharing a cell
+    need an overlap test. Moving a sprite marks it dirty; dirty sprites are
+    re-bucketed before the next query, and only if they changed cells.
+    
+    Pick a cell size around the size of the larger sprites: much smaller
+    and big sprites span many cells, much larger and cells fill up.
+    
+    Sprites overriding rect() or collides_with() may collide beyond their
+    x/y/width/height box, so they are not bucketed: every query returns
+    them, and a query for one returns every sprite.
+    """
+    
+    def __init__(self, cell_size=16):
+        """
+        Initialize spatial hash.
+        
+        Args:
+            cell_size: Cell width and height in pixels
+        """
+        if cell_size <= 0:
+            raise ValueError(f"Cell size must be positive, not {cell_size!r}")
+        self.cell_size = cell_size
+        self.cells = {}  # (col, row) -> set of sprites
+        self.entries = {}  # sprite -> (order, (col0, row0, col1, row1) or None)
+        self.unbucketed = set()  # Sprites with their own collision tests
+        self.dirty = set()
+        self.next_order = 0
+        self.rebuckets = 0
+    
+    def _cell_range(self, sprite):
+        """Cells covered by a sprite: (col0, row0, col1, row1), inclusive."""
+        size = self.cell_size
+        x = sprite._x
+        y = sprite._y
+        return (int(x // size), int(y // size),
+                int((x + sprite._width) // size), int((y + sprite._height) // size))
+    
+    def _bucket(self, sprite, cell_range, add):
+        """Add the sprite to (or remove it from) every cell in cell_range."""
+        col0, row0, col1, row1 = cell_range
+        cells = self.cells
+        for row in range(row0, row1 + 1):
+            for col in range(col0, col1 + 1):
+                if add:
+                    cell = cells.get((col, row))
+                    if cell is None:
+                        cells[(col, row)] = {sprite}
+                    else:
+                        cell.add(sprite)
+                else:
+                    cell = cells[(col, row)]
+                    cell.discard(sprite)
+                    if not cell:
+                        del cells[(col, row)]
+    
+    def insert(self, sprite):
+        """
+        Add a sprite (ordered after those already in the hash).
+        
+        Args:
+            sprite: Sprite to index
+        """
+        if sprite in self.entries:
+            return
+        if _is_plain(sprite):
+            cell_range = self._cell_range(sprite)
+            self._bucket(sprite, cell_range, True)
+        else:
+            cell_range = None
+            self.unbucketed.add(sprite)
+        self.entries[sprite] = (self.next_order, cell_range)
+        self.next_order += 1
+        if not sprite._spatial_hashes:
+            sprite._spatial_hashes = []
+        sprite._spatial_hashes.append(self)
+    
+    def remove(self, sprite):
+        """
+        Remove a sprite.
+        
+        Args:
+            sprite: Sprite to drop from the index
+        """
+        entry = self.entries.pop(sprite, None)
+        if entry is None:
+            return
+        if entry[1] is None:
+            self.unbucketed.discard(sprite)
+        else:
+            self._bucket(sprite, entry[1], False)
+        self.dirty.discard(sprite)
+        sprite._spatial_hashes.remove(self)
+    
+    def clear(self):
+        """Remove every sprite."""
+        for sprite in self.entries:
+            sprite._spatial_hashes.remove(self)
+        self.cells.clear()
+        self.entries.clear()
+        self.unbucketed.clear()
+        self.dirty.clear()
+    
+    def flush(self):
+        """Re-bucket sprites that moved since the last query (if they changed cells)."""
+        if not self.dirty:
+            return
+        entries = self.entries
+        for sprite in self.dirty:
+            entry = entries.get(sprite)
+            if entry is None or entry[1] is None:
+                continue  # Not in this hash, or not bucketed
+            order, old_range = entry
+            new_range = self._cell_range(sprite)
+            if new_range != old_range:
+                self._bucket(sprite, old_range, False)
+                self._bucket(sprite, new_range, True)
+                entries[sprite] = (order, new_range)
+                self.rebuckets += 1
+        self.dirty.clear()
+    
+    def query(self, sprite):
+        """
+        Sprites sharing a cell with a sprite's bounding box, plus those that
+        aren't bucketed (candidates for a collision; may include the sprite
+        itself). A sprite with its own collision test gets every sprite.
+        
+        Args:
+            sprite: Sprite to look around (need not be in the hash)
+        
+        Returns:
+            set: Candidate sprites
+        """
+        if not _is_plain(sprite):
+            return self.entries.keys()
+        self.flush()
+        col0, row0, col1, row1 = self._cell_range(sprite)
+        cells = self.cells
+        if col0 == col1 and row0 == row1 and not self.unbucketed:
+            return cells.get((col0, row0), ())
+        candidates = set(self.unbucketed)
+        for row in range(row0, row1 + 1):
+            for col in range(col0, col1 + 1):
+                cell = cells.get((col, row))
+                if cell:
+                    candidates.update(cell)
+        return candidates
+    
+    def order(self, sprite):
+        """Insertion order of a sprite in the hash (to sort query results)."""
+        return self.entries[sprite][0]
+    
+    def get_stats(self):
+        """
+        Index statistics.
+        
+        Returns:
+            dict: sprites, unbucketed (sprites with their own collision
+                  tests), cells (non-empty), cell_size, rebuckets (sprites
+                  moved to different cells) and average_per_cell
+        """
+        listed = sum(len(cell) for cell in self.cells.values())
+        return {
+            'sprites': len(self.entries),
+            'unbucketed': len(self.unbucketed),
+            'cells': len(self.cells),
+            'cell_size': self.cell_size,
+            'rebuckets': self.rebuckets,
+            'average_per_cell': listed / len(self.cells) if self.cells else 0.0,
+        }
+    
+    def __len__(self):
+        """Return number of sprites in the hash."""
+        return len(self.entries)
+
+
 # ============================================================================
 # Sprite Group
 # ============================================================================
@@ -310,16 +626,69 @@ class SpriteGroup:
         # Check player collision with any enemy
         for enemy in enemies.check_collisions(player):
             print(f"Hit {enemy}!")
+    
+    With a cell_size, the group keeps its sprites in a SpatialHash and
+    collision checks against it only test nearby sprites - much faster for
+    large groups (bullets, particles). Add and remove sprites with add() and
+    remove() so the index stays in step; the index is also rebuilt when
+    group.sprites is assigned a new list or changes length, but not when
+    a sprite in it is replaced in place.
     """
     
-    def __init__(self, *sprites):
+    def __init__(self, *sprites, cell_size=None):
         """
         Initialize sprite group.
         
         Args:
             *sprites: Optional initial sprites to add
+            cell_size: Index the sprites in a spatial hash with cells this
+                       size (None = no index; collisions test every sprite)
         """
+        self._sprites_version = 0
         self.sprites = list(sprites)
+        self.spatial_hash = None
+        self._indexed_version = None
+        if cell_size is not None:
+            self.enable_spatial_hash(cell_size)
+    
+    @property
+    def sprites(self):
+        """The group's sprites (a list)."""
+        return self._sprites
+    
+    @sprites.setter
+    def sprites(self, sprites):
+        # A new list: the spatial hash no longer matches it
+        self._sprites = sprites
+        self._sprites_version += 1
+    
+    def enable_spatial_hash(self, cell_size=16):
+        """
+        Index the group's sprites in a spatial hash for collision checks.
+        
+        Args:
+            cell_size: Cell width and height in pixels
+        """
+        self.disable_spatial_hash()
+        self.spatial_hash = SpatialHash(cell_size)
+        self._indexed_version = self._sprites_version
+        for sprite in self.sprites:
+            self.spatial_hash.insert(sprite)
+    
+    def disable_spatial_hash(self):
+        """Drop the spatial hash (collision checks test every sprite)."""
+        if self.spatial_hash is not None:
+            self.spatial_hash.clear()
+            self.spatial_hash = None
+    
+    def _index(self):
+        """The spatial hash, rebuilt if group.sprites changed around add()/remove()."""
+        spatial_hash = self.spatial_hash
+        if spatial_hash is not None and (self._indexed_version != self._sprites_version or
+                                         len(spatial_hash) != len(self._sprites)):
+            self.enable_spatial_hash(spatial_hash.cell_size)
+            spatial_hash = self.spatial_hash
+        return spatial_hash
     
     def add(self, sprite):
         """
@@ -330,6 +699,8 @@ class SpriteGroup:
         """
         if sprite not in self.sprites:
             self.sprites.append(sprite)
+            if self.spatial_hash is not None:
+                self.spatial_hash.insert(sprite)
     
     def remove(self, sprite):
         """
@@ -340,10 +711,14 @@ class SpriteGroup:
         """
         if sprite in self.sprites:
             self.sprites.remove(sprite)
+            if self.spatial_hash is not None:
+                self.spatial_hash.remove(sprite)
     
     def clear(self):
         """Remove all sprites from group."""
         self.sprites.clear()
+        if self.spatial_hash is not None:
+            self.spatial_hash.clear()
     
     def update(self, delta_time):
         """
@@ -373,13 +748,18 @@ class SpriteGroup:
             sprite: Sprite to check against
         
         Returns:
-            list: List of colliding sprites
+            list: List of colliding sprites (in group order)
         """
-        collisions = []
-        for other in self.sprites:
-            if other != sprite and sprite.collides_with(other):
-                collisions.append(other)
-        return collisions
+        spatial_hash = self._index()
+        if spatial_hash is not None:
+            collisions = [other for other in spatial_hash.query(sprite)
+                          if other is not sprite and _collide(sprite, other)]
+            if len(collisions) > 1:
+                collisions.sort(key=spatial_hash.order)
+            return collisions
+        
+        return [other for other in self.sprites
+                if other is not sprite and _collide(sprite, other)]
     
     def check_group_collisions(self, other_group):
         """
@@ -389,13 +769,53 @@ class SpriteGroup:
             other_group: Another SpriteGroup
         
         Returns:
-            list: List of (sprite1, sprite2) collision pairs
-        """
+            list: List of (sprite1, sprite2) collision pairs, ordered as the
+                  groups are
+        """
+        other_hash = other_group._index()
+        own_hash = self._index()
+        if other_hash is not None:
+            # Look up each of our sprites in the other group's cells
+            collisions = []
+            for sprite1 in self.sprites:
+                candidates = other_hash.query(sprite1)
+                if not candidates:
+                    continue
+                hits = [sprite2 for sprite2 in candidates
+                        if _collide(sprite1, sprite2)]
+                if len(hits) > 1:
+                    hits.sort(key=other_hash.order)
+                collisions.extend((sprite1, sprite2) for sprite2 in hits)
+            return collisions
+        if own_hash is not None:
+            # Only we are indexed: look up the other group's sprites in our cells
+            collisions = [(sprite1, sprite2) for sprite2 in other_group.sprites
+                          for sprite1 in own_hash.query(sprite2)
+                          if _collide(sprite1, sprite2)]
+            order = {sprite: i for i, sprite in enumerate(other_group.sprites)}
+            collisions.sort(key=lambda pair: (own_hash.order(pair[0]), order[pair[1]]))
+            return collisions
+        
         collisions = []
+        others = other_group.sprites
         for sprite1 in self.sprites:
-            for sprite2 in other_group.sprites:
-                if sprite1.collides_with(sprite2):
-                    collisions.append((sprite1, sprite2))
+            if _is_plain(sprite1):
+                # Inline box test, no rect() tuples
+                x0 = sprite1._x
+                x1 = x0 + sprite1._width
+                y0 = sprite1._y
+                y1 = y0 + sprite1._height
+                for sprite2 in others:
+                    if _is_plain(sprite2):
+                        if (sprite2._x < x1 and x0 < sprite2._x + sprite2._width and
+                                sprite2._y < y1 and y0 < sprite2._y + sprite2._height):
+                            collisions.append((sprite1, sprite2))
+                    elif sprite1.collides_with(sprite2):
+                        collisions.append((sprite1, sprite2))
+            else:
+                for sprite2 in others:
+                    if sprite1.collides_with(sprite2):
+                        collisions.append((sprite1, sprite2))
         return collisions
     
     def find_by_tag(self, tag):
@@ -510,6 +930,12 @@ class TileMap:
             1: (33, 33, 222),    # Wall/blue (Pac-Man style)
             2: (255, 200, 150),  # Dot/tan
         }
+        
+        # Pre-rendered tiles for render(): rebuilt only where tiles change
+        self._bitmap = None
+        self._bitmap_key = None
+        self._bitmap_colors = None
+        self._bitmap_tiles = None
     
     # ------------------------------------------------------------------------
     # Coordinate Conversion
@@ -892,9 +1318,18 @@ class TileMap:
         """
         Render all tiles to matrix.
         
+        On an LEDMatrix the tiles live in a cached Bitmap (black tiles are
+        transparent) that is drawn with a single blit; only tiles that
+        changed since the last render are redrawn into it.
+        
         Args:
             matrix: LED matrix to draw on
         """
+        display = getattr(matrix, 'display', None)
+        if isinstance(display, Display) and hasattr(matrix, 'blit'):
+            matrix.blit(self._tile_bitmap(display), 0, 0)
+            return
+        
         for row in range(self.height):
             for col in range(self.width):
                 tile_id = self.tiles[row][col]
@@ -904,6 +1339,51 @@ class TileMap:
                         x, y = self.grid_to_pixel(col, row)
                         matrix.rect(x, y, self.tile_size, self.tile_size, color, fill=True)
     
+    def _tile_bitmap(self, display):
+        """
+        Get the pre-rendered tile Bitmap, updating tiles that changed.
+        
+        Args:
+            display: Framebuffer the bitmap will be blitted to (sets color mode)
+        
+        Returns:
+            Bitmap of the whole map
+        """
+        key = (display.color_mode, id(display.palette))
+        if self._bitmap is None or self._bitmap_key != key or \
+                self._bitmap_colors != self.tile_colors:
+            size = self.tile_size
+            self._bitmap = Bitmap(self.width * size, self.height * size,
+                                  display.color_mode, display.palette)
+            self._bitmap.set_alpha_rect(0, 0, self._bitmap.width, self._bitmap.height, 0)
+            self._bitmap_key = key
+            self._bitmap_colors = dict(self.tile_colors)
+            self._bitmap_tiles = [[None] * self.width for _ in range(self.height)]
+        
+        for row in range(self.height):
+            tiles = self.tiles[row]
+            drawn = self._bitmap_tiles[row]
+            if tiles == drawn:
+                continue
+            for col in range(self.width):
+                if tiles[col] != drawn[col]:
+                    self._draw_bitmap_tile(col, row, tiles[col])
+            self._bitmap_tiles[row] = list(tiles)
+        
+        return self._bitmap
+    
+    def _draw_bitmap_tile(self, col, row, tile_id):
+        """Draw one tile into the cached Bitmap."""
+        x, y = self.grid_to_pixel(col, row)
+        size = self.tile_size
+        color = self.tile_colors.get(tile_id)
+        if color is None or color == (0, 0, 0):
+            # Skip black tiles (left transparent)
+            self._bitmap.set_alpha_rect(x, y, size, size, 0)
+        else:
+            self._bitmap.fill_rect(x, y, size, size, color)
+            self._bitmap.set_alpha_rect(x, y, size, size, 255)
+    
     def render_tile(self, matrix, col, row):
         """
         Render single tile to matrix.
@@ -1020,8 +1500,9 @@ class EmojiSprite(Sprite):
         self.animation_fps = fps
         self.animation_timer = 0.0
         
-        # Image cache (PIL Image objects)
+        # Image cache (PIL Image objects) and the Bitmaps blitted from them
         self._image_cache = {}
+        self._bitmap_cache = {}
         self._preload_images()
     
     def _preload_images(self):
@@ -1051,9 +1532,12 @@ class EmojiSprite(Sprite):
                         img = img.resize((self.width, self.height), resample)
                     
                     self._image_cache[emoji] = img
+                    # Pixels with alpha < 128 are transparent, the rest opaque
+                    self._bitmap_cache[emoji] = Bitmap.from_image(img, threshold=128)
                 else:
                     # Emoji not found - cache None to avoid repeated lookups
                     self._image_cache[emoji] = None
+                    self._bitmap_cache[emoji] = None
     
     def update(self, delta_time):
         """
@@ -1087,32 +1571,15 @@ class EmojiSprite(Sprite):
         
         # Get current frame emoji
         emoji = self.emoji_frames[self.current_frame]
-        img = self._image_cache.get(emoji)
+        bitmap = self._bitmap_cache.get(emoji)
         
-        if img is None:
+        if bitmap is None:
             # Emoji not available - draw placeholder (small rectangle)
             matrix.rect(int(self.x), int(self.y), self.width, self.height, 
                        (100, 100, 100), fill=False)
             return
         
-        # Render emoji pixels
-        for py in range(self.height):
-            for px in range(self.width):
-                try:
-                    r, g, b, a = img.getpixel((px, py))
-                    
-                    # Skip transparent pixels (alpha < 128)
-                    if a < 128:
-                        continue
-                    
-                    # Draw pixel
-                    screen_x = int(self.x + px)
-                    screen_y = int(self.y + py)
-                    matrix.set_pixel(screen_x, screen_y, (r, g, b))
-                    
-                except:
-                    # Out of bounds or invalid pixel
-                    pass
+        blit_bitmap(matrix, bitmap, int(self.x), int(self.y))
     
     def set_emoji(self, emoji):
         """
@@ -3,6 +3,7 @@ MatrixOS Testing Framework
 
 Integrated testing system for MatrixOS apps with:
 - Headless display adapter for buffer inspection
+- Recording display driver for checking presented frames
 - Input event simulation
 - Sprite tracking and collision detection
 - Rich assertion library
@@ -18,12 +19,14 @@ Example usage:
 """
 
 from .display_adapter import HeadlessDisplay
+from .recording_driver import RecordingDriver
 from .input_simulator import InputSimulator
 from .runner import TestRunner
 from .assertions import Assertions
 
 __all__ = [
     'HeadlessDisplay',
+    'RecordingDriver',
     'InputSimulator', 
     'TestRunner',
     'Assertions',
@@ -4,19 +4,27 @@ Headless display adapter with rich inspection capabilities.
 Provides a display that captures all drawing operations without rendering
 to terminal, plus methods to inspect the display buffer for testing.
 
-Uses pure Python (no numpy) to minimize dependencies.
+Uses pure Python so it runs anywhere; when numpy is installed, pixel
+searches and snapshot comparisons take a vectorized fast path.
 """
 
-from typing import List, Tuple, Optional, Set
+from typing import List, Tuple, Optional
 from collections import deque
 import copy
 
+from matrixos.graphics import flood_spans
+
+try:
+    import numpy
+except ImportError:  # numpy is optional - fall back to pure Python
+    numpy = None
+
 
 class HeadlessDisplay:
     """
     Display adapter that captures drawing operations without rendering.
     
-    Compatible with LEDMatrix API. Uses pure Python lists (no numpy).
+    Compatible with LEDMatrix API. Uses pure Python lists (numpy optional).
     """
     
     def __init__(self, width: int = 128, height: int = 128):
@@ -170,6 +178,13 @@ class HeadlessDisplay:
         Returns:
             List of (x, y) coordinates
         """
+        if numpy is not None:
+            pixels = self._as_array(self.buffer)
+            if pixels is not None:
+                diff = numpy.abs(pixels - numpy.asarray(color[:3], dtype=numpy.int16))
+                ys, xs = numpy.nonzero((diff <= tolerance).all(axis=2))
+                return list(zip(xs.tolist(), ys.tolist()))
+
         matches = []
         for y in range(self.height):
             for x in range(self.width):
@@ -182,27 +197,36 @@ class HeadlessDisplay:
         return len(self.find_color(color, tolerance))
     
     def find_blobs(self, color: Tuple[int, int, int], 
-                   min_size: int = 1, tolerance: int = 0) -> List[List[Tuple[int, int]]]:
+                   min_size: int = 1, tolerance: int = 0,
+                   connectivity: int = 4) -> List[List[Tuple[int, int]]]:
         """
         Find connected regions (blobs) of a color.
         
+        Matching pixels are marked in a mask and each blob is collected
+        with the scanline flood fill from matrixos.graphics.
+        
         Args:
             color: RGB tuple to search for
             min_size: Minimum pixels in blob
             tolerance: Color matching tolerance
+            connectivity: 4, or 8 to join diagonally touching pixels
             
         Returns:
             List of blobs, where each blob is a list of (x, y) coordinates
         """
-        pixels = set(self.find_color(color, tolerance))
-        blobs = []
+        mask = bytearray(self.width * self.height)
+        for x, y in self.find_color(color, tolerance):
+            mask[y * self.width + x] = 1
         
-        while pixels:
-            # Flood fill to find connected component
-            start = pixels.pop()
-            blob = self._flood_fill(start, pixels)
+        blobs = []
+        pos = mask.find(1)
+        while pos >= 0:
+            spans = flood_spans(mask, self.width, self.height,
+                                pos % self.width, pos // self.width, connectivity)
+            blob = [(x, y) for y, x0, x1 in spans for x in range(x0, x1 + 1)]
             if len(blob) >= min_size:
                 blobs.append(blob)
+            pos = mask.find(1, pos)
         
         return blobs
     
@@ -246,6 +270,14 @@ class HeadlessDisplay:
         total_diff = 0
         max_possible = 255 * 3  # Max RGB difference per pixel
         
+        if numpy is not None:
+            current = self._as_array(self.buffer)
+            previous = self._as_array(snapshot)
+            if current is not None and previous is not None:
+                total_diff = int(numpy.abs(current - previous).sum())
+                max_diff = max_possible * self.width * self.height
+                return 1.0 - (total_diff / max_diff)
+        
         for y in range(self.height):
             for x in range(self.width):
                 for c in range(3):  # R, G, B
@@ -304,29 +336,20 @@ class HeadlessDisplay:
             'frame': self.render_count
         })
     
+    def _as_array(self, buffer: List[List[Tuple[int, int, int]]]):
+        """Convert a buffer to a (height, width, 3) int16 array, or None."""
+        try:
+            pixels = numpy.asarray(buffer, dtype=numpy.int16)
+        except (TypeError, ValueError):
+            return None  # Ragged or non-RGB entries - use the pure Python path
+        if pixels.shape != (self.height, self.width, 3):
+            return None
+        return pixels
+    
     def _color_match(self, c1: Tuple[int, int, int], c2: Tuple[int, int, int], 
                      tolerance: int) -> bool:
         """Check if two colors match within tolerance."""
         return all(abs(c1[i] - c2[i]) <= tolerance for i in range(3))
     
-    def _flood_fill(self, start: Tuple[int, int], 
-                    pixels: Set[Tuple[int, int]]) -> List[Tuple[int, int]]:
-        """Flood fill to find connected pixels."""
-        blob = [start]
-        queue = [start]
-        
-        while queue:
-            x, y = queue.pop(0)
-            
-            # Check 4-connected neighbors
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                neighbor = (x + dx, y + dy)
-                if neighbor in pixels:
-                    pixels.remove(neighbor)
-                    blob.append(neighbor)
-                    queue.append(neighbor)
-        
-        return blob
-    
     def __repr__(self):
         return f"HeadlessDisplay({self.width}x{self.height}, {self.render_count} renders)"
@@ -0,0 +1,70 @@
+"""
+Recording display driver for tests.
+
+A headless DisplayDriver that keeps what it is given instead of showing
+it, so tests can drive LEDMatrix, the compositor or an output process
+through a real driver and check the frames that came out.
+"""
+
+import threading
+from typing import Optional, Tuple
+
+from matrixos.devices.base import DisplayDriver
+
+
+class RecordingDriver(DisplayDriver):
+    """
+    Display driver that records pixels and presented frames.
+
+    set_pixel() writes into `pixels`, so DisplayDriver's default drawing
+    methods can be checked through it. Every present() appends a
+    (frame, data, damage, thread name) tuple to `presented`: data is a
+    snapshot of the frame's bytes (later drawing can't change what was
+    seen) and damage is what the frame carried, taken as a real driver
+    would take it.
+    """
+
+    def __init__(self, width: int, height: int, path: Optional[str] = None, **kwargs):
+        """
+        Args:
+            width, height: Display size
+            path: Also write each presented frame's bytes to this file
+                  (to see frames presented in another process)
+        """
+        super().__init__(width, height)
+        self.name = "Recording Display"
+        self.path = path
+        self.pixels = {}
+        self.presented = []
+        self.gate = None  # threading.Event present() waits on (a slow panel)
+        self.entered = threading.Event()  # Set once present() is called
+
+    def initialize(self) -> bool:
+        return True
+
+    def set_pixel(self, x: int, y: int, color: Tuple[int, int, int]):
+        self.pixels[(x, y)] = color
+
+    def get_pixel(self, x: int, y: int) -> Tuple[int, int, int]:
+        return self.pixels.get((x, y), (0, 0, 0))
+
+    def clear(self):
+        self.pixels = {}
+
+    def show(self):
+        pass
+
+    def present(self, frame):
+        """Record a frame (after waiting on `gate`, if set)."""
+        self.entered.set()
+        if self.gate is not None:
+            self.gate.wait(2.0)
+        data = bytes(frame.buffer)
+        self.presented.append((frame, data, frame.take_damage(),
+                               threading.current_thread().name))
+        if self.path:
+            with open(self.path, 'wb') as f:
+                f.write(data)
+
+    def cleanup(self):
+        pass
@@ -0,0 +1,318 @@
+"""
+Text layout for MatrixOS
+
+Breaks text into lines that fit a box: word-wrap to a width, align each
+line, and ellipsize what doesn't fit the width or the number of lines.
+Widths come from the font's glyph advances, so layouts are right for
+proportional fonts and scaled text too.
+
+Layouts are kept in a bounded LRU cache keyed by the text, font, box and
+options, so a dialog or list redrawn every frame lays its text out once:
+
+    box = layout_text(message, matrix.font, 90, 40, align='center')
+    box.draw(matrix, x, y, (220, 220, 220))
+"""
+
+from collections import OrderedDict
+from typing import Optional
+from matrixos.font import default_font
+
+ALIGNMENTS = ('left', 'center', 'right')
+VERTICAL_ALIGNMENTS = ('top', 'middle', 'bottom')
+
+
+class TextLayout:
+    """Text broken into positioned lines within a box."""
+
+    def __init__(self, lines: tuple, width: int, height: int, line_height: int,
+                 line_spacing: int, truncated: bool, spacing: int = 0, scale: int = 1):
+        """
+        Args:
+            lines: (text, x, y, width) per line, relative to the box
+            width, height: Box size (the text's size where unbounded)
+            line_height: Pixels from one line to the next
+            line_spacing: Blank rows between lines (part of line_height)
+            truncated: True if text was cut (and ellipsized) to fit
+            spacing, scale: Text options the layout was measured with
+        """
+        self.lines = lines
+        self.width = width
+        self.height = height
+        self.line_height = line_height
+        self.line_spacing = line_spacing
+        self.truncated = truncated
+        self.spacing = spacing
+        self.scale = scale
+
+    @property
+    def text_width(self) -> int:
+        """Width of the widest line."""
+        return max((line[3] for line in self.lines), default=0)
+
+    @property
+    def text_height(self) -> int:
+        """Height of the lines, from the top of the first to the bottom of the last."""
+        if not self.lines:
+            return 0
+        return self.lines[-1][2] - self.lines[0][2] + self.line_height - self.line_spacing
+
+    def draw(self, matrix, x: int, y: int, color=True, bg_color=None):
+        """
+        Draw the lines with the box's top-left corner at (x, y).
+
+        Args:
+            matrix: Anything with LEDMatrix's text() method
+            x, y: Box position
+            color: Text color
+            bg_color: Background color behind each line (None = transparent)
+        """
+        options = {}
+        if self.spacing:
+            options['spacing'] = self.spacing
+        if self.scale != 1:
+            options['scale'] = self.scale
+        for text, line_x, line_y, _ in self.lines:
+            matrix.text(text, x + line_x, y + line_y, color, bg_color, **options)
+
+
+class LayoutCache:
+    """
+    Bounded LRU cache of text layouts.
+
+    Keyed by everything the layout depends on - the text, the font (and its
+    glyph version, bumped when glyphs change), the box and the options - so
+    laying out the same text again is a dictionary lookup.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Args:
+            max_entries: Layouts kept before the least recently used is
+                         dropped (0 disables caching)
+        """
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: tuple, compute) -> TextLayout:
+        """
+        Get a layout, computing it on a miss.
+
+        Args:
+            key: Layout inputs
+            compute: Called on a miss; returns the TextLayout
+
+        Returns:
+            TextLayout
+        """
+        layout = self.entries.get(key)
+        if layout is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return layout
+
+        self.misses += 1
+        layout = compute()
+        if self.max_entries > 0:
+            self.entries[key] = layout
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+        return layout
+
+    def clear(self):
+        """Drop every cached layout and reset the statistics."""
+        self.entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def get_stats(self) -> dict:
+        """
+        Cache statistics.
+
+        Returns:
+            dict: hits, misses, evictions, entries, max_entries and
+                  hit_rate (fraction of lookups that were hits)
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'max_entries': self.max_entries,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Shared by every layout_text() call
+layout_cache = LayoutCache()
+
+
+def matrix_font(matrix):
+    """The font matrix.text() draws with (the default font if it doesn't say)."""
+    return getattr(matrix, 'font', None) or default_font
+
+
+def layout_text(text: str, font, width: Optional[int] = None, height: Optional[int] = None,
+                align: str = 'left', valign: str = 'top', wrap: bool = True,
+                ellipsis: str = '...', line_spacing: int = 2, spacing: int = 0,
+                scale: int = 1) -> TextLayout:
+    """
+    Lay text out in a box (cached).
+
+    Newlines always start a new line. With `wrap`, lines are broken between
+    words to fit `width` (a word wider than the box is broken between
+    characters); without it, each line is cut to the width. Lines beyond
+    `height` are dropped. Wherever text is cut, the last character kept is
+    followed by `ellipsis` (if it fits).
+
+    Args:
+        text: Text to lay out
+        font: Font whose glyph advances measure the text
+        width: Box width in pixels (None = unbounded)
+        height: Box height in pixels (None = unbounded)
+        align: 'left', 'center' or 'right' within the width
+        valign: 'top', 'middle' or 'bottom' within the height
+        wrap: Break lines to fit the width
+        ellipsis: Marks cut text ('' = cut without one)
+        line_spacing: Blank rows between lines
+        spacing: Extra spacing between characters
+        scale: Integer text scale factor
+
+    Returns:
+        TextLayout
+    """
+    if align not in ALIGNMENTS:
+        raise ValueError(f"align must be one of {ALIGNMENTS}, not {align!r}")
+    if valign not in VERTICAL_ALIGNMENTS:
+        raise ValueError(f"valign must be one of {VERTICAL_ALIGNMENTS}, not {valign!r}")
+    key = (text, font, getattr(font, 'glyph_version', 0), width, height, align, valign,
+           wrap, ellipsis, line_spacing, spacing, scale)
+    return layout_cache.get(key, lambda: _layout(text, font, width, height, align, valign,
+                                                 wrap, ellipsis, line_spacing, spacing,
+                                                 scale))
+
+
+def _layout(text, font, width, height, align, valign, wrap, ellipsis, line_spacing,
+            spacing, scale) -> TextLayout:
+    """Compute a layout (see layout_text())."""
+    advances = _Advances(font, spacing, scale)
+    glyph_height = font.char_height * scale
+    line_height = glyph_height + line_spacing
+    if width is not None and width <= 0:
+        # Nothing fits in a box with no width
+        return TextLayout((), 0, max(0, height or 0), line_height, line_spacing,
+                          bool(text), spacing, scale)
+
+    lines = []
+    truncated = False
+    for paragraph in text.split('\n'):
+        if wrap and width is not None:
+            lines.extend(_wrap(paragraph, width, advances))
+        elif width is not None and advances.measure(paragraph) > width:
+            lines.append(_ellipsize(paragraph, width, ellipsis, advances))
+            truncated = True
+        else:
+            lines.append(paragraph)
+
+    # Clamp to the lines that fit, ellipsizing the last one kept
+    if height is not None:
+        max_lines = max(0, (height + line_spacing) // line_height)
+        if len(lines) > max_lines:
+            lines = lines[:max_lines]
+            truncated = True
+            if lines:
+                lines[-1] = _ellipsize(lines[-1].rstrip(), width, ellipsis, advances, cut=True)
+
+    measured = [(line, advances.measure(line)) for line in lines]
+    box_width = width if width is not None else max((w for _, w in measured), default=0)
+    used_height = len(lines) * line_height - line_spacing if lines else 0
+    box_height = height if height is not None else used_height
+
+    top = 0
+    if valign == 'middle':
+        top = (box_height - used_height) // 2
+    elif valign == 'bottom':
+        top = box_height - used_height
+
+    positioned = []
+    for i, (line, line_width) in enumerate(measured):
+        x = 0
+        if align == 'center':
+            x = (box_width - line_width) // 2
+        elif align == 'right':
+            x = box_width - line_width
+        positioned.append((line, x, top + i * line_height, line_width))
+
+    return TextLayout(tuple(positioned), box_width, box_height, line_height, line_spacing,
+                      truncated, spacing, scale)
+
+
+class _Advances:
+    """Measures text with one font, spacing and scale."""
+
+    def __init__(self, font, spacing: int, scale: int):
+        self.font = font
+        self.spacing = spacing
+        self.scale = scale
+
+    def char(self, char: str) -> int:
+        """Pen advance of one character, spacing included."""
+        glyph = self.font.get_glyph(char)
+        return (glyph.width * self.scale if glyph is not None else 0) + self.spacing
+
+    def measure(self, text: str) -> int:
+        """Width of a string as draw_text() would draw it."""
+        return self.font.measure(text, self.scale, self.spacing)[0]
+
+    def fit(self, text: str, width: int) -> int:
+        """Number of leading characters of text that fit in width."""
+        used = -self.spacing
+        for i, char in enumerate(text):
+            used += self.char(char)
+            if used > width:
+                return i
+        return len(text)
+
+
+def _wrap(paragraph: str, width: int, advances: _Advances) -> list:
+    """Break one paragraph into lines no wider than width."""
+    lines = []
+    line = ''
+    for word in paragraph.split(' '):
+        candidate = f"{line} {word}" if line else word
+        if advances.measure(candidate) <= width:
+            line = candidate
+            continue
+        if line:
+            lines.append(line)
+        # Break words that don't fit on a line of their own
+        while advances.measure(word) > width:
+            count = max(advances.fit(word, width), 1)
+            lines.append(word[:count])
+            word = word[count:]
+        line = word
+    # Breaking the last word can leave nothing over for a final line
+    if line or not lines:
+        lines.append(line)
+    return lines
+
+
+def _ellipsize(line: str, width: Optional[int], ellipsis: str, advances: _Advances,
+              cut: bool = False) -> str:
+    """
+    Cut a line to fit width, ending it with ellipsis.
+
+    With `cut`, text after the line was already dropped, so it gets the
+    ellipsis even if it fits. The ellipsis is left out if even it won't fit.
+    """
+    if width is None:
+        return line + ellipsis if cut else line
+    if not cut and advances.measure(line) <= width:
+        return line
+    if not ellipsis or advances.measure(ellipsis) > width:
+        return line[:advances.fit(line, width)]
+    room = width - advances.measure(ellipsis) - advances.spacing
+    return line[:advances.fit(line, room)].rstrip() + ellipsis
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark the bit-plane (BCM) encoder
+
+Encodes full frames and frames with one moving sprite through
+BitplaneDisplayDriver and reports the encode time per frame. With --output
+the encoded frames are recorded with FileSink for offline checking.
+
+Usage:
+    python -m matrixos.tools.benchmark_bitplane [--bits 8] [--frames 200] [--output frames.bin]
+"""
+
+import argparse
+
+from matrixos.devices.display import bitplane
+from matrixos.devices.display.bitplane import BitplaneDisplayDriver, BitplaneSink, FileSink
+from matrixos.led_api import LEDMatrix
+
+
+def full_frame(matrix, i):
+    """Redraw every pixel with a new colour each frame."""
+    matrix.fill(((i * 7) % 256, 64, 255 - (i * 7) % 256))
+
+
+def sprite_frame(matrix, i):
+    """Move one 8x8 sprite over a static background."""
+    matrix.fill((0, 0, 40))
+    x = i % (matrix.width - 8)
+    matrix.rect(x, matrix.height // 4, 8, 8, (255, 255, 0), fill=True)
+
+
+def time_encoder(driver, frames, draw):
+    """Average encode milliseconds per frame, and rows re-encoded per frame."""
+    encoder = driver.encoder
+    matrix = LEDMatrix(driver.width, driver.height, driver=driver)
+    encoder.frames = encoder.rows_encoded = encoder.rows_reused = 0
+    encoder.total_encode_ms = 0.0
+    for i in range(frames):
+        draw(matrix, i)
+        matrix.show()
+    stats = encoder.get_stats()
+    return stats['average_encode_ms'], stats['rows_encoded'] / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the bit-plane encoder")
+    parser.add_argument('--width', type=int, default=256)
+    parser.add_argument('--height', type=int, default=64)
+    parser.add_argument('--bits', type=int, default=8)
+    parser.add_argument('--frames', type=int, default=200)
+    parser.add_argument('--output', help="Record encoded frames to this file")
+    parser.add_argument('--no-numpy', action='store_true', help="Use the pure Python encoder")
+    args = parser.parse_args()
+
+    if args.no_numpy:
+        bitplane.numpy = None
+
+    sink = FileSink(args.output) if args.output else BitplaneSink()
+    driver = BitplaneDisplayDriver(args.width, args.height, sink=sink, bits=args.bits)
+    driver.initialize()
+
+    try:
+        backend = "pure Python" if bitplane.numpy is None else "NumPy"
+        print(f"{args.width}x{args.height}, {args.bits} bit-planes, "
+              f"{driver.encoder.scan_rows} scan rows, {args.frames} frames ({backend})")
+        for name, draw in (("full frame", full_frame), ("moving sprite", sprite_frame)):
+            ms, rows = time_encoder(driver, args.frames, draw)
+            print(f"  {name:14s} {ms:7.3f} ms/frame  ({rows:5.1f} rows re-encoded)")
+    finally:
+        driver.cleanup()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark polygon filling
+
+Compares the active-edge-table scanline filler (graphics.fill_polygon)
+with the old approach of splitting the polygon into a triangle fan from
+vertex 0 and filling each triangle. Reports fills per second and the spans
+drawn per fill; the fan re-draws the rows shared by neighbouring triangles
+and fills concave shapes wrongly. The triangle goes through draw_triangle(),
+which skips the edge table for three vertices.
+
+Usage:
+    python -m matrixos.tools.benchmark_polygon [--repeat 500]
+"""
+
+import argparse
+import math
+import time
+
+from matrixos.display import Display
+from matrixos.graphics import draw_span, draw_triangle, fill_polygon
+
+
+def fan_triangle(display, x0, y0, x1, y1, x2, y2, color):
+    """The previous filled triangle: interpolate both sides of each row."""
+    (x0, y0), (x1, y1), (x2, y2) = sorted([(x0, y0), (x1, y1), (x2, y2)], key=lambda p: p[1])
+
+    def interpolate(xa, ya, xb, yb, y):
+        if yb == ya:
+            return xa
+        return xa + (xb - xa) * (y - ya) / (yb - ya)
+
+    for y in range(y0, y2 + 1):
+        if y < y1:
+            xa = interpolate(x0, y0, x1, y1, y)
+        else:
+            xa = interpolate(x1, y1, x2, y2, y)
+        xb = interpolate(x0, y0, x2, y2, y)
+        draw_span(display, y, int(xa), int(xb), color)
+
+
+def fan_polygon(display, points, color):
+    """The previous filled polygon: a triangle fan from vertex 0."""
+    for i in range(1, len(points) - 1):
+        fan_triangle(display, *points[0], *points[i], *points[i + 1], color)
+
+
+def scanline_fill(display, points, color):
+    """fill_polygon(), or draw_triangle() for three vertices."""
+    if len(points) == 3:
+        draw_triangle(display, *points[0], *points[1], *points[2], color, fill=True)
+    else:
+        fill_polygon(display, points, color)
+
+
+def star_points(cx, cy, radius, points=5):
+    """Vertices of draw_star()'s star."""
+    vertices = []
+    for i in range(points * 2):
+        angle = (i * math.pi / points) - math.pi / 2
+        r = radius if i % 2 == 0 else radius * 0.4
+        vertices.append((cx + int(r * math.cos(angle)), cy + int(r * math.sin(angle))))
+    return vertices
+
+
+class SpanCounter(Display):
+    """Display that counts fill_span() calls."""
+
+    def __init__(self, width, height):
+        super().__init__(width, height, 'rgb')
+        self.spans = 0
+
+    def fill_span(self, y, x0, x1, value=True):
+        self.spans += 1
+        super().fill_span(y, x0, x1, value)
+
+
+SHAPES = {
+    'triangle': [(20, 10), (230, 40), (90, 180)],
+    'star': star_points(128, 96, 90),
+    '24-gon': [(128 + int(90 * math.cos(i * math.pi / 12)),
+                96 + int(90 * math.sin(i * math.pi / 12))) for i in range(24)],
+    'concave comb': [(10, 10), (240, 10), (240, 180)] +
+                    [(x, y) for i in range(10, 0, -1)
+                     for x, y in ((20 * i + 10, 180), (20 * i, 40))] + [(10, 180)],
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark polygon filling")
+    parser.add_argument('--repeat', type=int, default=500)
+    args = parser.parse_args()
+
+    color = (255, 200, 0)
+    print(f"256x192, {args.repeat} fills per shape")
+    print(f"  {'shape':14s} {'fan fills/s':>12s} {'scan fills/s':>12s} {'fan spans':>10s} {'scan spans':>10s}")
+    for name, points in SHAPES.items():
+        results = []
+        for fill in (fan_polygon, scanline_fill):
+            display = SpanCounter(256, 192)
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                fill(display, points, color)
+            elapsed = time.perf_counter() - start
+            results.append((args.repeat / elapsed, display.spans // args.repeat))
+        (fan_rate, fan_spans), (scan_rate, scan_spans) = results
+        print(f"  {name:14s} {fan_rate:12.0f} {scan_rate:12.0f} {fan_spans:10d} {scan_spans:10d}")
+
+
+if __name__ == '__main__':
+    main()
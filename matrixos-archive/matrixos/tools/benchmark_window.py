@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Pygame window driver headless
+
+Presents full frames and small damaged regions through MacOSWindowDriver
+with SDL's dummy video driver and reports the time per frame.
+
+Usage:
+    python -m matrixos.tools.benchmark_window [--scale 3] [--gap 1] [--frames 200]
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from matrixos.devices.display.macos_window import MacOSWindowDriver
+from matrixos.led_api import LEDMatrix
+
+
+def time_frames(matrix, frames, draw):
+    """Average milliseconds per draw() + show()."""
+    start = time.perf_counter()
+    for i in range(frames):
+        draw(matrix, i)
+        matrix.show()
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def full_frame(matrix, i):
+    """Redraw every pixel with a new colour each frame."""
+    matrix.fill(((i * 7) % 256, 64, 255 - (i * 7) % 256))
+
+
+def sprite_frame(matrix, i):
+    """Move one 8x8 sprite over a static background."""
+    matrix.fill((0, 0, 40))
+    x = i % (matrix.width - 8)
+    matrix.rect(x, matrix.height // 2, 8, 8, (255, 255, 0), fill=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Pygame window driver")
+    parser.add_argument('--width', type=int, default=256)
+    parser.add_argument('--height', type=int, default=192)
+    parser.add_argument('--scale', type=int, default=3)
+    parser.add_argument('--gap', type=int, default=1, help="Pixel gap (LED look)")
+    parser.add_argument('--frames', type=int, default=200)
+    args = parser.parse_args()
+
+    driver = MacOSWindowDriver(args.width, args.height, scale=args.scale,
+                               pixel_gap=args.gap)
+    if not driver.initialize():
+        raise SystemExit("Could not initialize the window driver")
+
+    try:
+        matrix = LEDMatrix(args.width, args.height, driver=driver)
+        print(f"{args.width}x{args.height} at scale {args.scale}, gap {args.gap}, "
+              f"{args.frames} frames ({os.environ['SDL_VIDEODRIVER']} video driver)")
+        for name, draw in (("full frame", full_frame), ("moving sprite", sprite_frame)):
+            ms = time_frames(matrix, args.frames, draw)
+            print(f"  {name:14s} {ms:7.2f} ms/frame  ({1000 / ms:6.0f} fps)")
+    finally:
+        driver.cleanup()
+
+
+if __name__ == '__main__':
+    main()
@@ -19,7 +19,10 @@ Example:
 """
 
 from typing import Callable, Optional, List
+from matrixos.display import Bitmap
+from matrixos.font import default_font
 from matrixos.input import InputEvent
+from matrixos.text_layout import layout_text, matrix_font
 from matrixos import layout
 
 
@@ -62,7 +65,7 @@ class Label(Widget):
     """Static text label."""
     
     def __init__(self, text: str, x: int = 0, y: int = 0, 
-                 color: tuple = (200, 200, 200)):
+                 color: tuple = (200, 200, 200), font=None):
         """
         Initialize label.
         
@@ -71,24 +74,29 @@ class Label(Widget):
             x: X position
             y: Y position
             color: Text color (r, g, b)
+            font: Font to use (default: the matrix's font)
         """
-        width = len(text) * 6
-        super().__init__(x, y, width, 7)
+        # Sized with the default font until rendered with the real one
+        box = layout_text(text, font or default_font)
+        super().__init__(x, y, box.text_width, box.text_height)
         self.text = text
         self.color = color
+        self.font = font
     
     def render(self, matrix):
-        """Render label."""
+        """Render label (and size it to the font it is drawn with)."""
         if not self.visible:
             return
-        matrix.text(self.text, self.x, self.y, self.color)
+        box = layout_text(self.text, self.font or matrix_font(matrix))
+        self.width, self.height = box.text_width, box.text_height
+        box.draw(matrix, self.x, self.y, self.color)
 
 
 class Button(Widget):
     """Clickable button."""
     
     def __init__(self, text: str, x: int = 0, y: int = 0, 
-                 width: int = 0, on_click: Optional[Callable] = None):
+                 width: int = 0, on_click: Optional[Callable] = None, font=None):
         """
         Initialize button.
         
@@ -98,17 +106,24 @@ class Button(Widget):
             y: Y position
             width: Width (0 = auto from text)
             on_click: Callback when clicked
+            font: Font to use (default: the matrix's font)
         """
-        if width == 0:
-            width = len(text) * 6 + 8
+        # Auto width is measured again with the font the button is drawn with
+        self.auto_width = width == 0
+        if self.auto_width:
+            width = (font or default_font).measure(text)[0] + 8
         super().__init__(x, y, width, 11)
         self.text = text
         self.on_click = on_click
+        self.font = font
     
     def render(self, matrix):
         """Render button."""
         if not self.visible:
             return
+        font = self.font or matrix_font(matrix)
+        if self.auto_width:
+            self.width = font.measure(self.text)[0] + 8
         
         # Button colors
         if not self.enabled:
@@ -128,10 +143,10 @@ class Button(Widget):
         border_color = (150, 150, 150) if self.focused else (100, 100, 100)
         matrix.rect(self.x, self.y, self.width, self.height, border_color, fill=False)
         
-        # Text (centered)
-        text_x = self.x + (self.width - len(self.text) * 6) // 2
-        text_y = self.y + 2
-        matrix.text(self.text, text_x, text_y, text_color)
+        # Text (centered, ellipsized to fit)
+        label = layout_text(self.text, font, self.width - 4,
+                            align='center', wrap=False)
+        label.draw(matrix, self.x + 2, self.y + 2, text_color)
     
     def handle_input(self, event: InputEvent) -> bool:
         """Handle input."""
@@ -192,16 +207,12 @@ class TextInput(Widget):
         
         if self.value:
             # Show value (truncate if too long)
-            display_text = self.value
-            max_chars = (self.width - 10) // 6
-            if len(display_text) > max_chars:
-                display_text = display_text[:max_chars - 3] + "..."
-            
-            matrix.text(display_text, text_x, text_y, (255, 255, 255))
+            value = layout_text(self.value, matrix_font(matrix), self.width - 8, wrap=False)
+            value.draw(matrix, text_x, text_y, (255, 255, 255))
             
             # Cursor when focused
             if self.focused and self.cursor_visible:
-                cursor_x = text_x + len(display_text) * 6
+                cursor_x = text_x + value.text_width
                 if cursor_x < self.x + self.width - 3:
                     matrix.rect(cursor_x, text_y, 2, 7, (100, 200, 255), fill=True)
         
@@ -269,6 +280,7 @@ class ListWidget(Widget):
             self.scroll_offset = self.selected_index - visible_count + 1
         
         # Render visible items
+        font = matrix_font(matrix)
         y = self.y + 2
         for i in range(self.scroll_offset, min(len(self.items), self.scroll_offset + visible_count)):
             item = self.items[i]
@@ -283,10 +295,8 @@ class ListWidget(Widget):
                 text_color = (200, 200, 200)
             
             # Truncate if needed
-            max_chars = (self.width - 8) // 6
-            display_text = item if len(item) <= max_chars else item[:max_chars - 3] + "..."
-            
-            matrix.text(display_text, self.x + 4, y, text_color)
+            layout_text(item, font, self.width - 8, wrap=False).draw(
+                matrix, self.x + 4, y, text_color)
             y += item_height
     
     def handle_input(self, event: InputEvent) -> bool:
@@ -347,13 +357,18 @@ class Dialog(Widget):
         dialog_y = (height - dialog_height) // 2
         
         # Semi-transparent background (darken rest of screen)
-        for y in range(height):
-            for x in range(width):
-                if x < dialog_x or x >= dialog_x + dialog_width or \
-                   y < dialog_y or y >= dialog_y + dialog_height:
-                    # Darken pixels outside dialog
-                    r, g, b = matrix.get_pixel(x, y)
-                    matrix.set_pixel(x, y, (r // 2, g // 2, b // 2))
+        if hasattr(matrix, 'scale_brightness'):
+            # Darken everything in one pass; the dialog background below
+            # covers the dialog area anyway
+            matrix.scale_brightness(0.5)
+        else:
+            for y in range(height):
+                for x in range(width):
+                    if x < dialog_x or x >= dialog_x + dialog_width or \
+                       y < dialog_y or y >= dialog_y + dialog_height:
+                        # Darken pixels outside dialog
+                        r, g, b = matrix.get_pixel(x, y)
+                        matrix.set_pixel(x, y, (r // 2, g // 2, b // 2))
         
         # Dialog background
         matrix.rect(dialog_x, dialog_y, dialog_width, dialog_height, 
@@ -362,29 +377,18 @@ class Dialog(Widget):
                    (150, 150, 180), fill=False)
         
         # Title bar
+        font = matrix_font(matrix)
         matrix.rect(dialog_x, dialog_y, dialog_width, 10, (70, 100, 180), fill=True)
-        title_x = dialog_x + (dialog_width - len(self.title) * 6) // 2
-        matrix.text(self.title, title_x, dialog_y + 2, (255, 255, 255))
+        title = layout_text(self.title, font, dialog_width - 4, align='center', wrap=False)
+        title.draw(matrix, dialog_x + 2, dialog_y + 2, (255, 255, 255))
         
-        # Message (word wrap)
-        msg_x = dialog_x + 4
+        # Message (word wrapped, ellipsized if it runs into the buttons)
+        button_y = dialog_y + dialog_height - 14
         msg_y = dialog_y + 14
-        max_chars = (dialog_width - 8) // 6
-        
-        words = self.message.split()
-        line = ""
-        for word in words:
-            if len(line + word) > max_chars:
-                matrix.text(line, msg_x, msg_y, (220, 220, 220))
-                msg_y += 10
-                line = word + " "
-            else:
-                line += word + " "
-        if line:
-            matrix.text(line.strip(), msg_x, msg_y, (220, 220, 220))
+        message = layout_text(self.message, font, dialog_width - 8, button_y - 2 - msg_y)
+        message.draw(matrix, dialog_x + 4, msg_y, (220, 220, 220))
         
         # Buttons
-        button_y = dialog_y + dialog_height - 14
         button_width = (dialog_width - 8 - (len(self.buttons) - 1) * 4) // len(self.buttons)
         button_x = dialog_x + 4
         
@@ -397,8 +401,8 @@ class Dialog(Widget):
             
             # Button text
             text_color = (255, 255, 255) if is_selected else (200, 200, 200)
-            text_x = button_x + (button_width - len(btn_text) * 6) // 2
-            matrix.text(btn_text, text_x, button_y + 2, text_color)
+            label = layout_text(btn_text, font, button_width - 2, align='center', wrap=False)
+            label.draw(matrix, button_x + 1, button_y + 2, text_color)
             
             button_x += button_width + 4
     
@@ -464,3 +468,144 @@ class ProgressBar(Widget):
     def set_value(self, value: float):
         """Set progress value (0.0 to 1.0)."""
         self.value = max(0.0, min(1.0, value))
+
+
+class Ticker(Widget):
+    """
+    Scrolling marquee (news/stock ticker) inside a fixed window.
+    
+    The text is rendered once into an off-screen strip (text plus a gap),
+    cut into short chunks. Each frame only the chunks under the window are
+    blitted, wrapping around at the end of the strip, so the cost depends
+    on the window width - not the length of the text - and many tickers can
+    run at once.
+    
+    Example:
+        ticker = Ticker("MARKETS UP 2%", x=0, y=180, width=256, speed=40)
+        
+        def on_update(self, delta_time):
+            if ticker.update(delta_time):
+                self.dirty = True
+        
+        def render(self, matrix):
+            ticker.render(matrix)
+    """
+    
+    CHUNK_WIDTH = 64  # Strip chunk size in pixels
+    
+    def __init__(self, text: str, x: int = 0, y: int = 0, width: int = 64,
+                 color: tuple = (255, 255, 255), bg_color: Optional[tuple] = None,
+                 speed: float = 30.0, gap: int = 16, scale: int = 1, font=None):
+        """
+        Initialize ticker.
+        
+        Args:
+            text: Text to scroll
+            x: X position of the window
+            y: Y position of the window
+            width: Window width in pixels
+            color: Text color
+            bg_color: Background color (None = transparent)
+            speed: Pixels per second; positive scrolls left, negative right
+            gap: Blank pixels between the end of the text and its next repeat
+            scale: Integer text scale factor
+            font: Font to use (default: the matrix's font)
+        """
+        super().__init__(x, y, width, 0)
+        self.text = text
+        self.color = color
+        self.bg_color = bg_color
+        self.speed = speed
+        self.gap = gap
+        self.scale = scale
+        self.font = font
+        self.offset = 0.0  # Scroll position in the strip, sub-pixel
+        self._strip_key = None
+        self._chunks = []
+        self._period = 0  # Strip width: text plus gap
+    
+    def set_text(self, text: str):
+        """Change the text (the strip is re-rendered on the next render)."""
+        if text != self.text:
+            self.text = text
+            self._strip_key = None
+    
+    def update(self, delta_time: float) -> bool:
+        """
+        Advance the scroll position.
+        
+        Args:
+            delta_time: Seconds since the last update
+        
+        Returns:
+            True if the text moved by at least one pixel (worth a redraw)
+        """
+        before = int(self.offset)
+        self.offset += self.speed * delta_time
+        if self._period:
+            self.offset %= self._period
+        return int(self.offset) != before
+    
+    def render(self, matrix):
+        """Render the visible window of the strip."""
+        if not self.visible or self.width <= 0 or not self.text:
+            return
+        font = self.font or matrix.font
+        self._build_strip(matrix.display, font)
+        
+        chunk_width = self.CHUNK_WIDTH
+        pos = int(self.offset) % self._period
+        x = self.x
+        remaining = self.width
+        while remaining > 0:
+            chunk = self._chunks[pos // chunk_width]
+            sx = pos % chunk_width
+            n = min(chunk.width - sx, remaining)
+            matrix.blit(chunk, x, self.y, (sx, 0, n, chunk.height))
+            x += n
+            remaining -= n
+            pos = (pos + n) % self._period
+    
+    def _build_strip(self, display, font):
+        """Render the text into strip chunks (only when something changed)."""
+        key = (self.text, font, display.color_mode, display.pack_color(self.color),
+               None if self.bg_color is None else display.pack_color(self.bg_color),
+               self.gap, self.scale)
+        if key == self._strip_key:
+            return
+        
+        text, _ = font.render_text(display, self.text, self.color, self.bg_color,
+                                   0, self.scale)
+        width = text.width
+        height = text.height
+        period = width + max(0, self.gap)
+        
+        strip = Bitmap(period, height, display.color_mode, display.palette)
+        if self.bg_color is not None:
+            strip.fill(self.bg_color)
+        strip.copy_rect(text, 0, 0, width, height, 0, 0)
+        alpha = None
+        if self.bg_color is None:
+            alpha = bytearray(period * height)
+            for row in range(height):
+                alpha[row * period:row * period + width] = (
+                    text.alpha[row * width:(row + 1) * width] if text.alpha is not None
+                    else b'\xff' * width
+                )
+        
+        self._chunks = []
+        for start in range(0, period, self.CHUNK_WIDTH):
+            chunk_width = min(self.CHUNK_WIDTH, period - start)
+            chunk = Bitmap(chunk_width, height, display.color_mode, display.palette)
+            chunk.copy_rect(strip, start, 0, chunk_width, height, 0, 0)
+            if alpha is not None:
+                chunk.alpha = bytearray(b''.join(
+                    alpha[row * period + start:row * period + start + chunk_width]
+                    for row in range(height)
+                ))
+            self._chunks.append(chunk)
+        
+        self.height = height
+        self._period = period
+        self.offset %= period
+        self._strip_key = key
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the MatrixOS app framework (matrixos.app_framework)
+
+Tests the opt-in fixed-timestep mode: constant ticks, capped catch-up,
+interpolation alpha and the monitoring counters.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from matrixos.app_framework import App, OSContext
+from matrixos.input import InputEvent
+from matrixos.led_api import LEDMatrix
+from matrixos.testing import RecordingDriver
+
+
+class ScriptedInput:
+    """Input handler that replays events (None = no key), then stops the OS loop."""
+
+    def __init__(self, events):
+        self.events = list(events)
+        self.os = None
+
+    def get_key(self, timeout=0.0):
+        if self.events:
+            key = self.events.pop(0)
+            return InputEvent(key) if key else None
+        self.os.running = False
+        return None
+
+
+class TickingApp(App):
+    """App with a fixed timestep that records its ticks and renders."""
+
+    def __init__(self, tick_rate=60):
+        super().__init__("Ticker")
+        self.tick_rate = tick_rate
+        self.steps = []
+        self.alphas = []
+        self.log = []  # 'tick' per tick and the alpha of each render, in order
+
+    def on_update(self, delta_time):
+        self.steps.append(delta_time)
+        self.log.append('tick')
+
+    def render(self, matrix, alpha=0.0):
+        self.alphas.append(alpha)
+        self.log.append(alpha)
+        self.dirty = False
+
+
+def make_context(app):
+    context = OSContext(LEDMatrix(8, 8, driver=RecordingDriver(8, 8)), ScriptedInput([]))
+    context.register_app(app)
+    context.active_app = app
+    return context
+
+
+# ============================================================================
+# Fixed Timestep Tests
+# ============================================================================
+
+def test_fixed_ticks():
+    """Test frame time is spent in constant ticks with the rest as alpha."""
+    print("TEST: Fixed Ticks")
+
+    app = TickingApp(tick_rate=10)
+    context = make_context(app)
+
+    ticks, alpha = context._run_ticks(app, 0.25)
+    assert ticks == 2 and app.steps == [0.1, 0.1], "Two 0.1s ticks due"
+    assert abs(alpha - 0.5) < 1e-9, f"Half a tick left over ({alpha})"
+
+    ticks, alpha = context._run_ticks(app, 0.04)
+    assert ticks == 0, "Not enough time for a tick"
+    ticks, alpha = context._run_ticks(app, 0.07)
+    assert ticks == 1 and abs(alpha - 0.6) < 1e-9, "Leftover time carried over"
+
+    stats = context.get_timestep_stats()
+    assert stats['ticks'] == 3, f"Ticks counted: {stats}"
+    assert stats['catch_up_frames'] == 1 and stats['catch_up_ticks'] == 1, \
+        "First frame caught up one tick"
+
+    print("✓ Constant ticks with interpolation alpha")
+
+
+def test_catch_up_cap():
+    """Test a long stall runs at most max_catch_up_steps and drops the rest."""
+    print("\nTEST: Catch-up Cap")
+
+    app = TickingApp(tick_rate=100)
+    app.max_catch_up_steps = 4
+    context = make_context(app)
+
+    ticks, alpha = context._run_ticks(app, 1.0)  # 100 ticks due
+    assert ticks == 4, "Capped at max_catch_up_steps"
+    assert context.dropped_ticks == 96, f"Rest dropped ({context.dropped_ticks})"
+    assert context.tick_accumulator < 0.01, "No backlog left behind"
+
+    context.switch_to_app(app)
+    assert context.tick_accumulator == 0.0, "Switching apps resets the accumulator"
+
+    print("✓ Catch-up capped")
+
+
+def test_os_loop_passes_alpha():
+    """Test the OS loop ticks fixed-timestep apps and passes alpha to render."""
+    print("\nTEST: OS Loop Alpha")
+
+    matrix = LEDMatrix(8, 8, driver=RecordingDriver(8, 8))
+    input_handler = ScriptedInput([None] * 6)
+    context = OSContext(matrix, input_handler)
+    input_handler.os = context
+    app = TickingApp(tick_rate=120)
+    context.register_app(app)
+    context.switch_to_app(app)
+    context.run()
+
+    assert app.steps and all(step == 1 / 120 for step in app.steps), "Fixed delta_time"
+    assert app.alphas and all(0.0 <= a <= 1.0 for a in app.alphas), "render() gets alpha"
+    assert context.ticks == len(app.steps), "Ticks counted"
+
+    print("✓ OS loop runs fixed ticks")
+
+
+def test_renders_between_ticks():
+    """Test a slow tick rate still renders every frame with rising alpha."""
+    print("\nTEST: Renders Between Ticks")
+
+    matrix = LEDMatrix(8, 8, driver=RecordingDriver(8, 8))
+    input_handler = ScriptedInput([None] * 40)
+    context = OSContext(matrix, input_handler)
+    input_handler.os = context
+    app = TickingApp(tick_rate=10)
+    context.register_app(app)
+    context.switch_to_app(app)
+    context.run()
+
+    ticks = len(app.steps)
+    renders = len(app.alphas)
+    assert ticks >= 2, f"10 Hz ticks ran ({ticks})"
+    assert 4 <= renders / ticks <= 8, f"About 6 renders per tick at 60 fps ({renders}/{ticks})"
+
+    # Renders between one tick and the next
+    runs = [[]]
+    for entry in app.log:
+        if entry == 'tick':
+            runs.append([])
+        else:
+            runs[-1].append(entry)
+    for alphas in runs[1:-1]:
+        assert len(alphas) > 1, f"Frames rendered between ticks ({alphas})"
+        assert all(a < b for a, b in zip(alphas, alphas[1:])), \
+            f"Alpha rises between ticks ({alphas})"
+
+    print("✓ Frames between ticks are interpolated")
+
+
+# ============================================================================
+# Test Runner
+# ============================================================================
+
+def run_all_tests():
+    """Run all tests and report results."""
+    print("=" * 70)
+    print("MATRIXOS APP FRAMEWORK TESTS")
+    print("=" * 70)
+
+    tests = [
+        test_fixed_ticks,
+        test_catch_up_cap,
+        test_os_loop_passes_alpha,
+        test_renders_between_ticks,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
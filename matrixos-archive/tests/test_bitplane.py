@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the bit-plane (BCM) encoder (matrixos.devices.display.bitplane)
+
+Checks the packed plane bytes, incremental row reuse, both encoder paths
+and frames recorded by FileSink.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import tempfile
+
+from matrixos.devices.display import bitplane
+from matrixos.devices.display.bitplane import (
+    BitplaneEncoder, BitplaneDisplayDriver, FileSink, gamma_lut
+)
+from matrixos.display import Display
+from matrixos.led_api import LEDMatrix
+
+
+def encode_both(width, height, frame, **kwargs):
+    """Encode a frame with the NumPy and pure Python encoders."""
+    results = []
+    saved = bitplane.numpy
+    try:
+        for backend in (saved, None):
+            bitplane.numpy = backend
+            encoder = BitplaneEncoder(width, height, **kwargs)
+            encoder.encode(frame)
+            results.append(encoder.rows)
+    finally:
+        bitplane.numpy = saved
+    return results
+
+
+# ============================================================================
+# Encoder Tests
+# ============================================================================
+
+def test_gamma_lut():
+    """Test the gamma LUT keeps black and full brightness and darkens mid-tones."""
+    print("TEST: Gamma LUT")
+
+    lut = gamma_lut(8, 2.2)
+    assert lut[0] == 0 and lut[255] == 255, "End points kept"
+    assert lut[128] < 128, "Mid-tones darkened"
+    assert gamma_lut(4, 1.0)[255] == 15, "Scaled to the bit depth"
+    assert gamma_lut(8, 1.0) == list(range(256)), "Linear LUT is the identity"
+
+    print("✓ Gamma LUT")
+
+
+def test_packed_planes():
+    """Test top/bottom half pixels land on the right pins and planes."""
+    print("\nTEST: Packed Planes")
+
+    display = Display(4, 4, 'rgb')
+    display.set_pixel(0, 0, (255, 0, 0))   # Scan row 0, top half: R1
+    display.set_pixel(1, 2, (0, 0, 5))     # Scan row 0, bottom half: B2, value 5
+    display.set_pixel(3, 3, (0, 255, 0))   # Scan row 1, bottom half: G2
+
+    encoder = BitplaneEncoder(4, 4, bits=8, gamma=1.0)
+    encoder.encode(display.buffer)
+    assert encoder.scan_rows == 2, "HUB75 lights two rows at once"
+    assert len(encoder.rows[0]) == 8, "One buffer per plane"
+    assert all(encoder.rows[0][p][0] == 0b000001 for p in range(8)), "R1 set in every plane"
+    assert [encoder.rows[0][p][1] for p in range(3)] == [0b100000, 0, 0b100000], \
+        "5 = planes 0 and 2 on B2"
+    assert encoder.rows[1][7][3] == 0b010000, "G2 on scan row 1"
+    assert encoder.rows[1][7][0] == 0, "Other columns dark"
+
+    print("✓ Planes packed per column")
+
+
+def test_incremental_rows():
+    """Test unchanged scan rows keep their encoded planes."""
+    print("\nTEST: Incremental Encoding")
+
+    display = Display(8, 8, 'rgb')
+    display.fill((10, 20, 30))
+    encoder = BitplaneEncoder(8, 8, bits=6)
+    assert encoder.encode(display.buffer) == 4, "First frame encodes every scan row"
+    planes = encoder.rows[2]
+
+    display.set_pixel(3, 5, (255, 255, 255))  # Bottom half of scan row 1
+    assert encoder.encode(display.buffer) == 1, "Only the changed scan row"
+    assert encoder.rows[2] is planes, "Unchanged rows reused"
+    assert encoder.encode(display.buffer) == 0, "Unchanged frame encodes nothing"
+
+    stats = encoder.get_stats()
+    assert stats['frames'] == 3 and stats['rows_reused'] == 7, f"Stats: {stats}"
+
+    print("✓ Unchanged rows reused")
+
+
+def test_encoder_paths_agree():
+    """Test the NumPy and pure Python encoders produce the same planes."""
+    print("\nTEST: Encoder Paths")
+
+    frame = bytearray(i * 37 % 256 for i in range(16 * 8 * 3))
+    fast, slow = encode_both(16, 8, frame, bits=11)
+    assert fast == slow, "HUB75 layouts agree"
+    fast, slow = encode_both(16, 8, frame, bits=4, scan_rows=8)
+    assert fast == slow, "One-row-at-a-time layouts agree"
+    assert max(fast[0][0]) <= 0b111, "Only R1/G1/B1 used without a bottom half"
+
+    try:
+        BitplaneEncoder(16, 8, scan_rows=3)
+        assert False, "Bad scan rows should raise"
+    except ValueError:
+        pass
+
+    print("✓ Both encoders agree")
+
+
+def test_driver_file_sink():
+    """Test the driver records every presented frame to a FileSink."""
+    print("\nTEST: Driver File Sink")
+
+    fd, path = tempfile.mkstemp(suffix='.bin')
+    os.close(fd)
+    try:
+        driver = BitplaneDisplayDriver(8, 4, sink=FileSink(path), bits=4)
+        assert driver.initialize(), "Driver initializes"
+        matrix = LEDMatrix(8, 4, driver=driver)
+        matrix.set_pixel(2, 1, (255, 255, 255))
+        matrix.show()
+        matrix.clear()
+        matrix.show()
+        driver.cleanup()
+
+        (width, scan_rows, bits), frames = FileSink.read(path)
+    finally:
+        os.remove(path)
+
+    assert (width, scan_rows, bits) == (8, 2, 4), "Header records the geometry"
+    assert len(frames) == 2, "Both frames recorded"
+    assert frames[0][1][3][2] == 0b000111, "White pixel on R1/G1/B1"
+    assert frames[1][1][3][2] == 0, "Cleared in the second frame"
+
+    print("✓ Frames recorded")
+
+
+# ============================================================================
+# Test Runner
+# ============================================================================
+
+def run_all_tests():
+    """Run all tests and report results."""
+    print("=" * 70)
+    print("MATRIXOS BIT-PLANE ENCODER TESTS")
+    print("=" * 70)
+
+    tests = [
+        test_gamma_lut,
+        test_packed_planes,
+        test_incremental_rows,
+        test_encoder_paths_agree,
+        test_driver_file_sink,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
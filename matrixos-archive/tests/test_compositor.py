@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the MatrixOS overlay compositor (matrixos.compositor)
+
+Tests layer blending modes, z-order, damage-limited recompositing and the
+OSContext overlays (help, keyboard, toasts) built on it.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from matrixos.compositor import Compositor
+from matrixos.display import Display
+from matrixos.led_api import LEDMatrix
+from matrixos.app_framework import App, OSContext
+from matrixos.input import InputEvent
+from matrixos.testing import RecordingDriver
+
+
+class ScriptedInput:
+    """Input handler that replays events (None = no key), then stops the OS loop."""
+
+    def __init__(self, events):
+        self.events = list(events)
+        self.os = None
+
+    def get_key(self, timeout=0.0):
+        if self.events:
+            key = self.events.pop(0)
+            return InputEvent(key) if key else None
+        self.os.running = False
+        return None
+
+
+class CountingApp(App):
+    """App that fills the screen and counts render() calls."""
+
+    def __init__(self):
+        super().__init__("Counter")
+        self.renders = 0
+
+    def render(self, matrix):
+        self.renders += 1
+        matrix.fill((0, 0, 200))
+        self.dirty = False
+
+
+def make_base(width=8, height=8, color=(0, 0, 200)):
+    frame = Display(width, height, 'rgb')
+    frame.fill(color)
+    return frame
+
+
+# ============================================================================
+# Layer Blending Tests
+# ============================================================================
+
+def test_opaque_layer_and_restore():
+    """Test an opaque layer covers its area and hiding it restores the base."""
+    print("TEST: Opaque Layer")
+
+    compositor = Compositor(8, 8)
+    compositor.set_base(make_base())
+    compositor.compose()
+
+    layer = compositor.create_layer('box', 2, 2, 3, 3)
+    layer.fill((255, 0, 0))
+    layer.visible = True
+    assert compositor.compose() == [(2, 2, 3, 3)], "Only the layer area is recomposited"
+    assert compositor.output.get_pixel(3, 3) == (255, 0, 0), "Layer pixel on top"
+    assert compositor.output.get_pixel(1, 1) == (0, 0, 200), "Base pixel around it"
+
+    layer.visible = False
+    assert compositor.compose() == [(2, 2, 3, 3)], "Hiding recomposites the same area"
+    assert compositor.output.get_pixel(3, 3) == (0, 0, 200), "Base restored without re-render"
+    assert compositor.compose() == [], "Nothing left to do"
+
+    print("✓ Opaque layers composite and uncover cleanly")
+
+
+def test_color_key_layer():
+    """Test key-colour pixels are transparent."""
+    print("\nTEST: Colour-keyed Layer")
+
+    compositor = Compositor(8, 8)
+    compositor.set_base(make_base())
+    layer = compositor.create_layer('sprite', mode='key', key=(255, 0, 255))
+    layer.fill((255, 0, 255))
+    layer.set_pixel(4, 4, (0, 255, 0))
+    layer.visible = True
+    compositor.compose()
+
+    assert compositor.output.get_pixel(4, 4) == (0, 255, 0), "Drawn pixel shown"
+    assert compositor.output.get_pixel(5, 4) == (0, 0, 200), "Key colour is transparent"
+
+    print("✓ Colour key works")
+
+
+def test_rgba_layer():
+    """Test per-pixel and uniform alpha blending."""
+    print("\nTEST: RGBA Layer")
+
+    compositor = Compositor(4, 1)
+    compositor.set_base(make_base(4, 1, (0, 0, 200)))
+    layer = compositor.create_layer('fade', mode='rgba', opacity=0)
+    layer.fill((255, 255, 255))
+    layer.set_alpha(1, 0, 255)
+    layer.set_alpha(2, 0, 51)
+    layer.visible = True
+    compositor.compose()
+
+    assert compositor.output.get_pixel(0, 0) == (0, 0, 200), "Alpha 0 is invisible"
+    assert compositor.output.get_pixel(1, 0) == (255, 255, 255), "Alpha 255 is opaque"
+    assert compositor.output.get_pixel(2, 0) == (51, 51, 211), \
+        f"Alpha 51 blends: {compositor.output.get_pixel(2, 0)}"
+
+    layer.fill_alpha(51)
+    compositor.compose()
+    assert compositor.output.get_pixel(0, 0) == (51, 51, 211), "Uniform alpha row blends"
+
+    print("✓ Alpha blending works")
+
+
+def test_z_order():
+    """Test higher z layers are drawn on top regardless of creation order."""
+    print("\nTEST: Z-order")
+
+    compositor = Compositor(4, 4)
+    compositor.set_base(make_base(4, 4))
+    top = compositor.create_layer('top', z=10)
+    bottom = compositor.create_layer('bottom', z=1)
+    top.fill((255, 0, 0))
+    bottom.fill((0, 255, 0))
+    top.visible = bottom.visible = True
+    compositor.compose()
+    assert compositor.output.get_pixel(0, 0) == (255, 0, 0), "Higher z wins"
+
+    compositor.remove_layer(top)
+    compositor.compose()
+    assert compositor.output.get_pixel(0, 0) == (0, 255, 0), "Removing uncovers lower layer"
+    assert compositor.get_layer('top') is None, "Removed layer is gone"
+
+    print("✓ Layers stack by z")
+
+
+def test_layer_drawing_damage():
+    """Test drawing inside a visible layer recomposites only that area."""
+    print("\nTEST: Layer Drawing Damage")
+
+    compositor = Compositor(16, 16)
+    compositor.set_base(make_base(16, 16))
+    layer = compositor.create_layer('panel', 4, 8, 8, 8)
+    layer.visible = True
+    compositor.compose()
+
+    layer.set_pixel(1, 1, (255, 255, 0))
+    assert compositor.needs_compose(), "Drawing creates damage"
+    assert compositor.compose() == [(5, 9, 1, 1)], "Damage translated to screen space"
+
+    print("✓ Layer drawing tracked as screen damage")
+
+
+# ============================================================================
+# OSContext Overlay Tests
+# ============================================================================
+
+def run_os(events, setup=None):
+    """Run OSContext with a scripted input until the events run out."""
+    driver = RecordingDriver(64, 64)
+    matrix = LEDMatrix(64, 64, driver=driver)
+    input_handler = ScriptedInput(events)
+    context = OSContext(matrix, input_handler)
+    input_handler.os = context
+    app = CountingApp()
+    context.register_app(app)
+    context.switch_to_app(app)
+    if setup:
+        setup(context)
+    context.run()
+    return context, app, driver
+
+
+def test_help_overlay_does_not_rerender_app():
+    """Test opening and closing help only recomposites."""
+    print("\nTEST: Help Overlay Layer")
+
+    context, app, driver = run_os([None, InputEvent.HELP, InputEvent.HELP])
+    assert app.renders == 1, f"App rendered once, not on help toggles ({app.renders})"
+    frames = [data for _, data, _, _ in driver.presented]
+    assert len(frames) == 3, "Frames: app, help open, help closed"
+    assert frames[1] != frames[0], "Help visible over the app"
+    assert frames[2] == frames[0], "Closing help restores the app frame"
+
+    print("✓ Help overlay is a layer")
+
+
+def test_keyboard_and_toast_layers():
+    """Test the non-blocking keyboard and toasts are layers."""
+    print("\nTEST: Keyboard and Toast Layers")
+
+    results = []
+
+    def setup(context):
+        context.open_keyboard("Name:", "ab", on_done=results.append)
+        context.show_toast("HI", duration=60)
+
+    context, app, driver = run_os([InputEvent.OK, InputEvent.BACK], setup)
+    assert results == [None], "Cancelled keyboard reports None"
+    assert context.keyboard is None, "Keyboard closed"
+    assert app.renders == 2, "App redrawn only once after the keyboard closed"
+    assert context.compositor.get_layer('keyboard') is None, "Keyboard layer removed"
+    assert context.toast_layer.visible, "Toast still showing"
+
+    print("✓ Keyboard and toasts are layers")
+
+
+# ============================================================================
+# Test Runner
+# ============================================================================
+
+def run_all_tests():
+    """Run all tests and report results."""
+    print("=" * 70)
+    print("MATRIXOS COMPOSITOR TESTS")
+    print("=" * 70)
+
+    tests = [
+        test_opaque_layer_and_restore,
+        test_color_key_layer,
+        test_rgba_layer,
+        test_z_order,
+        test_layer_drawing_damage,
+        test_help_overlay_does_not_rerender_app,
+        test_keyboard_and_toast_layers,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,701 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the MatrixOS framebuffer (matrixos.display.Display)
+
+Tests pixel storage, bulk operations and the raw buffer layout drivers rely on.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import io
+import contextlib
+
+from matrixos.display import (Bitmap, ColorCorrection, Display, NumpyDisplay, Palette,
+                              TerminalRenderer, create_display, merge_row_spans, numpy)
+from matrixos.devices.display.terminal import TerminalDisplayDriver
+
+
+# ============================================================================
+# Framebuffer Storage Tests
+# ============================================================================
+
+def test_flat_buffer_layout():
+    """Test that RGB pixels are packed row-major, 3 bytes each."""
+    print("TEST: Flat Buffer Layout")
+
+    display = Display(4, 3, color_mode='rgb')
+    assert isinstance(display.buffer, bytearray), "Buffer should be a bytearray"
+    assert len(display.buffer) == 4 * 3 * 3, "Buffer should hold 3 bytes per pixel"
+    assert display.stride == 12, "Stride should be width * 3"
+
+    display.set_pixel(2, 1, (10, 20, 30))
+    offset = (1 * 4 + 2) * 3
+    assert display.buffer[offset:offset + 3] == bytes((10, 20, 30)), "Pixel bytes at index math offset"
+    assert display.get_pixel(2, 1) == (10, 20, 30), "get_pixel round-trips"
+
+    print("✓ RGB pixels stored at (y * width + x) * 3")
+
+
+def test_mono_buffer():
+    """Test mono mode stores one byte per pixel and returns bools."""
+    print("\nTEST: Mono Buffer")
+
+    display = Display(8, 8)
+    assert len(display.buffer) == 64, "Mono buffer should hold 1 byte per pixel"
+
+    display.set_pixel(3, 3, True)
+    assert display.get_pixel(3, 3) is True, "Lit pixel reads True"
+    assert display.get_pixel(4, 3) is False, "Unlit pixel reads False"
+
+    display.fill(True)
+    assert all(display.buffer), "fill(True) lights every pixel"
+    display.clear()
+    assert not any(display.buffer), "clear() turns every pixel off"
+
+    print("✓ Mono mode works with flat storage")
+
+
+def test_out_of_bounds():
+    """Test out-of-bounds writes are ignored and reads return off."""
+    print("\nTEST: Out of Bounds")
+
+    display = Display(4, 4, color_mode='rgb')
+    display.set_pixel(-1, 0, (255, 0, 0))
+    display.set_pixel(4, 0, (255, 0, 0))
+    display.set_pixel(0, 4, (255, 0, 0))
+    assert not any(display.buffer), "Out-of-bounds writes must not touch the buffer"
+    assert display.get_pixel(10, 10) == (0, 0, 0), "Out-of-bounds read is black"
+
+    print("✓ Bounds checking works")
+
+
+def test_color_coercion():
+    """Test bools, lists and out-of-range values are stored sensibly."""
+    print("\nTEST: Color Coercion")
+
+    display = Display(4, 1, color_mode='rgb')
+    display.set_pixel(0, 0, True)
+    display.set_pixel(1, 0, [1, 2, 3])
+    display.set_pixel(2, 0, (300, -5, 12.7))
+    display.set_pixel(3, 0, False)
+
+    assert display.get_pixel(0, 0) == (255, 255, 255), "True is white"
+    assert display.get_pixel(1, 0) == (1, 2, 3), "Lists are accepted"
+    assert display.get_pixel(2, 0) == (255, 0, 12), "Components are clamped"
+    assert display.get_pixel(3, 0) == (0, 0, 0), "False is black"
+
+    print("✓ Color values are coerced into RGB888")
+
+
+def test_fill_and_clear():
+    """Test fill() and clear() cover the whole buffer."""
+    print("\nTEST: Fill and Clear")
+
+    display = Display(16, 8, color_mode='rgb')
+    display.fill((1, 2, 3))
+    assert display.buffer == bytearray(bytes((1, 2, 3)) * 128), "fill() writes every pixel"
+
+    buffer_id = id(display.buffer)
+    display.clear()
+    assert not any(display.buffer), "clear() zeroes the buffer"
+    assert id(display.buffer) == buffer_id, "clear() reuses the same buffer"
+
+    print("✓ fill() and clear() work in place")
+
+
+def test_view_is_zero_copy():
+    """Test view() exposes the live framebuffer."""
+    print("\nTEST: Zero-copy View")
+
+    display = Display(4, 4, color_mode='rgb')
+    view = display.view()
+    display.set_pixel(0, 0, (9, 8, 7))
+    assert bytes(view[0:3]) == bytes((9, 8, 7)), "View sees later writes"
+    view.release()
+
+    print("✓ view() is a live memoryview")
+
+
+def test_terminal_renderer_reads_flat_buffer():
+    """Test the terminal renderer still renders from the flat buffer."""
+    print("\nTEST: Terminal Renderer")
+
+    display = Display(4, 4, color_mode='rgb')
+    display.set_pixel(0, 0, (255, 0, 0))
+    output = TerminalRenderer(display).render(use_half_blocks=True)
+    lines = output.split('\n')
+    assert len(lines) == 2, "Half-block mode packs 2 rows per line"
+    assert '▀' in lines[0], "Top pixel rendered as upper half block"
+
+    mono = Display(2, 3)
+    mono.set_pixel(1, 2, True)
+    output = TerminalRenderer(mono).render(use_half_blocks=True)
+    assert output.split('\n')[1] == ' ▀', "Odd height handled in mono mode"
+
+    print("✓ TerminalRenderer renders the flat buffer")
+
+
+class ByteStream:
+    """stdout stand-in with a binary buffer that counts writes."""
+
+    def __init__(self):
+        self.buffer = self
+        self.data = b''
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        self.data += data
+
+    def flush(self):
+        pass
+
+
+def test_terminal_renderer_frame_diff():
+    """Test later frames only emit changed cells, in one binary write."""
+    print("\nTEST: Terminal Renderer Frame Diff")
+
+    display = Display(16, 4, color_mode='rgb')
+    renderer = TerminalRenderer(display)
+    stream = ByteStream()
+    with contextlib.redirect_stdout(stream):
+        renderer.display_in_terminal()
+    assert stream.writes == 1, "Full frame is a single write"
+    assert stream.data.startswith(b'\033[2J'), "First frame clears the screen"
+
+    display.set_pixel(2, 0, (255, 0, 0))
+    display.set_pixel(4, 1, (0, 255, 0))
+    display.set_pixel(12, 2, (0, 0, 255))
+    stream = ByteStream()
+    with contextlib.redirect_stdout(stream):
+        renderer.display_in_terminal(clear_screen=False)
+    frame = stream.data.decode('utf-8')
+    assert stream.writes == 1, "Changes are a single write"
+    assert frame.startswith('\033[1;3H'), f"Cursor jumps to the first change: {frame!r}"
+    assert frame.count('H') == 3, "Two runs (close cells merged) plus parking the cursor"
+    assert '\033[2;13H' in frame, "Second terminal row positioned"
+    assert frame.count(renderer.lower_half_char) == 1, "Only changed cells sent"
+
+    stream = ByteStream()
+    with contextlib.redirect_stdout(stream):
+        renderer.display_in_terminal(clear_screen=False)
+    assert stream.writes == 0, "Unchanged frame writes nothing"
+
+    assert TerminalRenderer.rgb_to_ansi(255, 128, 0) == '\033[38;5;208m', "Colour table lookup"
+    assert TerminalRenderer.rgb_to_ansi(0, 0, 255, True) == '\033[48;5;21m', "Background table"
+
+    print("✓ Only changed cells are written")
+
+
+def test_terminal_truecolor_and_sgr_runs():
+    """Test truecolor detection, the 256-colour LUT and merged SGR runs."""
+    print("\nTEST: Truecolor and SGR Runs")
+
+    display = Display(8, 2, color_mode='rgb')
+    display.fill_rect(0, 0, 6, 2, (10, 200, 30))
+
+    saved = os.environ.get('COLORTERM')
+    try:
+        os.environ['COLORTERM'] = 'truecolor'
+        assert TerminalRenderer(display).truecolor, "COLORTERM=truecolor detected"
+        os.environ['COLORTERM'] = ''
+        assert not TerminalRenderer(display).truecolor, "Falls back to 256 colours"
+    finally:
+        if saved is None:
+            os.environ.pop('COLORTERM', None)
+        else:
+            os.environ['COLORTERM'] = saved
+
+    output = TerminalRenderer(display, truecolor=True).render()
+    assert output.count('\033[38;2;10;200;30;48;2;10;200;30m') == 1, \
+        f"Same-coloured cells share one SGR sequence: {output!r}"
+    assert output.count('▀') == 6, "Every cell still drawn"
+
+    output = TerminalRenderer(display, truecolor=False).render()
+    assert output.count('\033[38;5;') == 1, "256-colour cells merged too"
+
+    lut = TerminalRenderer.ansi256_lut()
+    assert len(lut) == 32768, "One entry per RGB555 colour"
+    assert TerminalRenderer.ansi256_index(255, 0, 0) == 196, "Pure red in the cube"
+    assert 232 <= TerminalRenderer.ansi256_index(40, 40, 40) <= 255, "Dark grey uses the grey ramp"
+
+    print("✓ Truecolor and merged SGR runs")
+
+
+# ============================================================================
+# Bulk Operation Tests
+# ============================================================================
+
+def test_fill_rect():
+    """Test fill_rect() clips and writes whole rows."""
+    print("\nTEST: fill_rect")
+
+    display = Display(8, 4, color_mode='rgb')
+    display.fill_rect(6, 1, 5, 2, (255, 0, 0))
+    assert display.get_pixel(6, 1) == (255, 0, 0), "Inside the rect is filled"
+    assert display.get_pixel(7, 2) == (255, 0, 0), "Clipped at the right edge"
+    assert display.get_pixel(5, 1) == (0, 0, 0), "Left of the rect untouched"
+    assert display.get_pixel(6, 3) == (0, 0, 0), "Below the rect untouched"
+    assert display.take_damage() == [(6, 1, 2, 2)], "Damage covers the clipped rect"
+
+    display.fill_rect(-2, -2, 100, 100, (1, 2, 3))
+    assert display.buffer == bytearray(bytes((1, 2, 3)) * 32), "Oversized rect fills everything"
+
+    print("✓ fill_rect() clips and fills")
+
+
+def test_copy_rect():
+    """Test copy_rect() copies clipped regions between displays."""
+    print("\nTEST: copy_rect")
+
+    src = Display(4, 4, color_mode='rgb')
+    for y in range(4):
+        for x in range(4):
+            src.set_pixel(x, y, (x * 10, y * 10, 1))
+
+    dst = Display(4, 4, color_mode='rgb')
+    dst.copy_rect(src, 0, 0, 4, 4, 2, -1)
+    assert dst.get_pixel(2, 0) == (0, 10, 1), "Source row 1 lands on row 0"
+    assert dst.get_pixel(3, 2) == (10, 30, 1), "Columns offset by 2"
+    assert dst.get_pixel(1, 0) == (0, 0, 0), "Outside destination untouched"
+
+    try:
+        dst.copy_rect(Display(4, 4), 0, 0, 4, 4, 0, 0)
+        assert False, "Mixing color modes should raise"
+    except ValueError:
+        pass
+
+    print("✓ copy_rect() copies clipped rows")
+
+
+def test_blit_clip_and_src_rect():
+    """Test blit() clips to both surfaces and honours src_rect."""
+    print("\nTEST: blit")
+
+    src = Display(4, 4, color_mode='rgb')
+    for y in range(4):
+        for x in range(4):
+            src.set_pixel(x, y, (x * 10, y * 10, 1))
+
+    dst = Display(6, 6, color_mode='rgb')
+    dst.blit(src, 4, -1)
+    assert dst.get_pixel(4, 0) == (0, 10, 1), "Source row 1 lands on row 0"
+    assert dst.get_pixel(5, 2) == (10, 30, 1), "Clipped at the right edge"
+
+    dst.clear()
+    dst.blit(src, 0, 0, src_rect=(2, 2, 2, 2))
+    assert dst.get_pixel(0, 0) == (20, 20, 1), "src_rect top-left lands at (x, y)"
+    assert dst.get_pixel(2, 0) == (0, 0, 0), "Nothing outside src_rect drawn"
+
+    print("✓ blit() clips and copies sub-rectangles")
+
+
+def test_blit_key_and_alpha():
+    """Test colour-key, uniform alpha and per-pixel alpha blits."""
+    print("\nTEST: blit key and alpha")
+
+    src = Display(3, 1, color_mode='rgb')
+    src.fill((255, 0, 255))
+    src.set_pixel(1, 0, (255, 255, 255))
+
+    dst = Display(3, 1, color_mode='rgb')
+    dst.fill((0, 0, 200))
+    dst.blit(src, 0, 0, key=(255, 0, 255))
+    assert dst.get_pixel(0, 0) == (0, 0, 200), "Key colour is transparent"
+    assert dst.get_pixel(1, 0) == (255, 255, 255), "Other pixels copied"
+
+    dst.fill((0, 0, 200))
+    dst.blit(src, 0, 0, alpha=51)
+    assert dst.get_pixel(1, 0) == (51, 51, 211), f"Uniform alpha blends: {dst.get_pixel(1, 0)}"
+
+    bitmap = Bitmap.from_rgba(2, 1, bytes((255, 0, 0, 255, 0, 255, 0, 0)))
+    assert bitmap.row_runs(0) == [(0, 1, 255)], "Transparent pixel dropped from runs"
+    dst.fill((0, 0, 200))
+    dst.blit(bitmap, 1, 0)
+    assert dst.get_pixel(1, 0) == (255, 0, 0), "Opaque bitmap pixel drawn"
+    assert dst.get_pixel(2, 0) == (0, 0, 200), "Transparent bitmap pixel skipped"
+
+    opaque = Bitmap.from_rgba(1, 1, bytes((1, 2, 3, 255)))
+    assert opaque.alpha is None, "Fully opaque images need no mask"
+
+    mono = Display(3, 1, color_mode='mono')
+    mono.blit(bitmap, 0, 0)
+    assert mono.get_pixel(0, 0), "Mixed color modes fall back per pixel"
+    assert not mono.get_pixel(1, 0), "Fallback still honours alpha"
+
+    print("✓ blit() keys and blends")
+
+
+def test_scale_brightness():
+    """Test scale_brightness() dims RGB pixels in place."""
+    print("\nTEST: scale_brightness")
+
+    display = Display(4, 2, color_mode='rgb')
+    display.fill((200, 100, 7))
+    display.scale_brightness(0.5, rect=(0, 0, 2, 1))
+    assert display.get_pixel(0, 0) == (100, 50, 3), "Pixels in rect are halved"
+    assert display.get_pixel(2, 0) == (200, 100, 7), "Pixels outside rect unchanged"
+
+    display.scale_brightness(0.5)
+    assert display.get_pixel(3, 1) == (100, 50, 3), "Whole display dimmed"
+
+    print("✓ scale_brightness() dims pixels")
+
+
+def test_create_display_backends():
+    """Test backend selection and the pure Python fallback."""
+    print("\nTEST: create_display Backends")
+
+    assert type(create_display(4, 4, 'rgb')) is Display, "Default backend is pure Python"
+    auto = create_display(4, 4, 'rgb', backend='auto')
+    if numpy is None:
+        assert type(auto) is Display, "Falls back without numpy"
+    else:
+        assert isinstance(auto, NumpyDisplay), "Uses numpy when installed"
+
+    try:
+        create_display(4, 4, 'rgb', backend='gpu')
+        assert False, "Unknown backend should raise"
+    except ValueError:
+        pass
+
+    print("✓ Backends selected correctly")
+
+
+def test_numpy_backend_matches_python():
+    """Test the NumPy backend produces the same bytes as pure Python."""
+    print("\nTEST: NumPy Backend Equivalence")
+
+    if numpy is None:
+        print("⊘ numpy not installed - skipped")
+        return
+
+    src = Display(16, 8, color_mode='rgb')
+    for x in range(16):
+        src.set_pixel(x, x % 8, (x * 16, 255 - x, 40))
+
+    results = []
+    for display in (Display(16, 8, 'rgb'), NumpyDisplay(16, 8, 'rgb')):
+        display.fill((10, 20, 30))
+        display.fill_rect(3, 2, 20, 3, (255, 128, 0))
+        display.copy_rect(src, 2, 1, 6, 6, -1, 4)
+        display.scale_brightness(0.7, rect=(4, 0, 8, 8))
+        display.set_pixel(0, 0, (1, 2, 3))
+        results.append(bytes(display.buffer))
+
+    assert results[0] == results[1], "Both backends produce identical frames"
+
+    print("✓ NumPy backend matches pure Python")
+
+
+# ============================================================================
+# Indexed Colour Tests
+# ============================================================================
+
+def test_indexed_storage():
+    """Test indexed mode stores one palette index per pixel."""
+    print("\nTEST: Indexed Storage")
+
+    display = Display(4, 2, color_mode='indexed')
+    assert len(display.buffer) == 8, "One byte per pixel"
+
+    display.set_pixel(0, 0, (255, 0, 0))
+    assert display.get_index(0, 0) == 10, "Spectrum BRIGHT red is index 10"
+    assert display.get_pixel(0, 0) == (255, 0, 0), "get_pixel returns RGB"
+
+    display.set_pixel(1, 0, (12, 34, 56))
+    index = display.get_index(1, 0)
+    assert index == 16, "New colours get the next free entry"
+    display.set_pixel(2, 0, [12, 34, 56])
+    assert display.get_index(2, 0) == index, "Same colour reuses the entry"
+
+    display.set_pixel(3, 0, 5)
+    assert display.get_pixel(3, 0) == (0, 215, 215), "Ints are raw indices"
+
+    display.fill_rect(0, 1, 4, 1, (255, 255, 255))
+    assert display.buffer[4:8] == bytes([15]) * 4, "Fills are byte operations"
+
+    print("✓ Indexed pixels are palette indices")
+
+
+def test_palette_full_uses_nearest():
+    """Test a full palette maps new colours to the nearest entry."""
+    print("\nTEST: Full Palette")
+
+    palette = Palette([(i, 0, 0) for i in range(256)])
+    assert palette.index_of((0, 0, 0)) == 0, "Existing colour found"
+    assert palette.index_of((100, 3, 0)) == 100, "Nearest entry when full"
+    assert len(palette) == 256, "Palette stays at 256 entries"
+
+    # Nearest matches are worked out again once an entry changes
+    palette = Palette([(i, 0, 0) for i in range(256)])
+    assert palette.index_of((250, 10, 10)) == 250, "Nearest to a red"
+    palette[250] = (0, 0, 255)
+    assert palette.index_of((250, 10, 10)) == 249, "Nearest after palette animation"
+    assert palette.index_of((0, 0, 250)) == 250, "Changed entry is now the nearest blue"
+
+    print("✓ Full palette falls back to nearest colour")
+
+
+def test_indexed_expand_to_rgb():
+    """Test expansion through the LUT matches drawing in RGB."""
+    print("\nTEST: Indexed Expansion")
+
+    indexed = Display(8, 4, color_mode='indexed')
+    rgb = Display(8, 4, color_mode='rgb')
+    for display in (indexed, rgb):
+        display.fill((0, 0, 215))
+        display.fill_rect(2, 1, 3, 2, (255, 255, 0))
+        display.set_pixel(7, 3, (1, 2, 3))
+
+    output = Display(8, 4, color_mode='rgb')
+    indexed.expand_to(output)
+    assert output.buffer == rgb.buffer, "Expanded frame matches the RGB frame"
+    assert output.take_damage() == [(0, 0, 8, 4)], "First expansion damages everything"
+
+    indexed.set_pixel(0, 0, (255, 0, 0))
+    indexed.expand_to(output)
+    assert output.take_damage() == [(0, 0, 1, 1)], "Pixel damage carries over"
+
+    indexed.palette[1] = (0, 0, 100)
+    indexed.expand_to(output)
+    assert output.get_pixel(5, 0) == (0, 0, 100), "Palette change recolours pixels"
+    assert output.take_damage() == [(0, 0, 8, 4)], "Palette change damages everything"
+
+    print("✓ Indexed frames expand to RGB at output")
+
+
+def test_color_correction_tables():
+    """Test gamma, brightness and balance fold into one table per channel."""
+    print("\nTEST: Colour Correction Tables")
+
+    source = Display(4, 2, color_mode='rgb')
+    source.fill((255, 128, 0))
+    output = Display(4, 2, color_mode='rgb')
+
+    correction = ColorCorrection(gamma=2.0, brightness=0.5, balance=(1.0, 1.0, 0.8))
+    red, green, blue = correction.channel_tables()
+    assert red[255] == 128 and blue[255] == 102, "Brightness and balance scale full on"
+    assert green[128] == 32, "Gamma applied before brightness"
+
+    correction.apply(source, output)
+    assert output.get_pixel(3, 1) == (128, 32, 0), "Frame corrected"
+    assert source.get_pixel(3, 1) == (255, 128, 0), "Source left as drawn"
+    assert output.take_damage() == [(0, 0, 4, 2)], "First frame damages everything"
+
+    source.set_pixel(1, 0, (0, 0, 255))
+    correction.apply(source, output)
+    assert output.take_damage() == [(1, 0, 1, 1)], "Pixel damage carries over"
+
+    correction.set(brightness=1.0)
+    correction.apply(source, output)
+    assert output.get_pixel(0, 0) == (255, 64, 0), "New settings take effect"
+    assert output.take_damage() == [(0, 0, 4, 2)], "Settings change damages everything"
+
+    print("✓ Per-channel correction tables")
+
+
+def test_power_limiter():
+    """Test bright frames are dimmed to the current budget and recover slowly."""
+    print("\nTEST: Power Limiter")
+
+    source = Display(10, 10, color_mode='rgb')
+    output = Display(10, 10, color_mode='rgb')
+    # Full white draws 100 pixels * 3 channels * 0.01A = 3A
+    correction = ColorCorrection(max_current=1.5, channel_current=(0.01, 0.01, 0.01),
+                                 release=0.1)
+
+    source.fill((255, 255, 255))
+    correction.apply(source, output)
+    assert abs(correction.estimated_current - 3.0) < 1e-9, "Current estimated from sums"
+    assert correction.limit == 0.5, "Dimmed to the budget"
+    assert output.get_pixel(0, 0) == (127, 127, 127), "Frame dimmed"
+
+    source.fill((0, 0, 0))
+    source.set_pixel(0, 0, (255, 0, 0))
+    correction.apply(source, output)
+    assert correction.limit == 0.6, "Brightens back gradually"
+    assert output.get_pixel(0, 0) == (153, 0, 0), "Dark frame still limited this frame"
+
+    print("✓ Power limited")
+
+
+# ============================================================================
+# Damage Tracking Tests
+# ============================================================================
+
+def test_damage_from_writes():
+    """Test set_pixel accumulates a merged damage region."""
+    print("\nTEST: Damage From Writes")
+
+    display = Display(32, 32, color_mode='rgb')
+    assert not display.has_damage(), "New display has no damage"
+
+    display.set_pixel(4, 4, (255, 0, 0))
+    display.set_pixel(5, 5, (255, 0, 0))
+    display.set_pixel(20, 20, (0, 255, 0))
+    assert display.has_damage(), "Writes create damage"
+
+    rects = display.take_damage()
+    assert rects == [(4, 4, 2, 2), (20, 20, 1, 1)], f"Unexpected rects: {rects}"
+    assert not display.has_damage(), "take_damage() resets the region"
+    assert display.take_damage() == [], "Nothing left after reset"
+
+    print("✓ Writes produce merged damage rectangles")
+
+
+def test_damage_full_frame():
+    """Test clear() and fill() damage the whole display."""
+    print("\nTEST: Full-frame Damage")
+
+    display = Display(16, 8, color_mode='rgb')
+    display.clear()
+    assert display.take_damage() == [(0, 0, 16, 8)], "clear() damages everything"
+    display.fill((1, 1, 1))
+    assert display.take_damage() == [(0, 0, 16, 8)], "fill() damages everything"
+
+    display.add_damage(-4, 6, 8, 10)
+    assert display.take_damage() == [(0, 6, 4, 2)], "add_damage() clips to the display"
+
+    print("✓ Full-frame operations and add_damage() work")
+
+
+def test_damage_narrowed_by_previous_frame():
+    """Test clear-and-redraw only reports pixels that really changed."""
+    print("\nTEST: Damage Narrowed by Previous Frame")
+
+    display = Display(64, 32, color_mode='rgb')
+    previous = bytearray(len(display.buffer))
+
+    # Frame 1: a box and a "cursor"
+    for x in range(10, 30):
+        display.set_pixel(x, 10, (255, 255, 255))
+    display.set_pixel(40, 12, (0, 255, 0))
+    rects = display.take_damage(previous)
+    assert rects == [(10, 10, 20, 1), (40, 12, 1, 1)], f"Unexpected rects: {rects}"
+    assert previous == display.buffer, "Previous frame updated to match"
+
+    # Frame 2: clear and redraw the same box, cursor blinked off
+    display.clear()
+    for x in range(10, 30):
+        display.set_pixel(x, 10, (255, 255, 255))
+    rects = display.take_damage(previous)
+    assert rects == [(40, 12, 1, 1)], f"Only the cursor changed, got {rects}"
+
+    # Frame 3: identical redraw produces no damage at all
+    display.clear()
+    for x in range(10, 30):
+        display.set_pixel(x, 10, (255, 255, 255))
+    assert display.take_damage(previous) == [], "Identical frame has no damage"
+
+    print("✓ Damage narrowed to changed pixels")
+
+
+def test_merge_row_spans():
+    """Test merging of per-row spans into rectangles."""
+    print("\nTEST: Merge Row Spans")
+
+    clean = (10, -1)
+    spans = [clean, (2, 4), (5, 6), clean, (0, 1), (8, 9)]
+    rects = merge_row_spans(spans)
+    assert rects == [(2, 1, 5, 2), (0, 4, 2, 1), (8, 5, 2, 1)], f"Unexpected rects: {rects}"
+
+    print("✓ Touching spans merge, disjoint spans stay separate")
+
+
+def test_terminal_driver_repaints_damage_only():
+    """Test the terminal driver emits positioned updates after the first frame."""
+    print("\nTEST: Terminal Driver Partial Repaint")
+
+    driver = TerminalDisplayDriver(16, 8)
+    assert driver.initialize(), "Terminal driver initializes"
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        driver.show()
+    assert '\033[2J' in output.getvalue(), "First frame is a full repaint"
+
+    driver.clear()
+    driver.set_pixel(5, 3, (255, 255, 255))
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        driver.show()
+    frame = output.getvalue()
+    assert '\033[2J' not in frame, "Later frames don't clear the screen"
+    assert frame.startswith('\033[2;6H'), f"Cursor moves to the damaged cell: {frame!r}"
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        driver.clear()
+        driver.set_pixel(5, 3, (255, 255, 255))
+        driver.show()
+    assert output.getvalue() == '', "Unchanged frame writes nothing"
+
+    print("✓ Terminal driver repaints only damaged cells")
+
+
+# ============================================================================
+# Test Runner
+# ============================================================================
+
+def run_all_tests():
+    """Run all tests and report results."""
+    print("=" * 70)
+    print("MATRIXOS DISPLAY TESTS")
+    print("=" * 70)
+
+    tests = [
+        test_flat_buffer_layout,
+        test_mono_buffer,
+        test_out_of_bounds,
+        test_color_coercion,
+        test_fill_and_clear,
+        test_view_is_zero_copy,
+        test_terminal_renderer_reads_flat_buffer,
+        test_terminal_renderer_frame_diff,
+        test_terminal_truecolor_and_sgr_runs,
+        test_fill_rect,
+        test_copy_rect,
+        test_blit_clip_and_src_rect,
+        test_blit_key_and_alpha,
+        test_scale_brightness,
+        test_create_display_backends,
+        test_numpy_backend_matches_python,
+        test_indexed_storage,
+        test_palette_full_uses_nearest,
+        test_indexed_expand_to_rgb,
+        test_color_correction_tables,
+        test_power_limiter,
+        test_damage_from_writes,
+        test_damage_full_frame,
+        test_damage_narrowed_by_previous_frame,
+        test_merge_row_spans,
+        test_terminal_driver_repaints_damage_only,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
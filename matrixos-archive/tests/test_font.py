@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+"""
+Unit tests for MatrixOS text rendering (matrixos.font, matrixos.font_loader)
+
+Tests the pre-rasterized glyphs and the rendered-string cache: cached
+strings must draw exactly what drawing character by character does.
+Also tests BDF/PCF loading, proportional advances, scaling and measure().
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import gzip
+import struct
+import tempfile
+
+from matrixos.display import Display
+from matrixos.font import Font, Glyph, default_font
+from matrixos.led_api import LEDMatrix
+
+
+class PixelDisplay:
+    """Display with only set_pixel/get_pixel (no framebuffer, no cache)."""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.pixels = {}
+
+    def set_pixel(self, x, y, color):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.pixels[(x, y)] = color
+
+    def get_pixel(self, x, y):
+        return self.pixels.get((x, y), (0, 0, 0))
+
+
+def reference_text(display, font, text, x, y, color, bg_color=None, spacing=0):
+    """Draw text bit by bit from the font's byte rows."""
+    for i, char in enumerate(text):
+        bitmap = font.get_char_bitmap(char)
+        cx = x + i * (font.char_width + spacing)
+        for row in range(8):
+            for col in range(8):
+                if bitmap[row] & (0x80 >> col):
+                    display.set_pixel(cx + col, y + row, color)
+                elif bg_color is not None:
+                    display.set_pixel(cx + col, y + row, bg_color)
+
+
+# Two-glyph test font: a 3-wide 'i'-like bar and a 5-wide box with a
+# descender, 6 rows above the baseline and 2 below
+BDF_FONT = """STARTFONT 2.1
+FONT -test-tiny
+SIZE 8 75 75
+FONTBOUNDINGBOX 5 8 0 -2
+STARTPROPERTIES 2
+FONT_ASCENT 6
+FONT_DESCENT 2
+ENDPROPERTIES
+CHARS 3
+STARTCHAR i
+ENCODING 105
+DWIDTH 3 0
+BBX 1 5 1 0
+BITMAP
+80
+00
+80
+80
+80
+ENDCHAR
+STARTCHAR box
+ENCODING 9633
+DWIDTH 6 0
+BBX 5 6 0 -2
+BITMAP
+F8
+88
+88
+88
+88
+F8
+ENDCHAR
+STARTCHAR space
+ENCODING 32
+DWIDTH 2 0
+BBX 0 0 0 0
+BITMAP
+ENDCHAR
+ENDFONT
+"""
+
+# The same glyphs as PCF records: (codepoint, advance, left, right, ascent, descent, rows)
+PCF_GLYPHS = [
+    (105, 3, 1, 2, 5, 0, [1, 0, 1, 1, 1]),
+    (9633, 6, 0, 5, 4, 2, [0x1F, 0x11, 0x11, 0x11, 0x11, 0x1F]),
+    (32, 2, 0, 0, 0, 0, []),
+]
+
+
+def make_pcf(glyphs, ascent, descent, msb_first=True):
+    """Build a PCF font (metrics, bitmaps, encodings, accelerators tables)."""
+    order = '>' if msb_first else '<'
+    fmt = 0xC if msb_first else 0x0  # Byte/bit order; glyph rows padded to 1 byte
+
+    metrics = struct.pack('<I', fmt) + struct.pack(order + 'I', len(glyphs))
+    offsets, blob = [], b''
+    for _, advance, left, right, up, down, rows in glyphs:
+        metrics += struct.pack(order + 'hhhhhH', left, right, advance, up, down, 0)
+        offsets.append(len(blob))
+        width = right - left
+        for row in rows:
+            byte = (row << (8 - width)) & 0xFF if width else 0
+            if not msb_first:
+                byte = int(f'{byte:08b}'[::-1], 2)
+            blob += bytes((byte,))
+    bitmaps = (struct.pack('<I', fmt) + struct.pack(order + 'I', len(glyphs)) +
+               struct.pack(order + f'{len(glyphs)}I', *offsets) +
+               struct.pack(order + '4I', len(blob), 0, 0, 0) + blob)
+
+    codes = [g[0] for g in glyphs]
+    min1, max1 = min(c >> 8 for c in codes), max(c >> 8 for c in codes)
+    table = [0xFFFF] * ((max1 - min1 + 1) * 256)
+    for index, code in enumerate(codes):
+        table[((code >> 8) - min1) * 256 + (code & 0xFF)] = index
+    encodings = (struct.pack('<I', fmt) +
+                 struct.pack(order + '5H', 0, 255, min1, max1, 32) +
+                 struct.pack(order + f'{len(table)}H', *table))
+
+    accel = struct.pack('<I', fmt) + bytes(8) + struct.pack(order + 'iii', ascent, descent, 0)
+
+    tables = [(1 << 2, metrics), (1 << 3, bitmaps), (1 << 5, encodings), (1 << 1, accel)]
+    header = b'\x01fcp' + struct.pack('<I', len(tables))
+    offset = len(header) + 16 * len(tables)
+    body = b''
+    for kind, data in tables:
+        header += struct.pack('<IIII', kind, 0, len(data), offset + len(body))
+        body += data
+    return header + body
+
+
+def write_temp(data, suffix):
+    """Write bytes to a temporary file and return its path."""
+    handle, path = tempfile.mkstemp(suffix=suffix)
+    with os.fdopen(handle, 'wb') as f:
+        f.write(data)
+    return path
+
+
+def rendered(display):
+    """Rows of a mono display as strings ('#' = lit)."""
+    return [''.join('#' if display.get_pixel(x, y) else '.' for x in range(display.width))
+            for y in range(display.height)]
+
+
+# ============================================================================
+# Glyph Tests
+# ============================================================================
+
+def test_glyph_spans():
+    """Test glyphs split each row into lit and unlit runs."""
+    print("TEST: Glyph Spans")
+
+    glyph = Glyph.from_rows([0b11000011, 0xFF, 0x00, 0b01010000, 0, 0, 0, 0])
+    assert glyph.spans[:2] == [(0, 0, 1), (0, 6, 7)], "Lit runs of row 0"
+    assert (0, 2, 5) in glyph.gaps, "Unlit run of row 0"
+    assert (1, 0, 7) in glyph.spans and (2, 0, 7) in glyph.gaps, "Full rows"
+    assert [s for s in glyph.spans if s[0] == 3] == [(3, 1, 1), (3, 3, 3)], "Single pixels"
+    lit = sum(x1 - x0 + 1 for _, x0, x1 in glyph.spans)
+    unlit = sum(x1 - x0 + 1 for _, x0, x1 in glyph.gaps)
+    assert lit + unlit == 64, "Runs cover the cell"
+
+    font = Font()
+    assert len(font.glyphs) == len(font.charset), "Charset rasterized at load"
+    assert font.get_glyph('\x01') is font.glyphs[' '], "Unknown characters draw as space"
+
+    print("✓ Glyphs rasterized into spans")
+
+
+def test_text_matches_reference():
+    """Test cached and glyph-by-glyph text draw the same pixels as bit tests."""
+    print("\nTEST: Text Matches Reference")
+
+    font = Font()
+    cases = [
+        ("Hello, World!", 3, 2, (255, 0, 0), None, 0),
+        ("Score 1234", -5, -3, (0, 255, 0), (0, 0, 80), 0),
+        ("AB", 10, 4, (255, 255, 0), (10, 10, 10), 2),
+        ("xyz", 30, 0, (255, 255, 255), None, -2),
+    ]
+    for mode in ('rgb', 'mono', 'indexed'):
+        for text, x, y, color, bg_color, spacing in cases:
+            if mode == 'mono':
+                color, bg_color = True, (None if bg_color is None else False)
+            expected = Display(40, 12, mode)
+            actual = Display(40, 12, mode, expected.palette)
+            for d in (expected, actual):
+                d.fill(True)
+            reference_text(expected, font, text, x, y, color, bg_color, spacing)
+            for how in ("from the glyphs", "from the cache"):  # First and second draw
+                font.draw_text(actual, text, x, y, color, bg_color, spacing)
+                assert actual.buffer == expected.buffer, f"{mode}: {text!r} drawn {how}"
+
+    pixels = PixelDisplay(40, 12)
+    expected = PixelDisplay(40, 12)
+    font.draw_text(pixels, "Hi!", 1, 2, (0, 0, 255), (9, 9, 9), 1)
+    reference_text(expected, font, "Hi!", 1, 2, (0, 0, 255), (9, 9, 9), 1)
+    assert pixels.pixels == expected.pixels, "Glyph-by-glyph fallback"
+
+    print("✓ Same pixels as drawing bit by bit")
+
+
+# ============================================================================
+# Text Cache Tests
+# ============================================================================
+
+def test_text_cache_hits():
+    """Test repeated labels are rendered once (on their second draw) and blitted."""
+    print("\nTEST: Text Cache Hits")
+
+    font = Font()
+    display = Display(64, 16, 'rgb')
+    for frame in range(5):
+        display.clear()
+        font.draw_text(display, "SCORE", 0, 0, (255, 255, 0))
+        font.draw_text(display, "LIVES", 0, 8, (255, 255, 0), (0, 0, 0))
+    stats = font.get_cache_stats()
+    assert stats['misses'] == 4 and stats['hits'] == 6, f"Cached on the second draw: {stats}"
+    assert stats['hit_rate'] == 0.6, "Hit rate"
+
+    font.draw_text(display, "SCORE", 0, 0, (255, 0, 0))
+    assert font.get_cache_stats()['misses'] == 5, "Color is part of the key"
+
+    heart = [0x00, 0x66, 0xFF, 0xFF, 0x7E, 0x3C, 0x18, 0x00]
+    font.register_char('S', heart)
+    assert not font.text_cache, "Registering a glyph drops cached strings"
+    display.clear()
+    font.draw_text(display, "S", 0, 0, (255, 0, 0))
+    assert display.get_pixel(0, 2) == (255, 0, 0), "New glyph drawn"
+
+    # Changing text is drawn straight from the glyphs and never evicts labels
+    font = Font(text_cache_size=4)
+    for frame in range(3):
+        font.draw_text(display, "LIVES", 0, 8)
+    for score in range(100):
+        font.draw_text(display, f"SCORE {score}", 0, 0)
+    assert [key[0] for key in font.text_cache] == ["LIVES"], "Only the repeated label cached"
+    assert len(font.text_seen) == 4, "Strings seen once are bounded too"
+
+    print("✓ Repeated labels hit the cache")
+
+
+def test_text_cache_bounded():
+    """Test the string cache evicts the least recently used entry."""
+    print("\nTEST: Text Cache Bounded")
+
+    font = Font(text_cache_size=2)
+    display = Display(32, 8, 'rgb')
+    for text in ("A", "B", "A", "C"):  # A most recent, then C evicts B
+        font.draw_text(display, text, 0, 0)
+        font.draw_text(display, text, 0, 0)
+    texts = [key[0] for key in font.text_cache]
+    assert texts == ["A", "C"], f"Least recently used evicted ({texts})"
+    assert font.get_cache_stats()['evictions'] == 1, "Eviction counted"
+
+    uncached = Font(text_cache_size=0)
+    uncached.draw_text(display, "A", 0, 0)
+    uncached.draw_text(display, "A", 0, 0)
+    assert not uncached.text_cache and not uncached.text_seen, "Size 0 disables the cache"
+
+    print("✓ Bounded LRU")
+
+
+# ============================================================================
+# Font File Tests
+# ============================================================================
+
+def test_load_bdf():
+    """Test BDF glyphs land on the baseline with their own advances."""
+    print("\nTEST: Load BDF")
+
+    path = write_temp(BDF_FONT.encode('latin-1'), '.bdf')
+    try:
+        font = Font(path)
+    finally:
+        os.unlink(path)
+
+    assert font.char_height == 8, "Line height is ascent + descent"
+    assert font.char_width == 6, "Grid cell fits the widest advance"
+    assert font.measure("ii") == (6, 8), "Proportional advances"
+    assert font.measure("i\u25a1 i", spacing=1) == (3 + 6 + 2 + 3 + 3, 8), "Spacing between chars"
+    assert font.get_glyph('Z') is font.glyphs[' '], "Missing chars use the default"
+
+    display = Display(12, 8, 'mono')
+    font.draw_text(display, "i\u25a1", 0, 0, True)
+    assert rendered(display) == [
+        '............',
+        '.#..........',
+        '...#####....',
+        '.#.#...#....',
+        '.#.#...#....',
+        '.#.#...#....',
+        '...#...#....',
+        '...#####....',
+    ], "Glyphs placed by their bounding boxes"
+
+    print("✓ BDF fonts load")
+
+
+def test_load_pcf():
+    """Test PCF fonts (either bit order, gzipped) load like the same BDF font."""
+    print("\nTEST: Load PCF")
+
+    path = write_temp(BDF_FONT.encode('latin-1'), '.bdf')
+    try:
+        expected = Font(path)
+    finally:
+        os.unlink(path)
+
+    for msb_first in (True, False):
+        data = make_pcf(PCF_GLYPHS, 6, 2, msb_first)
+        for suffix, payload in (('.pcf', data), ('.pcf.gz', gzip.compress(data))):
+            path = write_temp(payload, suffix)
+            try:
+                font = Font(path)
+            finally:
+                os.unlink(path)
+            assert font.char_height == expected.char_height, "Same line height"
+            for char in ('i', '\u25a1', ' '):
+                assert font.glyphs[char].width == expected.glyphs[char].width, \
+                    f"Advance of {char!r}"
+                assert sorted(font.glyphs[char].spans) == sorted(expected.glyphs[char].spans), \
+                    f"Pixels of {char!r} ({suffix}, msb_first={msb_first})"
+
+    path = write_temp(b'not a font', '.bin')
+    try:
+        Font(path)
+        assert False, "Unknown formats should raise"
+    except ValueError:
+        pass
+    finally:
+        os.unlink(path)
+
+    print("✓ PCF fonts load")
+
+
+def test_scaled_text():
+    """Test scaled text draws each pixel as a block, with cached glyphs."""
+    print("\nTEST: Scaled Text")
+
+    font = Font()
+    small = Display(16, 8, 'mono')
+    big = Display(48, 24, 'mono')
+    font.draw_text(small, "1!", 0, 0, True)
+    font.draw_text(big, "1!", 0, 0, True, scale=3)
+    for y in range(24):
+        for x in range(48):
+            expected = small.get_pixel(x // 3, y // 3) if x < 48 else False
+            assert big.get_pixel(x, y) == expected, f"Pixel ({x}, {y}) scaled"
+
+    assert font.measure("1!", scale=3) == (48, 24), "Measured at scale"
+    assert ('1', 3) in font.scaled_glyphs, "Scaled glyph cached"
+    assert font.get_cache_stats()['scaled_glyphs'] == 2, "Counted"
+
+    pixels = PixelDisplay(48, 24)
+    font.draw_text(pixels, "1!", 0, 0, (255, 0, 0), scale=3)
+    assert {p for p in pixels.pixels} == {(x, y) for y in range(24) for x in range(48)
+                                          if big.get_pixel(x, y)}, "Glyph-by-glyph fallback"
+
+    try:
+        font.get_glyph('A', 0)
+        assert False, "Scale must be positive"
+    except ValueError:
+        pass
+
+    print("✓ Integer scaling")
+
+
+def test_centered_text_measures():
+    """Test LEDMatrix.centered_text centers by measured width, not len * 8."""
+    print("\nTEST: Centered Text")
+
+    path = write_temp(BDF_FONT.encode('latin-1'), '.bdf')
+    try:
+        matrix = LEDMatrix(20, 8, color_mode='mono')
+        matrix.load_font(path)
+    finally:
+        os.unlink(path)
+
+    matrix.centered_text("ii", 0, True)
+    lit = [x for x in range(20) if matrix.display.get_pixel(x, 3)]
+    assert lit == [8, 11], f"6 px wide text starts at 7 ({lit})"
+    assert matrix.measure_text("ii", scale=2) == (12, 16), "measure_text"
+
+    # Registered characters survive a font switch, without touching the
+    # shared default font
+    matrix = LEDMatrix(16, 16, color_mode='mono')
+    matrix.font = Font()
+    matrix.register_char('\x01', [0xFF] * 8)
+    path = write_temp(BDF_FONT.encode('latin-1'), '.bdf')
+    try:
+        matrix.load_font(path)
+    finally:
+        os.unlink(path)
+    assert matrix.font.custom_chars == {'\x01': [0xFF] * 8}, "Custom char carried over"
+    matrix.draw_char('\x01', 0, 0, True, scale=2)
+    assert matrix.display.get_pixel(15, 15), "draw_char() forwards scale"
+    assert '\x01' not in default_font.custom_chars, "Default font untouched"
+
+    matrix = LEDMatrix(64, 16)
+    matrix.centered_text("AB", 0, (255, 255, 255), scale=2)
+    assert matrix.display.get_pixel(16, 4) == (0, 0, 0), "Left of the text blank"
+    assert any(matrix.display.get_pixel(x, 4) != (0, 0, 0) for x in range(16, 48)), \
+        "32 px wide text centered"
+
+    print("✓ Centered by measured width")
+
+
+# ============================================================================
+# Test Runner
+# ============================================================================
+
+def run_all_tests():
+    """Run all tests and report results."""
+    print("=" * 70)
+    print("MATRIXOS FONT TESTS")
+    print("=" * 70)
+
+    tests = [
+        test_glyph_spans,
+        test_text_matches_reference,
+        test_text_cache_hits,
+        test_text_cache_bounded,
+        test_load_bdf,
+        test_load_pcf,
+        test_scaled_text,
+        test_centered_text_measures,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""
+Unit tests for MatrixOS graphics primitives (matrixos.graphics)
+
+Tests that filled shapes are drawn as clipped spans and match the
+pixel-by-pixel fallback used for displays without span support.
+"""
+
+import sys
+import os
+import math
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from matrixos.display import Display
+from matrixos.graphics import (
+    draw_rect, draw_circle, draw_ellipse, draw_triangle, draw_rounded_rect,
+    draw_line, draw_span, draw_polygon, draw_star, polygon_spans, flood_fill,
+    span_cache, SpanCache
+)
+from matrixos.testing import RecordingDriver
+
+
+class PixelDisplay:
+    """Display with only set_pixel/get_pixel (forces the per-pixel fallback)."""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.pixels = {}
+        self.calls = 0
+
+    def set_pixel(self, x, y, color):
+        self.calls += 1
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.pixels[(x, y)] = color
+
+    def get_pixel(self, x, y):
+        return self.pixels.get((x, y), (0, 0, 0))
+
+
+class CountingDisplay(Display):
+    """Display that counts span and pixel calls."""
+
+    def __init__(self, width, height):
+        super().__init__(width, height, 'rgb')
+        self.fill_rects = 0
+        self.pixel_calls = 0
+
+    def fill_rect(self, x, y, width, height, value=True):
+        self.fill_rects += 1
+        super().fill_rect(x, y, width, height, value)
+
+    def fill_spans(self, spans, dx=0, dy=0, value=True):
+        spans = list(spans)
+        self.fill_rects += len(spans)  # Each span is one fill
+        super().fill_spans(spans, dx, dy, value)
+
+    def set_pixel(self, x, y, value=True):
+        self.pixel_calls += 1
+        super().set_pixel(x, y, value)
+
+
+def lit_pixels(display):
+    """Set of (x, y) that are not black."""
+    return {(x, y) for y in range(display.height) for x in range(display.width)
+            if display.get_pixel(x, y) != (0, 0, 0)}
+
+
+SHAPES = [
+    ('rect', lambda d: draw_rect(d, -3, 2, 12, 5, (255, 0, 0), fill=True)),
+    ('rect outline', lambda d: draw_rect(d, 1, 1, 10, 8, (255, 0, 0))),
+    ('circle', lambda d: draw_circle(d, 8, 8, 6, (255, 0, 0), fill=True)),
+    ('clipped circle', lambda d: draw_circle(d, 1, 14, 5, (255, 0, 0), fill=True)),
+    ('ellipse', lambda d: draw_ellipse(d, 8, 8, 7, 3, (255, 0, 0), fill=True)),
+    ('triangle', lambda d: draw_triangle(d, 2, 1, 14, 6, 5, 15, (255, 0, 0), fill=True)),
+    ('rounded rect', lambda d: draw_rounded_rect(d, 1, 2, 14, 11, 4, (255, 0, 0), fill=True)),
+    ('rounded outline', lambda d: draw_rounded_rect(d, 1, 2, 14, 11, 4, (255, 0, 0))),
+    ('vertical line', lambda d: draw_line(d, 3, 12, 3, -2, (255, 0, 0))),
+    ('star', lambda d: draw_star(d, 8, 8, 7, 5, (255, 0, 0), fill=True)),
+]
+
+
+# ============================================================================
+# Span Tests
+# ============================================================================
+
+def test_display_span_primitives():
+    """Test hline/vline/fill_span clip and fill inclusive ranges."""
+    print("TEST: Display Span Primitives")
+
+    display = Display(8, 4, 'rgb')
+    display.fill_span(1, 6, -2, (255, 0, 0))
+    assert display.get_pixel(0, 1) == (255, 0, 0), "Span clipped at the left edge"
+    assert display.get_pixel(6, 1) == (255, 0, 0), "End column is inclusive"
+    assert display.get_pixel(7, 1) == (0, 0, 0), "Nothing past the end"
+
+    display.hline(5, 3, 10, (0, 255, 0))
+    assert display.get_pixel(7, 3) == (0, 255, 0), "hline clipped at the right edge"
+    display.vline(2, -1, 3, (0, 0, 255))
+    assert display.get_pixel(2, 0) == (0, 0, 255), "vline clipped at the top"
+    assert display.get_pixel(2, 2) == (0, 0, 0), "vline height respected"
+
+    display = Display(8, 4, 'rgb')
+    display.fill_spans([(0, -3, 1), (1, 2, 20), (3, 0, 0)], 1, 1, (255, 0, 0))
+    assert display.get_pixel(0, 1) == (255, 0, 0) and display.get_pixel(2, 1) == (255, 0, 0), \
+        "fill_spans offset and clipped left"
+    assert display.get_pixel(7, 2) == (255, 0, 0), "fill_spans clipped right"
+    assert display.take_damage() == [(0, 1, 8, 2)], "Rows damaged, off-screen rows skipped"
+
+    print("✓ Spans clip and fill")
+
+
+def test_driver_default_spans():
+    """Test DisplayDriver's default span methods go through set_pixel."""
+    print("\nTEST: DisplayDriver Default Spans")
+
+    driver = RecordingDriver(4, 4)
+    driver.fill_span(0, 5, -1, (1, 2, 3))
+    driver.vline(3, 2, 5, (4, 5, 6))
+    assert len(driver.pixels) == 6, f"Clipped to the display ({len(driver.pixels)})"
+    assert driver.pixels[(0, 0)] == (1, 2, 3), "Span pixel set"
+    assert driver.pixels[(3, 3)] == (4, 5, 6), "vline pixel set"
+
+    print("✓ Drivers without a framebuffer still get spans")
+
+
+def test_filled_shapes_match_pixel_fallback():
+    """Test span-drawn shapes light exactly the pixels of the per-pixel path."""
+    print("\nTEST: Shapes Match Fallback")
+
+    for name, draw in SHAPES:
+        fast = Display(16, 16, 'rgb')
+        slow = PixelDisplay(16, 16)
+        draw(fast)
+        draw(slow)
+        assert lit_pixels(fast) == lit_pixels(slow), f"{name} differs"
+
+    print("✓ Span and per-pixel drawing agree")
+
+
+def test_fills_use_spans():
+    """Test filled shapes make one call per row, not per pixel."""
+    print("\nTEST: Fills Use Spans")
+
+    display = CountingDisplay(256, 192)
+    draw_rect(display, 0, 0, 256, 192, (10, 20, 30), fill=True)
+    assert display.fill_rects == 1, "Full-screen rect is one fill"
+    assert display.pixel_calls == 0, "No per-pixel calls"
+
+    display.fill_rects = 0
+    draw_circle(display, 100, 100, 20, (255, 0, 0), fill=True)
+    assert display.fill_rects == 41, f"One span per row ({display.fill_rects})"
+    assert display.pixel_calls == 0, "No per-pixel calls"
+
+    display.fill_rects = 0
+    draw_rounded_rect(display, 10, 10, 50, 30, 6, (255, 0, 0), fill=True)
+    assert display.fill_rects == 30, f"One span per row ({display.fill_rects})"
+
+    slow = PixelDisplay(256, 192)
+    draw_span(slow, 5, 0, 255, (1, 1, 1))
+    assert slow.calls == 256, "Fallback sets each pixel"
+
+    print("✓ Fills are span based")
+
+
+def test_rounded_rect_corners():
+    """Test filled rounded rectangles stay inside their box with cut corners."""
+    print("\nTEST: Rounded Rect Corners")
+
+    display = Display(16, 16, 'rgb')
+    draw_rounded_rect(display, 2, 2, 10, 8, 3, (255, 0, 0), fill=True)
+    lit = lit_pixels(display)
+    assert all(2 <= x < 12 and 2 <= y < 10 for x, y in lit), "Stays inside the box"
+    assert (2, 2) not in lit and (11, 9) not in lit, "Corners are cut"
+    assert (2, 5) in lit and (7, 2) in lit, "Edges are filled"
+
+    # Pills (radius clamped to half an even width or height) keep their end
+    # rows, as the per-row inset drawing did before the span cache
+    for width, height, radius in ((8, 20, 4), (8, 20, 9), (20, 8, 4), (6, 6, 3), (2, 10, 1)):
+        display = Display(24, 24, 'rgb')
+        draw_rounded_rect(display, 2, 2, width, height, radius, (255, 0, 0), fill=True)
+        radius = min(radius, width // 2, height // 2)
+        expected = set()
+        for row in range(height):
+            d = radius - row if row < radius else row - (height - radius - 1)
+            inset = radius - int(math.sqrt(max(0, radius * radius - d * d))) if d > 0 else 0
+            x0, x1 = sorted((inset, width - 1 - inset))
+            expected.update((2 + x, 2 + row) for x in range(x0, x1 + 1))
+        assert lit_pixels(display) == expected, f"{width}x{height} r{radius} pill"
+        slow = PixelDisplay(24, 24)
+        draw_rounded_rect(slow, 2, 2, width, height, radius, (255, 0, 0), fill=True)
+        assert lit_pixels(slow) == expected, f"{width}x{height} r{radius} pill (fallback)"
+
+    print("✓ Rounded rect corners")
+
+
+def test_concave_polygon_fill():
+    """Test concave polygons fill their inside only (no fan artefacts)."""
+    print("\nTEST: Concave Polygon Fill")
+
+    # A U shape: the notch between the arms must stay empty
+    u_shape = [(0, 0), (3, 0), (3, 6), (6, 6), (6, 0), (9, 0), (9, 9), (0, 9)]
+    display = Display(12, 12, 'rgb')
+    draw_polygon(display, u_shape, (255, 0, 0), fill=True)
+    lit = lit_pixels(display)
+    assert (4, 2) not in lit and (5, 5) not in lit, "Notch left empty"
+    assert (1, 1) in lit and (8, 1) in lit and (5, 8) in lit, "Arms and base filled"
+    assert (0, 0) in lit and (9, 9) in lit, "Fill reaches the outline's corners"
+    assert len(lit) == 10 * 10 - 2 * 6, f"Exact area ({len(lit)})"
+
+    spans = polygon_spans(u_shape)
+    assert len([s for s in spans if s[0] == 2]) == 2, "Two spans on an arm row"
+    assert len([s for s in spans if s[0] == 8]) == 1, "One span on a base row"
+
+    print("✓ Concave polygons fill correctly")
+
+
+def test_fill_rules():
+    """Test even-odd leaves overlaps empty and non-zero fills them."""
+    print("\nTEST: Fill Rules")
+
+    # Outer square and inner square traced the same way round
+    path = [(0, 0), (9, 0), (9, 9), (0, 9), (0, 0), (3, 3), (6, 3), (6, 6), (3, 6), (3, 3)]
+    assert polygon_spans(path, 'evenodd')[4] == (4, 0, 3), "Even-odd: hole in the middle"
+    assert polygon_spans(path, 'nonzero')[4] == (4, 0, 9), "Non-zero: winding 2 is filled"
+
+    # Clipped to the display rows
+    assert polygon_spans([(0, -5), (4, -5), (4, 20), (0, 20)], y_min=0, y_max=3)[-1][0] == 3, \
+        "Rows clipped"
+
+    try:
+        polygon_spans(path, 'winding')
+        assert False, "Unknown rules should raise"
+    except ValueError:
+        pass
+
+    print("✓ Even-odd and non-zero rules")
+
+
+def test_triangle_fill_spans():
+    """Test filled triangles are one span per row, tip rows included."""
+    print("\nTEST: Triangle Fill Spans")
+
+    display = CountingDisplay(32, 32)
+    draw_triangle(display, 2, 3, 20, 3, 11, 21, (255, 0, 0), fill=True)
+    assert display.fill_rects == 19, f"One span per row ({display.fill_rects})"
+    assert display.get_pixel(11, 21) == (255, 0, 0), "Bottom tip drawn"
+    assert display.get_pixel(2, 3) == (255, 0, 0) and display.get_pixel(20, 3) == (255, 0, 0), \
+        "Top edge drawn end to end"
+
+    # Triangles skip the edge table but fill exactly what fill_polygon() does
+    for triangle in ([(2, 3), (20, 3), (11, 21)], [(5, 0), (30, 12), (0, 31)],
+                     [(1, 1), (9, 30), (25, 30)], [(-6, 10), (40, -3), (16, 45)],
+                     [(3.5, 2.2), (28.7, 9.5), (12.1, 26.8)]):
+        expected = PixelDisplay(32, 32)
+        for y, x0, x1 in polygon_spans(triangle, 'evenodd', 0, 31):
+            draw_span(expected, y, x0, x1, (0, 255, 0))
+        display = PixelDisplay(32, 32)
+        draw_triangle(display, *triangle[0], *triangle[1], *triangle[2], (0, 255, 0), fill=True)
+        assert display.pixels == expected.pixels, f"Same fill as the polygon filler: {triangle}"
+
+    print("✓ Triangles are span filled")
+
+
+# ============================================================================
+# Flood Fill Tests
+# ============================================================================
+
+def test_flood_fill_region():
+    """Test flood fill stays inside an outline and matches the fallback."""
+    print("\nTEST: Flood Fill Region")
+
+    display = CountingDisplay(16, 12)
+    pixel_display = PixelDisplay(16, 12)
+    for d in (display, pixel_display):
+        draw_rect(d, 2, 2, 10, 8, (255, 0, 0))
+        draw_line(d, 2, 2, 11, 9, (255, 0, 0))  # Split the inside in two
+
+    display.fill_rects = 0
+    filled = flood_fill(display, 8, 4, (0, 255, 0))
+    assert filled == 20, f"Upper triangle filled ({filled})"
+    assert display.get_pixel(4, 7) == (0, 0, 0), "Other half untouched"
+    assert display.get_pixel(0, 0) == (0, 0, 0), "Outside untouched"
+    assert display.fill_rects == 5, f"Filled a span per row ({display.fill_rects})"
+
+    assert flood_fill(pixel_display, 8, 4, (0, 255, 0)) == filled, "Fallback agrees"
+    assert lit_pixels(display) == lit_pixels(pixel_display), "Same pixels filled"
+
+    assert flood_fill(display, 8, 4, (0, 255, 0)) == 0, "Already that color"
+    assert flood_fill(display, 20, 4, (0, 255, 0)) == 0, "Off screen seed"
+    assert flood_fill(display, 0, 0, (0, 0, 255)) == 112, "Outside filled"
+
+    print("✓ Flood fill bounded by the outline")
+
+
+def test_flood_fill_connectivity():
+    """Test 8-connectivity leaks through diagonal gaps and 4 does not."""
+    print("\nTEST: Flood Fill Connectivity")
+
+    def make():
+        display = Display(8, 8, 'rgb')
+        draw_line(display, 0, 7, 7, 0, (255, 255, 255))  # Diagonal wall
+        return display
+
+    display = make()
+    assert flood_fill(display, 0, 0, (255, 0, 0)) == 28, "4-connected: one side"
+    assert display.get_pixel(7, 7) == (0, 0, 0), "Wall holds"
+
+    display = make()
+    assert flood_fill(display, 0, 0, (255, 0, 0), connectivity=8) == 56, \
+        "8-connected: through the diagonal"
+
+    try:
+        flood_fill(display, 0, 0, (0, 0, 0), connectivity=6)
+        assert False, "Connectivity must be 4 or 8"
+    except ValueError:
+        pass
+
+    print("✓ 4 and 8 connectivity")
+
+
+def test_flood_fill_tolerance():
+    """Test tolerance fills near colors (per channel)."""
+    print("\nTEST: Flood Fill Tolerance")
+
+    display = Display(6, 1, 'rgb')
+    for x, color in enumerate([(100, 100, 100), (104, 98, 100), (110, 100, 100),
+                               (100, 100, 100), (0, 0, 0), (100, 100, 100)]):
+        display.set_pixel(x, 0, color)
+
+    assert flood_fill(display, 0, 0, (1, 1, 1), tolerance=5) == 2, "Stops at the far color"
+    display.set_pixel(0, 0, (100, 100, 100))
+    display.set_pixel(1, 0, (104, 98, 100))
+    assert flood_fill(display, 0, 0, (1, 1, 1), tolerance=10) == 4, "Wider tolerance"
+    assert display.get_pixel(5, 0) == (100, 100, 100), "Not connected"
+
+    print("✓ Tolerance matching")
+
+
+def test_flood_fill_other_modes():
+    """Test flood fill on mono and indexed framebuffers."""
+    print("\nTEST: Flood Fill Mono/Indexed")
+
+    mono = Display(8, 4, 'mono')
+    draw_line(mono, 4, 0, 4, 3, True)
+    assert flood_fill(mono, 0, 0, True) == 16, "Mono left half"
+    assert mono.get_pixel(6, 1) is False, "Right half untouched"
+
+    indexed = Display(8, 4, 'indexed')
+    draw_line(indexed, 4, 0, 4, 3, (255, 0, 0))
+    assert flood_fill(indexed, 7, 3, (0, 0, 255)) == 12, "Indexed right part"
+    assert indexed.get_pixel(7, 0) == (0, 0, 255), "Palette color filled"
+    assert indexed.get_pixel(0, 0) == (0, 0, 0), "Left half untouched"
+
+    print("✓ Mono and indexed framebuffers")
+
+
+# ============================================================================
+# Shape Cache Tests
+# ============================================================================
+
+def test_shape_cache_hits():
+    """Test repeated shapes reuse their cached spans wherever they are drawn."""
+    print("\nTEST: Shape Cache Hits")
+
+    span_cache.clear()
+    first = Display(32, 32, 'rgb')
+    draw_circle(first, 10, 10, 5, (255, 0, 0))
+    draw_rounded_rect(first, 2, 20, 12, 8, 3, (0, 255, 0), fill=True)
+    assert span_cache.get_stats()['misses'] == 2, "First draws rasterize"
+
+    moved = Display(32, 32, 'rgb')
+    draw_circle(moved, 20, 12, 5, (255, 0, 0))
+    draw_rounded_rect(moved, 12, 22, 12, 8, 3, (0, 255, 0), fill=True)
+    stats = span_cache.get_stats()
+    assert stats['hits'] == 2 and stats['misses'] == 2, f"Redraws hit: {stats}"
+    assert stats['hit_rate'] == 0.5, "Hit rate"
+    assert {(x + 10, y + 2) for x, y in lit_pixels(first)} == lit_pixels(moved), \
+        "Cached spans translated"
+
+    # Displays without fill_spans get the same pixels
+    slow = PixelDisplay(32, 32)
+    draw_circle(slow, 10, 10, 5, (255, 0, 0))
+    draw_rounded_rect(slow, 2, 20, 12, 8, 3, (0, 255, 0), fill=True)
+    assert lit_pixels(slow) == lit_pixels(first), "Fallback agrees"
+
+    # Clipped at the display edges
+    edge = Display(8, 8, 'rgb')
+    draw_circle(edge, 0, 0, 4, (255, 0, 0), fill=True)
+    assert edge.get_pixel(0, 0) == (255, 0, 0) and edge.get_pixel(7, 7) == (0, 0, 0), \
+        "Clipped"
+
+    print("✓ Shapes cached and translated")
+
+
+def test_shape_cache_lru():
+    """Test the cache is bounded and evicts the least recently used shape."""
+    print("\nTEST: Shape Cache LRU")
+
+    cache = SpanCache(max_entries=2)
+    calls = []
+
+    def rasterize(radius):
+        calls.append(radius)
+        return [(0, -radius, radius)]
+
+    cache.get(('circle', 1), lambda: rasterize(1))
+    cache.get(('circle', 2), lambda: rasterize(2))
+    cache.get(('circle', 1), lambda: rasterize(1))  # 1 is now most recent
+    cache.get(('circle', 3), lambda: rasterize(3))  # Evicts 2
+    assert ('circle', 2) not in cache.entries and ('circle', 1) in cache.entries, \
+        "Least recently used evicted"
+    cache.get(('circle', 2), lambda: rasterize(2))
+    assert calls == [1, 2, 3, 2], f"Rasterized on misses only ({calls})"
+
+    stats = cache.get_stats()
+    assert stats['entries'] == 2 and stats['evictions'] == 2, f"Stats: {stats}"
+
+    off = SpanCache(max_entries=0)
+    assert off.get(('x',), lambda: [(0, 0, 0)]) == ((0, 0, 0),), "Still rasterizes"
+    assert not off.entries, "Disabled cache stores nothing"
+
+    print("✓ Bounded LRU")
+
+
+# ============================================================================
+# Test Runner
+# ============================================================================
+
+def run_all_tests():
+    """Run all tests and report results."""
+    print("=" * 70)
+    print("MATRIXOS GRAPHICS TESTS")
+    print("=" * 70)
+
+    tests = [
+        test_display_span_primitives,
+        test_driver_default_spans,
+        test_filled_shapes_match_pixel_fallback,
+        test_fills_use_spans,
+        test_rounded_rect_corners,
+        test_concave_polygon_fill,
+        test_fill_rules,
+        test_triangle_fill_spans,
+        test_flood_fill_region,
+        test_flood_fill_connectivity,
+        test_flood_fill_tolerance,
+        test_flood_fill_other_modes,
+        test_shape_cache_hits,
+        test_shape_cache_lru,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
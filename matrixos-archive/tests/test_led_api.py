@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the MatrixOS high-level LED API (matrixos.led_api.LEDMatrix)
+
+Tests double buffering and how frames are handed to display drivers.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from matrixos.led_api import LEDMatrix
+from matrixos.devices.base import DisplayDriver
+from matrixos.testing import RecordingDriver
+
+
+# ============================================================================
+# Double Buffering Tests
+# ============================================================================
+
+def test_show_flips_buffers():
+    """Test show() swaps back and front buffers without copying."""
+    print("TEST: Buffer Flip")
+
+    driver = RecordingDriver(8, 8)
+    matrix = LEDMatrix(8, 8, driver=driver)
+    back, front = matrix.display, matrix.front
+
+    matrix.set_pixel(1, 1, (255, 0, 0))
+    matrix.show()
+
+    assert matrix.front is back, "Drawn buffer becomes the front buffer"
+    assert matrix.display is front, "Old front buffer becomes the back buffer"
+    assert driver.presented[-1][0] is back, "Driver receives the front buffer"
+    assert matrix.front.get_pixel(1, 1) == (255, 0, 0), "Front holds the finished frame"
+
+    print("✓ show() flips by swapping references")
+
+
+def test_front_buffer_stable_while_drawing():
+    """Test drawing the next frame doesn't touch the presented frame."""
+    print("\nTEST: Stable Front Buffer")
+
+    driver = RecordingDriver(8, 8)
+    matrix = LEDMatrix(8, 8, driver=driver)
+
+    matrix.fill((0, 0, 255))
+    matrix.show()
+    shown = matrix.front
+
+    matrix.clear()
+    matrix.set_pixel(0, 0, (255, 255, 255))
+    assert shown.get_pixel(0, 0) == (0, 0, 255), "Front buffer unaffected by new drawing"
+    assert shown.get_pixel(7, 7) == (0, 0, 255), "Front buffer not cleared"
+
+    print("✓ Front buffer stays stable while the app draws")
+
+
+def test_copy_front_to_back_mode():
+    """Test incremental drawing with copy_front_to_back."""
+    print("\nTEST: Copy Front to Back")
+
+    driver = RecordingDriver(8, 8)
+    matrix = LEDMatrix(8, 8, driver=driver, copy_front_to_back=True)
+
+    matrix.set_pixel(0, 0, (255, 0, 0))
+    matrix.show()
+    matrix.set_pixel(1, 0, (0, 255, 0))
+    matrix.show()
+
+    frame = driver.presented[-1][0]
+    assert frame.get_pixel(0, 0) == (255, 0, 0), "Earlier drawing carried over"
+    assert frame.get_pixel(1, 0) == (0, 255, 0), "New drawing added"
+    assert matrix.display.buffer == matrix.front.buffer, "Back buffer refreshed from front"
+
+    print("✓ copy_front_to_back supports incremental drawing")
+
+
+def test_flip_damages_stale_back_buffer():
+    """Test the stale back buffer is fully damaged after a flip."""
+    print("\nTEST: Stale Back Buffer Damage")
+
+    matrix = LEDMatrix(8, 4, driver=RecordingDriver(8, 4))
+    matrix.show()
+    assert matrix.display.take_damage() == [(0, 0, 8, 4)], "Stale back buffer fully damaged"
+
+    print("✓ Swapped-in back buffer is marked damaged")
+
+
+def test_default_present_copies_pixels():
+    """Test DisplayDriver.present() falls back to set_pixel + show()."""
+    print("\nTEST: Default present()")
+
+    class PixelDriver(RecordingDriver):
+        def __init__(self, width, height):
+            super().__init__(width, height)
+            self.shows = 0
+
+        def show(self):
+            self.shows += 1
+
+        present = DisplayDriver.present
+
+    driver = PixelDriver(4, 4)
+    matrix = LEDMatrix(4, 4, driver=driver)
+    matrix.set_pixel(2, 3, (1, 2, 3))
+    matrix.show()
+
+    assert driver.pixels[(2, 3)] == (1, 2, 3), "Pixel copied into driver"
+    assert len(driver.pixels) == 16, "Every pixel copied"
+    assert driver.shows == 1, "show() called once"
+
+    print("✓ Default present() copies the frame")
+
+
+def test_indexed_palette_animation():
+    """Test indexed mode presents RGB and animates via the palette."""
+    print("\nTEST: Indexed Palette Animation")
+
+    driver = RecordingDriver(4, 2)
+    matrix = LEDMatrix(4, 2, color_mode='indexed', driver=driver)
+    assert len(matrix.display.buffer) == 8, "Indexed buffers use 1 byte per pixel"
+    assert matrix.display.palette is matrix.front.palette, "Buffers share one palette"
+
+    border = matrix.color_index((0, 0, 215))
+    matrix.fill((0, 0, 0))
+    matrix.rect(0, 0, 4, 1, border, fill=True)
+    matrix.show()
+
+    frame, data, _, _ = driver.presented[-1]
+    assert frame.color_mode == 'rgb', "Driver receives an RGB frame"
+    assert data[:3] == bytes((0, 0, 215)), "Palette colour expanded"
+
+    matrix.set_palette_color(border, (255, 0, 0))
+    matrix.refresh()
+    frame, data, _, _ = driver.presented[-1]
+    assert data[:3] == bytes((255, 0, 0)), "Palette change shows without redrawing"
+    assert data[12:15] == bytes((0, 0, 0)), "Other pixels unchanged"
+
+    print("✓ Palette animation works without redrawing")
+
+
+def test_color_correction_on_output():
+    """Test brightness is applied to the presented frame, not the buffers."""
+    print("\nTEST: Colour Correction on Output")
+
+    driver = RecordingDriver(4, 2)
+    matrix = LEDMatrix(4, 2, driver=driver)
+    matrix.set_brightness(0.5)
+    matrix.set_pixel(0, 0, (200, 100, 50))
+    matrix.show()
+
+    frame, data, _, _ = driver.presented[-1]
+    assert data[:3] == bytes((100, 50, 25)), "Presented frame dimmed"
+    assert matrix.front.get_pixel(0, 0) == (200, 100, 50), "Front buffer kept as drawn"
+
+    matrix.set_brightness(1.0)
+    matrix.refresh()
+    frame, data, _, _ = driver.presented[-1]
+    assert data[:3] == bytes((200, 100, 50)), "Brightness change shows without redrawing"
+
+    print("✓ Correction applied at output")
+
+
+# ============================================================================
+# Test Runner
+# ============================================================================
+
+def run_all_tests():
+    """Run all tests and report results."""
+    print("=" * 70)
+    print("MATRIXOS LED API TESTS")
+    print("=" * 70)
+
+    tests = [
+        test_show_flips_buffers,
+        test_front_buffer_stable_while_drawing,
+        test_copy_front_to_back_mode,
+        test_flip_damages_stale_back_buffer,
+        test_default_present_copies_pixels,
+        test_indexed_palette_animation,
+        test_color_correction_on_output,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the MatrixOS output thread (matrixos.output_thread)
+
+Tests the single-slot, latest-frame-wins handoff from LEDMatrix.show() to
+the output thread and the output timing statistics.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import threading
+
+from matrixos.display import Display
+from matrixos.led_api import LEDMatrix
+from matrixos.output_thread import OutputThread
+from matrixos.testing import RecordingDriver
+
+
+# ============================================================================
+# Output Thread Tests
+# ============================================================================
+
+def test_show_hands_frame_to_thread():
+    """Test show() returns at once and the frame is output on the thread."""
+    print("TEST: Threaded Show")
+
+    driver = RecordingDriver(4, 2)
+    matrix = LEDMatrix(4, 2, driver=driver, threaded_output=True)
+    try:
+        matrix.set_pixel(1, 1, (255, 0, 0))
+        matrix.show()
+        matrix.fill((0, 0, 255))  # Drawing the next frame can't change the one sent
+        assert matrix.output_thread.flush(), "Frame output"
+
+        _, data, damage, name = driver.presented[-1]
+        assert name == "MatrixOS-Output", "Output ran on the output thread"
+        assert data[15:18] == bytes((255, 0, 0)), "Frame contents handed over"
+        assert data[0:3] == bytes(3), "Later drawing not visible"
+        assert damage == [(1, 1, 1, 1)], "Damage handed over with the frame"
+    finally:
+        matrix.stop_output_thread()
+    assert matrix.output_thread is None, "Stopped"
+
+    print("✓ show() hands frames to the output thread")
+
+
+def test_latest_frame_wins():
+    """Test frames arriving while output is busy replace each other."""
+    print("\nTEST: Latest Frame Wins")
+
+    driver = RecordingDriver(4, 4)
+    driver.gate = threading.Event()
+    matrix = LEDMatrix(4, 4, driver=driver, copy_front_to_back=True, threaded_output=True)
+    try:
+        matrix.show()  # Frame 1 - output blocks on the gate
+        assert driver.entered.wait(2.0), "Output thread busy with frame 1"
+
+        matrix.set_pixel(0, 0, (255, 0, 0))
+        matrix.show()  # Frame 2 waits in the mailbox
+        matrix.set_pixel(3, 3, (0, 255, 0))
+        matrix.show()  # Frame 3 replaces frame 2
+
+        driver.gate.set()
+        assert matrix.output_thread.flush(), "All frames output"
+        stats = matrix.output_thread.get_stats()
+    finally:
+        matrix.stop_output_thread()
+
+    assert len(driver.presented) == 2, f"Frame 2 dropped ({len(driver.presented)} presented)"
+    assert stats['dropped'] == 1 and stats['submitted'] == 3, f"Stats: {stats}"
+    _, data, damage, name = driver.presented[-1]
+    assert data[0:3] == bytes((255, 0, 0)) and data[45:48] == bytes((0, 255, 0)), \
+        "Newest frame output"
+    assert damage == [(0, 0, 1, 1), (3, 3, 1, 1)], f"Dropped frame's damage kept: {damage}"
+
+    print("✓ Intermediate frames dropped, not queued")
+
+
+def test_output_stats():
+    """Test the thread records how long output takes."""
+    print("\nTEST: Output Stats")
+
+    frames = []
+    thread = OutputThread(lambda frame, tag: frames.append(tag))
+    frame = Display(2, 2, 'rgb')
+    try:
+        for i in range(3):
+            thread.submit(frame, i)
+            assert thread.flush(), "Frame output"
+    finally:
+        thread.stop()
+
+    assert frames == [0, 1, 2], "Extra arguments passed through"
+    stats = thread.get_stats()
+    assert stats['presented'] == 3 and stats['dropped'] == 0, f"Stats: {stats}"
+    assert stats['max_ms'] >= stats['average_ms'] >= 0.0, "Timings recorded"
+    assert 0.0 <= stats['utilization'] <= 1.0, "Utilization is a fraction"
+    assert len(thread.spare) == 1, "Frame copies reused"
+
+    print("✓ Output timing recorded")
+
+
+# ============================================================================
+# Test Runner
+# ============================================================================
+
+def run_all_tests():
+    """Run all tests and report results."""
+    print("=" * 70)
+    print("MATRIXOS OUTPUT THREAD TESTS")
+    print("=" * 70)
+
+    tests = [
+        test_show_hands_frame_to_thread,
+        test_latest_frame_wins,
+        test_output_stats,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Unit tests for HUB75 panel mapping (matrixos.devices.display.panel_layout)
+
+Checks remapped frame bytes offline: chain order, serpentine and U-mapped
+chains, rotation, and the DeviceManager integration.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+import tempfile
+
+from matrixos.devices import DeviceManager
+from matrixos.devices.display import panel_layout
+from matrixos.devices.display.panel_layout import PanelLayout
+from matrixos.led_api import LEDMatrix
+from matrixos.testing import RecordingDriver
+
+
+def numbered_frame(layout):
+    """Mono-sized frame whose pixel i holds the value i (1 byte per pixel)."""
+    width, height = layout.logical_size
+    return bytearray(i % 256 for i in range(width * height))
+
+
+def physical_pixel(layout, data, x, y):
+    """Value at chain position (x, y) of a 1-byte-per-pixel remapped frame."""
+    return data[y * layout.physical_size[0] + x]
+
+
+# ============================================================================
+# Layout Tests
+# ============================================================================
+
+def test_single_panel_is_identity():
+    """Test a single unrotated panel copies the frame unchanged."""
+    print("TEST: Single Panel")
+
+    layout = PanelLayout(4, 2)
+    assert layout.is_identity, "No remapping needed"
+    frame = bytearray(range(24))
+    assert layout.remap(frame) == frame, "Frame copied as is"
+
+    print("✓ Single panel is a plain copy")
+
+
+def test_row_major_chain():
+    """Test a 1x2 wall: the lower panel comes second in the chain."""
+    print("\nTEST: Row-major Chain")
+
+    layout = PanelLayout(4, 2, cols=1, rows=2, bytes_per_pixel=1)
+    assert layout.logical_size == (4, 4), "Wall is 4x4"
+    assert layout.physical_size == (8, 2), "Chain is 8x2"
+    out = layout.remap(numbered_frame(layout))
+    assert physical_pixel(layout, out, 0, 0) == 0, "Panel 0 shows the top"
+    assert physical_pixel(layout, out, 4, 0) == 8, "Panel 1 shows logical row 2"
+    assert physical_pixel(layout, out, 7, 1) == 15, "Last pixel is the bottom-right"
+    assert sorted(layout.index) == list(range(16)), "Index is a permutation"
+
+    print("✓ Chain order follows rows")
+
+
+def test_serpentine_and_u_mapping():
+    """Test returning rows run backwards, and upside down with u_mapping."""
+    print("\nTEST: Serpentine and U-mapping")
+
+    snake = PanelLayout(2, 2, cols=2, rows=2, serpentine=True, bytes_per_pixel=1)
+    assert [p[:2] for p in snake.panels] == [(0, 0), (1, 0), (1, 1), (0, 1)], \
+        "Second row of panels runs right to left"
+    out = snake.remap(numbered_frame(snake))
+    # Chain panel 2 is wall panel (1, 1): its top-left is logical (2, 2)
+    assert physical_pixel(snake, out, 4, 0) == 2 * 4 + 2, "Panel kept upright"
+
+    u_map = PanelLayout(2, 2, cols=2, rows=2, u_mapping=True, bytes_per_pixel=1)
+    out = u_map.remap(numbered_frame(u_map))
+    # Upside down: the panel's first pixel is the wall panel's bottom-right
+    assert physical_pixel(u_map, out, 4, 0) == 3 * 4 + 3, "Returning panel rotated 180"
+    assert physical_pixel(u_map, out, 7, 1) == 2 * 4 + 0, "Last pixel of the last panel"
+
+    print("✓ Serpentine and U-mapped chains")
+
+
+def test_rotation():
+    """Test rotating the image onto the wall."""
+    print("\nTEST: Rotation")
+
+    layout = PanelLayout(4, 2, rotation=90, bytes_per_pixel=1)
+    assert layout.logical_size == (2, 4), "Portrait logical display"
+    out = layout.remap(numbered_frame(layout))
+    # Clockwise: the logical bottom-left lands at the wall's top-left
+    assert physical_pixel(layout, out, 0, 0) == 3 * 2 + 0, "Bottom-left to top-left"
+    assert physical_pixel(layout, out, 3, 0) == 0, "Top-left to top-right"
+
+    layout = PanelLayout(4, 2, rotation=180, bytes_per_pixel=1)
+    out = layout.remap(numbered_frame(layout))
+    assert out == numbered_frame(layout)[::-1], "180 degrees reverses the frame"
+
+    try:
+        PanelLayout(4, 2, rotation=45)
+        assert False, "Odd rotations should raise"
+    except ValueError:
+        pass
+
+    print("✓ Rotation")
+
+
+def test_rgb_gather_paths_agree():
+    """Test the NumPy and itemgetter gathers produce the same RGB bytes."""
+    print("\nTEST: RGB Gather Paths")
+
+    config = {"panel_width": 8, "panel_height": 4, "cols": 2, "rows": 3,
+              "u_mapping": True, "rotation": 270}
+    frame = bytearray(i * 7 % 256 for i in range(16 * 12 * 3))
+    results = []
+    saved = panel_layout.numpy
+    try:
+        for backend in (saved, None):
+            panel_layout.numpy = backend
+            results.append(PanelLayout.from_config(config).remap(frame))
+    finally:
+        panel_layout.numpy = saved
+
+    assert results[0] == results[1], "Both gathers agree"
+    layout = PanelLayout.from_config(config)
+    p = 5
+    assert results[1][p * 3:p * 3 + 3] == frame[layout.index[p] * 3:layout.index[p] * 3 + 3], \
+        "Whole RGB pixels are moved"
+
+    print("✓ Gather paths agree")
+
+
+def test_device_manager_panel_layout():
+    """Test DeviceManager wraps the driver and sizes it to the chain."""
+    print("\nTEST: DeviceManager Panel Layout")
+
+    config = {"display": {"width": 8, "height": 4, "driver": "recording",
+                          "panel_layout": {"panel_width": 4, "panel_height": 2,
+                                           "cols": 2, "rows": 2, "serpentine": True}}}
+    fd, path = tempfile.mkstemp(suffix='.json')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(config, f)
+    try:
+        manager = DeviceManager(config_path=path)
+        manager.register_display_driver("recording", RecordingDriver)
+        assert manager.initialize_display(), "Display initializes"
+    finally:
+        os.remove(path)
+
+    driver = manager.active_display
+    assert (driver.width, driver.height) == (8, 4), "Apps see the logical size"
+    matrix = LEDMatrix(8, 4, driver=driver)
+    matrix.set_pixel(4, 2, (255, 0, 0))  # Top-left of wall panel (1, 1) = chain panel 2
+    matrix.show()
+
+    frame, data, _, _ = driver.output_driver.presented[-1]
+    width, height = frame.width, frame.height
+    assert (width, height) == (16, 2), "Output driver gets the 4-panel chain"
+    assert data[8 * 3:8 * 3 + 3] == bytes((255, 0, 0)), "Pixel lands in chain panel 2"
+
+    print("✓ DeviceManager remaps frames")
+
+
+# ============================================================================
+# Test Runner
+# ============================================================================
+
+def run_all_tests():
+    """Run all tests and report results."""
+    print("=" * 70)
+    print("MATRIXOS PANEL LAYOUT TESTS")
+    print("=" * 70)
+
+    tests = [
+        test_single_panel_is_identity,
+        test_row_major_chain,
+        test_serpentine_and_u_mapping,
+        test_rotation,
+        test_rgb_gather_paths_agree,
+        test_device_manager_panel_layout,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
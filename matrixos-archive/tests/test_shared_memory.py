@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Unit tests for display server mode (matrixos.devices.display.shared_memory)
+
+Tests the shared framebuffer, the app-side SharedMemoryDisplayDriver and the
+output loop that feeds a real driver from another process.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import io
+import struct
+import tempfile
+import threading
+import contextlib
+
+from matrixos.led_api import LEDMatrix
+from matrixos.testing import RecordingDriver
+from matrixos.devices.display.terminal import TerminalDisplayDriver
+from matrixos.devices.display.shared_memory import (
+    SharedFramebuffer, SharedMemoryDisplayDriver, run_output_loop, SEQUENCE_OFFSET
+)
+
+
+# ============================================================================
+# Shared Framebuffer Tests
+# ============================================================================
+
+def test_publish_and_read():
+    """Test frames round-trip through shared memory with a sequence counter."""
+    print("TEST: Publish and Read")
+
+    writer = SharedFramebuffer.create(4, 2)
+    reader = SharedFramebuffer.attach(writer.name)
+    try:
+        assert (reader.width, reader.height) == (4, 2), "Reader sees the frame size"
+        local = bytearray(reader.frame_size)
+        assert reader.read_into(local) is None, "No frame published yet"
+
+        sequence = writer.publish(bytes(range(24)))
+        assert sequence == 2, "First frame has sequence 2"
+        assert reader.read_into(local) == 2, "Reader picks up the new frame"
+        assert local == bytearray(range(24)), "Frame bytes copied out"
+        assert reader.read_into(local, last_sequence=2) is None, "Same frame not read twice"
+
+        try:
+            writer.publish(b'\x00' * 3)
+            assert False, "Wrong-sized frames should raise"
+        except ValueError:
+            pass
+    finally:
+        reader.close()
+        writer.close()
+
+    print("✓ Frames and sequence numbers shared")
+
+
+def test_torn_frame_not_read():
+    """Test a frame that is mid-write (odd sequence) is never returned."""
+    print("\nTEST: Torn Frame Detection")
+
+    framebuffer = SharedFramebuffer.create(2, 2)
+    try:
+        struct.pack_into('<Q', framebuffer.shm.buf, SEQUENCE_OFFSET, 3)
+        local = bytearray(framebuffer.frame_size)
+        assert framebuffer.read_into(local) is None, "Odd sequence means writer busy"
+        assert framebuffer.publish(bytes(12)) == 4, "Writer finishes on an even sequence"
+    finally:
+        framebuffer.close()
+
+    print("✓ Seqlock rejects in-progress frames")
+
+
+def test_sequence_behind_lock():
+    """Test the sequence counter is only touched while holding the lock."""
+    print("\nTEST: Sequence Counter Lock")
+
+    writer = SharedFramebuffer.create(2, 2)
+    reader = SharedFramebuffer.attach(writer.name, writer.lock)
+    try:
+        assert writer.lock is not None and reader.lock is writer.lock, "Lock shared with reader"
+
+        published = []
+        with writer.lock:
+            thread = threading.Thread(target=lambda: published.append(writer.publish(bytes(12))))
+            thread.start()
+            thread.join(0.05)
+            assert not published, "Publish waits for the lock"
+        thread.join()
+        assert published == [2], "Publish finishes once the lock is free"
+
+        local = bytearray(reader.frame_size)
+        assert reader.read_into(local) == 2, "Reader with the lock sees the frame"
+    finally:
+        reader.close()
+        writer.close()
+
+    print("✓ Counter updates are fenced by the lock")
+
+
+# ============================================================================
+# Driver and Output Loop Tests
+# ============================================================================
+
+def test_output_loop_in_thread():
+    """Test LEDMatrix frames reach an output driver through shared memory."""
+    print("\nTEST: Output Loop")
+
+    app_driver = SharedMemoryDisplayDriver(8, 4)
+    assert app_driver.initialize(), "App-side driver initializes"
+    output = RecordingDriver(8, 4)
+    try:
+        matrix = LEDMatrix(8, 4, driver=app_driver)
+        matrix.set_pixel(3, 1, (255, 0, 0))
+        matrix.show()
+
+        frames = run_output_loop(app_driver.shm_name, output, max_frames=1)
+        assert frames == 1, "One frame presented"
+        assert output.presented[0][1][(1 * 8 + 3) * 3:(1 * 8 + 3) * 3 + 3] == bytes((255, 0, 0)), \
+            "Output sees the published pixel"
+
+        stop = threading.Event()
+        thread = threading.Thread(target=run_output_loop,
+                                  args=(app_driver.shm_name, output, stop),
+                                  kwargs={'lock': app_driver.shm_lock})
+        thread.start()
+        matrix.set_pixel(0, 0, (0, 255, 0))
+        matrix.show()
+        for _ in range(200):
+            if len(output.presented) > 1:
+                break
+            threading.Event().wait(0.01)
+        stop.set()
+        thread.join()
+        assert len(output.presented) >= 2, "Threaded loop picks up later frames"
+    finally:
+        app_driver.cleanup()
+
+    print("✓ Output loop presents published frames")
+
+
+def test_output_loop_with_terminal_driver():
+    """Test the output loop drives the terminal driver's partial repaints."""
+    print("\nTEST: Output Loop with Terminal Driver")
+
+    app_driver = SharedMemoryDisplayDriver(16, 8)
+    assert app_driver.initialize(), "App-side driver initializes"
+    terminal = TerminalDisplayDriver(16, 8)
+    terminal.initialize()
+    try:
+        app_driver.show()
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            run_output_loop(app_driver.shm_name, terminal, max_frames=1)
+        assert '\033[2J' in out.getvalue(), "First frame is a full repaint"
+
+        app_driver.set_pixel(5, 3, (255, 255, 255))
+        app_driver.show()
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            run_output_loop(app_driver.shm_name, terminal, max_frames=1)
+        assert out.getvalue().startswith('\033[2;6H'), "Only the changed cell is redrawn"
+    finally:
+        app_driver.cleanup()
+
+    print("✓ Terminal driver repaints from shared memory")
+
+
+def test_output_process():
+    """Test frames cross a real process boundary."""
+    print("\nTEST: Output Process")
+
+    fd, path = tempfile.mkstemp()
+    os.close(fd)
+    app_driver = SharedMemoryDisplayDriver(4, 4, output_driver=RecordingDriver,
+                                           output_kwargs={'path': path})
+    try:
+        assert app_driver.initialize(), "Driver starts the output process"
+        app_driver.fill((1, 2, 3))
+        app_driver.show()
+
+        expected = bytes((1, 2, 3)) * 16
+        for _ in range(500):
+            with open(path, 'rb') as f:
+                if f.read() == expected:
+                    break
+            threading.Event().wait(0.01)
+        with open(path, 'rb') as f:
+            assert f.read() == expected, "Output process wrote the frame"
+    finally:
+        app_driver.cleanup()
+        os.remove(path)
+
+    assert app_driver.process is None, "cleanup() stops the output process"
+
+    print("✓ Output process presents frames")
+
+
+# ============================================================================
+# Test Runner
+# ============================================================================
+
+def run_all_tests():
+    """Run all tests and report results."""
+    print("=" * 70)
+    print("MATRIXOS SHARED MEMORY DISPLAY TESTS")
+    print("=" * 70)
+
+    tests = [
+        test_publish_and_read,
+        test_torn_frame_not_read,
+        test_sequence_behind_lock,
+        test_output_loop_in_thread,
+        test_output_loop_with_terminal_driver,
+        test_output_process,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -7,10 +7,14 @@ Tests collision detection, sprite groups, movement, and rendering.
 
 import sys
 import os
+import copy
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from matrixos.led_api import LEDMatrix
+import random
+
 from matrixos.sprites import (
-    Sprite, SpriteGroup, TileMap, EmojiSprite,
+    Sprite, SpriteGroup, SpatialHash, TileMap, EmojiSprite,
     rect_overlap, point_in_rect, distance
 )
 
@@ -414,6 +418,156 @@ def test_sprite_group_iteration():
     print("✓ Sprite group iteration works correctly")
 
 
+# ============================================================================
+# Spatial Hash Tests
+# ============================================================================
+
+def test_spatial_hash_incremental():
+    """Test moving sprites are re-bucketed only when they change cells."""
+    print("\nTEST: Spatial Hash Incremental Updates")
+    
+    index = SpatialHash(cell_size=16)
+    sprite = Sprite(2, 2, 4, 4)
+    far = Sprite(100, 100, 4, 4)
+    index.insert(sprite)
+    index.insert(far)
+    assert index.query(Sprite(0, 0, 8, 8)) == {sprite}, "Found in its cell"
+    
+    sprite.x = 6  # Same cell
+    assert index.query(Sprite(0, 0, 8, 8)) == {sprite}
+    assert index.rebuckets == 0, "Not moved between cells"
+    
+    sprite.x = 40  # Next cells over; straddles two columns when wide
+    sprite.width = 10
+    assert not index.query(Sprite(0, 0, 8, 8)), "Left its old cell"
+    assert sprite in index.query(Sprite(47, 0, 2, 2)), "Listed in both cells it covers"
+    assert index.rebuckets == 1, "Moved once"
+    
+    index.remove(sprite)
+    assert len(index) == 1 and not sprite._spatial_hashes, "Removed"
+    sprite.x = 100  # No longer tracked
+    assert index.query(far) == {far}
+    
+    # Copies of an indexed sprite (spawned from a prototype) aren't indexed
+    group = SpriteGroup(cell_size=16)
+    prototype = Sprite(2, 2, 4, 4)
+    group.add(prototype)
+    for bullet in (copy.copy(prototype), copy.deepcopy(prototype)):
+        assert not bullet._spatial_hashes and prototype._spatial_hashes, "Copy starts unindexed"
+        bullet.x = 50
+        assert group.check_collisions(bullet) == [], "Moving the copy leaves the group alone"
+        group.add(bullet)
+        assert group.check_collisions(Sprite(50, 2, 2, 2)) == [bullet], "Copy indexed once added"
+        group.remove(bullet)
+    index.dirty.add(Sprite(0, 0, 1, 1))
+    index.flush()  # Sprites it doesn't hold are skipped
+    
+    try:
+        SpatialHash(cell_size=0)
+        assert False, "Cell size must be positive"
+    except ValueError:
+        pass
+    
+    print("✓ Spatial hash tracks moving sprites")
+
+
+def test_spatial_hash_matches_loops():
+    """Test indexed groups find the same collisions, in the same order."""
+    print("\nTEST: Spatial Hash Matches Loops")
+    
+    rng = random.Random(7)
+    bullets = [Sprite(rng.uniform(0, 120), rng.uniform(0, 120), 2, 4) for _ in range(150)]
+    enemies = [Sprite(rng.uniform(0, 120), rng.uniform(0, 120), rng.randint(4, 30), 8)
+               for _ in range(40)]
+    for bullet in bullets:
+        bullet.velocity_y = -rng.uniform(20, 200)
+    
+    plain_bullets, plain_enemies = SpriteGroup(*bullets), SpriteGroup(*enemies)
+    hashed_bullets = SpriteGroup(*bullets, cell_size=16)
+    hashed_enemies = SpriteGroup(*enemies, cell_size=8)
+    for frame in range(10):
+        plain_bullets.update(0.05)  # Moves the sprites shared by both pairs of groups
+        expected = plain_bullets.check_group_collisions(plain_enemies)
+        assert expected, "Some collisions to find"
+        assert hashed_bullets.check_group_collisions(hashed_enemies) == expected, \
+            f"Frame {frame}: both indexed"
+        assert plain_bullets.check_group_collisions(hashed_enemies) == expected, \
+            f"Frame {frame}: other group indexed"
+        assert hashed_bullets.check_group_collisions(plain_enemies) == expected, \
+            f"Frame {frame}: own group indexed"
+        for enemy in enemies[:5]:
+            assert hashed_bullets.check_collisions(enemy) == \
+                plain_bullets.check_collisions(enemy), "Sprite vs group"
+    
+    # Groups kept in step through add/remove/clear (and around them)
+    extra = Sprite(bullets[0].x, bullets[0].y, 2, 2)
+    hashed_bullets.add(extra)
+    assert extra in hashed_bullets.check_collisions(bullets[0]), "Added sprite indexed"
+    hashed_bullets.remove(extra)
+    assert extra not in hashed_bullets.check_collisions(bullets[0]), "Removed sprite dropped"
+    hashed_bullets.sprites.append(extra)
+    assert extra in hashed_bullets.check_collisions(bullets[0]), "Index rebuilt"
+    swapped = list(hashed_bullets.sprites)
+    swapped[-1] = Sprite(bullets[0].x, bullets[0].y, 2, 2)
+    hashed_bullets.sprites = swapped  # Same length, new list
+    hits = hashed_bullets.check_collisions(bullets[0])
+    assert swapped[-1] in hits and extra not in hits, "Index rebuilt for a new list"
+    hashed_bullets.clear()
+    assert not hashed_bullets.check_collisions(bullets[0]), "Cleared"
+    
+    print("✓ Indexed collision checks match the loops")
+
+
+def test_spatial_hash_custom_collision():
+    """Test sprites overriding collides_with() are still asked."""
+    print("\nTEST: Spatial Hash Custom Collision")
+    
+    class Ghost(Sprite):
+        def collides_with(self, other):
+            return False
+    
+    ghost = Ghost(0, 0, 8, 8)
+    solid = Sprite(2, 2, 4, 4)
+    group = SpriteGroup(ghost, solid, cell_size=16)
+    
+    assert group.check_collisions(solid) == [ghost], "Plain sprite hits the ghost's box"
+    assert group.check_collisions(ghost) == [], "Ghost's own test used"
+    assert SpriteGroup(ghost, cell_size=16).check_group_collisions(group) == [], \
+        "Ghost's own test used for pairs"
+    
+    # Collision tests reaching past the box still find far sprites
+    class Aura(Sprite):
+        def collides_with(self, other):
+            return self.distance_to(other) < 40
+    
+    class BigHitbox(Sprite):
+        def rect(self):
+            return (self.x - 30, self.y - 30, self.width + 60, self.height + 60)
+    
+    for cls in (Aura, BigHitbox):
+        special = cls(50, 50, 4, 4)
+        near = Sprite(75, 50, 4, 4)  # Two cells away, inside the reach
+        plain = SpriteGroup(special, near)
+        indexed = SpriteGroup(special, near, cell_size=8)
+        assert indexed.check_collisions(special) == plain.check_collisions(special) == [near], \
+            f"{cls.__name__}: its own query"
+        assert indexed.check_collisions(near) == plain.check_collisions(near), \
+            f"{cls.__name__}: found by others"
+        others = SpriteGroup(near, cell_size=8)
+        specials = SpriteGroup(special, cell_size=8)
+        assert specials.check_group_collisions(others) == \
+            SpriteGroup(special).check_group_collisions(SpriteGroup(near)), \
+            f"{cls.__name__}: group pairs"
+        assert others.check_group_collisions(specials) == \
+            SpriteGroup(near).check_group_collisions(SpriteGroup(special)), \
+            f"{cls.__name__}: group pairs (reversed)"
+        special.x += 3  # Moving an unbucketed sprite is fine
+        assert indexed.spatial_hash.get_stats()['unbucketed'] == 1
+        assert indexed.check_collisions(special) == [near]
+    
+    print("✓ Custom collision tests respected")
+
+
 # ============================================================================
 # TileMap Tests
 # ============================================================================
@@ -740,6 +894,33 @@ def test_tile_utilities():
     print("✓ Tile utilities work correctly")
 
 
+def test_tilemap_render_blit():
+    """Test TileMap.render() blits a cached bitmap and updates changed tiles."""
+    print("\nTEST: TileMap Render via blit")
+
+    tilemap = TileMap(4, 2, tile_size=2)
+    tilemap.set_tile(1, 0, 1)
+    matrix = LEDMatrix(8, 4, color_mode='rgb')
+    matrix.fill((9, 9, 9))
+    tilemap.render(matrix)
+    assert matrix.get_pixel(3, 1) == (33, 33, 222), "Wall tile drawn"
+    assert matrix.get_pixel(0, 0) == (9, 9, 9), "Empty tile is transparent"
+
+    bitmap = tilemap._bitmap
+    tilemap.set_tile(1, 0, 0)
+    tilemap.set_tile(3, 1, 2)
+    tilemap.render(matrix)
+    assert tilemap._bitmap is bitmap, "Bitmap reused when only tiles change"
+    assert matrix.get_pixel(7, 3) == (255, 200, 150), "Changed tile drawn"
+
+    tilemap.tile_colors[2] = (0, 255, 0)
+    tilemap.render(matrix)
+    assert tilemap._bitmap is not bitmap, "Colour change rebuilds the bitmap"
+    assert matrix.get_pixel(7, 3) == (0, 255, 0), "New tile colour used"
+
+    print("✓ TileMap renders through blit")
+
+
 # ============================================================================
 # EmojiSprite Tests
 # ============================================================================
@@ -907,6 +1088,11 @@ def run_all_tests():
         test_sprite_group_find_by_color,
         test_sprite_group_iteration,
         
+        # Spatial hash tests
+        test_spatial_hash_incremental,
+        test_spatial_hash_matches_loops,
+        test_spatial_hash_custom_collision,
+        
         # TileMap tests
         test_tilemap_creation,
         test_coordinate_conversion,
@@ -920,6 +1106,7 @@ def run_all_tests():
         test_ascii_maze_loading,
         test_list_maze_loading,
         test_tile_utilities,
+        test_tilemap_render_blit,
         
         # EmojiSprite tests
         test_emoji_sprite_creation,
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Unit tests for MatrixOS text layout (matrixos.text_layout)
+
+Tests word-wrap, alignment, ellipsis and clamping to a box, the layout
+cache, and the widgets and helpers that lay their text out with it.
+"""
+
+import sys
+import os
+import threading
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from matrixos.font import Font, Glyph
+from matrixos.led_api import LEDMatrix
+from matrixos.text_layout import LayoutCache, layout_text, layout_cache
+from matrixos.ui import Button, Dialog, Label
+from matrixos import layout
+
+
+def line_texts(box):
+    return [line[0] for line in box.lines]
+
+
+# ============================================================================
+# Layout Tests
+# ============================================================================
+
+def test_wrap():
+    """Test lines break between words, and inside words wider than the box."""
+    print("TEST: Word Wrap")
+
+    font = Font()
+    box = layout_text("THE QUICK BROWN FOX", font, 72)
+    assert line_texts(box) == ["THE QUICK", "BROWN FOX"], f"Wrapped: {line_texts(box)}"
+    assert [line[2] for line in box.lines] == [0, 10], "8 px lines, 2 px apart"
+    assert box.text_height == 18 and not box.truncated, "Nothing cut"
+
+    box = layout_text("AN EXTRAORDINARY\nDAY", font, 64)
+    assert line_texts(box) == ["AN", "EXTRAORD", "INARY", "DAY"], \
+        f"Long word broken, newline kept: {line_texts(box)}"
+
+    box = layout_text("ONE LINE ONLY", font, 40, wrap=False)
+    assert line_texts(box) == ["ON..."] and box.truncated, f"Cut without wrapping: {line_texts(box)}"
+
+    print("✓ Text wrapped to the width")
+
+
+def test_clamp_and_align():
+    """Test text is clamped to the box height and aligned within it."""
+    print("\nTEST: Clamp and Align")
+
+    font = Font()
+    box = layout_text("ONE TWO THREE FOUR", font, 56, 18)
+    assert line_texts(box) == ["ONE TWO", "THRE..."], f"Last line ellipsized: {line_texts(box)}"
+    assert box.truncated and box.height == 18, "Clamped to two lines"
+
+    box = layout_text("ONE TWO", font, 64, 8, ellipsis='')
+    assert line_texts(box) == ["ONE TWO"], "Fits exactly"
+
+    box = layout_text("AB\nABCD", font, 64, 40, align='right', valign='bottom')
+    assert [(line[1], line[2]) for line in box.lines] == [(48, 22), (32, 32)], \
+        f"Right/bottom: {box.lines}"
+    box = layout_text("AB", font, 64, 40, align='center', valign='middle')
+    assert box.lines[0][1:3] == (24, 16), f"Centered: {box.lines}"
+
+    try:
+        layout_text("AB", font, 64, align='justify')
+        assert False, "Unknown alignment rejected"
+    except ValueError:
+        pass
+
+    print("✓ Clamped and aligned")
+
+
+def test_proportional_and_scaled():
+    """Test widths come from glyph advances, spacing and scale."""
+    print("\nTEST: Proportional and Scaled")
+
+    font = Font()
+    font.glyphs['I'] = Glyph(3, 8, [])  # A narrow glyph
+    font.glyph_version += 1
+    box = layout_text("IIII IIII", font, 24)
+    assert line_texts(box) == ["IIII", "IIII"], f"Narrow glyphs: {line_texts(box)}"
+
+    box = layout_text("AB CD", Font(), 40, scale=2)
+    assert line_texts(box) == ["AB", "CD"] and box.line_height == 18, "Scaled metrics"
+    box = layout_text("ABC", Font(), spacing=2)
+    assert box.text_width == 28, "Spacing between characters"
+
+    print("✓ Measured with the font")
+
+
+def test_cache():
+    """Test layouts are reused until the text, box or glyphs change."""
+    print("\nTEST: Layout Cache")
+
+    cache = LayoutCache(max_entries=2)
+    calls = []
+    for key in ('a', 'b', 'a', 'c', 'b'):
+        cache.get((key,), lambda: calls.append(key) or key)
+    assert calls == ['a', 'b', 'c', 'b'], f"Least recently used evicted ({calls})"
+    stats = cache.get_stats()
+    assert stats['hits'] == 1 and stats['evictions'] == 2, f"Stats: {stats}"
+
+    font = Font()
+    first = layout_text("CACHED TEXT", font, 64)
+    assert layout_text("CACHED TEXT", font, 64) is first, "Same layout reused"
+    assert layout_text("CACHED TEXT", font, 56) is not first, "Width is part of the key"
+    font.register_char('C', [0xFF] * 8)
+    assert layout_text("CACHED TEXT", font, 64) is not first, "New glyphs invalidate"
+
+    print("✓ Layouts cached")
+
+
+# ============================================================================
+# Widget Tests
+# ============================================================================
+
+def test_widgets_use_layout():
+    """Test helpers and widgets fit their text and reuse layouts across frames."""
+    print("\nTEST: Widgets")
+
+    matrix = LEDMatrix(64, 64)
+    layout.center_text(matrix, "PRESS ANY KEY", 0)
+    assert matrix.get_pixel(0, 3) == (0, 0, 0), "Ellipsized, not clipped at the edge"
+
+    matrix = LEDMatrix(64, 64)
+    layout.center_text(matrix, "HI", None)
+    lit = [(x, y) for y in range(64) for x in range(64) if matrix.get_pixel(x, y) != (0, 0, 0)]
+    assert min(x for x, _ in lit) >= 24 and max(x for x, _ in lit) < 40, "Centered across"
+    assert min(y for _, y in lit) >= 28 and max(y for _, y in lit) < 36, "Centered down"
+
+    button = Button("OK")
+    assert button.width == 24, "Auto width from the font"
+
+    # Sized with the font they are drawn with, not the default font
+    narrow = Font()
+    narrow.glyphs['I'] = Glyph(3, 8, [])
+    narrow.glyph_version += 1
+    matrix = LEDMatrix(64, 64)
+    matrix.font = narrow
+    label = Label("IIII")
+    button = Button("IIII")
+    label.render(matrix)
+    button.render(matrix)
+    assert (label.width, label.height) == (12, 8), f"Label sized by matrix font ({label.width})"
+    assert button.width == 20, f"Button auto width from matrix font ({button.width})"
+    assert Label("IIII", font=narrow).width == 12, "Label font argument"
+    assert Button("IIII", font=narrow).width == 20, "Button font argument"
+    button = Button("IIII", width=40)
+    button.render(matrix)
+    assert button.width == 40, "Fixed width kept"
+
+    matrix = LEDMatrix(128, 64)
+    dialog = Dialog("SAVE", "SAVE CHANGES BEFORE LEAVING THE SETTINGS PAGE?", ["YES", "NO"])
+    dialog.render(matrix)
+    misses = layout_cache.misses
+    for _ in range(5):
+        dialog.render(matrix)
+    assert layout_cache.misses == misses, "Dialog layouts reused across frames"
+
+    # Narrower than the dialog's margins: the message box has no width
+    matrix = LEDMatrix(20, 32)
+    thread = threading.Thread(target=Dialog("T", "HELLO THERE WORLD").render,
+                              args=(matrix,), daemon=True)
+    thread.start()
+    thread.join(5)
+    assert not thread.is_alive(), "Dialog renders on a narrow matrix"
+    box = layout_text("HELLO THERE", Font(), -4)
+    assert box.lines == () and box.truncated, "Nothing fits a negative width"
+    box = layout_text("AB", Font(), 3)
+    assert line_texts(box) == ["A", "B"], f"No empty line after a broken word: {line_texts(box)}"
+
+    print("✓ Widgets lay out text")
+
+
+# ============================================================================
+# Test Runner
+# ============================================================================
+
+def run_all_tests():
+    """Run all tests and report results."""
+    print("=" * 70)
+    print("MATRIXOS TEXT LAYOUT TESTS")
+    print("=" * 70)
+
+    tests = [
+        test_wrap,
+        test_clamp_and_align,
+        test_proportional_and_scaled,
+        test_cache,
+        test_widgets_use_layout,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
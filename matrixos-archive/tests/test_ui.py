@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Unit tests for MatrixOS UI widgets (matrixos.ui)
+
+Tests the Ticker marquee: the visible window of the pre-rendered strip
+must match drawing the text at the scrolled position, including where
+the strip wraps around.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from matrixos.led_api import LEDMatrix
+from matrixos.ui import Ticker
+
+
+def window(matrix, x, y, width, height):
+    """Bytes of a rectangle of the matrix's back buffer."""
+    display = matrix.display
+    bpp = display.bytes_per_pixel
+    return b''.join(
+        bytes(display.buffer[((y + row) * display.width + x) * bpp:
+                             ((y + row) * display.width + x + width) * bpp])
+        for row in range(height)
+    )
+
+
+def expected_window(text, offset, period, x, y, width, color, bg_color=None):
+    """Draw the text (and its repeats) scrolled by `offset`, clipped to a window."""
+    matrix = LEDMatrix(x + width + period * 3, y + 8)
+    if bg_color is not None:
+        matrix.rect(x, y, width, 8, bg_color, fill=True)
+    start = x - offset
+    while start < x + width:
+        matrix.text(text, start, y, color, bg_color)
+        start += period
+    # Blank out what the window doesn't show
+    clipped = LEDMatrix(x + width, y + 8)
+    clipped.blit(matrix.display, x, y, (x, y, width, 8))
+    return window(clipped, x, y, width, 8)
+
+
+# ============================================================================
+# Ticker Tests
+# ============================================================================
+
+def test_ticker_window():
+    """Test the window shows the strip at the scroll position, wrapping."""
+    print("TEST: Ticker Window")
+
+    text = "HELLO TICKER WORLD"  # 144 px + 16 px gap = 160 px strip
+    for bg_color in (None, (0, 0, 60)):
+        for offset in (0, 5, 63, 64, 100, 150, 159):
+            matrix = LEDMatrix(100, 12)
+            ticker = Ticker(text, x=10, y=2, width=70, color=(255, 255, 0),
+                            bg_color=bg_color, gap=16)
+            ticker.offset = offset
+            ticker.render(matrix)
+            assert ticker.height == 8, "Height from the font"
+            assert window(matrix, 10, 2, 70, 8) == \
+                expected_window(text, offset, 160, 10, 2, 70, (255, 255, 0), bg_color), \
+                f"Window at offset {offset} (bg {bg_color})"
+            assert matrix.display.get_pixel(9, 2) == (0, 0, 0) and \
+                matrix.display.get_pixel(80, 2) == (0, 0, 0), "Nothing outside the window"
+
+    # Short text repeats across a wide window
+    matrix = LEDMatrix(100, 8)
+    ticker = Ticker("AB", x=0, y=0, width=100, color=(255, 255, 255), gap=4)
+    ticker.render(matrix)
+    assert window(matrix, 0, 0, 100, 8) == \
+        expected_window("AB", 0, 20, 0, 0, 100, (255, 255, 255)), "Repeats fill the window"
+
+    print("✓ Window blitted from the strip")
+
+
+def test_ticker_subpixel_speed():
+    """Test scrolling accumulates sub-pixel steps from delta_time."""
+    print("\nTEST: Ticker Sub-pixel Speed")
+
+    matrix = LEDMatrix(64, 8)
+    ticker = Ticker("SCROLL", x=0, y=0, width=64, speed=10.0, gap=16)  # 64 px strip
+    ticker.render(matrix)
+
+    moved = [ticker.update(1 / 60) for _ in range(12)]
+    assert moved.count(True) == 2, f"10 px/s at 60 fps moves every 6th frame ({moved})"
+    assert abs(ticker.offset - 2.0) < 1e-9, f"Offset {ticker.offset}"
+
+    ticker.update(6.3)  # 63 px more: wraps at the strip width
+    assert abs(ticker.offset - 1.0) < 1e-6, f"Wrapped ({ticker.offset})"
+
+    ticker.speed = -10.0
+    ticker.update(0.2)
+    assert abs(ticker.offset - 63.0) < 1e-6, f"Scrolls right and wraps ({ticker.offset})"
+
+    print("✓ Sub-pixel scrolling")
+
+
+def test_ticker_strip_reused():
+    """Test the strip is rendered once and rebuilt only when the text changes."""
+    print("\nTEST: Ticker Strip Reuse")
+
+    matrix = LEDMatrix(64, 8)
+    ticker = Ticker("NEWS " * 40, x=0, y=0, width=64, gap=8)
+    ticker.render(matrix)
+    chunks = ticker._chunks
+    assert len(chunks) == (40 * 5 * 8 + 8 + 63) // 64, "Strip cut into chunks"
+
+    for _ in range(10):
+        ticker.update(0.1)
+        ticker.render(matrix)
+    assert ticker._chunks is chunks, "Strip reused while scrolling"
+
+    ticker.set_text("OTHER")
+    ticker.render(matrix)
+    assert ticker._chunks is not chunks and len(ticker._chunks) == 1, "Rebuilt for new text"
+
+    print("✓ Strip rendered once")
+
+
+# ============================================================================
+# Test Runner
+# ============================================================================
+
+def run_all_tests():
+    """Run all tests and report results."""
+    print("=" * 70)
+    print("MATRIXOS UI TESTS")
+    print("=" * 70)
+
+    tests = [
+        test_ticker_window,
+        test_ticker_subpixel_speed,
+        test_ticker_strip_reused,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Pygame window driver (matrixos.devices.display.macos_window)
+
+Runs headless with SDL_VIDEODRIVER=dummy. Tests the scaled frame upload,
+the cached LED gap mask and dirty-rect updates.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+try:
+    import pygame
+    from matrixos.devices.display.macos_window import MacOSWindowDriver
+except ImportError:  # pygame is optional - skip these tests without it
+    pygame = None
+
+from matrixos.led_api import LEDMatrix
+
+
+def make_driver(width=8, height=4, scale=4, pixel_gap=0):
+    driver = MacOSWindowDriver(width, height, scale=scale, pixel_gap=pixel_gap)
+    assert driver.initialize(), "Driver initializes headless"
+    return driver
+
+
+# ============================================================================
+# Window Driver Tests
+# ============================================================================
+
+def test_full_frame_scaled():
+    """Test a frame is scaled into the window in solid blocks."""
+    print("TEST: Full Frame Upload")
+    if pygame is None:
+        print("(pygame not installed - skipped)")
+        return
+
+    driver = make_driver()
+    try:
+        matrix = LEDMatrix(8, 4, driver=driver)
+        matrix.set_pixel(2, 1, (255, 0, 0))
+        matrix.show()
+        screen = driver.screen
+        assert screen.get_at((8, 4))[:3] == (255, 0, 0), "Top-left of the block"
+        assert screen.get_at((11, 7))[:3] == (255, 0, 0), "Bottom-right of the block"
+        assert screen.get_at((12, 4))[:3] == (0, 0, 0), "Neighbour untouched"
+    finally:
+        driver.cleanup()
+
+    print("✓ Frame scaled into the window")
+
+
+def test_pixel_gap_mask():
+    """Test the LED gap mask blacks out gaps and is cached."""
+    print("\nTEST: Pixel Gap Mask")
+    if pygame is None:
+        print("(pygame not installed - skipped)")
+        return
+
+    driver = make_driver(pixel_gap=1)
+    try:
+        driver.fill((0, 255, 0))
+        driver.needs_full_repaint = True
+        driver.show()
+        screen = driver.screen
+        assert screen.get_at((0, 0))[:3] == (0, 255, 0), "LED area shows the colour"
+        assert screen.get_at((2, 2))[:3] == (0, 255, 0), "Whole LED lit"
+        assert screen.get_at((3, 0))[:3] == (0, 0, 0), "Column gap is black"
+        assert screen.get_at((0, 3))[:3] == (0, 0, 0), "Row gap is black"
+
+        mask = driver.gap_mask
+        driver.set_pixel(0, 0, (0, 0, 255))
+        driver.show()
+        assert driver.gap_mask is mask, "Mask reused between frames"
+    finally:
+        driver.cleanup()
+
+    print("✓ Gap mask composited on top")
+
+
+def test_dirty_rect_update():
+    """Test only damaged rectangles are sent to pygame.display.update()."""
+    print("\nTEST: Dirty Rect Update")
+    if pygame is None:
+        print("(pygame not installed - skipped)")
+        return
+
+    driver = make_driver()
+    updates = []
+    original = pygame.display.update
+    pygame.display.update = lambda rects=None: updates.append(rects)
+    try:
+        driver.set_pixel(5, 3, (255, 255, 255))
+        driver.show()
+        assert updates == [[pygame.Rect(20, 12, 4, 4)]], f"One scaled dirty rect: {updates}"
+        assert driver.screen.get_at((21, 13))[:3] == (255, 255, 255), "Damaged pixel drawn"
+
+        driver.show()
+        assert len(updates) == 1, "Unchanged frame updates nothing"
+    finally:
+        pygame.display.update = original
+        driver.cleanup()
+
+    print("✓ Dirty rects updated")
+
+
+# ============================================================================
+# Test Runner
+# ============================================================================
+
+def run_all_tests():
+    """Run all tests and report results."""
+    print("=" * 70)
+    print("MATRIXOS WINDOW DRIVER TESTS")
+    print("=" * 70)
+
+    tests = [
+        test_full_frame_scaled,
+        test_pixel_gap_mask,
+        test_dirty_rect_update,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)